@@ -0,0 +1,8 @@
+"""
+マネージャから取得したデータをローカルで集計・分析するためのモジュール群
+"""
+from .event_store import EventStore
+from .event_summary import EventSummarizer
+from .templates import TemplateMiner
+from .series_cache import SeriesCache
+from .job_history import JobHistoryStore
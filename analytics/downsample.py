@@ -0,0 +1,138 @@
+"""
+時系列のダウンサンプリング
+収集データを MCP クライアントへ返す前に、指定した点数まで間引く（NumPy でベクトル化）。
+    lttb:       Largest-Triangle-Three-Buckets。実在する点を選び、スパイクなど形状に効く点を残す
+    minmax:     等間隔の時間バケットごとの min / max / avg / 件数
+    percentile: 等間隔の時間バケットごとのパーセンタイル
+"""
+from typing import Any, Dict, Optional, Sequence, Tuple
+
+import numpy as np
+
+DOWNSAMPLE_MODES = ("lttb", "minmax", "percentile")
+DEFAULT_POINTS = 500
+DEFAULT_PERCENTILES = (50, 95, 99)
+
+
+def lttb(times: np.ndarray, values: np.ndarray, threshold: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    LTTB で threshold 点を選ぶ（先頭と末尾の点は必ず残す）
+    各バケットで「前に選んだ点・次のバケットの平均点」と作る三角形の面積が最大の点を選ぶ。
+    バケットの平均は累積和からまとめて求め、バケット内の面積計算もベクトル演算で行う。
+    """
+    count = len(times)
+    if threshold >= count or threshold < 3:
+        return times, values
+    x = (times - times[0]).astype(np.float64)
+    y = values.astype(np.float64)
+    # 先頭・末尾を除く count - 2 点を threshold - 2 個のバケットに分ける（edges[i]:edges[i+1] がバケット i）
+    edges = (np.arange(threshold - 1, dtype=np.int64) * (count - 2)) // (threshold - 2) + 1
+    sizes = np.diff(edges)
+    cumulative_x = np.concatenate(([0.0], np.cumsum(x)))
+    cumulative_y = np.concatenate(([0.0], np.cumsum(y)))
+    mean_x = (cumulative_x[edges[1:]] - cumulative_x[edges[:-1]]) / sizes
+    mean_y = (cumulative_y[edges[1:]] - cumulative_y[edges[:-1]]) / sizes
+    # バケット i の三角形の第3頂点はバケット i + 1 の平均点（最後のバケットは末尾の点）
+    next_x = np.append(mean_x[1:], x[-1])
+    next_y = np.append(mean_y[1:], y[-1])
+
+    selected = np.empty(threshold, dtype=np.int64)
+    selected[0], selected[-1] = 0, count - 1
+    anchor = 0
+    for bucket in range(threshold - 2):
+        lower, upper = edges[bucket], edges[bucket + 1]
+        anchor_x, anchor_y = x[anchor], y[anchor]
+        area = np.abs((anchor_x - next_x[bucket]) * (y[lower:upper] - anchor_y)
+                      - (anchor_x - x[lower:upper]) * (next_y[bucket] - anchor_y))
+        anchor = lower + int(np.argmax(area))
+        selected[bucket + 1] = anchor
+    return times[selected], values[selected]
+
+
+def time_buckets(times: np.ndarray, buckets: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    期間を buckets 個の等間隔バケットに分ける（times は昇順）
+    Returns:
+        (点ごとのバケット番号, 空でないバケットの先頭位置, 空でないバケットの開始時刻)
+    """
+    span = int(times[-1] - times[0]) + 1
+    ids = ((times - times[0]) * buckets) // span
+    starts = np.flatnonzero(np.concatenate(([True], ids[1:] != ids[:-1])))
+    labels = times[0] + (ids[starts] * span) // buckets
+    return ids, starts, labels
+
+
+def minmax_buckets(times: np.ndarray, values: np.ndarray, buckets: int) -> Dict[str, np.ndarray]:
+    """等間隔の時間バケットごとの min / max / avg / 件数（空のバケットは含まない）"""
+    _, starts, labels = time_buckets(times, buckets)
+    counts = np.diff(np.append(starts, len(values)))
+    return {
+        "time": labels,
+        "min": np.minimum.reduceat(values, starts),
+        "max": np.maximum.reduceat(values, starts),
+        "avg": np.add.reduceat(values, starts) / counts,
+        "count": counts,
+    }
+
+
+def percentile_buckets(times: np.ndarray, values: np.ndarray, buckets: int,
+                       percentiles: Sequence[float] = DEFAULT_PERCENTILES) -> Dict[str, np.ndarray]:
+    """
+    等間隔の時間バケットごとのパーセンタイル（線形補間。numpy.percentile の既定と同じ）
+    バケット番号・値の順で一度だけ並べ替え、各バケットの順位位置を直接参照する。
+    """
+    ids, starts, labels = time_buckets(times, buckets)
+    counts = np.diff(np.append(starts, len(values)))
+    ordered = values[np.lexsort((values, ids))]
+    last = starts + counts - 1
+    result = {"time": labels}
+    for q in percentiles:
+        position = starts + (float(q) / 100.0) * (counts - 1)
+        lower = np.floor(position).astype(np.int64)
+        upper = np.minimum(lower + 1, last)
+        fraction = position - lower
+        result[f"p{q:g}"] = ordered[lower] + (ordered[upper] - ordered[lower]) * fraction
+    result["count"] = counts
+    return result
+
+
+def _format_times(times: np.ndarray) -> list:
+    text = np.datetime_as_string(times.astype("datetime64[ms]").astype("datetime64[s]"))
+    return np.char.replace(text, "T", " ").tolist()
+
+
+def downsample(times: np.ndarray, values: np.ndarray, mode: str = "lttb", points: Optional[int] = None,
+               percentiles: Optional[Sequence[float]] = None) -> Dict[str, Any]:
+    """
+    時系列を points 点（minmax / percentile はバケット数）まで間引き、列名と行の配列で返す
+    欠損値(NaN)は除いてから間引く。行の時刻は "yyyy-MM-dd HH:mm:ss"（minmax / percentile はバケットの開始時刻）。
+    Returns:
+        {"mode", "inputPoints", "returned", "columns", "rows"}
+    """
+    if mode not in DOWNSAMPLE_MODES:
+        raise ValueError(f"downsample は {', '.join(DOWNSAMPLE_MODES)} のいずれかです: {mode}")
+    points = max(3, int(points or DEFAULT_POINTS))
+    finite = np.isfinite(values)
+    times, values = times[finite], values[finite]
+    if not len(times):
+        columns: Dict[str, np.ndarray] = {"time": times, "value": values}
+    elif mode == "lttb":
+        sampled_times, sampled_values = lttb(times, values, points)
+        columns = {"time": sampled_times, "value": sampled_values}
+    elif mode == "minmax":
+        columns = minmax_buckets(times, values, points)
+    else:
+        columns = percentile_buckets(times, values, points, percentiles or DEFAULT_PERCENTILES)
+
+    names = list(columns)
+    data = [_format_times(columns["time"])]
+    for name in names[1:]:
+        column = columns[name]
+        data.append(column.tolist() if column.dtype.kind == "i" else np.round(column, 6).tolist())
+    return {
+        "mode": mode,
+        "inputPoints": int(len(times)),
+        "returned": len(data[0]),
+        "columns": names,
+        "rows": [list(row) for row in zip(*data)],
+    }
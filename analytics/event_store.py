@@ -0,0 +1,510 @@
+"""
+イベントのローカルストア
+event_search の結果を SQLite に永続化し（priority, facilityId, monitorId, pluginId, generationDate に索引）、
+件数集計・上位N件・時系列ヒストグラムは辞書符号化した列をメモリ上に持つ列指向インデックスで答える。
+保持期間・最大件数を超えた古いイベントは取り込みのたびに SQLite とインデックスの両方から削除する。
+"""
+import os
+import time
+import fnmatch
+import sqlite3
+import threading
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from client.event_pager import parse_event_date
+
+# フィルタ/集計に使える項目（APIの項目名 → 列名）
+DIMENSIONS = {
+    "priority": "priority",
+    "facilityId": "facility_id",
+    "monitorId": "monitor_id",
+    "monitorDetailId": "monitor_detail_id",
+    "pluginId": "plugin_id",
+    "application": "application",
+    "ownerRoleId": "owner_role_id",
+    "confirmType": "confirm_type",
+}
+# 列指向インデックスに載せる項目（取り込み後に変化しない項目のみ。confirmType は SQLite で集計する）
+COLUMNAR_DIMENSIONS = ("priority", "facilityId", "monitorId", "monitorDetailId", "pluginId", "application", "ownerRoleId")
+
+INTERVALS = {"minute": 60, "5m": 300, "15m": 900, "hour": 3600, "6h": 21600, "day": 86400, "week": 604800}
+
+_EVENT_COLUMNS = (
+    "monitor_id", "monitor_detail_id", "plugin_id", "facility_id", "output_date",
+    "generation_date", "priority", "facility_name", "application", "message",
+    "confirm_type", "confirm_user", "comment", "owner_role_id",
+)
+_KEY_COLUMNS = "monitor_id, monitor_detail_id, plugin_id, facility_id, output_date"
+
+_SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS events (
+    monitor_id TEXT NOT NULL,
+    monitor_detail_id TEXT NOT NULL,
+    plugin_id TEXT NOT NULL,
+    facility_id TEXT NOT NULL,
+    output_date INTEGER NOT NULL,
+    generation_date INTEGER NOT NULL,
+    priority TEXT NOT NULL,
+    facility_name TEXT,
+    application TEXT,
+    message TEXT,
+    confirm_type INTEGER,
+    confirm_user TEXT,
+    comment TEXT,
+    owner_role_id TEXT,
+    PRIMARY KEY ({_KEY_COLUMNS})
+);
+CREATE INDEX IF NOT EXISTS idx_events_generation ON events (generation_date);
+CREATE INDEX IF NOT EXISTS idx_events_priority ON events (priority, generation_date);
+CREATE INDEX IF NOT EXISTS idx_events_facility ON events (facility_id, generation_date);
+CREATE INDEX IF NOT EXISTS idx_events_monitor ON events (monitor_id, generation_date);
+CREATE INDEX IF NOT EXISTS idx_events_plugin ON events (plugin_id, generation_date);
+"""
+
+
+def _millis(value: Optional[str]) -> Optional[int]:
+    if not value:
+        return None
+    return int(parse_event_date(value).timestamp() * 1000)
+
+
+def _iso(millis: int) -> str:
+    return datetime.fromtimestamp(millis / 1000, tz=timezone.utc).strftime('%Y-%m-%dT%H:%M:%S.%f')[:-3] + 'Z'
+
+
+def _event_row(event: Dict[str, Any]) -> Optional[Tuple]:
+    output_date = _millis(event.get("outputDate"))
+    if output_date is None:
+        return None
+    generation_date = _millis(event.get("generationDate")) or output_date
+    return (
+        event.get("monitorId") or "", event.get("monitorDetailId") or "", event.get("pluginId") or "",
+        event.get("facilityId") or "", output_date, generation_date,
+        "" if event.get("priority") is None else str(event.get("priority")),
+        event.get("facilityName"), event.get("application") or "", event.get("message"),
+        event.get("confirmType"), event.get("confirmUser"), event.get("comment"), event.get("ownerRoleId") or "",
+    )
+
+
+class _ColumnIndex:
+    """発生日時(int64)と各項目の辞書符号(int32)を列で保持する追記専用インデックス"""
+
+    _ROW_POSITIONS = {name: _EVENT_COLUMNS.index(DIMENSIONS[name]) for name in COLUMNAR_DIMENSIONS}
+    _TIME_POSITION = _EVENT_COLUMNS.index("generation_date")
+
+    def __init__(self):
+        self.size = 0
+        self.times = np.empty(0, dtype=np.int64)
+        self.codes = {name: np.empty(0, dtype=np.int32) for name in COLUMNAR_DIMENSIONS}
+        self.vocab: Dict[str, Dict[str, int]] = {name: {} for name in COLUMNAR_DIMENSIONS}
+        self.values: Dict[str, List[str]] = {name: [] for name in COLUMNAR_DIMENSIONS}
+        self.sorted = True
+
+    def _reserve(self, extra: int) -> None:
+        needed = self.size + extra
+        if needed <= len(self.times):
+            return
+        capacity = max(needed, len(self.times) * 2, 1024)
+        self.times = np.resize(self.times, capacity)
+        for name in COLUMNAR_DIMENSIONS:
+            self.codes[name] = np.resize(self.codes[name], capacity)
+
+    def _encode(self, name: str, value: str) -> int:
+        vocab = self.vocab[name]
+        code = vocab.get(value)
+        if code is None:
+            code = vocab[value] = len(self.values[name])
+            self.values[name].append(value)
+        return code
+
+    def append(self, rows: Sequence[Tuple]) -> None:
+        if not rows:
+            return
+        self._reserve(len(rows))
+        end = self.size + len(rows)
+        times = self.times[self.size:end]
+        times[:] = [row[self._TIME_POSITION] for row in rows]
+        # 時刻順に追記される限りソート済みを保つ（過去分の取り込み時だけ次回検索時に並べ直す）
+        if self.sorted and (np.any(times[1:] < times[:-1]) or (self.size and times[0] < self.times[self.size - 1])):
+            self.sorted = False
+        for name, position in self._ROW_POSITIONS.items():
+            encode = self._encode
+            self.codes[name][self.size:end] = [encode(name, row[position] or "") for row in rows]
+        self.size = end
+
+    def drop_before(self, cutoff: int) -> int:
+        """発生日時が cutoff より前の行を削除し、削除した行数を返す（辞書は残す）"""
+        self._ensure_sorted()
+        count = int(np.searchsorted(self.times[:self.size], cutoff, side="left"))
+        if count:
+            remaining = self.size - count
+            self.times[:remaining] = self.times[count:self.size]
+            for name in COLUMNAR_DIMENSIONS:
+                self.codes[name][:remaining] = self.codes[name][count:self.size]
+            self.size = remaining
+        return count
+
+    def _ensure_sorted(self) -> None:
+        if self.sorted:
+            return
+        order = np.argsort(self.times[:self.size], kind="stable")
+        self.times[:self.size] = self.times[:self.size][order]
+        for name in COLUMNAR_DIMENSIONS:
+            self.codes[name][:self.size] = self.codes[name][:self.size][order]
+        self.sorted = True
+
+    def code_set(self, name: str, value: Any) -> np.ndarray:
+        """フィルタ値に一致する符号の集合（リストはいずれか一致、* を含む文字列はワイルドカード）"""
+        candidates = value if isinstance(value, (list, tuple)) else [value]
+        codes = set()
+        for candidate in candidates:
+            text = str(candidate)
+            if "*" in text:
+                codes.update(code for v, code in self.vocab[name].items() if fnmatch.fnmatchcase(v, text))
+            elif text in self.vocab[name]:
+                codes.add(self.vocab[name][text])
+        return np.fromiter(codes, dtype=np.int32, count=len(codes))
+
+    def select(self, filters: Dict[str, Any], start: Optional[int], end: Optional[int]) -> "_Selection":
+        """期間は二分探索で行範囲に、項目条件はその範囲内のマスクに変換する"""
+        self._ensure_sorted()
+        times = self.times[:self.size]
+        lo = int(np.searchsorted(times, start, side="left")) if start is not None else 0
+        hi = int(np.searchsorted(times, end, side="left")) if end is not None else self.size
+        hi = max(lo, hi)
+        mask = None
+        for name, value in filters.items():
+            column = self.codes[name][lo:hi]
+            codes = self.code_set(name, value)
+            matched = column == codes[0] if len(codes) == 1 else np.isin(column, codes)
+            mask = matched if mask is None else mask & matched
+        return _Selection(self, lo, hi, mask)
+
+
+class _Selection:
+    """_ColumnIndex.select() の結果（行範囲 [lo, hi) と範囲内のマスク）"""
+
+    def __init__(self, columns: _ColumnIndex, lo: int, hi: int, mask: Optional[np.ndarray]):
+        self.columns = columns
+        self.lo, self.hi, self.mask = lo, hi, mask
+
+    def count(self) -> int:
+        return int(self.mask.sum()) if self.mask is not None else self.hi - self.lo
+
+    def _take(self, array: np.ndarray) -> np.ndarray:
+        window = array[self.lo:self.hi]
+        return window[self.mask] if self.mask is not None else window
+
+    def codes(self, name: str) -> np.ndarray:
+        return self._take(self.columns.codes[name])
+
+    def times(self) -> np.ndarray:
+        return self._take(self.columns.times)
+
+
+class EventStore:
+    """
+    イベントの組込みストア
+    Args:
+        path: SQLiteファイルのパス（HINEMOS_EVENT_STORE、既定: ./hinemos_events.db）。":memory:" も可
+        max_age_days: 発生日時がこれより古いイベントを削除する日数（HINEMOS_EVENT_STORE_MAX_AGE_DAYS、0 で無期限）
+        max_rows: 保持するイベント数の上限。超えた分は発生日時の古いものから削除する（HINEMOS_EVENT_STORE_MAX_ROWS、0 で無制限）
+    """
+
+    def __init__(self, path: Optional[str] = None, max_age_days: Optional[float] = None, max_rows: Optional[int] = None):
+        self.path = path or os.getenv("HINEMOS_EVENT_STORE", "hinemos_events.db")
+        self.max_age_days = max_age_days if max_age_days is not None else float(os.getenv("HINEMOS_EVENT_STORE_MAX_AGE_DAYS", "0"))
+        self.max_rows = max_rows if max_rows is not None else int(os.getenv("HINEMOS_EVENT_STORE_MAX_ROWS", "1000000"))
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._lock = threading.Lock()
+        self._columns: Optional[_ColumnIndex] = None
+        self._count: Optional[int] = None
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript(_SCHEMA)
+            self._conn.execute(f"CREATE TEMP TABLE staging AS SELECT {', '.join(_EVENT_COLUMNS)} FROM events WHERE 0")
+            self._conn.execute(f"CREATE UNIQUE INDEX temp.idx_staging ON staging ({_KEY_COLUMNS})")
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def _column_index(self) -> _ColumnIndex:
+        """列指向インデックス（初回の集計時に SQLite から構築）。呼び出し側で _lock を取得していること"""
+        if self._columns is None:
+            columns = _ColumnIndex()
+            cursor = self._conn.execute(f"SELECT {', '.join(_EVENT_COLUMNS)} FROM events")
+            while True:
+                rows = cursor.fetchmany(50000)
+                if not rows:
+                    break
+                columns.append(rows)
+            self._columns = columns
+        return self._columns
+
+    # --- 取り込み ---
+    def ingest(self, events: Iterable[Dict[str, Any]]) -> int:
+        """
+        イベントを取り込む（既存イベントは確認状態・コメントのみ更新）
+        Returns:
+            新規に追加したイベント数
+        """
+        rows = [row for row in map(_event_row, events) if row is not None]
+        if not rows:
+            return 0
+        placeholders = ", ".join("?" * len(_EVENT_COLUMNS))
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM staging")
+            self._conn.executemany(f"INSERT OR REPLACE INTO staging VALUES ({placeholders})", rows)
+            new_rows = self._conn.execute(f"""
+                SELECT s.* FROM staging s
+                WHERE NOT EXISTS (
+                    SELECT 1 FROM events e
+                    WHERE e.monitor_id = s.monitor_id AND e.monitor_detail_id = s.monitor_detail_id
+                      AND e.plugin_id = s.plugin_id AND e.facility_id = s.facility_id AND e.output_date = s.output_date
+                )
+            """).fetchall()
+            self._conn.execute(f"""
+                INSERT INTO events SELECT * FROM staging WHERE true
+                ON CONFLICT ({_KEY_COLUMNS}) DO UPDATE SET
+                    confirm_type = excluded.confirm_type, confirm_user = excluded.confirm_user, comment = excluded.comment
+            """)
+            if self._columns is not None:
+                self._columns.append(new_rows)
+            if self._count is not None:
+                self._count += len(new_rows)
+            self._prune()
+        return len(new_rows)
+
+    def _prune(self) -> int:
+        """保持期間・最大件数を超えた古いイベントを削除する。呼び出し側で _lock を取得していること"""
+        cutoff = None
+        if self.max_age_days > 0:
+            cutoff = int((time.time() - self.max_age_days * 86400) * 1000)
+        if self.max_rows > 0:
+            if self._count is None:
+                self._count = self._conn.execute("SELECT COUNT(*) FROM events").fetchone()[0]
+            excess = self._count - self.max_rows
+            if excess > 0:
+                # 上限を超えた分の最も新しい発生日時まで削除する（同時刻の行はまとめて消すため上限をわずかに下回ることがある）
+                newest_excess = self._conn.execute(
+                    "SELECT generation_date FROM events ORDER BY generation_date LIMIT 1 OFFSET ?", (excess - 1,)
+                ).fetchone()[0]
+                cutoff = newest_excess + 1 if cutoff is None else max(cutoff, newest_excess + 1)
+        if cutoff is None:
+            return 0
+        removed = self._conn.execute("DELETE FROM events WHERE generation_date < ?", (cutoff,)).rowcount
+        if removed:
+            if self._count is not None:
+                self._count -= removed
+            if self._columns is not None:
+                self._columns.drop_before(cutoff)
+        return removed
+
+    # --- 検索条件 ---
+    @staticmethod
+    def _split_filters(filters: Optional[Dict[str, Any]]) -> Tuple[Dict[str, Any], Optional[int], Optional[int]]:
+        dimensions: Dict[str, Any] = {}
+        for name, value in (filters or {}).items():
+            if name in ("from", "to") or value is None or value == "" or value == []:
+                continue
+            if name not in DIMENSIONS:
+                raise ValueError(f"未対応のフィルタ項目です: {name}（{', '.join(DIMENSIONS)}, from, to）")
+            dimensions[name] = value
+        return dimensions, _millis((filters or {}).get("from")), _millis((filters or {}).get("to"))
+
+    @staticmethod
+    def _check_fields(fields: Sequence[str]) -> None:
+        for name in fields:
+            if name not in DIMENSIONS:
+                raise ValueError(f"未対応の集計項目です: {name}（{', '.join(DIMENSIONS)}）")
+
+    @staticmethod
+    def _sql_where(dimensions: Dict[str, Any], start: Optional[int], end: Optional[int]) -> Tuple[str, List[Any]]:
+        clauses: List[str] = []
+        params: List[Any] = []
+        for name, value in dimensions.items():
+            column = DIMENSIONS[name]
+            if isinstance(value, (list, tuple)):
+                clauses.append(f"{column} IN ({', '.join('?' * len(value))})")
+                params.extend(value)
+            elif isinstance(value, str) and "*" in value:
+                clauses.append(f"{column} GLOB ?")
+                params.append(value)
+            else:
+                clauses.append(f"{column} = ?")
+                params.append(value)
+        if start is not None:
+            clauses.append("generation_date >= ?")
+            params.append(start)
+        if end is not None:
+            clauses.append("generation_date < ?")
+            params.append(end)
+        return (" WHERE " + " AND ".join(clauses)) if clauses else "", params
+
+    @staticmethod
+    def _columnar(fields: Sequence[str], dimensions: Dict[str, Any]) -> bool:
+        return all(name in COLUMNAR_DIMENSIONS for name in list(fields) + list(dimensions))
+
+    # --- 集計 ---
+    def count_by(self, group_by: Optional[Sequence[str]] = None, filters: Optional[Dict[str, Any]] = None,
+                 limit: Optional[int] = None) -> Dict[str, Any]:
+        """
+        group_by の組み合わせ毎のイベント件数（件数の多い順）
+        Args:
+            group_by: 集計項目（priority, facilityId, monitorId, pluginId, application, confirmType 等）
+            filters: 絞り込み条件。値がリストならいずれか一致、"*"を含む文字列はワイルドカード。from/to は発生日時（toは含まない）
+            limit: 返す行数の上限
+        """
+        group_by = list(group_by or [])
+        self._check_fields(group_by)
+        dimensions, start, end = self._split_filters(filters)
+        started = time.perf_counter()
+        with self._lock:
+            if self._columnar(group_by, dimensions):
+                rows, source = self._count_columnar(group_by, dimensions, start, end), "columnar"
+            else:
+                rows, source = self._count_sql(group_by, dimensions, start, end), "sqlite"
+        rows.sort(key=lambda r: r["count"], reverse=True)
+        total = sum(r["count"] for r in rows)
+        if limit:
+            rows = rows[:int(limit)]
+        return {
+            "groupBy": group_by,
+            "rows": rows,
+            "total": total,
+            "source": source,
+            "elapsedMs": round((time.perf_counter() - started) * 1000, 3),
+        }
+
+    def _count_columnar(self, group_by, dimensions, start, end) -> List[Dict[str, Any]]:
+        columns = self._column_index()
+        selection = columns.select(dimensions, start, end)
+        if not group_by:
+            count = selection.count()
+            return [{"count": count}] if count else []
+        keys, counts = self._group(selection, group_by)
+        return [
+            {**{name: columns.values[name][code] for name, code in zip(group_by, key)}, "count": int(count)}
+            for key, count in zip(keys, counts)
+        ]
+
+    @staticmethod
+    def _group(selection: "_Selection", group_by: Sequence[str],
+               extra: Optional[np.ndarray] = None) -> Tuple[List[Tuple[int, ...]], np.ndarray]:
+        """
+        マスクされた行を (extra,) + group_by の符号の組で数える
+        各符号を混合基数で1つの int64 キーにまとめ、bincount / 1次元 unique で集計する
+        """
+        columns = selection.columns
+        selected = [selection.codes(name).astype(np.int64) for name in group_by]
+        radixes = [len(columns.values[name]) or 1 for name in group_by]
+        if extra is not None:
+            base = int(extra.min()) if len(extra) else 0
+            selected.insert(0, extra - base)
+            radixes.insert(0, int(extra.max()) - base + 1 if len(extra) else 1)
+        else:
+            base = 0
+        key = np.zeros(selection.count(), dtype=np.int64)
+        for codes, radix in zip(selected, radixes):
+            key = key * radix + codes
+        space = int(np.prod(radixes, dtype=np.float64))
+        if space <= max(1 << 20, 4 * len(key)):
+            counts = np.bincount(key, minlength=space)
+            unique_keys = np.flatnonzero(counts)
+            counts = counts[unique_keys]
+        else:
+            unique_keys, counts = np.unique(key, return_counts=True)
+        decoded = []
+        for value in unique_keys.tolist():
+            parts = []
+            for radix in reversed(radixes):
+                value, part = divmod(value, radix)
+                parts.append(part)
+            parts.reverse()
+            if extra is not None:
+                parts[0] += base
+            decoded.append(tuple(parts))
+        return decoded, counts
+
+    def _count_sql(self, group_by, dimensions, start, end) -> List[Dict[str, Any]]:
+        where, params = self._sql_where(dimensions, start, end)
+        columns = [DIMENSIONS[name] for name in group_by]
+        select = ", ".join(columns + ["COUNT(*)"])
+        sql = f"SELECT {select} FROM events{where}"
+        if columns:
+            sql += f" GROUP BY {', '.join(columns)}"
+        return [dict(zip(group_by + ["count"], row)) for row in self._conn.execute(sql, params) if row[-1]]
+
+    def top_n(self, field: str, n: int = 10, filters: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """field の値ごとの件数上位 n 件"""
+        return self.count_by([field], filters, limit=n)
+
+    def histogram(self, interval: Any = "hour", filters: Optional[Dict[str, Any]] = None,
+                  group_by: Optional[str] = None, utc_offset_hours: float = 0) -> Dict[str, Any]:
+        """
+        発生日時の時系列ヒストグラム
+        Args:
+            interval: minute / 5m / 15m / hour / 6h / day / week、または秒数
+            group_by: 系列を分ける項目（例: priority）
+            utc_offset_hours: バケット境界のタイムゾーン（例: JSTは9）
+        """
+        text = str(interval)
+        seconds = int(text) if text.isdigit() else INTERVALS.get(text)
+        if not seconds:
+            raise ValueError(f"未対応の interval です: {interval}（{', '.join(INTERVALS)} または秒数）")
+        fields = [group_by] if group_by else []
+        self._check_fields(fields)
+        dimensions, start, end = self._split_filters(filters)
+        bucket_ms = seconds * 1000
+        offset_ms = int(utc_offset_hours * 3600 * 1000)
+        started = time.perf_counter()
+        with self._lock:
+            if self._columnar(fields, dimensions):
+                columns = self._column_index()
+                selection = columns.select(dimensions, start, end)
+                buckets = (selection.times() + offset_ms) // bucket_ms
+                keys, counts = self._group(selection, fields, extra=buckets)
+                rows = [
+                    (key[0] * bucket_ms - offset_ms, columns.values[group_by][key[1]] if group_by else None, int(count))
+                    for key, count in zip(keys, counts)
+                ]
+                source = "columnar"
+            else:
+                where, params = self._sql_where(dimensions, start, end)
+                bucket = f"((generation_date + {offset_ms}) / {bucket_ms}) * {bucket_ms} - {offset_ms}"
+                series = f", {DIMENSIONS[group_by]}" if group_by else ", NULL"
+                rows = self._conn.execute(
+                    f"SELECT {bucket} AS b{series}, COUNT(*) FROM events{where} GROUP BY 1, 2 ORDER BY 1", params
+                ).fetchall()
+                source = "sqlite"
+        buckets = [
+            {"time": _iso(b), **({group_by: series} if group_by else {}), "count": count}
+            for b, series, count in sorted(rows, key=lambda r: r[0])
+        ]
+        return {
+            "interval": seconds,
+            "buckets": buckets,
+            "total": sum(b["count"] for b in buckets),
+            "source": source,
+            "elapsedMs": round((time.perf_counter() - started) * 1000, 3),
+        }
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            count, first, last = self._conn.execute(
+                "SELECT COUNT(*), MIN(generation_date), MAX(generation_date) FROM events"
+            ).fetchone()
+        return {
+            "path": self.path,
+            "events": count,
+            "columnarLoaded": self._columns is not None,
+            "maxAgeDays": self.max_age_days or None,
+            "maxRows": self.max_rows or None,
+            "firstGenerationDate": _iso(first) if first is not None else None,
+            "lastGenerationDate": _iso(last) if last is not None else None,
+        }
@@ -0,0 +1,120 @@
+"""
+イベント一覧の要約
+イベントを1件ずつ受け取って件数を集計し、件数に関係なく一定サイズの要約を返す。
+"""
+from collections import Counter
+from typing import Any, Dict, Optional, Set, Tuple
+
+from client.event_pager import parse_event_date
+
+# Hinemos の重要度（数値表現は 0:危険 1:不明 2:警告 3:通知）
+PRIORITY_NAMES = {0: "CRITICAL", 1: "UNKNOWN", 2: "WARNING", 3: "INFO"}
+PRIORITY_RANK = {"CRITICAL": 0, "UNKNOWN": 1, "WARNING": 2, "INFO": 3}
+
+# サンプルとして返すイベントの項目
+SAMPLE_FIELDS = ("priority", "facilityId", "facilityName", "monitorId", "monitorDetailId", "pluginId",
+                 "generationDate", "outputDate", "message", "confirmType")
+MESSAGE_LIMIT = 200
+
+
+def priority_name(value: Any) -> str:
+    if isinstance(value, int):
+        return PRIORITY_NAMES.get(value, str(value))
+    return str(value) if value is not None else "UNKNOWN"
+
+
+class EventSummarizer:
+    """
+    イベントの要約を逐次集計する
+    Args:
+        top_n: 件数内訳・ノイズの多い監視として返す上位件数
+        samples: 代表イベントの件数（重要度の高い監視から1件ずつ）
+    """
+
+    def __init__(self, top_n: int = 10, samples: int = 5):
+        self.top_n = top_n
+        self.samples = samples
+        self.count = 0
+        self.by_priority: Counter = Counter()
+        self.by_facility: Counter = Counter()
+        self.by_monitor: Counter = Counter()
+        self.facility_names: Dict[str, str] = {}
+        self.monitor_facilities: Dict[str, Set[str]] = {}
+        self.monitor_last_seen: Dict[str, Tuple[float, str]] = {}
+        self.first_seen: Optional[Tuple[Any, str]] = None
+        self.last_seen: Optional[Tuple[Any, str]] = None
+        # 監視ID → (重要度順位, -発生時刻) が最小のイベント（最も重要で新しいもの）
+        self._representatives: Dict[str, Tuple[Tuple[int, float], Dict[str, Any]]] = {}
+
+    def add(self, event: Dict[str, Any]) -> None:
+        self.count += 1
+        priority = priority_name(event.get("priority"))
+        facility = event.get("facilityId") or ""
+        monitor = event.get("monitorId") or ""
+        self.by_priority[priority] += 1
+        self.by_facility[facility] += 1
+        self.by_monitor[monitor] += 1
+        if event.get("facilityName"):
+            self.facility_names.setdefault(facility, event["facilityName"])
+        self.monitor_facilities.setdefault(monitor, set()).add(facility)
+
+        stamp_text = event.get("generationDate") or event.get("outputDate")
+        stamp = parse_event_date(stamp_text).timestamp() if stamp_text else 0.0
+        if stamp_text:
+            if self.first_seen is None or stamp < self.first_seen[0]:
+                self.first_seen = (stamp, stamp_text)
+            if self.last_seen is None or stamp > self.last_seen[0]:
+                self.last_seen = (stamp, stamp_text)
+            if monitor not in self.monitor_last_seen or stamp > self.monitor_last_seen[monitor][0]:
+                self.monitor_last_seen[monitor] = (stamp, stamp_text)
+
+        rank = (PRIORITY_RANK.get(priority, len(PRIORITY_RANK)), -stamp)
+        current = self._representatives.get(monitor)
+        if current is None or rank < current[0]:
+            self._representatives[monitor] = (rank, event)
+
+    @staticmethod
+    def _top(counter: Counter, n: int, key: str) -> Dict[str, Any]:
+        top = counter.most_common(n)
+        return {
+            "top": [{key: value, "count": count} for value, count in top],
+            "distinct": len(counter),
+            "others": sum(counter.values()) - sum(count for _, count in top),
+        }
+
+    @staticmethod
+    def _sample(event: Dict[str, Any]) -> Dict[str, Any]:
+        sample = {field: event.get(field) for field in SAMPLE_FIELDS if event.get(field) not in (None, "")}
+        message = sample.get("message")
+        if isinstance(message, str) and len(message) > MESSAGE_LIMIT:
+            sample["message"] = message[:MESSAGE_LIMIT] + "…"
+        if "priority" in sample:
+            sample["priority"] = priority_name(sample["priority"])
+        return sample
+
+    def result(self) -> Dict[str, Any]:
+        facilities = self._top(self.by_facility, self.top_n, "facilityId")
+        for row in facilities["top"]:
+            if row["facilityId"] in self.facility_names:
+                row["facilityName"] = self.facility_names[row["facilityId"]]
+        # ノイズの多い監視: 件数上位の監視ごとの影響ファシリティ数・最悪重要度・最終発生
+        noisy = [
+            {
+                "monitorId": monitor,
+                "count": count,
+                "facilities": len(self.monitor_facilities.get(monitor, ())),
+                "worstPriority": priority_name(self._representatives[monitor][1].get("priority")),
+                "lastSeen": self.monitor_last_seen[monitor][1] if monitor in self.monitor_last_seen else None,
+            }
+            for monitor, count in self.by_monitor.most_common(self.top_n)
+        ]
+        representatives = sorted(self._representatives.values(), key=lambda item: item[0])[:self.samples]
+        return {
+            "total": self.count,
+            "firstSeen": self.first_seen[1] if self.first_seen else None,
+            "lastSeen": self.last_seen[1] if self.last_seen else None,
+            "byPriority": dict(sorted(self.by_priority.items(), key=lambda kv: PRIORITY_RANK.get(kv[0], len(PRIORITY_RANK)))),
+            "byFacility": facilities,
+            "byMonitor": {"distinct": len(self.by_monitor), "noisyMonitors": noisy},
+            "samples": [self._sample(event) for _, event in representatives],
+        }
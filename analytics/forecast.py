@@ -0,0 +1,190 @@
+"""
+収集データ（性能値）の容量予測
+全系列を共通の等間隔バケットに平均して (系列数 × バケット数) の行列に揃え、同じ計画行列に対する重み付き最小二乗
+（欠測バケットは重み 0）を正規方程式のバッチ解法でまとめて解く。
+    linear:   値 = a + b·t
+    seasonal: linear に日周期（1・2次の調和項）と、期間が2週間以上あれば週周期（1次）の項を加える
+    auto:     系列ごとに BIC の小さい方を選ぶ
+トレンドに季節変動の山（seasonal の場合）を加えた値が閾値に達するまでの日数で順位付けする。
+"""
+import time
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from client.collect_fetch import CollectSeries, format_collect_time
+
+FORECAST_MODELS = ("linear", "seasonal", "auto")
+
+_DAY_MS = 86400000
+# 1系列あたりに必要な値のあるバケット数（係数の数に加えて最低限確保する数）
+_MIN_EXTRA_BUCKETS = 4
+# 正規方程式の特異化を避けるための正則化
+_RIDGE = 1e-9
+
+
+def bucket_matrix(series: Sequence[CollectSeries], bucket_ms: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    全系列を共通の等間隔バケットの平均値に揃える
+    Returns:
+        (バケット中心時刻(int64 ms), 平均値の行列 (系列数 × バケット数、値のないバケットは NaN), 系列ごとの最終時刻)
+    """
+    lengths = np.array([len(s) for s in series], dtype=np.int64)
+    last_times = np.array([int(s.times[-1]) if len(s) else -1 for s in series], dtype=np.int64)
+    if not lengths.sum():
+        return np.empty(0, dtype=np.int64), np.full((len(series), 0), np.nan), last_times
+    times = np.concatenate([s.times for s in series])
+    values = np.concatenate([s.values for s in series])
+    rows = np.repeat(np.arange(len(series)), lengths)
+    finite = np.isfinite(values)
+    times, values, rows = times[finite], values[finite], rows[finite]
+    start = int(times.min()) - int(times.min()) % bucket_ms
+    buckets = int((int(times.max()) - start) // bucket_ms) + 1
+    index = rows * buckets + (times - start) // bucket_ms
+    size = len(series) * buckets
+    sums = np.bincount(index, weights=values, minlength=size).reshape(len(series), buckets)
+    counts = np.bincount(index, minlength=size).reshape(len(series), buckets)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        matrix = sums / counts
+    centers = start + np.arange(buckets, dtype=np.int64) * bucket_ms + bucket_ms // 2
+    return centers, matrix, last_times
+
+
+def design_matrix(days: np.ndarray, seasonal: bool, weekly: bool) -> np.ndarray:
+    """計画行列（t は日単位）。seasonal の場合は日周期の1・2次、weekly の場合は週周期の1次の調和項を加える"""
+    columns = [np.ones_like(days), days]
+    if seasonal:
+        for harmonic in (1, 2):
+            angle = 2 * np.pi * harmonic * days
+            columns += [np.sin(angle), np.cos(angle)]
+        if weekly:
+            angle = 2 * np.pi * days / 7
+            columns += [np.sin(angle), np.cos(angle)]
+    return np.stack(columns, axis=1)
+
+
+def fit_batch(matrix: np.ndarray, design: np.ndarray) -> Dict[str, np.ndarray]:
+    """
+    行ごとの重み付き最小二乗（NaN は重み 0）を正規方程式 (XᵀWX)β = XᵀWy のバッチで解く
+    Returns:
+        {"coef" (系列数 × 係数), "rss", "tss", "n"}
+    """
+    weights = np.isfinite(matrix).astype(np.float64)
+    observed = np.where(weights > 0, matrix, 0.0)
+    gram = np.einsum("sb,bi,bj->sij", weights, design, design, optimize=True)
+    gram += _RIDGE * np.eye(design.shape[1])
+    moment = (observed * weights) @ design
+    coef = np.linalg.solve(gram, moment[..., None])[..., 0]
+    residual = (observed - coef @ design.T) * weights
+    n = weights.sum(axis=1)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mean = observed.sum(axis=1) / n
+    tss = (((observed - mean[:, None]) * weights) ** 2).sum(axis=1)
+    return {"coef": coef, "rss": (residual ** 2).sum(axis=1), "tss": tss, "n": n}
+
+
+def _bic(fit: Dict[str, np.ndarray], parameters: int) -> np.ndarray:
+    n = np.maximum(fit["n"], 1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return n * np.log(np.maximum(fit["rss"], 1e-12) / n) + parameters * np.log(n)
+
+
+def _seasonal_peak(coef: np.ndarray, seasonal_columns: slice, weekly: bool, direction: str) -> np.ndarray:
+    """季節項の1周期内の最大値（direction="below" の場合は最小値）"""
+    grid = np.linspace(0, 7 if weekly else 1, 7 * 96 if weekly else 96, endpoint=False)
+    terms = design_matrix(grid, True, weekly)[:, seasonal_columns]
+    curve = coef[:, seasonal_columns] @ terms.T
+    return curve.max(axis=1) if direction == "above" else curve.min(axis=1)
+
+
+def forecast_series(series: Sequence[CollectSeries], threshold: float, direction: str = "above",
+                    horizon_days: float = 30.0, model: str = "auto", bucket_minutes: float = 60.0,
+                    top_n: int = 20) -> Dict[str, Any]:
+    """
+    系列ごとにトレンド（と季節変動）を当てはめ、閾値に達するまでの日数が短い順に返す
+    Args:
+        threshold: 容量の閾値（使用率 90 など）
+        direction: above は増加して閾値を超える、below は減少して閾値を下回る（空き容量など）までを予測する
+        horizon_days: この日数以内に達する系列を「到達見込み」とする
+        bucket_minutes: 当てはめに使うバケット幅（分）
+    Returns:
+        {"analyzed", "insufficientData", "breaching", "alreadyBreached", "horizonDays", "threshold", "direction",
+         "series": [...horizon_days 以内に達する系列の上位 top_n 件], "truncated", "elapsedSeconds"}
+    """
+    if model not in FORECAST_MODELS:
+        raise ValueError(f"model は {', '.join(FORECAST_MODELS)} のいずれかです: {model}")
+    if direction not in ("above", "below"):
+        raise ValueError(f"direction は above / below のいずれかです: {direction}")
+    started = time.monotonic()
+    bucket_ms = max(60000, int(bucket_minutes * 60000))
+    centers, matrix, last_times = bucket_matrix(series, bucket_ms)
+    span_days = (centers[-1] - centers[0]) / _DAY_MS if len(centers) else 0.0
+    weekly = span_days >= 14
+    # t は最後のバケットの中心を 0 とする日数（係数 a がその時点の水準、日数もその時点から数える）
+    days = (centers - centers[-1]) / _DAY_MS if len(centers) else np.empty(0)
+
+    linear_design = design_matrix(days, False, False)
+    seasonal_design = design_matrix(days, True, weekly)
+    use_seasonal = np.zeros(len(series), dtype=bool)
+    linear = fit_batch(matrix, linear_design)
+    coef = np.zeros((len(series), seasonal_design.shape[1]))
+    coef[:, :2] = linear["coef"]
+    rss, tss, n = linear["rss"], linear["tss"], linear["n"]
+    if model != "linear":
+        seasonal = fit_batch(matrix, seasonal_design)
+        enough = seasonal["n"] >= seasonal_design.shape[1] + _MIN_EXTRA_BUCKETS
+        if model == "seasonal":
+            use_seasonal = enough
+        else:
+            use_seasonal = enough & (_bic(seasonal, seasonal_design.shape[1]) < _bic(linear, 2))
+        coef = np.where(use_seasonal[:, None], seasonal["coef"], coef)
+        rss = np.where(use_seasonal, seasonal["rss"], rss)
+
+    valid = n >= 2 + _MIN_EXTRA_BUCKETS
+    level, slope = coef[:, 0], coef[:, 1]
+    peak = np.where(use_seasonal, _seasonal_peak(coef, slice(2, None), weekly, direction), 0.0)
+    sign = 1.0 if direction == "above" else -1.0
+    # 閾値までの残り（トレンド + 季節変動の山 が閾値に達するまで）
+    remaining = sign * (threshold - level - peak)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        days_to = np.where(remaining <= 0, 0.0, np.where(sign * slope > 0, remaining / (sign * slope), np.inf))
+        r2 = np.where(tss > 0, 1 - rss / tss, np.nan)
+    days_to = np.where(valid, days_to, np.inf)
+    end = int(centers[-1]) if len(centers) else 0
+
+    order = np.argsort(days_to, kind="stable")
+    ranked: List[Dict[str, Any]] = []
+    for row in order[:max(0, top_n)]:
+        if not np.isfinite(days_to[row]) or days_to[row] > horizon_days:
+            break
+        ranked.append({
+            "collectId": series[row].collect_id,
+            "model": "seasonal" if use_seasonal[row] else "linear",
+            "daysToThreshold": round(float(days_to[row]), 2),
+            "thresholdTime": format_collect_time(int(end + days_to[row] * _DAY_MS)),
+            "lastTime": format_collect_time(int(last_times[row])),
+            "level": _round(level[row]),
+            "slopePerDay": _round(slope[row]),
+            "seasonalPeak": _round(peak[row]) if use_seasonal[row] else None,
+            f"forecastIn{horizon_days:g}Days": _round(level[row] + slope[row] * horizon_days + peak[row]),
+            "r2": _round(r2[row], 3),
+            "buckets": int(n[row]),
+        })
+    breaching = int(np.sum(np.isfinite(days_to) & (days_to <= horizon_days)))
+    return {
+        "analyzed": len(series),
+        "insufficientData": int(np.sum(~valid)),
+        "breaching": breaching,
+        "alreadyBreached": int(np.sum(valid & (remaining <= 0))),
+        "horizonDays": horizon_days,
+        "threshold": threshold,
+        "direction": direction,
+        "series": ranked,
+        "truncated": breaching > len(ranked),
+        "elapsedSeconds": round(time.monotonic() - started, 3),
+    }
+
+
+def _round(value: float, digits: int = 4) -> Optional[float]:
+    value = float(value)
+    return round(value, digits) if np.isfinite(value) else None
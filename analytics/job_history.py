@@ -0,0 +1,334 @@
+"""
+ジョブ実行履歴のローカルストア
+history_search の結果を SQLite に永続化し（sessionId / jobunitId / jobId を主キー、ジョブ×開始日時・開始日時・ジョブ×所要時間に索引）、
+ジョブごとの所要時間のパーセンタイル・失敗率・遅い実行の上位をローカルで集計する。
+パーセンタイルは (ジョブ, 所要時間) の索引順に所要時間の列を一度だけ読み、ジョブごとの順位位置を直接参照して求める。
+"""
+import os
+import time
+import sqlite3
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from client.event_pager import parse_event_date
+from .event_store import INTERVALS, _iso
+
+# フィルタに使える項目（APIの項目名 → 列名）
+DIMENSIONS = {
+    "jobunitId": "jobunit_id",
+    "jobId": "job_id",
+    "sessionId": "session_id",
+    "facilityId": "facility_id",
+    "ownerRoleId": "owner_role_id",
+    "triggerType": "trigger_type",
+    "status": "status",
+    "endStatus": "end_status",
+}
+DEFAULT_PERCENTILES = (50, 95)
+SORT_KEYS = ("p50", "p95", "max", "avg", "runs", "failureRate")
+
+# 終了状態のコード（EndStatusConstant）→ 名前
+_END_STATUS_NAMES = {0: "NORMAL", 1: "WARNING", 2: "ABNORMAL"}
+
+_RUN_COLUMNS = (
+    "session_id", "jobunit_id", "job_id", "job_name", "job_type", "facility_id", "owner_role_id",
+    "trigger_type", "trigger_info", "status", "end_status", "end_value",
+    "schedule_date", "start_date", "end_date", "duration_ms",
+)
+_KEY_COLUMNS = "session_id, jobunit_id, job_id"
+
+_SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS job_runs (
+    session_id TEXT NOT NULL,
+    jobunit_id TEXT NOT NULL,
+    job_id TEXT NOT NULL,
+    job_name TEXT,
+    job_type TEXT,
+    facility_id TEXT,
+    owner_role_id TEXT,
+    trigger_type TEXT,
+    trigger_info TEXT,
+    status TEXT,
+    end_status TEXT,
+    end_value INTEGER,
+    schedule_date INTEGER,
+    start_date INTEGER,
+    end_date INTEGER,
+    duration_ms INTEGER,
+    PRIMARY KEY ({_KEY_COLUMNS})
+);
+CREATE INDEX IF NOT EXISTS idx_job_runs_job ON job_runs (jobunit_id, job_id, start_date);
+CREATE INDEX IF NOT EXISTS idx_job_runs_start ON job_runs (start_date);
+CREATE INDEX IF NOT EXISTS idx_job_runs_duration ON job_runs (jobunit_id, job_id, duration_ms);
+"""
+
+
+def _millis(value: Any) -> Optional[int]:
+    if value is None or value == "":
+        return None
+    if isinstance(value, (int, float)):
+        return int(value)
+    # yyyy/MM/dd 形式の日時も受け付ける
+    return int(parse_event_date(str(value).replace("/", "-")).timestamp() * 1000)
+
+
+def _text(value: Any) -> Optional[str]:
+    return None if value is None else str(value)
+
+
+def _end_status(value: Any) -> Optional[str]:
+    if value is None or value == "":
+        return None
+    if isinstance(value, int) or str(value).isdigit():
+        return _END_STATUS_NAMES.get(int(value), str(value))
+    return str(value).upper()
+
+
+def _run_row(run: Dict[str, Any]) -> Optional[Tuple]:
+    if not run.get("sessionId") or not run.get("jobId"):
+        return None
+    start_date = _millis(run.get("startDate"))
+    end_date = _millis(run.get("endDate"))
+    duration = end_date - start_date if start_date is not None and end_date is not None else None
+    return (
+        run["sessionId"], run.get("jobunitId") or "", run["jobId"], run.get("jobName"), _text(run.get("jobType")),
+        run.get("facilityId"), run.get("ownerRoleId"), _text(run.get("jobTriggerType", run.get("triggerType"))),
+        run.get("triggerInfo"), _text(run.get("status")), _end_status(run.get("endStatus")), run.get("endValue"),
+        _millis(run.get("scheduleDate")), start_date, end_date, duration,
+    )
+
+
+class JobHistoryStore:
+    """
+    ジョブ実行履歴の組込みストア
+    Args:
+        path: SQLiteファイルのパス（HINEMOS_JOB_HISTORY_STORE、既定: ./hinemos_job_history.db）。":memory:" も可
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path or os.getenv("HINEMOS_JOB_HISTORY_STORE", "hinemos_job_history.db")
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    # --- 取り込み ---
+    def ingest(self, runs: Iterable[Dict[str, Any]]) -> Dict[str, int]:
+        """
+        ジョブ履歴を取り込む（既存の実行は状態・終了日時などを更新）
+        Returns:
+            {"added": 新規に追加した実行数, "updated": 更新した実行数}
+        """
+        rows = [row for row in map(_run_row, runs) if row is not None]
+        if not rows:
+            return {"added": 0, "updated": 0}
+        placeholders = ", ".join("?" * len(_RUN_COLUMNS))
+        updates = ", ".join(f"{column} = excluded.{column}" for column in _RUN_COLUMNS[3:])
+        with self._lock, self._conn:
+            before = self._conn.execute("SELECT COUNT(*) FROM job_runs").fetchone()[0]
+            self._conn.executemany(f"""
+                INSERT INTO job_runs VALUES ({placeholders})
+                ON CONFLICT ({_KEY_COLUMNS}) DO UPDATE SET {updates}
+            """, rows)
+            added = self._conn.execute("SELECT COUNT(*) FROM job_runs").fetchone()[0] - before
+        return {"added": added, "updated": len(rows) - added}
+
+    # --- 検索条件 ---
+    @staticmethod
+    def _sql_where(filters: Optional[Dict[str, Any]], extra: Sequence[str] = ()) -> Tuple[str, List[Any]]:
+        """
+        filters を WHERE 句に変換する（値がリストならいずれか一致、"*"を含む文字列はワイルドカード、
+        from / to は開始日時（toは含まない））
+        """
+        clauses: List[str] = list(extra)
+        params: List[Any] = []
+        for name, value in (filters or {}).items():
+            if name in ("from", "to") or value is None or value == "" or value == []:
+                continue
+            if name not in DIMENSIONS:
+                raise ValueError(f"未対応のフィルタ項目です: {name}（{', '.join(DIMENSIONS)}, from, to）")
+            column = DIMENSIONS[name]
+            if name == "endStatus":
+                value = [_end_status(v) for v in value] if isinstance(value, (list, tuple)) else _end_status(value)
+            if isinstance(value, (list, tuple)):
+                clauses.append(f"{column} IN ({', '.join('?' * len(value))})")
+                params.extend(str(v) for v in value)
+            elif isinstance(value, str) and "*" in value:
+                clauses.append(f"{column} GLOB ?")
+                params.append(value)
+            else:
+                clauses.append(f"{column} = ?")
+                params.append(str(value))
+        for name, operator in (("from", ">="), ("to", "<")):
+            if (filters or {}).get(name):
+                clauses.append(f"start_date {operator} ?")
+                params.append(_millis((filters or {})[name]))
+        return (" WHERE " + " AND ".join(clauses)) if clauses else "", params
+
+    @staticmethod
+    def _bucket(interval: Any, utc_offset_hours: float) -> Optional[str]:
+        """開始日時を interval 単位に切り捨てる SQL 式（interval が None なら None）"""
+        if not interval:
+            return None
+        text = str(interval)
+        seconds = int(text) if text.isdigit() else INTERVALS.get(text)
+        if not seconds:
+            raise ValueError(f"未対応の interval です: {interval}（{', '.join(INTERVALS)} または秒数）")
+        bucket_ms = seconds * 1000
+        offset_ms = int(utc_offset_hours * 3600 * 1000)
+        return f"((start_date + {offset_ms}) / {bucket_ms}) * {bucket_ms} - {offset_ms}"
+
+    # --- 集計 ---
+    def duration_stats(self, filters: Optional[Dict[str, Any]] = None,
+                       percentiles: Optional[Sequence[float]] = None, sort_by: str = "p95",
+                       limit: Optional[int] = None, interval: Any = None,
+                       utc_offset_hours: float = 0) -> Dict[str, Any]:
+        """
+        ジョブ（interval 指定時はジョブ × 期間）ごとの実行回数・所要時間のパーセンタイル/最大/平均・失敗率
+        所要時間は開始・終了日時の揃った実行のみ、失敗率は終了状態のある実行に占める ABNORMAL の割合
+        Args:
+            percentiles: 求めるパーセンタイル（既定: 50, 95）
+            sort_by: 並び順（p50, p95 など求めたパーセンタイル, max, avg, runs, failureRate。いずれも降順）
+            interval: 期間ごとの推移を出す場合の単位（day, week など、または秒数）
+        """
+        percentiles = list(percentiles or DEFAULT_PERCENTILES)
+        bucket = self._bucket(interval, utc_offset_hours)
+        sort_keys = SORT_KEYS + tuple(f"p{q:g}" for q in percentiles)
+        if sort_by not in sort_keys:
+            raise ValueError(f"sort_by は {', '.join(dict.fromkeys(sort_keys))} のいずれかです: {sort_by}")
+        started = time.perf_counter()
+        group = ["jobunit_id", "job_id"] + ([bucket] if bucket else [])
+        group_sql = ", ".join(group)
+        where, params = self._sql_where(filters)
+        duration_where, duration_params = self._sql_where(filters, ["duration_ms IS NOT NULL"])
+        with self._lock:
+            groups = self._conn.execute(f"""
+                SELECT {group_sql}, MAX(job_name), COUNT(*), COUNT(duration_ms), MAX(duration_ms), AVG(duration_ms),
+                       COUNT(end_status), SUM(end_status = 'ABNORMAL'), SUM(end_status = 'WARNING'),
+                       MIN(start_date), MAX(start_date)
+                FROM job_runs{where} GROUP BY {group_sql} ORDER BY {group_sql}
+            """, params).fetchall()
+            # 集計と同じグループ順・グループ内は所要時間の昇順で、所要時間の列だけを読む
+            cursor = self._conn.execute(
+                f"SELECT duration_ms FROM job_runs{duration_where} ORDER BY {group_sql}, duration_ms", duration_params)
+            durations = np.fromiter((row[0] for row in cursor), dtype=np.float64)
+        width = len(group)
+        measured = np.array([row[width + 2] for row in groups], dtype=np.int64)
+        values = self._group_percentiles(durations, measured, percentiles)
+
+        rows = []
+        for index, row in enumerate(groups):
+            finished, abnormal, warning = row[width + 5], row[width + 6] or 0, row[width + 7] or 0
+            item = {"jobunitId": row[0], "jobId": row[1]}
+            if bucket:
+                item["period"] = _iso(row[2]) if row[2] is not None else None
+            item.update({
+                "jobName": row[width],
+                "runs": row[width + 1],
+                "measured": row[width + 2],
+                **{f"p{q:g}": _seconds(values[q][index]) for q in percentiles},
+                "max": _seconds(row[width + 3]),
+                "avg": _seconds(row[width + 4]),
+                "failureRate": round(abnormal / finished, 4) if finished else None,
+                "warningRate": round(warning / finished, 4) if finished else None,
+                "failures": abnormal,
+                "firstStart": _iso(row[width + 8]) if row[width + 8] is not None else None,
+                "lastStart": _iso(row[width + 9]) if row[width + 9] is not None else None,
+            })
+            rows.append(item)
+        if not bucket:
+            rows.sort(key=lambda r: (r[sort_by] is not None, r[sort_by] or 0), reverse=True)
+        total = len(rows)
+        if limit:
+            rows = rows[:int(limit)]
+        return {
+            "unit": "seconds",
+            "interval": interval,
+            "rows": rows,
+            "groups": total,
+            "runs": int(sum(row[width + 1] for row in groups)),
+            "elapsedMs": round((time.perf_counter() - started) * 1000, 3),
+        }
+
+    @staticmethod
+    def _group_percentiles(durations: np.ndarray, counts: np.ndarray,
+                           percentiles: Sequence[float]) -> Dict[float, np.ndarray]:
+        """グループ順・グループ内昇順に並んだ durations から、グループごとのパーセンタイル（線形補間）を求める"""
+        starts = np.concatenate(([0], np.cumsum(counts)[:-1])) if len(counts) else np.empty(0, dtype=np.int64)
+        last = np.maximum(starts + counts - 1, starts)
+        result = {}
+        for q in percentiles:
+            position = starts + (float(q) / 100.0) * np.maximum(counts - 1, 0)
+            lower = np.floor(position).astype(np.int64)
+            upper = np.minimum(lower + 1, last)
+            fraction = position - lower
+            if len(durations):
+                low, high = durations[np.minimum(lower, len(durations) - 1)], durations[np.minimum(upper, len(durations) - 1)]
+                value = low + (high - low) * fraction
+            else:
+                value = np.zeros(len(counts))
+            result[q] = np.where(counts > 0, value, np.nan)
+        return result
+
+    def slowest_runs(self, filters: Optional[Dict[str, Any]] = None, n: int = 10,
+                     per_job: bool = False) -> Dict[str, Any]:
+        """
+        所要時間の長い実行の上位 n 件（per_job の場合はジョブごとに上位 n 件）
+        """
+        started = time.perf_counter()
+        where, params = self._sql_where(filters, ["duration_ms IS NOT NULL"])
+        columns = ("session_id, jobunit_id, job_id, job_name, status, end_status, end_value, "
+                   "start_date, end_date, duration_ms")
+        if per_job:
+            sql = f"""
+                SELECT {columns} FROM (
+                    SELECT {columns}, ROW_NUMBER() OVER (
+                        PARTITION BY jobunit_id, job_id ORDER BY duration_ms DESC) AS rank
+                    FROM job_runs{where}
+                ) WHERE rank <= ? ORDER BY jobunit_id, job_id, duration_ms DESC
+            """
+        else:
+            sql = f"SELECT {columns} FROM job_runs{where} ORDER BY duration_ms DESC LIMIT ?"
+        with self._lock:
+            records = self._conn.execute(sql, params + [max(1, int(n))]).fetchall()
+        runs = [{
+            "sessionId": session_id, "jobunitId": jobunit_id, "jobId": job_id, "jobName": job_name,
+            "status": status, "endStatus": end_status, "endValue": end_value,
+            "startDate": _iso(start_date), "endDate": _iso(end_date), "duration": _seconds(duration),
+        } for (session_id, jobunit_id, job_id, job_name, status, end_status, end_value,
+               start_date, end_date, duration) in records]
+        return {
+            "unit": "seconds",
+            "perJob": per_job,
+            "runs": runs,
+            "elapsedMs": round((time.perf_counter() - started) * 1000, 3),
+        }
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            count, jobs, first, last = self._conn.execute(
+                "SELECT COUNT(*), COUNT(DISTINCT jobunit_id || char(0) || job_id), MIN(start_date), MAX(start_date) "
+                "FROM job_runs"
+            ).fetchone()
+        return {
+            "path": self.path,
+            "runs": count,
+            "jobs": jobs,
+            "firstStartDate": _iso(first) if first is not None else None,
+            "lastStartDate": _iso(last) if last is not None else None,
+        }
+
+
+def _seconds(millis: Any) -> Optional[float]:
+    if millis is None:
+        return None
+    value = float(millis)
+    return round(value / 1000, 3) if np.isfinite(value) else None
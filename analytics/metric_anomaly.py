@@ -0,0 +1,241 @@
+"""
+収集データ（性能値）の異常検知・閾値超過の集計
+収集IDごとの時系列を NaN 埋めの2次元配列に詰め、一定数の系列ずつまとめてベクトル演算で処理する。
+    移動平均・移動標準偏差: 直前 window 点（現在の点を含まない）から累積和で求める
+    z スコア: (値 - 移動平均) / 移動標準偏差
+    パーセンタイル: 行ごとに並べ替えて順位位置を直接参照する
+    閾値超過: 超過していた時間の合計と最長連続時間
+"""
+import time
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from client.collect_fetch import CollectSeries, format_collect_time
+
+RANK_KEYS = {"zscore": "maxAbsZ", "anomalies": "anomalyPoints", "breach": "breachSeconds"}
+DEFAULT_PERCENTILES = (50, 95, 99)
+
+# 一度に2次元配列へ詰める系列数（作業用配列のメモリを抑える）
+_BLOCK_SERIES = 128
+# 移動標準偏差の下限（系列全体の標準偏差に対する比）。変動のほとんどない区間で z スコアが発散しないようにする
+_STD_FLOOR_RATIO = 0.1
+# 閾値超過時間の計算で1点が代表する時間の上限（収集間隔の中央値に対する倍率）。欠測区間を超過扱いにしない
+_GAP_RATIO = 3.0
+_INTERVAL_SAMPLE = 1024
+
+
+def _stack(series: Sequence[CollectSeries]):
+    length = max(1, max(len(s) for s in series))
+    times = np.zeros((len(series), length), dtype=np.int64)
+    values = np.full((len(series), length), np.nan)
+    lengths = np.zeros(len(series), dtype=np.int64)
+    for row, item in enumerate(series):
+        count = len(item)
+        lengths[row] = count
+        if count:
+            times[row, :count] = item.times
+            times[row, count:] = item.times[-1]
+            values[row, :count] = item.values
+    return times, values, lengths
+
+
+def _row_percentiles(values: np.ndarray, counts: np.ndarray, percentiles: Sequence[float]) -> Dict[str, np.ndarray]:
+    ordered = np.sort(values, axis=1)  # NaN は末尾に並ぶ
+    last = np.maximum(counts - 1, 0)
+    result = {}
+    for q in percentiles:
+        position = (float(q) / 100.0) * last
+        lower = np.floor(position).astype(np.int64)
+        upper = np.minimum(lower + 1, last)
+        low = np.take_along_axis(ordered, lower[:, None], axis=1)[:, 0]
+        high = np.take_along_axis(ordered, upper[:, None], axis=1)[:, 0]
+        result[f"p{q:g}"] = np.where(counts > 0, low + (high - low) * (position - lower), np.nan)
+    return result
+
+
+def _trailing(values: np.ndarray, window: int) -> np.ndarray:
+    """各位置の直前 window 個の和（位置 i は [i - window, i) の和。累積和の差で求める）"""
+    rows, length = values.shape
+    cumulative = np.zeros((rows, length + 1))
+    np.cumsum(values, axis=1, out=cumulative[:, 1:])
+    result = np.empty((rows, length))
+    head = min(window, length)
+    result[:, :head] = cumulative[:, :head]
+    np.subtract(cumulative[:, window:length], cumulative[:, :length - window], out=result[:, head:])
+    return result
+
+
+def _rolling_z(values: np.ndarray, finite: np.ndarray, counts: np.ndarray, mean: np.ndarray,
+               window: int, min_periods: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    直前 window 点の平均・標準偏差による z スコア（点数が min_periods 未満の位置は NaN）と系列全体の標準偏差
+    累積和の桁落ちを避けるため、系列全体の平均 mean を引いてから計算する
+    """
+    centered = values - np.nan_to_num(mean)[:, None]
+    centered[~finite] = 0.0
+    squared = centered * centered
+    overall = np.sqrt(squared.sum(axis=1) / np.maximum(counts, 1))
+    n = _trailing(finite.astype(np.float64), window)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        rolling_mean = _trailing(centered, window)
+        rolling_mean /= n
+        variance = _trailing(squared, window)
+        variance /= n
+        variance -= rolling_mean * rolling_mean
+        np.maximum(variance, 0.0, out=variance)
+        std = np.sqrt(variance, out=variance)
+        np.maximum(std, (_STD_FLOOR_RATIO * overall)[:, None], out=std)
+        z = centered
+        z -= rolling_mean
+        z /= std
+    z[~finite | (n < min_periods) | (std == 0)] = np.nan
+    return z, np.where(counts > 0, overall, np.nan)
+
+
+def _breaches(times: np.ndarray, breach: np.ndarray, lengths: np.ndarray) -> Dict[str, np.ndarray]:
+    """閾値を超過していた時間の合計・最長連続時間（秒）とその開始時刻"""
+    rows, length = times.shape
+    step = np.diff(times, axis=1).astype(np.float64)
+    valid_step = np.arange(length - 1)[None, :] < (lengths - 1)[:, None]
+    masked = np.where(valid_step & (step > 0), step, np.nan)
+    # 収集間隔の中央値（先頭から最大 _INTERVAL_SAMPLE 個の間隔で求める。NaN を末尾に並べ、有効な個数の中央を参照する）
+    sample = masked[:, :_INTERVAL_SAMPLE]
+    valid = np.isfinite(sample).sum(axis=1)
+    median = np.zeros(rows)
+    if length > 1:
+        middle = np.take_along_axis(np.sort(sample, axis=1), (np.maximum(valid - 1, 0) // 2)[:, None], axis=1)[:, 0]
+        median = np.where(valid > 0, middle, 0.0)
+    # 各点はその次の点までの時間を代表する（末尾の点と欠測区間は収集間隔の中央値で打ち切る）
+    duration = np.concatenate((np.where(np.isfinite(masked), masked, median[:, None]), median[:, None]), axis=1)
+    duration = np.minimum(duration, (_GAP_RATIO * median)[:, None]) / 1000.0
+    duration = np.where(breach, duration, 0.0)
+    total = duration.sum(axis=1)
+
+    longest = np.zeros(rows)
+    longest_start = np.full(rows, -1, dtype=np.int64)
+    padded = np.zeros((rows, length + 2), dtype=np.int8)
+    padded[:, 1:-1] = breach
+    edges = np.diff(padded, axis=1)
+    starts = np.flatnonzero(edges == 1)
+    ends = np.flatnonzero(edges == -1)
+    if len(starts):
+        run_rows = starts // (length + 1)
+        start_cols, end_cols = starts % (length + 1), ends % (length + 1)
+        cumulative = np.concatenate((np.zeros((rows, 1)), np.cumsum(duration, axis=1)), axis=1)
+        run_seconds = cumulative[run_rows, end_cols] - cumulative[run_rows, start_cols]
+        # 行ごとの最長: 行番号・長さの順に並べて各行の最後を取る
+        order = np.lexsort((run_seconds, run_rows))
+        last = np.flatnonzero(np.append(run_rows[order][1:] != run_rows[order][:-1], True))
+        best = order[last]
+        longest[run_rows[best]] = run_seconds[best]
+        longest_start[run_rows[best]] = times[run_rows[best], start_cols[best]]
+    return {"total": total, "longest": longest, "longestStart": longest_start}
+
+
+def _round(value: float, digits: int = 4) -> Optional[float]:
+    value = float(value)
+    return round(value, digits) if np.isfinite(value) else None
+
+
+def analyze_series(series: Sequence[CollectSeries], window: int = 60, z_threshold: float = 5.0,
+                   threshold: Optional[float] = None, direction: str = "above",
+                   percentiles: Sequence[float] = DEFAULT_PERCENTILES,
+                   min_periods: Optional[int] = None) -> List[Dict[str, Any]]:
+    """
+    系列ごとの統計・z スコア・閾値超過を求める
+    Args:
+        window: 移動平均・移動標準偏差に使う直前の点数
+        z_threshold: |z| がこの値以上の点を異常点とみなす
+        threshold: 指定時は値がこれを超えた（direction="below" なら下回った）時間を集計する
+        min_periods: z スコアを求めるのに必要な直前の点数（既定: window の半分）
+    Returns:
+        系列ごとの {"collectId", "points", "mean", "std", "min", "max", "p..", "maxAbsZ", "maxZTime",
+        "anomalyPoints", "lastAnomalyTime", ("breachSeconds", "longestBreachSeconds", "longestBreachStart")}
+    """
+    if direction not in ("above", "below"):
+        raise ValueError(f"direction は above / below のいずれかです: {direction}")
+    window = max(2, int(window))
+    min_periods = max(2, int(min_periods or window // 2))
+    results: List[Dict[str, Any]] = []
+    for offset in range(0, len(series), _BLOCK_SERIES):
+        block = list(series[offset:offset + _BLOCK_SERIES])
+        times, values, lengths = _stack(block)
+        finite = np.isfinite(values)
+        counts = finite.sum(axis=1)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            mean = np.where(finite, values, 0.0).sum(axis=1) / counts
+        z, std = _rolling_z(values, finite, counts, mean, window, min_periods)
+        minimum = np.where(counts > 0, np.fmin.reduce(values, axis=1), np.nan)
+        maximum = np.where(counts > 0, np.fmax.reduce(values, axis=1), np.nan)
+        stats = _row_percentiles(values, counts, percentiles)
+
+        magnitude = np.where(np.isfinite(z), np.abs(z), -1.0)
+        peak = magnitude.argmax(axis=1)
+        peak_z = z[np.arange(len(block)), peak]
+        anomalous = magnitude >= z_threshold
+        anomaly_points = anomalous.sum(axis=1)
+        last_anomaly = values.shape[1] - 1 - np.argmax(anomalous[:, ::-1], axis=1)
+
+        breaches = None
+        if threshold is not None:
+            breach = finite & (values > threshold if direction == "above" else values < threshold)
+            breaches = _breaches(times, breach, lengths)
+
+        for row, item in enumerate(block):
+            result: Dict[str, Any] = {
+                "collectId": item.collect_id,
+                "points": int(counts[row]),
+                "mean": _round(mean[row]),
+                "std": _round(std[row]),
+                "min": _round(minimum[row]),
+                "max": _round(maximum[row]),
+            }
+            result.update({name: _round(column[row]) for name, column in stats.items()})
+            has_z = magnitude[row, peak[row]] >= 0
+            result.update({
+                "maxAbsZ": _round(abs(peak_z[row]), 2) if has_z else None,
+                "maxZ": _round(peak_z[row], 2) if has_z else None,
+                "maxZTime": format_collect_time(int(times[row, peak[row]])) if has_z else None,
+                "maxZValue": _round(values[row, peak[row]]) if has_z else None,
+                "anomalyPoints": int(anomaly_points[row]),
+                "lastAnomalyTime": format_collect_time(int(times[row, last_anomaly[row]])) if anomaly_points[row] else None,
+            })
+            if breaches is not None:
+                start = int(breaches["longestStart"][row])
+                result.update({
+                    "breachSeconds": _round(breaches["total"][row], 1),
+                    "longestBreachSeconds": _round(breaches["longest"][row], 1),
+                    "longestBreachStart": format_collect_time(start) if start >= 0 else None,
+                })
+            results.append(result)
+    return results
+
+
+def rank_anomalies(series: Sequence[CollectSeries], rank_by: str = "zscore", top_n: int = 20,
+                   z_threshold: float = 5.0, threshold: Optional[float] = None, **options) -> Dict[str, Any]:
+    """
+    analyze_series の結果から異常と判定した系列を rank_by の降順に並べて返す
+    異常の判定: rank_by="breach" は閾値超過時間が 0 より大きい系列、それ以外は |z| が z_threshold 以上の点がある系列。
+    Returns:
+        {"analyzed", "anomalous", "rankBy", "series": [...上位 top_n 件], "elapsedSeconds"}
+    """
+    if rank_by not in RANK_KEYS:
+        raise ValueError(f"rank_by は {', '.join(RANK_KEYS)} のいずれかです: {rank_by}")
+    if rank_by == "breach" and threshold is None:
+        raise ValueError("rank_by=breach には threshold の指定が必要です")
+    started = time.monotonic()
+    results = analyze_series(series, z_threshold=z_threshold, threshold=threshold, **options)
+    key = RANK_KEYS[rank_by]
+    if rank_by == "breach":
+        anomalous = [r for r in results if (r.get("breachSeconds") or 0) > 0]
+    else:
+        anomalous = [r for r in results if r["anomalyPoints"] > 0]
+    anomalous.sort(key=lambda r: (r.get(key) or 0, r.get("maxAbsZ") or 0), reverse=True)
+    return {
+        "analyzed": len(results),
+        "anomalous": len(anomalous),
+        "rankBy": rank_by,
+        "series": anomalous[:top_n],
+        "elapsedSeconds": round(time.monotonic() - started, 3),
+    }
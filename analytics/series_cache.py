@@ -0,0 +1,324 @@
+"""
+収集データ（性能値）のローカル時系列キャッシュ
+(collectId, summaryType) ごとに時刻(int64)・値(float64)の配列をファイルへ保存し、np.memmap で必要な範囲だけを読む。
+取得済みの期間を区間リストとして記録し、要求範囲のうち未取得の隙間だけをマネージャから取得する。
+"""
+import os
+import re
+import json
+import time
+import hashlib
+import logging
+import asyncio
+import threading
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Collection, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from client.collect_fetch import (
+    CollectFetchConfig, CollectFetchResult, CollectSeries, Window,
+    assemble_series, format_collect_time, parse_collect_time,
+)
+
+logger = logging.getLogger(__name__)
+
+_INDEX_FILE = "index.json"
+_TIMES_FILE = "times.i64"
+_VALUES_FILE = "values.f64"
+_UNSAFE_CHARS = re.compile(r"[^\w.-]")
+
+SeriesFetch = Callable[..., Awaitable[CollectFetchResult]]
+
+
+@dataclass
+class SeriesCacheConfig:
+    """
+    時系列キャッシュの設定
+    Attributes:
+        path: 保存先ディレクトリ
+        max_bytes: 全系列の合計サイズの上限（超えた分は最後に使われた時刻が古い系列から削除）
+        max_age_days: 最後に使われてからこの日数を過ぎた系列を削除
+        settle_minutes: 現在時刻からこの分数以内の期間は取得済みとして記録しない（遅れて届く収集値を取りこぼさないため）
+    """
+    path: str = "hinemos_series_cache"
+    max_bytes: int = 512 * 1024 * 1024
+    max_age_days: float = 30.0
+    settle_minutes: float = 10.0
+
+    @classmethod
+    def from_env(cls) -> "SeriesCacheConfig":
+        default = cls()
+        return cls(
+            path=os.getenv("HINEMOS_SERIES_CACHE_DIR", default.path),
+            max_bytes=int(float(os.getenv("HINEMOS_SERIES_CACHE_MAX_MB", default.max_bytes / 1048576)) * 1048576),
+            max_age_days=float(os.getenv("HINEMOS_SERIES_CACHE_MAX_AGE_DAYS", default.max_age_days)),
+            settle_minutes=float(os.getenv("HINEMOS_SERIES_CACHE_SETTLE_MINUTES", default.settle_minutes)),
+        )
+
+
+def merge_windows(windows: Sequence[Window]) -> List[Window]:
+    """
+    秒単位の閉区間を昇順に並べ、重なる・境界を共有する区間をまとめる
+    区間 (lower, upper) は fromTime=lower, toTime=upper で取得した範囲で、upper の秒の中（upper.000 より後）は
+    含まないため、1秒離れた区間はまとめない。
+    """
+    merged: List[List[int]] = []
+    for lower, upper in sorted(windows):
+        if merged and lower <= merged[-1][1]:
+            merged[-1][1] = max(merged[-1][1], upper)
+        else:
+            merged.append([lower, upper])
+    return [(lower, upper) for lower, upper in merged]
+
+
+def missing_windows(covered: Sequence[Window], start: int, end: int) -> List[Window]:
+    """
+    [start, end] のうち covered（merge_windows 済み）に含まれない区間
+    隙間は前後の取得済み区間と境界の秒を共有する（隙間の fromTime は直前の区間の toTime と同じ）。
+    """
+    gaps = []
+    lower = start
+    reached = False
+    for covered_lower, covered_upper in covered:
+        if covered_upper < lower:
+            continue
+        if covered_lower > end:
+            break
+        if covered_lower > lower:
+            gaps.append((lower, covered_lower))
+        lower = max(lower, covered_upper)
+        reached = True
+        if lower >= end:
+            return gaps
+    if lower < end or not reached:
+        gaps.append((lower, end))
+    return gaps
+
+
+def _entry_name(summary_type: str, collect_id: Any) -> str:
+    """系列のディレクトリ名（ファイル名に使えない文字を置き換えた場合は衝突しないようにハッシュを付ける）"""
+    raw = f"{summary_type}/{collect_id}"
+    safe = _UNSAFE_CHARS.sub("_", str(collect_id))
+    if safe != str(collect_id):
+        safe = f"{safe}-{hashlib.sha1(raw.encode('utf-8')).hexdigest()[:8]}"
+    return f"{_UNSAFE_CHARS.sub('_', str(summary_type))}/{safe}"
+
+
+def _now_millis() -> int:
+    # 収集日時はマネージャのローカル時刻を UTC とみなして扱うため、現在時刻も同じ扱いにする
+    return int(np.datetime64(datetime.now(), "ms").astype(np.int64))
+
+
+class SeriesCache:
+    """
+    収集データの永続キャッシュ
+    系列ごとに <path>/<summaryType>/<collectId>/times.i64, values.f64（時刻昇順・重複なし）を持ち、
+    取得済み期間・点数・最終利用時刻は <path>/index.json にまとめて記録する。
+    ファイルは一時ファイルへ書いてから置き換えるため、書き込み途中で中断しても前の内容が残る。
+    """
+
+    def __init__(self, config: Optional[SeriesCacheConfig] = None):
+        self.config = config or SeriesCacheConfig.from_env()
+        self.path = self.config.path
+        self._lock = threading.Lock()
+        os.makedirs(self.path, exist_ok=True)
+        self._index: Dict[str, Dict[str, Any]] = self._load_index()
+
+    # --- インデックス ---
+    def _load_index(self) -> Dict[str, Dict[str, Any]]:
+        try:
+            with open(os.path.join(self.path, _INDEX_FILE), encoding="utf-8") as f:
+                entries = json.load(f).get("entries", {})
+        except (OSError, ValueError):
+            return {}
+        # インデックスに記録された点数とファイルが食い違う系列（書き込み途中の中断など）は捨てる
+        valid = {}
+        for name, entry in entries.items():
+            size = entry.get("points", 0) * 8
+            if all(self._file_size(name, file) == size for file in (_TIMES_FILE, _VALUES_FILE)):
+                valid[name] = entry
+        return valid
+
+    def _save_index(self) -> None:
+        path = os.path.join(self.path, _INDEX_FILE)
+        with open(f"{path}.tmp", "w", encoding="utf-8") as f:
+            json.dump({"entries": self._index}, f, ensure_ascii=False)
+        os.replace(f"{path}.tmp", path)
+
+    def _file(self, name: str, file: str) -> str:
+        return os.path.join(self.path, name, file)
+
+    def _file_size(self, name: str, file: str) -> int:
+        try:
+            return os.path.getsize(self._file(name, file))
+        except OSError:
+            return -1
+
+    # --- 読み書き ---
+    def _arrays(self, name: str) -> Tuple[np.ndarray, np.ndarray]:
+        points = self._index.get(name, {}).get("points", 0)
+        if not points:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float64)
+        times = np.memmap(self._file(name, _TIMES_FILE), dtype=np.int64, mode="r", shape=(points,))
+        values = np.memmap(self._file(name, _VALUES_FILE), dtype=np.float64, mode="r", shape=(points,))
+        return times, values
+
+    def missing(self, collect_id: Any, summary_type: str, start: int, end: int) -> List[Window]:
+        """[start, end]（エポックミリ秒・秒単位）のうち未取得の期間"""
+        with self._lock:
+            entry = self._index.get(_entry_name(summary_type, collect_id))
+            covered = [tuple(window) for window in entry["covered"]] if entry else []
+        return missing_windows(covered, start, end)
+
+    def read(self, collect_id: Any, summary_type: str, start: int, end: int) -> CollectSeries:
+        """キャッシュから [start, end] の範囲を読み出す（配列はコピーを返す）"""
+        name = _entry_name(summary_type, collect_id)
+        with self._lock:
+            times, values = self._arrays(name)
+            lower = np.searchsorted(times, start, side="left")
+            upper = np.searchsorted(times, end, side="right")
+            series = CollectSeries(collect_id, np.array(times[lower:upper]), np.array(values[lower:upper]))
+            del times, values
+            if name in self._index:
+                self._index[name]["accessed"] = time.time()
+        return series
+
+    def store(self, summary_type: str, series: Dict[Any, CollectSeries], windows: Sequence[Window],
+              pinned: Sequence[Any] = ()) -> None:
+        """
+        取得した系列を既存の内容とマージして保存し、windows を取得済み期間として記録する
+        現在時刻から settle_minutes 以内の部分は値を保存しても取得済みとは記録せず、次回も取り直す。
+        pinned の収集IDの系列は、サイズの上限を超えても今回は削除しない（同じ要求でまだ読み出していない系列）。
+        """
+        horizon = _now_millis() - int(self.config.settle_minutes * 60000)
+        horizon -= horizon % 1000
+        settled = [(lower, min(upper, horizon)) for lower, upper in windows if lower <= horizon]
+        with self._lock:
+            for collect_id, fetched in series.items():
+                name = _entry_name(summary_type, collect_id)
+                entry = self._index.get(name) or {"collectId": collect_id, "summaryType": summary_type, "covered": []}
+                times, values = self._arrays(name)
+                # 同じ時刻は新しく取得した値を優先する（assemble_series は先に現れた方を残す）
+                merged = assemble_series({collect_id: [(fetched.times, fetched.values),
+                                                       (np.array(times), np.array(values))]})[collect_id]
+                del times, values
+                directory = os.path.join(self.path, name)
+                os.makedirs(directory, exist_ok=True)
+                for file, array in ((_TIMES_FILE, merged.times), (_VALUES_FILE, merged.values)):
+                    path = self._file(name, file)
+                    array.tofile(f"{path}.tmp")
+                    os.replace(f"{path}.tmp", path)
+                entry["covered"] = [list(window) for window in
+                                    merge_windows([tuple(window) for window in entry["covered"]] + settled)]
+                entry["points"] = len(merged)
+                entry["bytes"] = len(merged) * 16
+                entry["accessed"] = time.time()
+                self._index[name] = entry
+            self._evict({_entry_name(summary_type, collect_id) for collect_id in pinned})
+            self._save_index()
+
+    def contains(self, collect_id: Any, summary_type: str) -> bool:
+        with self._lock:
+            return _entry_name(summary_type, collect_id) in self._index
+
+    # --- 削除 ---
+    def _remove(self, name: str) -> None:
+        self._index.pop(name, None)
+        for file in (_TIMES_FILE, _VALUES_FILE):
+            try:
+                os.remove(self._file(name, file))
+            except OSError:
+                pass
+        try:
+            os.rmdir(os.path.join(self.path, name))
+        except OSError:
+            pass
+
+    def _evict(self, pinned: Collection[str] = ()) -> int:
+        """期限切れの系列と、合計サイズの上限を超えた分の系列を最終利用時刻の古い順に削除する（pinned の系列は除く）"""
+        removed = 0
+        expire = time.time() - self.config.max_age_days * 86400
+        for name in [name for name, entry in self._index.items() if entry.get("accessed", 0) < expire and name not in pinned]:
+            self._remove(name)
+            removed += 1
+        total = sum(entry.get("bytes", 0) for entry in self._index.values())
+        for name in sorted(self._index, key=lambda name: self._index[name].get("accessed", 0)):
+            if total <= self.config.max_bytes:
+                break
+            if name in pinned:
+                continue
+            total -= self._index[name].get("bytes", 0)
+            self._remove(name)
+            removed += 1
+        if removed:
+            logger.info(f"series cache: evicted {removed} series")
+        return removed
+
+    def evict(self) -> int:
+        with self._lock:
+            removed = self._evict()
+            self._save_index()
+        return removed
+
+    def flush(self) -> None:
+        """最終利用時刻をインデックスへ書き出す"""
+        with self._lock:
+            self._save_index()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "path": os.path.abspath(self.path),
+                "series": len(self._index),
+                "points": sum(entry.get("points", 0) for entry in self._index.values()),
+                "bytes": sum(entry.get("bytes", 0) for entry in self._index.values()),
+                "maxBytes": self.config.max_bytes,
+            }
+
+
+async def fetch_cached_series(cache: SeriesCache, fetch: SeriesFetch, id_list: Sequence[Any], summary_type: str,
+                              from_time: str, to_time: str, size: Optional[int] = None,
+                              config: Optional[CollectFetchConfig] = None) -> CollectFetchResult:
+    """
+    キャッシュにない期間だけを fetch（fetch_collect_series 相当）で取得してキャッシュへ追記し、要求範囲を返す
+    未取得の期間が同じ収集IDはまとめて1回の fetch で取得する。
+    要求した系列は読み出すまでキャッシュから削除せず、読み出した後でサイズの上限を適用する。
+    上限に収まらずキャッシュに残せなかった系列の数は stats の uncachedIds に返す。
+    """
+    start, end = parse_collect_time(from_time), parse_collect_time(to_time)
+    if start > end:
+        raise ValueError(f"from_time が to_time より後です: {from_time} > {to_time}")
+    start, end = start - start % 1000, end - end % 1000
+    started = time.monotonic()
+    groups: Dict[Tuple[Window, ...], List[Any]] = {}
+    for collect_id in id_list:
+        gaps = await asyncio.to_thread(cache.missing, collect_id, summary_type, start, end)
+        groups.setdefault(tuple(gaps), []).append(collect_id)
+
+    stats = {"cachedIds": len(groups.get((), [])), "gaps": 0, "requests": 0, "records": 0, "splits": 0}
+    for gaps, ids in groups.items():
+        for lower, upper in gaps:
+            result = await fetch(ids, summary_type, format_collect_time(lower), format_collect_time(upper), size, config)
+            stats["gaps"] += 1
+            for key in ("requests", "records", "splits"):
+                stats[key] += result.stats.get(key, 0)
+            await asyncio.to_thread(cache.store, summary_type, result.series, [(lower, upper)], id_list)
+
+    series = {}
+    for collect_id in id_list:
+        series[collect_id] = await asyncio.to_thread(cache.read, collect_id, summary_type, start, end)
+    stored = [collect_id for collect_id in id_list if cache.contains(collect_id, summary_type)]
+    await asyncio.to_thread(cache.evict)
+    uncached = sum(1 for collect_id in stored if not cache.contains(collect_id, summary_type))
+    if uncached:
+        stats["uncachedIds"] = uncached
+        logger.warning(f"series cache: {uncached} of {len(id_list)} series did not fit in "
+                       f"{cache.config.max_bytes} bytes (HINEMOS_SERIES_CACHE_MAX_MB) and were not kept")
+    stats.update({
+        "points": int(sum(len(s) for s in series.values())),
+        "elapsedSeconds": round(time.monotonic() - started, 3),
+    })
+    logger.info(f"cached collect data fetch: {stats}")
+    return CollectFetchResult(series, stats)
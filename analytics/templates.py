@@ -0,0 +1,204 @@
+"""
+イベントメッセージのテンプレート抽出（Drain 方式）
+ID・IPアドレス・数値などだけが異なるメッセージを1つのテンプレートにまとめ、件数とパラメータの分布を返す。
+メッセージは1件ずつ逐次投入でき、件数に比例したメモリを使わない（テンプレート数とパラメータ値の上限分のみ）。
+"""
+import re
+from collections import Counter
+from typing import Any, Dict, List, Optional
+
+WILDCARD = "<*>"
+
+# 先に可変部分をマスクしてから木を辿る（トークンごとに適用するため、空白をまたいで一致することはない）
+_MASK_PATTERN = re.compile(
+    r"(?:[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12})"  # UUID
+    r"|(?:\d{1,3}(?:\.\d{1,3}){3}(?::\d+)?)"                                             # IPv4[:port]
+    r"|(?:0x[0-9a-fA-F]+)"                                                               # 16進
+    r"|(?:\d{4}[-/]\d{2}[-/]\d{2}(?:T\d{2}:\d{2}(?::\d{2}(?:\.\d+)?)?)?)"                # 日付
+    r"|(?:\d{2}:\d{2}:\d{2}(?:\.\d+)?)"                                                  # 時刻
+    r"|(?:[-+]?\d+(?:\.\d+)?)"                                                           # 数値
+)
+
+# 数値として集計する値（"51ms" や "85%" のように単位付きでも数値が1つなら対象）
+_NUMBER_PATTERN = re.compile(r"[-+]?\d+(?:\.\d+)?")
+
+# パラメータ位置ごとに保持する異なり値の上限
+PARAMETER_VALUE_LIMIT = 200
+
+
+def _has_digit(token: str) -> bool:
+    return any(ch.isdigit() for ch in token)
+
+
+class _Parameter:
+    """テンプレートの1つの可変位置に現れた値の分布"""
+
+    __slots__ = ("values", "overflow", "numeric_min", "numeric_max", "numeric_sum", "numeric_count")
+
+    def __init__(self):
+        self.values: Counter = Counter()
+        self.overflow = 0
+        self.numeric_min = None
+        self.numeric_max = None
+        self.numeric_sum = 0.0
+        self.numeric_count = 0
+
+    def add(self, value: str) -> None:
+        if value in self.values or len(self.values) < PARAMETER_VALUE_LIMIT:
+            self.values[value] += 1
+        else:
+            self.overflow += 1
+        numbers = _NUMBER_PATTERN.findall(value)
+        if len(numbers) != 1:
+            return
+        number = float(numbers[0])
+        self.numeric_count += 1
+        self.numeric_sum += number
+        if self.numeric_min is None or number < self.numeric_min:
+            self.numeric_min = number
+        if self.numeric_max is None or number > self.numeric_max:
+            self.numeric_max = number
+
+    def summary(self, top: int) -> Dict[str, Any]:
+        result: Dict[str, Any] = {
+            "distinct": len(self.values),
+            "distinctCapped": bool(self.overflow),
+            "top": [{"value": value, "count": count} for value, count in self.values.most_common(top)],
+        }
+        if self.numeric_count:
+            result["numeric"] = {
+                "min": self.numeric_min,
+                "max": self.numeric_max,
+                "mean": round(self.numeric_sum / self.numeric_count, 6),
+            }
+        return result
+
+
+class LogCluster:
+    """1つのテンプレートとそれに属するメッセージの統計"""
+
+    __slots__ = ("cluster_id", "tokens", "count", "parameters", "sample", "attributes")
+
+    def __init__(self, cluster_id: int, tokens: List[str], sample: str):
+        self.cluster_id = cluster_id
+        self.tokens = tokens
+        self.count = 0
+        self.parameters: Dict[int, _Parameter] = {}
+        self.sample = sample
+        # 任意の属性（重要度・監視ID等）の件数
+        self.attributes: Dict[str, Counter] = {}
+
+    @property
+    def template(self) -> str:
+        return " ".join(self.tokens)
+
+    def add(self, masked: List[str], raw: List[str], attributes: Optional[Dict[str, Any]]) -> None:
+        self.count += 1
+        for position, token in enumerate(masked):
+            if WILDCARD in token or self.tokens[position] == WILDCARD:
+                parameter = self.parameters.get(position)
+                if parameter is None:
+                    parameter = self.parameters[position] = _Parameter()
+                parameter.add(raw[position])
+        if attributes:
+            for name, value in attributes.items():
+                if value is not None:
+                    self.attributes.setdefault(name, Counter())[str(value)] += 1
+
+
+class TemplateMiner:
+    """
+    Drain 方式のテンプレート抽出
+    Args:
+        similarity: 同じテンプレートとみなすトークン一致率の閾値
+        depth: 前方一致で辿るトークン数 + 2（トークン数の層と葉の層を含む）
+        max_children: 1ノードの子の上限。超えた分はワイルドカードの子にまとめる
+    """
+
+    def __init__(self, similarity: float = 0.5, depth: int = 4, max_children: int = 100):
+        self.similarity = similarity
+        self.prefix_depth = max(depth - 2, 1)
+        self.max_children = max_children
+        self.clusters: List[LogCluster] = []
+        self.total = 0
+        self._root: Dict[int, Dict] = {}
+        # マスク後のメッセージ → クラスタ（同一パターンの繰り返しは木を辿らない）
+        self._exact: Dict[str, LogCluster] = {}
+
+    def add(self, message: str, attributes: Optional[Dict[str, Any]] = None) -> LogCluster:
+        self.total += 1
+        message = message or ""
+        raw = message.split()
+        # 空白で分割してからトークンごとにマスクし、マスク後のトークンと元のトークンの位置を揃える
+        masked = [_MASK_PATTERN.sub(WILDCARD, token) for token in raw]
+        masked_message = " ".join(masked)
+        cluster = self._exact.get(masked_message)
+        if cluster is None:
+            cluster = self._match_or_create(masked, message)
+            if len(self._exact) < 100000:
+                self._exact[masked_message] = cluster
+        cluster.add(masked, raw, attributes)
+        return cluster
+
+    def _leaf(self, tokens: List[str]) -> List[LogCluster]:
+        node = self._root.setdefault(len(tokens), {})
+        for token in tokens[:self.prefix_depth]:
+            key = WILDCARD if WILDCARD in token or _has_digit(token) else token
+            child = node.get(key)
+            if child is None:
+                if key != WILDCARD and len(node) >= self.max_children:
+                    key = WILDCARD
+                    child = node.get(key)
+                if child is None:
+                    child = node[key] = {}
+            node = child
+        return node.setdefault(None, [])
+
+    def _match_or_create(self, tokens: List[str], message: str) -> LogCluster:
+        leaf = self._leaf(tokens)
+        best, best_score, best_params = None, -1.0, -1
+        for cluster in leaf:
+            same = 0
+            params = 0
+            for template_token, token in zip(cluster.tokens, tokens):
+                if template_token == WILDCARD:
+                    params += 1
+                elif template_token == token:
+                    same += 1
+            score = same / len(tokens) if tokens else 1.0
+            if score > best_score or (score == best_score and params > best_params):
+                best, best_score, best_params = cluster, score, params
+        if best is not None and best_score >= self.similarity:
+            # 一致しない位置をワイルドカードにする
+            best.tokens = [t if t == token else WILDCARD for t, token in zip(best.tokens, tokens)]
+            return best
+        cluster = LogCluster(len(self.clusters) + 1, list(tokens), message)
+        self.clusters.append(cluster)
+        leaf.append(cluster)
+        return cluster
+
+    def result(self, top_n: int = 20, parameter_values: int = 5) -> Dict[str, Any]:
+        clusters = sorted(self.clusters, key=lambda c: c.count, reverse=True)
+        templates = []
+        for cluster in clusters[:top_n]:
+            entry: Dict[str, Any] = {
+                "template": cluster.template,
+                "count": cluster.count,
+                "share": round(cluster.count / self.total, 4) if self.total else 0.0,
+                "sample": cluster.sample,
+            }
+            if cluster.parameters:
+                entry["parameters"] = [
+                    {"position": position, **parameter.summary(parameter_values)}
+                    for position, parameter in sorted(cluster.parameters.items())
+                ]
+            for name, counter in cluster.attributes.items():
+                entry[name] = dict(counter.most_common(parameter_values))
+            templates.append(entry)
+        covered = sum(t["count"] for t in templates)
+        return {
+            "messages": self.total,
+            "templateCount": len(self.clusters),
+            "templates": templates,
+            "otherMessages": self.total - covered,
+        }
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+HTTPコネクションプールのベンチマーク
+ローカルのダミーHinemosサーバに対して50並列のAPI呼び出しを複数ラウンド行い、
+旧構成（全スレッドで1つのSession・既定のプールサイズ10）と
+BaseClient（共有HTTPAdapter + スレッド毎Session・PoolConfig）のコネクション再利用率を比較する。
+レスポンスキャッシュは無効にし、すべての呼び出しがサーバへ届くようにする。
+
+    python benchmarks/bench_connection_pool.py [--concurrency 50] [--rounds 5]
+"""
+
+import argparse
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from client.cache import ResponseCache
+from client.hinemos_client import HinemosClient
+from client.pool import PoolConfig, adapter_pool_stats
+
+LOGIN_BODY = json.dumps({"token": {"tokenId": "BENCH", "expirationDate": "2099-12-31 23:59:59.000"}}).encode()
+API_BODY = json.dumps({"platformList": []}).encode()
+
+
+class DummyHinemosHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def _reply(self, body):
+        length = int(self.headers.get("Content-Length") or 0)
+        if length:
+            self.rfile.read(length)
+        time.sleep(0.005)
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self):
+        self._reply(LOGIN_BODY if self.path.endswith("/access/login") else API_BODY)
+
+    def do_GET(self):
+        self._reply(API_BODY)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def run_rounds(call, concurrency, rounds):
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        for _ in range(rounds):
+            list(executor.map(lambda _: call(), range(concurrency)))
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), DummyHinemosHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    api_url = f"{base_url}/HinemosWeb/api/RepositoryRestEndpoints/repository/platform"
+
+    # 旧構成: 1つのrequests.Sessionを全スレッドで共有（既定のHTTPAdapterはプールサイズ10）
+    legacy_session = requests.Session()
+    legacy_elapsed = run_rounds(lambda: legacy_session.get(api_url).json(), args.concurrency, args.rounds)
+    legacy_stats = adapter_pool_stats(legacy_session.get_adapter(api_url))
+
+    client = HinemosClient(base_url, pool_config=PoolConfig(pool_maxsize=args.concurrency),
+                           response_cache=ResponseCache(rules=()))
+    client.login()
+    pooled_elapsed = run_rounds(client.get_platform_list, args.concurrency, args.rounds)
+    pooled_stats = client.get_pool_stats()
+
+    server.shutdown()
+    total = args.concurrency * args.rounds
+    print(f"{total} calls ({args.concurrency} concurrent x {args.rounds} rounds)")
+    for label, stats, elapsed in (("legacy shared session", legacy_stats, legacy_elapsed),
+                                  ("pooled BaseClient", pooled_stats, pooled_elapsed)):
+        print(f"{label:22s} connections={stats['connections']:4d} requests={stats['requests']:4d} "
+              f"reuse_rate={stats['reuse_rate']:.1%} elapsed={elapsed:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+ツールディスパッチのマイクロベンチマーク
+旧方式（呼び出し毎に全モジュールの get_tools() を構築して線形探索）と
+TOOL_REGISTRY による O(1) ディスパッチの1呼び出しあたりのオーバーヘッドを比較する。
+
+    python benchmarks/bench_dispatch.py [--calls 2000]
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from mcp_tools import ALL_TOOL_MODULES, TOOL_REGISTRY, dispatch_tool
+
+
+class NullManager:
+    """全メソッドが即座に None を返すダミーマネージャ（HTTP通信を除いた純粋なディスパッチコストを測る）"""
+
+    def __getattr__(self, name):
+        async def method(*args, **kwargs):
+            return None
+        return method
+
+
+async def legacy_dispatch_tool(name, manager, arguments):
+    """変更前の mcp_tools.dispatch_tool と同等の処理"""
+    for get_tools, _, handlers in ALL_TOOL_MODULES:
+        tool_names = [tool.name for tool in get_tools()]
+        if name in tool_names:
+            # 各モジュールの if/elif 連鎖に相当する線形探索
+            for candidate, handler in handlers.items():
+                if name == candidate:
+                    return await handler(manager, arguments)
+    return None
+
+
+async def measure(dispatch, names, calls):
+    manager = NullManager()
+    start = time.perf_counter()
+    for i in range(calls):
+        name = names[i % len(names)]
+        await dispatch(name, manager, REQUIRED_ARGS[name])
+    return (time.perf_counter() - start) / calls
+
+
+def required_arguments(tool):
+    return {param: None for param in tool.inputSchema.get("required", ())}
+
+
+REQUIRED_ARGS = {tool.name: required_arguments(tool) for tool in TOOL_REGISTRY.tools}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--calls", type=int, default=2000)
+    args = parser.parse_args()
+
+    names = sorted(REQUIRED_ARGS)
+    legacy = asyncio.run(measure(legacy_dispatch_tool, names, max(args.calls // 20, 1)))
+    registry = asyncio.run(measure(dispatch_tool, names, args.calls))
+
+    print(f"tools: {len(TOOL_REGISTRY)}")
+    print(f"legacy   dispatch: {legacy * 1e6:10.1f} us/call")
+    print(f"registry dispatch: {registry * 1e6:10.1f} us/call")
+    print(f"speedup: {legacy / registry:.0f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+時系列ダウンサンプリングの処理時間と応答サイズの計測
+1分間隔・1週間分の合成 CPU 使用率（スパイク入り）をノード数分用意し、各モードで間引いたときの
+処理時間・JSON サイズ（全点をそのまま返した場合との比）・スパイクが残っているかを測る。
+
+    python benchmarks/bench_downsample.py [--nodes 50] [--days 7] [--points 500]
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from analytics.downsample import DOWNSAMPLE_MODES, downsample
+
+
+def payload_bytes(result):
+    # 大きな結果は handle_call_tool でインデントなしの JSON になる
+    return len(json.dumps(result, ensure_ascii=False, separators=(",", ":")).encode("utf-8"))
+
+
+def synthetic_series(nodes, days, seed=1):
+    rng = np.random.default_rng(seed)
+    count = days * 1440
+    times = np.datetime64("2025-06-01T00:00:00", "ms").astype(np.int64) + np.arange(count, dtype=np.int64) * 60000
+    series = []
+    for _ in range(nodes):
+        daily = 30 + 20 * np.sin(np.arange(count) * 2 * np.pi / 1440)
+        values = daily + rng.normal(0, 4, count)
+        spikes = rng.choice(count, 3, replace=False)
+        values[spikes] = 100.0
+        values[rng.random(count) < 0.01] = np.nan
+        series.append((times, values))
+    return series
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--nodes", type=int, default=50)
+    parser.add_argument("--days", type=int, default=7)
+    parser.add_argument("--points", type=int, default=500)
+    args = parser.parse_args()
+
+    series = synthetic_series(args.nodes, args.days)
+    total = sum(len(times) for times, _ in series)
+    started = time.perf_counter()
+    raw = [downsample(times, values, "lttb", len(times)) for times, values in series]
+    raw_bytes = payload_bytes(raw)
+    print(f"{args.nodes} series x {total // args.nodes} points = {total} points, "
+          f"raw JSON {raw_bytes / 1e6:.1f} MB ({time.perf_counter() - started:.2f} s)")
+
+    for mode in DOWNSAMPLE_MODES:
+        started = time.perf_counter()
+        sampled = [downsample(times, values, mode, args.points, (50, 95, 99, 100)) for times, values in series]
+        elapsed = time.perf_counter() - started
+        payload = payload_bytes(sampled)
+        column = sampled[0]["columns"].index("value" if mode == "lttb" else "max" if mode == "minmax" else "p100")
+        kept = sum(sum(1 for row in item["rows"] if row[column] == 100.0) for item in sampled)
+        print(f"  {mode:<10} {elapsed * 1000:7.1f} ms  {payload / 1e3:8.1f} KB  "
+              f"({raw_bytes / payload:5.0f}x smaller)  spikes kept {kept}/{args.nodes * 3}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+イベントエクスポート（EventExport）の書き込みスループット
+event_search 1ページ分（1000件）ずつ合成イベントを渡し、形式ごとの rows/s とファイルサイズを測る。
+マネージャとの通信時間は含まない。
+
+    python benchmarks/bench_event_export.py [--events 200000] [--formats ndjson,csv,parquet]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from bench_event_store import synthetic_events
+from client.event_export import EventExport
+
+PAGE_SIZE = 1000
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--events", type=int, default=200_000)
+    parser.add_argument("--days", type=int, default=30)
+    parser.add_argument("--formats", default="ndjson,csv,parquet")
+    args = parser.parse_args()
+
+    events = list(synthetic_events(args.events, args.days))
+    with tempfile.TemporaryDirectory() as directory:
+        for format in args.formats.split(","):
+            path = os.path.join(directory, f"events.{format}")
+            try:
+                with EventExport(path, format) as export:
+                    for start in range(0, len(events), PAGE_SIZE):
+                        export.write(events[start:start + PAGE_SIZE])
+            except ValueError as e:
+                print(f"{format:8s} skipped: {e}")
+                continue
+            result = export.result()
+            print(f"{format:8s} {result['rows']} rows  {result['seconds']:7.2f} s  "
+                  f"{result['rowsPerSecond']:>10,.0f} rows/s  {result['bytes'] / 1e6:8.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+ローカルイベントストアのベンチマーク
+合成イベントを取り込み、週単位の集計クエリ（件数集計・上位N件・ヒストグラム）の応答時間を測る。
+
+    python benchmarks/bench_event_store.py [--events 1000000] [--days 30]
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from analytics import EventStore
+
+PRIORITIES = ["INFO"] * 70 + ["WARNING"] * 20 + ["CRITICAL"] * 8 + ["UNKNOWN"] * 2
+PLUGINS = ["MON_PNG_N", "MON_SNMP_N", "MON_LOGFILE_S", "MON_HTTP_N", "MON_PRC_N", "MON_AGT_B"]
+
+
+def synthetic_events(count, days, seed=1):
+    rng = random.Random(seed)
+    facilities = [f"WEB_SERVER_{i:02d}" for i in range(40)] + [f"DB_SERVER_{i:02d}" for i in range(20)] + [f"APP_{i:03d}" for i in range(140)]
+    monitors = [f"MON_{i:03d}" for i in range(150)]
+    end = datetime(2025, 6, 30, tzinfo=timezone.utc)
+    span = days * 86400
+    for i in range(count):
+        generated = end - timedelta(seconds=rng.random() * span)
+        stamp = generated.strftime('%Y-%m-%dT%H:%M:%S.') + f"{generated.microsecond // 1000:03d}Z"
+        yield {
+            "monitorId": rng.choice(monitors),
+            "monitorDetailId": "",
+            "pluginId": rng.choice(PLUGINS),
+            "facilityId": rng.choice(facilities),
+            "priority": rng.choice(PRIORITIES),
+            "generationDate": stamp,
+            "outputDate": stamp,
+            "message": f"synthetic event {i}",
+            "application": "bench",
+            "confirmType": 0,
+        }
+
+
+def timed(label, func, repeat=5):
+    func()
+    started = time.perf_counter()
+    for _ in range(repeat):
+        result = func()
+    elapsed = (time.perf_counter() - started) / repeat * 1000
+    print(f"  {label:<48} {elapsed:9.2f} ms  (source={result['source']}, total={result['total']})")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--events", type=int, default=1_000_000)
+    parser.add_argument("--days", type=int, default=30)
+    args = parser.parse_args()
+
+    path = os.path.join(tempfile.mkdtemp(), "bench_events.db")
+    store = EventStore(path, max_age_days=0, max_rows=0)
+    started = time.perf_counter()
+    batch = []
+    for event in synthetic_events(args.events, args.days):
+        batch.append(event)
+        if len(batch) == 20000:
+            store.ingest(batch)
+            batch = []
+    store.ingest(batch)
+    print(f"ingest {args.events} events: {time.perf_counter() - started:.1f} s  {store.stats()}")
+
+    week = {"from": "2025-06-23T00:00:00Z", "to": "2025-06-30T00:00:00Z"}
+    unaligned = {"from": "2025-06-23T00:10:00Z", "to": "2025-06-30T00:00:00Z"}
+    print("week-scale queries:")
+    timed("CRITICAL on WEB_SERVER_* by facility", lambda: store.count_by(["facilityId"], {**week, "priority": "CRITICAL", "facilityId": "WEB_SERVER_*"}))
+    timed("count by priority", lambda: store.count_by(["priority"], week))
+    timed("top 10 monitors", lambda: store.top_n("monitorId", 10, week))
+    timed("hourly histogram by priority", lambda: store.histogram("hour", week, "priority"))
+    timed("daily histogram (JST)", lambda: store.histogram("day", week, utc_offset_hours=9))
+    timed("count by priority (unaligned window)", lambda: store.count_by(["priority"], unaligned))
+    timed("15m histogram of CRITICAL", lambda: store.histogram("15m", {**week, "priority": "CRITICAL"}))
+    timed("count by confirmType (sqlite)", lambda: store.count_by(["confirmType"], week))
+    store.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+容量予測(forecast_series)の処理時間計測
+5分間隔・30日分のファイルシステム使用率（日周期の変動 + ノイズ + 一部に増加トレンド）をノード数分用意し、
+閾値 90% に30日以内に達する系列の判定時間と、増加トレンドを入れた系列の検出数を測る。
+
+    python benchmarks/bench_forecast.py [--series 2000] [--days 30]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from client.collect_fetch import CollectSeries
+from analytics.forecast import forecast_series
+
+
+def synthetic_series(count, days, seed=1):
+    rng = np.random.default_rng(seed)
+    points = days * 288
+    times = np.datetime64("2025-06-01T00:00:00", "ms").astype(np.int64) + np.arange(points, dtype=np.int64) * 300000
+    elapsed_days = np.arange(points) / 288
+    daily = 3 * np.sin(2 * np.pi * elapsed_days)
+    series, growing = [], {}
+    for index in range(count):
+        level = rng.uniform(20, 70)
+        slope = 0.0
+        if index % 20 == 0:
+            slope = rng.uniform(0.5, 2.0)
+            level = rng.uniform(30, 60)
+            # 最終時点からこの日数で 90% に達する（日周期の山 +3 を含む）
+            growing[index] = (90 - 3 - (level + slope * days)) / slope
+        values = level + slope * elapsed_days + daily + rng.normal(0, 1, points)
+        values[rng.random(points) < 0.02] = np.nan
+        series.append(CollectSeries(index, times, values))
+    return series, growing
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--series", type=int, default=2000)
+    parser.add_argument("--days", type=int, default=30)
+    args = parser.parse_args()
+
+    series, growing = synthetic_series(args.series, args.days)
+    expected = {index for index, days in growing.items() if days <= 30}
+    for model in ("linear", "seasonal", "auto"):
+        started = time.perf_counter()
+        result = forecast_series(series, 90.0, horizon_days=30, model=model, top_n=len(series))
+        elapsed = time.perf_counter() - started
+        found = {item["collectId"] for item in result["series"]}
+        errors = [abs(item["daysToThreshold"] - max(growing[item["collectId"]], 0))
+                  for item in result["series"] if item["collectId"] in growing]
+        print(f"{model:<9} {args.series} series x {args.days * 288} points: {elapsed:.2f} s, "
+              f"{len(found & expected)}/{len(expected)} expected found, {len(found - expected)} false, "
+              f"median error {np.median(errors) if errors else float('nan'):.2f} days")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+ローカルジョブ履歴ストア(JobHistoryStore)の取り込み・集計時間の計測
+1年分のジョブ履歴（ジョブ数 × 1日あたりの実行回数、所要時間は対数正規分布、5% が異常終了）を取り込み、
+ジョブごとのパーセンタイル集計・週ごとの推移・遅い実行の上位取得の時間を測る。
+
+    python benchmarks/bench_job_history.py [--jobs 200] [--runs-per-day 12]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from analytics.job_history import JobHistoryStore
+
+
+def synthetic_runs(jobs, runs_per_day, days=365, seed=1):
+    rng = np.random.default_rng(seed)
+    count = jobs * runs_per_day * days
+    base = datetime(2025, 1, 1)
+    offsets = rng.integers(0, days * 86400, count)
+    job_index = np.arange(count) % jobs
+    durations = rng.lognormal(3 + (job_index % 10) * 0.3, 0.6).astype(np.int64) + 1
+    end_status = rng.choice(3, count, p=[0.9, 0.05, 0.05])
+    for i in range(count):
+        start = base + timedelta(seconds=int(offsets[i]))
+        yield {
+            "sessionId": f"{start:%Y%m%d%H%M%S}-{i:08d}", "jobunitId": f"JU{job_index[i] % 5}",
+            "jobId": f"JOB{job_index[i]:04d}", "jobName": f"job {job_index[i]}", "status": 300,
+            "endStatus": int(end_status[i]), "endValue": int(end_status[i]),
+            "startDate": f"{start:%Y-%m-%d %H:%M:%S}",
+            "endDate": f"{start + timedelta(seconds=int(durations[i])):%Y-%m-%d %H:%M:%S}",
+        }
+
+
+def timed(label, func, *args, **kwargs):
+    started = time.perf_counter()
+    result = func(*args, **kwargs)
+    print(f"{label:<28} {time.perf_counter() - started:8.3f} s")
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--jobs", type=int, default=200)
+    parser.add_argument("--runs-per-day", type=int, default=12)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        store = JobHistoryStore(os.path.join(directory, "job_history.db"))
+        runs = list(synthetic_runs(args.jobs, args.runs_per_day))
+
+        def ingest():
+            for start in range(0, len(runs), 5000):
+                store.ingest(runs[start:start + 5000])
+
+        timed(f"ingest {len(runs)} runs", ingest)
+        result = timed("duration_stats (all jobs)", store.duration_stats, None, (50, 95, 99))
+        timed("duration_stats (weekly)", store.duration_stats, {"jobunitId": "JU1"}, interval="week")
+        timed("duration_stats (1 job)", store.duration_stats, {"jobId": "JOB0007"})
+        timed("slowest_runs (per job)", store.slowest_runs, None, 3, True)
+        top = result["rows"][0]
+        print(f"slowest p95: {top['jobunitId']}/{top['jobId']} p50={top['p50']} p95={top['p95']} "
+              f"failureRate={top['failureRate']} ({result['groups']} jobs, {result['runs']} runs)")
+        store.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+テンプレート抽出(TemplateMiner)のスループット計測
+IDやIPアドレス、数値だけが異なる合成メッセージを投入し、1コアでの処理時間と抽出テンプレート数を測る。
+
+    python benchmarks/bench_templates.py [--messages 100000]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from analytics import TemplateMiner
+
+PATTERNS = [
+    lambda r: f"Ping response time: {r.uniform(1, 500):.1f}ms from {r.randint(10, 250)}.{r.randint(0, 255)}.{r.randint(0, 255)}.{r.randint(1, 254)}",
+    lambda r: f"応答時間が閾値を超過: {r.uniform(1, 10):.1f}秒",
+    lambda r: f"Connection refused to host db{r.randint(1, 40):02d}.example.local port {r.choice([5432, 3306, 1521])}",
+    lambda r: f"Disk usage on /var/lib/data{r.randint(1, 8)} is {r.randint(80, 100)}% (threshold 80%)",
+    lambda r: f"Process httpd count is {r.randint(0, 3)} (expected 1 to 10)",
+    lambda r: f"Job session {r.randint(10 ** 13, 10 ** 14)}-{r.randint(0, 999):03d} ended abnormally with exit code {r.randint(1, 255)}",
+    lambda r: f"SNMP polling failed for {r.randint(10, 250)}.{r.randint(0, 255)}.0.{r.randint(1, 254)} request id 0x{r.getrandbits(32):08x}",
+    lambda r: f"Logfile matched: ERROR [{r.choice(['main', 'worker-1', 'worker-2', 'scheduler'])}] user {r.choice(['alice', 'bob', 'carol', 'dave'])} login failed from {r.randint(10, 250)}.{r.randint(0, 255)}.{r.randint(0, 255)}.{r.randint(1, 254)}",
+    lambda r: f"Agent heartbeat lost for node APP_{r.randint(0, 139):03d} since {r.randint(1, 28):02d}:{r.randint(0, 59):02d}:{r.randint(0, 59):02d}",
+    lambda r: f"HTTP status {r.choice([500, 502, 503, 504])} returned by https://web{r.randint(1, 40):02d}/api/v1/orders/{r.randint(1, 10 ** 6)}",
+    lambda r: f"Request {r.getrandbits(32):08x}-{r.getrandbits(16):04x}-{r.getrandbits(16):04x}-{r.getrandbits(16):04x}-{r.getrandbits(48):012x} timed out after {r.randint(1, 60)} s",
+    lambda r: f"CPU usage {r.uniform(80, 100):.2f}% exceeded threshold on WEB_SERVER_{r.randint(0, 39):02d}",
+]
+
+
+def synthetic_messages(count, seed=1):
+    rng = random.Random(seed)
+    return [rng.choice(PATTERNS)(rng) for _ in range(count)]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--messages", type=int, default=100_000)
+    args = parser.parse_args()
+
+    messages = synthetic_messages(args.messages)
+    miner = TemplateMiner()
+    started = time.perf_counter()
+    for message in messages:
+        miner.add(message)
+    elapsed = time.perf_counter() - started
+    result = miner.result(top_n=len(PATTERNS) + 5, parameter_values=3)
+    print(f"{args.messages} messages: {elapsed:.2f} s ({elapsed / args.messages * 1e6:.1f} us/message), "
+          f"{result['templateCount']} templates from {len(PATTERNS)} patterns")
+    for template in result["templates"]:
+        print(f"  {template['count']:>7}  {template['template']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,214 @@
+import os
+import asyncio
+import logging
+import aiohttp
+from datetime import datetime
+from typing import Optional, Dict, Any
+from .base import BaseClient
+from .pool import PoolConfig
+from .retry import RetryPolicy
+from .download import DownloadWriter, DOWNLOAD_CHUNK_SIZE
+from .cache import ResponseCache, is_miss
+
+class AsyncBaseClient(BaseClient):
+    """
+    aiohttp版 BaseClient
+    各ミックスイン(RepositoryClient等)のメソッドは self._make_request(...) をそのまま返すため、
+    本クラスを基底にすると全APIメソッドがコルーチンを返し、await で呼び出せる。
+    """
+
+    def __init__(self, base_url: Optional[str] = None, session: Optional[aiohttp.ClientSession] = None,
+                 pool_config: Optional[PoolConfig] = None, retry_policy: Optional[RetryPolicy] = None,
+                 response_cache: Optional[ResponseCache] = None):
+        if base_url is None:
+            base_url = os.getenv("HINEMOS_ENDPOINT", "http://localhost:8080")
+        self.base_url = base_url.rstrip('/')
+        self.pool_config = pool_config or PoolConfig.from_env()
+        self._session = session
+        self._owns_session = session is None
+        self._pool_counts = {"connections": 0, "reused": 0}
+        self.token_id: Optional[str] = None
+        self.token_expiration: Optional[datetime] = None
+        self.logger = logging.getLogger(__name__)
+        self.timeout = aiohttp.ClientTimeout(total=float(os.getenv("HINEMOS_TIMEOUT", "30")))
+        self.headers = {
+            'Content-Type': 'application/json',
+            'Accept': 'application/json'
+        }
+        self._init_login_state()
+        self._init_resilience(retry_policy)
+        self.response_cache = response_cache or ResponseCache()
+        self._login_lock = asyncio.Lock()
+        self._refresher: Optional[asyncio.Task] = None
+
+    @property
+    def session(self) -> Optional[aiohttp.ClientSession]:
+        return self._session
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        # ClientSession はイベントループ上で生成する必要があるため遅延生成
+        if self._session is None or self._session.closed:
+            trace_config = aiohttp.TraceConfig()
+            trace_config.on_connection_create_end.append(self._on_connection_create)
+            trace_config.on_connection_reuseconn.append(self._on_connection_reuse)
+            self._session = aiohttp.ClientSession(
+                headers=self.headers,
+                timeout=self.timeout,
+                connector=aiohttp.TCPConnector(**self.pool_config.connector_kwargs()),
+                trace_configs=[trace_config],
+            )
+            self._owns_session = True
+        return self._session
+
+    async def _on_connection_create(self, session, context, params) -> None:
+        self._pool_counts["connections"] += 1
+
+    async def _on_connection_reuse(self, session, context, params) -> None:
+        self._pool_counts["reused"] += 1
+
+    def get_pool_stats(self) -> Dict[str, Any]:
+        connections = self._pool_counts["connections"]
+        requests_count = connections + self._pool_counts["reused"]
+        reuse_rate = 1 - connections / requests_count if requests_count else 0.0
+        return {"requests": requests_count, "connections": connections, "reuse_rate": round(reuse_rate, 4)}
+
+    @staticmethod
+    def _to_query_params(params: Optional[Dict[str, Any]]) -> Optional[Dict[str, str]]:
+        # requests と同様に None を除外し、bool を小文字文字列に変換（aiohttp は bool を受け付けない）
+        if params is None:
+            return None
+        converted = {}
+        for key, value in params.items():
+            if value is None:
+                continue
+            if isinstance(value, bool):
+                value = "true" if value else "false"
+            converted[key] = str(value)
+        return converted
+
+    async def login(self, user_id: Optional[str] = None, password: Optional[str] = None) -> Dict[str, Any]:
+        if user_id is None:
+            user_id = os.getenv("HINEMOS_USERNAME", "")
+        if password is None:
+            password = os.getenv("HINEMOS_PASSWORD", "")
+        login_url = f"{self.base_url}/HinemosWeb/api/AccessRestEndpoints/access/login"
+        login_data = {"userId": user_id, "password": password}
+        async with self._get_session().post(login_url, json=login_data) as response:
+            response.raise_for_status()
+            login_response = await response.json(content_type=None)
+        self._apply_login_response(login_response)
+        return login_response
+
+    async def _ensure_token(self) -> None:
+        """トークンが失効していればログインする。同時に失効を検知したタスクのうち1つだけがログインする"""
+        if self.is_token_valid():
+            return
+        async with self._login_lock:
+            if self.is_token_valid():
+                self.login_stats["logins_avoided"] += 1
+                return
+            await self.login()
+            if not self.is_token_valid():
+                raise ValueError("Token is invalid or expired. Please login again.")
+
+    def start_token_refresher(self) -> None:
+        """トークン失効前に再ログインするタスクを実行中のイベントループ上で開始"""
+        if self._refresher is not None and not self._refresher.done():
+            return
+        self._refresher = asyncio.get_running_loop().create_task(self._token_refresh_loop())
+
+    async def stop_token_refresher(self) -> None:
+        if self._refresher is None:
+            return
+        self._refresher.cancel()
+        try:
+            await self._refresher
+        except asyncio.CancelledError:
+            pass
+        self._refresher = None
+
+    async def _token_refresh_loop(self) -> None:
+        wait = self._seconds_until_refresh()
+        while True:
+            await asyncio.sleep(wait)
+            try:
+                async with self._login_lock:
+                    if self._seconds_until_refresh() <= 0:
+                        await self.login()
+                        self.login_stats["background_logins"] += 1
+                wait = self._seconds_until_refresh() or self.token_refresh_retry_seconds
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.logger.warning(f"Background token refresh failed: {e}")
+                wait = self.token_refresh_retry_seconds
+
+    async def _make_request(self, method: str, endpoint: str, **kwargs) -> Dict[str, Any]:
+        cached = self.response_cache.lookup(method, endpoint, kwargs.get('params'))
+        if not is_miss(cached):
+            return cached
+        try:
+            result = await self._request_with_retry(method, endpoint, **kwargs)
+        finally:
+            self.response_cache.invalidate_for(method, endpoint)
+        self.response_cache.store(method, endpoint, kwargs.get('params'), result)
+        return result
+
+    async def _request_with_retry(self, method: str, endpoint: str, **kwargs) -> Dict[str, Any]:
+        logging.info(f"Making {method} request to {endpoint} with params: {kwargs.get('params', {})} and data: {kwargs.get('json', {})}")
+        retryable = self.retry_policy.is_retryable_request(method, endpoint)
+        breaker = self.circuit_breakers.get(endpoint)
+        attempt = 0
+        while True:
+            self._before_attempt(breaker)
+            attempt += 1
+            try:
+                result = await self._send_request(method, endpoint, **kwargs)
+            except aiohttp.ClientResponseError as e:
+                delay = self._after_failure(breaker, method, endpoint, e.status, attempt, retryable, e)
+                if delay is None:
+                    raise
+                await asyncio.sleep(delay)
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+                delay = self._after_failure(breaker, method, endpoint, None, attempt, retryable, e)
+                if delay is None:
+                    raise
+                await asyncio.sleep(delay)
+            except BaseException:
+                breaker.release()
+                raise
+            else:
+                breaker.record_success()
+                return result
+
+    async def _send_request(self, method: str, endpoint: str, **kwargs) -> Dict[str, Any]:
+        await self._ensure_token()
+        download_to = kwargs.pop('download_to', None)
+        if 'params' in kwargs:
+            kwargs['params'] = self._to_query_params(kwargs['params'])
+        url = f"{self.base_url}/HinemosWeb/api/{endpoint}"
+        async with self._get_session().request(method, url, headers=self._auth_headers(), **kwargs) as response:
+            response.raise_for_status()
+            if download_to is None:
+                return await response.json(content_type=None)
+            with DownloadWriter(download_to) as writer:
+                async for chunk in response.content.iter_chunked(DOWNLOAD_CHUNK_SIZE):
+                    writer.write(chunk)
+                return writer.commit(response.headers.get('Content-Type'))
+
+    async def logout(self) -> None:
+        await self.stop_token_refresher()
+        self.response_cache.clear()
+        self.token_id = None
+        self.token_expiration = None
+
+    async def close(self) -> None:
+        await self.logout()
+        if self._owns_session and self._session is not None and not self._session.closed:
+            await self._session.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
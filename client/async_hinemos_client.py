@@ -0,0 +1,176 @@
+import asyncio
+from dataclasses import replace
+from datetime import datetime, timezone
+from typing import Dict, Any, AsyncIterator, List, Optional, Tuple
+from .async_base import AsyncBaseClient
+from .repository import RepositoryClient
+from .monitor import MonitorClient
+from .calendar import CalendarClient
+from .collect import CollectClient
+from .job import JobClient
+from .monitor_result import MonitorResultClient
+from .event_pager import EventWindowPager
+from .job_history_pager import JobHistoryPager
+from .event_fanout import FanoutConfig, fanout_event_search, scope_children
+from .bulk import BulkConfig, ProgressCallback, event_target, run_chunked
+from .event_export import EventExport
+from .collect_fetch import CollectFetchConfig, CollectFetchResult, fetch_collect_series
+from .collect_resolver import CollectIdResolver, CollectKey, resolve_collect_ids
+from .job_launch import LaunchConfig, launch_jobs
+
+class AsyncHinemosClient(
+    RepositoryClient,
+    MonitorClient,
+    CalendarClient,
+    CollectClient,
+    JobClient,
+    MonitorResultClient,
+    AsyncBaseClient
+):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.collect_ids = CollectIdResolver()
+
+    # ページング系は mixin の同期実装を await 版で置き換える
+
+    async def next_event_page(self, pager: EventWindowPager) -> List[Dict[str, Any]]:
+        while pager.has_next:
+            window = pager.pop()
+            events = pager.feed(window, await self.event_search(pager.request_filter(window), pager.page_size))
+            if events:
+                return events
+        return []
+
+    async def iter_events(self, filter: Dict[str, Any], page_size: int = 1000,
+                          field: str = "outputDate") -> AsyncIterator[Dict[str, Any]]:
+        pager = EventWindowPager(filter, page_size, field)
+        while pager.has_next:
+            for event in await self.next_event_page(pager):
+                yield event
+
+    async def next_history_page(self, pager: JobHistoryPager) -> List[Dict[str, Any]]:
+        while pager.has_next:
+            window = pager.pop()
+            history = pager.feed(window, await self.history_search(pager.page_size, pager.request_filter(window)))
+            if history:
+                return history
+        return []
+
+    async def iter_job_history(self, filter: Dict[str, Any], page_size: int = 1000,
+                               field: str = "startDate") -> AsyncIterator[Dict[str, Any]]:
+        pager = JobHistoryPager(filter, page_size, field)
+        while pager.has_next:
+            for run in await self.next_history_page(pager):
+                yield run
+
+    async def export_events(self, filter: Dict[str, Any], format: str = "ndjson", output_path: Optional[str] = None,
+                            fields: Optional[List[str]] = None, page_size: int = 1000, field: str = "outputDate",
+                            on_progress: Optional[ProgressCallback] = None) -> Dict[str, Any]:
+        """
+        export_events の非同期版
+        次ページの取得とファイル書き込み（別スレッド）を並行させ、書き込み待ちでイベントループを止めない
+        """
+        path = self._export_path(format, output_path)
+        pager = EventWindowPager(filter, page_size, field)
+        with EventExport(path, format, fields) as export:
+            fetch = asyncio.ensure_future(self.next_event_page(pager)) if pager.has_next else None
+            try:
+                while fetch is not None:
+                    events = await fetch
+                    fetch = asyncio.ensure_future(self.next_event_page(pager)) if pager.has_next else None
+                    await asyncio.to_thread(export.write, events)
+                    if on_progress is not None:
+                        await on_progress(export.rows, None, f"export_events: {export.rows} rows")
+            except BaseException:
+                if fetch is not None:
+                    fetch.cancel()
+                raise
+        return export.result()
+
+    async def event_search_fanout(self, filter: Dict[str, Any], size: int = 1000, field: str = "generationDate",
+                                  split_by_scope: bool = False, concurrency: Optional[int] = None) -> Dict[str, Any]:
+        """
+        広い日時範囲の event_search を時間スライス（split_by_scope 時は子スコープ単位にも）に分割して並列実行し、
+        日時の新しい順にマージした上位 size 件を返す
+        """
+        config = FanoutConfig.from_env()
+        if concurrency:
+            config = replace(config, concurrency=concurrency)
+        scopes = None
+        if split_by_scope:
+            scopes = scope_children(await self.get_facility_tree(), (filter or {}).get("facilityId") or "ROOT") or None
+        return await fanout_event_search(self.event_search, filter, size, field, scopes, config)
+
+    async def event_confirm_bulk(self, events: List[Dict[str, Any]], confirm_type: int,
+                                 config: Optional[BulkConfig] = None,
+                                 on_progress: Optional[ProgressCallback] = None) -> Dict[str, Any]:
+        """
+        大量イベントの確認状態を chunk_size 件ずつの event_confirm に分割し、並列に更新する
+        失敗したチャンクは再送する（同じ確認状態の再設定は冪等）
+        """
+        targets = [event_target(event) for event in events]
+
+        async def submit(chunk):
+            await self.event_confirm(chunk, confirm_type)
+
+        return await run_chunked(targets, submit, config, self.retry_policy, on_progress, label="event_confirm_bulk")
+
+    async def event_comment_bulk(self, events: List[Dict[str, Any]], comment: str, comment_user: str,
+                                 comment_date: Optional[str] = None, config: Optional[BulkConfig] = None,
+                                 on_progress: Optional[ProgressCallback] = None) -> Dict[str, Any]:
+        """
+        大量イベントに同じコメントを設定する
+        event_comment は1件ずつのAPIのため、チャンク内は順に送信し、チャンク単位で並列・再送する
+        """
+        targets = [event_target(event) for event in events]
+        if comment_date is None:
+            comment_date = datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%S.%f')[:-3] + 'Z'
+
+        async def submit(chunk):
+            for target in chunk:
+                await self.event_comment(target["monitorId"], target["monitorDetailId"], target["pluginId"],
+                                         target["facilityId"], target["outputDate"], comment, comment_date, comment_user)
+
+        return await run_chunked(targets, submit, config, self.retry_policy, on_progress, label="event_comment_bulk")
+
+    async def run_job_bulk(self, launches: List[Dict[str, Any]], config: Optional[LaunchConfig] = None,
+                           on_progress: Optional[ProgressCallback] = None) -> Dict[str, Any]:
+        """
+        run_job / run_job_kick を並列数とトークンバケットで流量を抑えて一括実行し、sessionId とエラーの表を返す
+        """
+        return await launch_jobs(launches, self.run_job, self.run_job_kick, config, on_progress)
+
+    async def fetch_collect_series(self, id_list: List[Any], summary_type: str, from_time: str, to_time: str,
+                                   size: Optional[int] = None,
+                                   config: Optional[CollectFetchConfig] = None) -> CollectFetchResult:
+        """
+        get_collect_data を収集IDのバッチ × 期間ウィンドウに分割して並列に取得し、収集IDごとの NumPy 配列にまとめる
+        """
+        return await fetch_collect_series(self.get_collect_data, id_list, summary_type, from_time, to_time, size, config)
+
+    async def resolve_collect_ids(self, keys: List[CollectKey]) -> Tuple[Dict[CollectKey, Any], List[CollectKey]]:
+        """
+        (monitorId, itemName, displayName, facilityId) を収集IDに解決する
+        get_item_code_list でファシリティ単位にまとめて取り込んだ対応表を使い、見つからないキーだけ get_collect_id で問い合わせる
+        """
+        return await resolve_collect_ids(self.collect_ids, self.get_item_code_list, self.get_collect_id, keys)
+
+    # 収集設定の更新後は収集IDの対応表を取り直す
+
+    async def add_collect_setting(self, collect_info: dict) -> Dict[str, Any]:
+        try:
+            return await super().add_collect_setting(collect_info)
+        finally:
+            self.collect_ids.invalidate()
+
+    async def modify_collect_setting(self, collect_id: str, collect_info: dict) -> Dict[str, Any]:
+        try:
+            return await super().modify_collect_setting(collect_id, collect_info)
+        finally:
+            self.collect_ids.invalidate()
+
+    async def delete_collect_setting(self, collect_ids: list) -> Dict[str, Any]:
+        try:
+            return await super().delete_collect_setting(collect_ids)
+        finally:
+            self.collect_ids.invalidate()
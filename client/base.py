@@ -1,22 +1,112 @@
 import os
+import time
+import threading
 import requests
 import logging
 from datetime import datetime, timedelta
 from typing import Optional, Dict, Any
+from .pool import PoolConfig, adapter_pool_stats
+from .retry import RetryPolicy, CircuitBreakerRegistry, CircuitOpenError
+from .download import DownloadWriter, DOWNLOAD_CHUNK_SIZE
+from .cache import ResponseCache, is_miss
+
+# is_token_valid() がトークンを失効扱いにする有効期限前の猶予
+TOKEN_EXPIRY_BUFFER = timedelta(minutes=5)
 
 class BaseClient:
-    def __init__(self, base_url: Optional[str] = None):
+    # バックグラウンド再ログインを TOKEN_EXPIRY_BUFFER よりさらに何秒前に行うか
+    token_refresh_lead_seconds = 60
+    # バックグラウンド再ログイン失敗時の再試行間隔（秒）
+    token_refresh_retry_seconds = 30
+
+    def __init__(self, base_url: Optional[str] = None, pool_config: Optional[PoolConfig] = None,
+                 retry_policy: Optional[RetryPolicy] = None, response_cache: Optional[ResponseCache] = None):
         if base_url is None:
             base_url = os.getenv("HINEMOS_ENDPOINT", "http://localhost:8080")
         self.base_url = base_url.rstrip('/')
-        self.session = requests.Session()
+        self.pool_config = pool_config or PoolConfig.from_env()
+        # コネクションプール(HTTPAdapter)は全スレッドで共有し、Sessionはスレッド毎に持つ
+        self._adapter = self.pool_config.create_http_adapter()
+        self._local = threading.local()
         self.token_id: Optional[str] = None
         self.token_expiration: Optional[datetime] = None
         self.logger = logging.getLogger(__name__)
-        self.session.headers.update({
+        self.headers = {
             'Content-Type': 'application/json',
             'Accept': 'application/json'
-        })
+        }
+        if not self.pool_config.keep_alive:
+            self.headers['Connection'] = 'close'
+        self._init_login_state()
+        self._init_resilience(retry_policy)
+        self.response_cache = response_cache or ResponseCache()
+        self._login_lock = threading.Lock()
+        self._refresher: Optional[threading.Thread] = None
+        self._refresher_stop = threading.Event()
+
+    def _init_login_state(self) -> None:
+        # logins: 実行したログイン数 / background_logins: うちバックグラウンド更新分
+        # logins_avoided: 失効を検知したが他の呼び出しの更新済みトークンを再利用できた数
+        self.login_stats = {"logins": 0, "background_logins": 0, "logins_avoided": 0}
+
+    def get_login_stats(self) -> Dict[str, int]:
+        return dict(self.login_stats)
+
+    def _init_resilience(self, retry_policy: Optional[RetryPolicy]) -> None:
+        self.retry_policy = retry_policy or RetryPolicy.from_env()
+        self.circuit_breakers = CircuitBreakerRegistry()
+        self.retry_stats = {"retries": 0, "circuit_rejections": 0}
+
+    def get_resilience_stats(self) -> Dict[str, Any]:
+        return {**self.retry_stats, "circuit_breakers": self.circuit_breakers.snapshot()}
+
+    def get_cache_stats(self) -> Dict[str, Any]:
+        return self.response_cache.snapshot()
+
+    def _before_attempt(self, breaker) -> None:
+        try:
+            breaker.before_request()
+        except CircuitOpenError:
+            self.retry_stats["circuit_rejections"] += 1
+            raise
+
+    def _after_failure(self, breaker, method: str, endpoint: str, status: Optional[int],
+                       attempt: int, retryable: bool, error: Exception) -> Optional[float]:
+        """
+        失敗した試行を記録し、リトライする場合は待機秒数を返す（リトライしない場合はNone）
+        4xx はマネージャ自体は正常に応答しているためブレーカーの失敗に数えない
+        """
+        if status is not None and status < 500:
+            breaker.record_success()
+            return None
+        breaker.record_failure()
+        if not (retryable and self.retry_policy.is_retryable_status(status) and attempt < self.retry_policy.max_attempts):
+            return None
+        self.retry_stats["retries"] += 1
+        delay = self.retry_policy.delay(attempt - 1)
+        self.logger.warning(f"Retrying {method} {endpoint} in {delay:.2f}s (attempt {attempt + 1}/{self.retry_policy.max_attempts}): {error}")
+        return delay
+
+    @property
+    def session(self) -> requests.Session:
+        """呼び出し元スレッド専用のSession（共有のコネクションプールをマウント済み）"""
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = requests.Session()
+            session.headers.update(self.headers)
+            session.mount("http://", self._adapter)
+            session.mount("https://", self._adapter)
+            self._local.session = session
+        return session
+
+    def get_pool_stats(self) -> Dict[str, Any]:
+        return adapter_pool_stats(self._adapter)
+
+    def _auth_headers(self) -> Dict[str, str]:
+        # トークンはSessionの共有ヘッダを書き換えず、リクエスト毎に付与する
+        if self.token_id:
+            return {'Authorization': f'Bearer {self.token_id}'}
+        return {}
 
     def login(self, user_id: Optional[str] = None, password: Optional[str] = None) -> Dict[str, Any]:
         if user_id is None:
@@ -28,39 +118,135 @@ class BaseClient:
         response = self.session.post(login_url, json=login_data)
         response.raise_for_status()
         login_response = response.json()
+        self._apply_login_response(login_response)
+        return login_response
+
+    def _apply_login_response(self, login_response: Dict[str, Any]) -> None:
         token_info = login_response.get('token', {})
         self.token_id = token_info.get('tokenId')
         expiration_str = token_info.get('expirationDate')
         if expiration_str:
             self.token_expiration = datetime.strptime(expiration_str, "%Y-%m-%d %H:%M:%S.%f")
-        if self.token_id:
-            self.session.headers.update({'Authorization': f'Bearer {self.token_id}'})
-        return login_response
+        self.login_stats["logins"] += 1
 
     def is_token_valid(self) -> bool:
         if not self.token_id or not self.token_expiration:
             return False
-        return datetime.now() < (self.token_expiration - timedelta(minutes=5))
+        return datetime.now() < (self.token_expiration - TOKEN_EXPIRY_BUFFER)
 
-    def _make_request(self, method: str, endpoint: str, **kwargs) -> Dict[str, Any]:
-        logging.info(f"Making {method} request to {endpoint} with params: {kwargs.get('params', {})} and data: {kwargs.get('json', {})}")
-        if not self.is_token_valid():
+    def _seconds_until_refresh(self) -> float:
+        """バックグラウンド再ログインを行うまでの秒数（未ログインなら0）"""
+        if not self.token_id or not self.token_expiration:
+            return 0.0
+        refresh_at = self.token_expiration - TOKEN_EXPIRY_BUFFER - timedelta(seconds=self.token_refresh_lead_seconds)
+        return max((refresh_at - datetime.now()).total_seconds(), 0.0)
+
+    def _ensure_token(self) -> None:
+        """トークンが失効していればログインする。同時に失効を検知したスレッドのうち1つだけがログインする"""
+        if self.is_token_valid():
+            return
+        with self._login_lock:
+            if self.is_token_valid():
+                self.login_stats["logins_avoided"] += 1
+                return
             self.login()
             if not self.is_token_valid():
                 raise ValueError("Token is invalid or expired. Please login again.")
+
+    def start_token_refresher(self) -> None:
+        """トークン失効前に再ログインするデーモンスレッドを開始"""
+        if self._refresher is not None and self._refresher.is_alive():
+            return
+        self._refresher_stop.clear()
+        self._refresher = threading.Thread(target=self._token_refresh_loop, name="hinemos-token-refresher", daemon=True)
+        self._refresher.start()
+
+    def stop_token_refresher(self) -> None:
+        self._refresher_stop.set()
+        if self._refresher is not None and self._refresher is not threading.current_thread():
+            self._refresher.join(timeout=5)
+        self._refresher = None
+
+    def _token_refresh_loop(self) -> None:
+        wait = self._seconds_until_refresh()
+        while not self._refresher_stop.wait(wait):
+            try:
+                with self._login_lock:
+                    if self._seconds_until_refresh() <= 0:
+                        self.login()
+                        self.login_stats["background_logins"] += 1
+                # 有効期限が猶予より短いトークンで再ログインが連続しないよう再試行間隔を下限にする
+                wait = self._seconds_until_refresh() or self.token_refresh_retry_seconds
+            except Exception as e:
+                self.logger.warning(f"Background token refresh failed: {e}")
+                wait = self.token_refresh_retry_seconds
+
+    def _make_request(self, method: str, endpoint: str, **kwargs) -> Dict[str, Any]:
+        """
+        認証付きリクエスト
+        マスタ・ツリー系のGETは ResponseCache から返し、対応する更新系リクエストでキャッシュを破棄する。
+        """
+        cached = self.response_cache.lookup(method, endpoint, kwargs.get('params'))
+        if not is_miss(cached):
+            return cached
+        try:
+            result = self._request_with_retry(method, endpoint, **kwargs)
+        finally:
+            # 更新系は失敗時も部分的に反映されている可能性があるため破棄する
+            self.response_cache.invalidate_for(method, endpoint)
+        self.response_cache.store(method, endpoint, kwargs.get('params'), result)
+        return result
+
+    def _request_with_retry(self, method: str, endpoint: str, **kwargs) -> Dict[str, Any]:
+        """
+        参照系(GET・検索POST)は一時的な障害時に指数バックオフでリトライする。
+        更新系は allow_mutation_retry() で許可された場合のみリトライする。
+        """
+        logging.info(f"Making {method} request to {endpoint} with params: {kwargs.get('params', {})} and data: {kwargs.get('json', {})}")
+        retryable = self.retry_policy.is_retryable_request(method, endpoint)
+        breaker = self.circuit_breakers.get(endpoint)
+        attempt = 0
+        while True:
+            self._before_attempt(breaker)
+            attempt += 1
+            try:
+                result = self._send_request(method, endpoint, **kwargs)
+            except (requests.ConnectionError, requests.Timeout, requests.HTTPError) as e:
+                status = e.response.status_code if e.response is not None else None
+                delay = self._after_failure(breaker, method, endpoint, status, attempt, retryable, e)
+                if delay is None:
+                    raise
+                time.sleep(delay)
+            except Exception:
+                breaker.release()
+                raise
+            else:
+                breaker.record_success()
+                return result
+
+    def _send_request(self, method: str, endpoint: str, **kwargs) -> Dict[str, Any]:
+        self._ensure_token()
+        # download_to 指定時はレスポンス本文をメモリに載せずファイルへ逐次書き込む
+        download_to = kwargs.pop('download_to', None)
         url = f"{self.base_url}/HinemosWeb/api/{endpoint}"
-        response = self.session.request(method, url, **kwargs)
+        headers = {**self._auth_headers(), **kwargs.pop('headers', {})}
+        response = self.session.request(method, url, headers=headers, stream=download_to is not None, **kwargs)
         response.raise_for_status()
-        return response.json()
+        if download_to is None:
+            return response.json()
+        with response, DownloadWriter(download_to) as writer:
+            for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                writer.write(chunk)
+            return writer.commit(response.headers.get('Content-Type'))
 
     def logout(self) -> None:
+        self.stop_token_refresher()
+        self.response_cache.clear()
         self.token_id = None
         self.token_expiration = None
-        if 'Authorization' in self.session.headers:
-            del self.session.headers['Authorization']
 
     def __enter__(self):
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        self.logout()
\ No newline at end of file
+        self.logout()
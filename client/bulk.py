@@ -0,0 +1,110 @@
+import os
+import time
+import asyncio
+import logging
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence
+
+from .retry import RetryPolicy
+
+logger = logging.getLogger(__name__)
+
+# 進捗通知 (完了件数, 総件数（不明な場合は None）, メッセージ)
+ProgressCallback = Callable[[int, Optional[int], str], Awaitable[None]]
+
+# 失敗した対象として応答に含める最大件数
+FAILED_ITEMS_LIMIT = 200
+
+# 1件の対象を識別するキー（event_confirm / event_comment の対象指定）
+EVENT_KEY_FIELDS = ("monitorId", "monitorDetailId", "pluginId", "facilityId", "outputDate")
+
+
+def event_target(event: Dict[str, Any]) -> Dict[str, Any]:
+    """イベント（検索結果でも可）から更新APIの対象指定部分だけを取り出す"""
+    return {field: event.get(field, "" if field == "monitorDetailId" else None) for field in EVENT_KEY_FIELDS}
+
+
+@dataclass
+class BulkConfig:
+    """
+    一括更新の分割・並列実行設定
+    Attributes:
+        chunk_size: 1リクエストあたりの対象件数
+        concurrency: 同時に送信するチャンク数
+        max_attempts: 1チャンクあたりの最大試行回数（初回を含む）
+    """
+    chunk_size: int = 500
+    concurrency: int = 4
+    max_attempts: int = 3
+
+    @classmethod
+    def from_env(cls) -> "BulkConfig":
+        default = cls()
+        return cls(
+            chunk_size=int(os.getenv("HINEMOS_BULK_CHUNK_SIZE", default.chunk_size)),
+            concurrency=int(os.getenv("HINEMOS_BULK_CONCURRENCY", default.concurrency)),
+            max_attempts=int(os.getenv("HINEMOS_BULK_MAX_ATTEMPTS", default.max_attempts)),
+        )
+
+
+async def run_chunked(items: Sequence[Any], submit: Callable[[List[Any]], Awaitable[Any]],
+                      config: Optional[BulkConfig] = None, retry_policy: Optional[RetryPolicy] = None,
+                      on_progress: Optional[ProgressCallback] = None, label: str = "bulk") -> Dict[str, Any]:
+    """
+    items を chunk_size 件ずつに分割して submit を並列実行する
+    失敗したチャンクはバックオフを挟んで max_attempts 回まで再送し、最終的に失敗したチャンクの対象を返す。
+    submit は同じチャンクを複数回送っても結果が変わらない（冪等な）処理であること。
+    Returns:
+        {"requested", "succeeded", "failed", "chunks", "chunkResults", "failedItems", "elapsedSeconds"}
+    """
+    config = config or BulkConfig.from_env()
+    retry_policy = retry_policy or RetryPolicy.from_env()
+    chunk_size = max(1, config.chunk_size)
+    chunks = [list(items[i:i + chunk_size]) for i in range(0, len(items), chunk_size)]
+    semaphore = asyncio.Semaphore(max(1, config.concurrency))
+    chunk_results: List[Optional[Dict[str, Any]]] = [None] * len(chunks)
+    progress = {"done": 0, "succeeded": 0}
+    started = time.monotonic()
+
+    async def process(index: int, chunk: List[Any]) -> None:
+        async with semaphore:
+            began = time.monotonic()
+            error = None
+            for attempt in range(max(1, config.max_attempts)):
+                if attempt:
+                    await asyncio.sleep(retry_policy.delay(attempt - 1))
+                try:
+                    await submit(chunk)
+                    error = None
+                    break
+                except Exception as e:
+                    error = e
+                    logger.warning(f"{label} chunk {index} ({len(chunk)} items) attempt {attempt + 1} failed: {e}")
+            result = {"chunk": index, "size": len(chunk), "attempts": attempt + 1,
+                      "status": "ok" if error is None else "failed",
+                      "seconds": round(time.monotonic() - began, 3)}
+            if error is not None:
+                result["error"] = str(error)
+            else:
+                progress["succeeded"] += len(chunk)
+            chunk_results[index] = result
+            progress["done"] += len(chunk)
+        if on_progress is not None:
+            await on_progress(progress["done"], len(items),
+                              f"{label}: {progress['succeeded']}/{len(items)} succeeded")
+
+    await asyncio.gather(*(process(index, chunk) for index, chunk in enumerate(chunks)))
+
+    failed_items = [item for chunk, result in zip(chunks, chunk_results) if result["status"] != "ok" for item in chunk]
+    summary = {
+        "requested": len(items),
+        "succeeded": progress["succeeded"],
+        "failed": len(failed_items),
+        "chunks": len(chunks),
+        "chunkResults": chunk_results,
+        "failedItems": failed_items[:FAILED_ITEMS_LIMIT],
+        "elapsedSeconds": round(time.monotonic() - started, 3),
+    }
+    logger.info(f"{label}: {summary['succeeded']}/{summary['requested']} succeeded in {summary['elapsedSeconds']}s "
+                f"({len(chunks)} chunks)")
+    return summary
@@ -0,0 +1,159 @@
+import os
+import copy
+import time
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Any, Optional, Tuple
+from .retry import is_idempotent
+
+
+@dataclass(frozen=True)
+class CacheRule:
+    """
+    キャッシュ対象エンドポイントのグループ
+    Attributes:
+        name: グループ名（HINEMOS_CACHE_TTL_<NAME> でTTLを個別指定できる）
+        endpoints: キャッシュするGETエンドポイント（クエリパラメータ違いは別エントリ）
+        invalidated_by: このプレフィックス配下への更新系リクエストでグループ全体を破棄する
+        ttl: 既定のTTL秒数
+    """
+    name: str
+    endpoints: Tuple[str, ...]
+    invalidated_by: Tuple[str, ...]
+    ttl: float = 300.0
+
+
+# 参照が多く、ほとんど変化しないマスタ・ツリー系API
+DEFAULT_CACHE_RULES = (
+    CacheRule(
+        "repository",
+        ("RepositoryRestEndpoints/repository/facility_tree",
+         "RepositoryRestEndpoints/repository/platform",
+         "RepositoryRestEndpoints/repository/subPlatform"),
+        ("RepositoryRestEndpoints/repository/",),
+    ),
+    CacheRule(
+        "calendar",
+        ("CalendarRestEndpoints/calendar/calendar",),
+        ("CalendarRestEndpoints/calendar/",),
+    ),
+    CacheRule(
+        "collect_master",
+        ("CollectRestEndpoints/collect/itemCodeMst",),
+        ("CollectRestEndpoints/collect/itemCodeMst",),
+        ttl=3600.0,
+    ),
+    CacheRule(
+        "jmx_master",
+        ("MonitorsettingRestEndpoints/monitorsetting/jmxmaster_all",),
+        ("MonitorsettingRestEndpoints/monitorsetting/jmxmaster",),
+        ttl=3600.0,
+    ),
+    CacheRule(
+        "job_tree",
+        ("JobRestEndpoints/job/setting/job_treeSimple",),
+        ("JobRestEndpoints/job/setting/",),
+        ttl=60.0,
+    ),
+)
+
+_MISS = object()
+
+
+class ResponseCache:
+    """
+    TTL + LRU のレスポンスキャッシュ
+    CacheRule に一致するGETの結果を保持し、対応する更新系リクエストで破棄する。
+    TTLが0のグループはキャッシュしない。
+    """
+
+    def __init__(self, rules=DEFAULT_CACHE_RULES, max_entries: Optional[int] = None):
+        self.max_entries = max_entries if max_entries is not None else int(os.getenv("HINEMOS_CACHE_MAX_ENTRIES", "256"))
+        default_ttl = os.getenv("HINEMOS_CACHE_TTL")
+        self._rules = {rule.name: rule for rule in rules}
+        self._ttls: Dict[str, float] = {
+            rule.name: float(os.getenv(f"HINEMOS_CACHE_TTL_{rule.name.upper()}", default_ttl or rule.ttl))
+            for rule in rules
+        }
+        self._endpoint_rules: Dict[str, str] = {
+            endpoint: rule.name for rule in rules for endpoint in rule.endpoints
+        }
+        self._entries: "OrderedDict[tuple, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "misses": 0, "evictions": 0, "invalidations": 0}
+
+    @staticmethod
+    def _key(rule: str, endpoint: str, params: Optional[Dict[str, Any]]) -> tuple:
+        items = tuple(sorted((k, str(v)) for k, v in (params or {}).items() if v is not None))
+        return (rule, endpoint, items)
+
+    def _rule_for(self, method: str, endpoint: str) -> Optional[str]:
+        if method.upper() != "GET":
+            return None
+        rule = self._endpoint_rules.get(endpoint)
+        if rule is None or self._ttls[rule] <= 0:
+            return None
+        return rule
+
+    def lookup(self, method: str, endpoint: str, params: Optional[Dict[str, Any]]) -> Any:
+        """キャッシュ済みの結果を返す。対象外・未キャッシュ・期限切れの場合は _MISS"""
+        rule = self._rule_for(method, endpoint)
+        if rule is None:
+            return _MISS
+        key = self._key(rule, endpoint, params)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= time.monotonic():
+                if entry is not None:
+                    del self._entries[key]
+                self.stats["misses"] += 1
+                return _MISS
+            self._entries.move_to_end(key)
+            self.stats["hits"] += 1
+            value = entry[1]
+        # 呼び出し側での書き換えがキャッシュに波及しないよう複製して返す
+        return copy.deepcopy(value)
+
+    def store(self, method: str, endpoint: str, params: Optional[Dict[str, Any]], value: Any) -> None:
+        rule = self._rule_for(method, endpoint)
+        if rule is None:
+            return
+        key = self._key(rule, endpoint, params)
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self._ttls[rule], copy.deepcopy(value))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.stats["evictions"] += 1
+
+    def invalidate_for(self, method: str, endpoint: str) -> None:
+        """更新系リクエストの対象に応じてキャッシュグループを破棄"""
+        if is_idempotent(method, endpoint):
+            return
+        path = endpoint.split("?")[0]
+        names = {
+            rule.name for rule in self._rules.values()
+            if any(path.startswith(prefix) for prefix in rule.invalidated_by)
+        }
+        if names:
+            self._drop(names)
+
+    def _drop(self, names) -> None:
+        with self._lock:
+            for key in [key for key in self._entries if key[0] in names]:
+                del self._entries[key]
+            self.stats["invalidations"] += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def snapshot(self) -> Dict[str, Any]:
+        lookups = self.stats["hits"] + self.stats["misses"]
+        hit_rate = self.stats["hits"] / lookups if lookups else 0.0
+        return {**self.stats, "entries": len(self._entries), "hit_rate": round(hit_rate, 4)}
+
+
+def is_miss(value: Any) -> bool:
+    return value is _MISS
@@ -0,0 +1,241 @@
+import os
+import time
+import asyncio
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# get_collect_data の fromTime / toTime の形式（マネージャのローカル時刻。内部では UTC とみなしてミリ秒に変換する）
+COLLECT_TIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+Window = Tuple[int, int]
+CollectFetch = Callable[[List[Any], str, str, str, Optional[int]], Awaitable[Any]]
+
+
+def parse_collect_time(value: Any) -> int:
+    """収集日時（yyyy-MM-dd HH:mm:ss[.SSS] / ISO8601 / エポックミリ秒）をエポックミリ秒に変換"""
+    if isinstance(value, (int, float)):
+        return int(value)
+    text = str(value).strip().rstrip("Z")
+    return int(np.datetime64(text, "ms").astype(np.int64))
+
+
+def format_collect_time(millis: int) -> str:
+    return datetime.fromtimestamp(millis / 1000, tz=timezone.utc).strftime(COLLECT_TIME_FORMAT)
+
+
+def _collect_records(result: Any) -> List[Dict[str, Any]]:
+    """get_collect_data の応答から収集値レコードの一覧を取り出す（リスト / {"...List": [...]} のどちらでも可）"""
+    if isinstance(result, list):
+        return result
+    if isinstance(result, dict):
+        for key in ("collectDataList", "dataList", "list"):
+            if isinstance(result.get(key), list):
+                return result[key]
+        for value in result.values():
+            if isinstance(value, list):
+                return value
+    return []
+
+
+def _times_to_millis(times: List[Any]) -> np.ndarray:
+    if times and isinstance(times[0], str):
+        try:
+            return np.array([t.rstrip("Z") for t in times], dtype="datetime64[ms]").astype(np.int64)
+        except ValueError:
+            pass
+    return np.fromiter((parse_collect_time(t) for t in times), dtype=np.int64, count=len(times))
+
+
+@dataclass
+class CollectSeries:
+    """1つの収集IDの時系列（時刻昇順、時刻の重複なし）"""
+    collect_id: Any
+    times: np.ndarray   # int64 エポックミリ秒
+    values: np.ndarray  # float64（欠損は NaN）
+
+    def __len__(self) -> int:
+        return len(self.times)
+
+    def summary(self) -> Dict[str, Any]:
+        result: Dict[str, Any] = {"collectId": self.collect_id, "points": len(self)}
+        if not len(self):
+            return result
+        finite = self.values[np.isfinite(self.values)]
+        result.update({
+            "from": format_collect_time(int(self.times[0])),
+            "to": format_collect_time(int(self.times[-1])),
+            "last": _round(self.values[-1]),
+            "missing": int(len(self.values) - len(finite)),
+        })
+        if len(finite):
+            result.update({
+                "min": _round(finite.min()),
+                "max": _round(finite.max()),
+                "mean": _round(finite.mean()),
+            })
+        return result
+
+
+def _round(value: float) -> Optional[float]:
+    value = float(value)
+    return round(value, 6) if np.isfinite(value) else None
+
+
+def assemble_series(parts: Dict[Any, List[Tuple[np.ndarray, np.ndarray]]]) -> Dict[Any, CollectSeries]:
+    """チャンクごとの (時刻, 値) を収集IDごとに連結し、時刻順に並べて重複時刻を除く"""
+    series = {}
+    for collect_id, chunks in parts.items():
+        times = np.concatenate([t for t, _ in chunks]) if chunks else np.empty(0, dtype=np.int64)
+        values = np.concatenate([v for _, v in chunks]) if chunks else np.empty(0, dtype=np.float64)
+        order = np.argsort(times, kind="stable")
+        times, values = times[order], values[order]
+        if len(times) > 1:
+            keep = np.empty(len(times), dtype=bool)
+            keep[0] = True
+            np.not_equal(times[1:], times[:-1], out=keep[1:])
+            times, values = times[keep], values[keep]
+        series[collect_id] = CollectSeries(collect_id, times, values)
+    return series
+
+
+@dataclass
+class CollectFetchConfig:
+    """
+    get_collect_data の分割・並列取得設定
+    Attributes:
+        ids_per_request: 1リクエストに含める収集IDの最大数
+        max_id_chars: idList パラメータの最大文字数（URL長の制限対策）
+        window_hours: 1リクエストの期間（時間）
+        concurrency: 同時に実行するリクエスト数
+    """
+    ids_per_request: int = 20
+    max_id_chars: int = 1500
+    window_hours: float = 24.0
+    concurrency: int = 4
+
+    @classmethod
+    def from_env(cls) -> "CollectFetchConfig":
+        default = cls()
+        return cls(
+            ids_per_request=int(os.getenv("HINEMOS_COLLECT_IDS_PER_REQUEST", default.ids_per_request)),
+            max_id_chars=default.max_id_chars,
+            window_hours=float(os.getenv("HINEMOS_COLLECT_WINDOW_HOURS", default.window_hours)),
+            concurrency=int(os.getenv("HINEMOS_COLLECT_CONCURRENCY", default.concurrency)),
+        )
+
+
+def batch_ids(id_list: Sequence[Any], per_request: int, max_chars: int) -> List[List[Any]]:
+    """収集IDを件数と idList の文字数の両方の上限に収まるように分割"""
+    batches: List[List[Any]] = []
+    current: List[Any] = []
+    length = 0
+    for collect_id in id_list:
+        width = len(str(collect_id)) + 1
+        if current and (len(current) >= per_request or length + width > max_chars):
+            batches.append(current)
+            current, length = [], 0
+        current.append(collect_id)
+        length += width
+    if current:
+        batches.append(current)
+    return batches
+
+
+def split_windows(start: int, end: int, span: int) -> List[Window]:
+    """
+    [start, end] を span ミリ秒ごとの閉区間（秒単位）に分割
+    toTime は秒未満を切り捨てて送るため、各区間の toTime を次の区間の fromTime と重ね、境界の秒の中
+    （x:59.000 より後）の収集値が抜け落ちないようにする（重複した時刻は assemble_series で除く）。
+    """
+    span = max(1000, span)
+    windows = [(start, min(end, start + span))]
+    while windows[-1][1] < end:
+        lower = windows[-1][1]
+        windows.append((lower, min(end, lower + span)))
+    return windows
+
+
+@dataclass
+class CollectFetchResult:
+    series: Dict[Any, CollectSeries]
+    stats: Dict[str, Any] = field(default_factory=dict)
+
+    def summary(self) -> Dict[str, Any]:
+        return {"series": [s.summary() for s in self.series.values()], "fetch": self.stats}
+
+
+async def fetch_collect_series(fetch: CollectFetch, id_list: Sequence[Any], summary_type: str,
+                               from_time: str, to_time: str, size: Optional[int] = None,
+                               config: Optional[CollectFetchConfig] = None) -> CollectFetchResult:
+    """
+    収集データを「収集IDのバッチ × 期間ウィンドウ」のチャンクに分けて並列に取得し、収集IDごとの NumPy 配列にまとめる
+    size を指定した場合、件数が size に達したチャンクは打ち切られている可能性があるため、期間を半分に分けて取り直す。
+    Args:
+        fetch: get_collect_data 相当のコルーチン関数 (id_list, summary_type, from_time, to_time, size)
+    """
+    config = config or CollectFetchConfig.from_env()
+    start, end = parse_collect_time(from_time), parse_collect_time(to_time)
+    if start > end:
+        raise ValueError(f"from_time が to_time より後です: {from_time} > {to_time}")
+    # 秒単位に揃える（fromTime/toTime は秒精度）
+    start, end = start - start % 1000, end - end % 1000
+    batches = batch_ids(list(id_list), max(1, config.ids_per_request), config.max_id_chars)
+    windows = split_windows(start, end, int(config.window_hours * 3600000))
+    semaphore = asyncio.Semaphore(max(1, config.concurrency))
+    parts: Dict[Any, List[Tuple[np.ndarray, np.ndarray]]] = {collect_id: [] for collect_id in id_list}
+    # 応答の collectId が文字列で返る場合にも要求時の ID に対応付ける
+    id_lookup = {str(collect_id): collect_id for collect_id in id_list}
+    stats = {"requests": 0, "splits": 0, "records": 0, "maxRequestSeconds": 0.0}
+    started = time.monotonic()
+
+    async def run(batch: List[Any], window: Window) -> None:
+        lower, upper = window
+        async with semaphore:
+            began = time.monotonic()
+            result = await fetch(batch, summary_type, format_collect_time(lower), format_collect_time(upper), size)
+            elapsed = time.monotonic() - began
+        stats["requests"] += 1
+        stats["maxRequestSeconds"] = max(stats["maxRequestSeconds"], elapsed)
+        records = _collect_records(result)
+        if size and len(records) >= size and upper - lower >= 2000:
+            middle = lower + ((upper - lower) // 2000) * 1000
+            stats["splits"] += 1
+            # 分割した区間も境界の秒を重ねる（split_windows と同じ）
+            await asyncio.gather(run(batch, (lower, middle)), run(batch, (middle, upper)))
+            return
+        stats["records"] += len(records)
+        grouped: Dict[Any, Tuple[List[Any], List[Any]]] = {}
+        default_id = batch[0] if len(batch) == 1 else None
+        for record in records:
+            raw_id = record.get("collectId", record.get("id", default_id))
+            collect_id = id_lookup.get(str(raw_id), raw_id)
+            times, values = grouped.setdefault(collect_id, ([], []))
+            times.append(record.get("time", record.get("date")))
+            values.append(record.get("value"))
+        for collect_id, (times, values) in grouped.items():
+            parts.setdefault(collect_id, []).append(
+                (_times_to_millis(times), np.array(values, dtype=np.float64)))
+
+    tasks = [asyncio.ensure_future(run(batch, window)) for batch in batches for window in windows]
+    try:
+        await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        raise
+    series = assemble_series(parts)
+    stats.update({
+        "idBatches": len(batches),
+        "windows": len(windows),
+        "points": int(sum(len(s) for s in series.values())),
+        "elapsedSeconds": round(time.monotonic() - started, 3),
+        "maxRequestSeconds": round(stats["maxRequestSeconds"], 3),
+    })
+    logger.info(f"collect data fetch: {stats}")
+    return CollectFetchResult(series, stats)
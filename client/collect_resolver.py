@@ -0,0 +1,194 @@
+import os
+import time
+import asyncio
+import logging
+import threading
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+# (monitorId, itemName, displayName, facilityId)
+CollectKey = Tuple[str, str, str, str]
+
+# 収集キー一覧の項目名の揺れ（バージョン・エンドポイントにより大文字小文字が異なる）
+_FACILITY_FIELDS = ("facilityId", "facilityid")
+_COLLECT_ID_FIELDS = ("collectId", "collectorId", "collectorid", "id")
+
+
+def collect_keys(targets: Iterable[Dict[str, Any]]) -> List[CollectKey]:
+    """
+    取得対象の指定を (monitorId, itemName, displayName, facilityId) の一覧に展開する
+    各対象は {"monitorId", "itemName", "displayName"(省略時は ""), "facilityIds" または "facilityId"}
+    """
+    keys: List[CollectKey] = []
+    for target in targets:
+        facility_ids = target.get("facilityIds") or [target.get("facilityId")]
+        for facility_id in facility_ids:
+            if not target.get("monitorId") or not target.get("itemName") or not facility_id:
+                raise ValueError(f"monitorId, itemName, facilityIds は必須です: {target}")
+            keys.append((target["monitorId"], target["itemName"], target.get("displayName") or "", facility_id))
+    return list(dict.fromkeys(keys))
+
+
+def _records(result: Any) -> List[Any]:
+    if isinstance(result, list):
+        return result
+    if isinstance(result, dict):
+        for value in result.values():
+            if isinstance(value, list):
+                return value
+    return []
+
+
+def _field(record: Dict[str, Any], names: Sequence[str]) -> Any:
+    for name in names:
+        if record.get(name) is not None:
+            return record[name]
+    return None
+
+
+def _key_record(record: Any) -> Optional[Tuple[CollectKey, Any]]:
+    """収集キー一覧の1件から (キー, 収集ID) を取り出す（収集IDを含まないレコードは None）"""
+    if not isinstance(record, dict):
+        return None
+    collect_id = _field(record, _COLLECT_ID_FIELDS)
+    facility_id = _field(record, _FACILITY_FIELDS)
+    if collect_id is None or facility_id is None or not record.get("monitorId") or not record.get("itemName"):
+        return None
+    return (record["monitorId"], record["itemName"], record.get("displayName") or "", facility_id), collect_id
+
+
+class CollectIdResolver:
+    """
+    (monitorId, itemName, displayName, facilityId) → collectId の対応表
+    ファシリティ単位で収集キー一覧（get_item_code_list）をまとめて取り込み、ttl 秒まで再利用する。
+    収集設定の追加・変更・削除時は invalidate() で全体を破棄する。
+    Args:
+        ttl: ファシリティごとの取り込み結果の有効秒数（HINEMOS_COLLECT_ID_TTL、既定: 3600）
+    """
+
+    def __init__(self, ttl: Optional[float] = None):
+        self.ttl = ttl if ttl is not None else float(os.getenv("HINEMOS_COLLECT_ID_TTL", "3600"))
+        self._mappings: Dict[CollectKey, Any] = {}
+        self._loaded: Dict[Any, float] = {}
+        self._generation = 0
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "misses": 0, "prefetchRequests": 0, "fallbackRequests": 0, "invalidations": 0}
+
+    @property
+    def generation(self) -> int:
+        return self._generation
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._mappings.clear()
+            self._loaded.clear()
+            self._generation += 1
+            self.stats["invalidations"] += 1
+
+    def stale_facilities(self, facility_ids: Iterable[Any]) -> List[Any]:
+        """取り込んでいない、または ttl を過ぎたファシリティ"""
+        now = time.monotonic()
+        with self._lock:
+            return [f for f in dict.fromkeys(facility_ids) if self._loaded.get(f, float("-inf")) + self.ttl <= now]
+
+    def add(self, records: Iterable[Any], facility_ids: Iterable[Any] = (), generation: Optional[int] = None) -> int:
+        """
+        収集キー一覧を取り込み、facility_ids を取り込み済みにする
+        generation が現在の世代と異なる（取得中に invalidate された）場合は取り込まない
+        """
+        pairs = [pair for pair in map(_key_record, records) if pair is not None]
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                return 0
+            loaded_at = time.monotonic()
+            for facility_id in facility_ids:
+                # 再取り込みで消えたキー（収集設定の削除など）が残らないよう、そのファシリティの古い対応を捨てる
+                if facility_id in self._loaded:
+                    for key in [key for key in self._mappings if key[3] == facility_id]:
+                        del self._mappings[key]
+                self._loaded[facility_id] = loaded_at
+            self._mappings.update(pairs)
+        return len(pairs)
+
+    def lookup(self, keys: Sequence[CollectKey]) -> Tuple[Dict[CollectKey, Any], List[CollectKey]]:
+        """対応表にあるキーの収集IDと、ないキーの一覧"""
+        found, missing = {}, []
+        with self._lock:
+            for key in keys:
+                collect_id = self._mappings.get(key)
+                if collect_id is None:
+                    missing.append(key)
+                else:
+                    found[key] = collect_id
+            self.stats["hits"] += len(found)
+            self.stats["misses"] += len(missing)
+        return found, missing
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {**self.stats, "mappings": len(self._mappings), "facilities": len(self._loaded), "ttl": self.ttl}
+
+
+async def resolve_collect_ids(resolver: CollectIdResolver,
+                              get_item_code_list: Callable[[List[Any]], Awaitable[Any]],
+                              get_collect_id: Callable[[str, str, str, List[Any]], Awaitable[Any]],
+                              keys: Sequence[CollectKey], facilities_per_request: int = 50,
+                              concurrency: int = 4) -> Tuple[Dict[CollectKey, Any], List[CollectKey]]:
+    """
+    キーを収集IDに解決する
+    未取り込みのファシリティは get_item_code_list でまとめて取り込み、それでも見つからないキーだけを
+    (monitorId, itemName, displayName) ごとに get_collect_id で問い合わせる。
+    Returns:
+        (キー → 収集ID, 解決できなかったキー)
+    """
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+    stale = resolver.stale_facilities(key[3] for key in keys)
+    if stale:
+        generation = resolver.generation
+
+        async def prefetch(batch: List[Any]) -> None:
+            async with semaphore:
+                result = await get_item_code_list(batch)
+            resolver.stats["prefetchRequests"] += 1
+            resolver.add(_records(result), batch, generation)
+
+        step = max(1, facilities_per_request)
+        await asyncio.gather(*(prefetch(stale[i:i + step]) for i in range(0, len(stale), step)))
+
+    found, missing = resolver.lookup(keys)
+    if not missing:
+        return found, []
+
+    # 収集キー一覧に収集IDが含まれない場合や、取り込み後に作られたキーは個別に問い合わせる
+    groups: Dict[Tuple[str, str, str], List[Any]] = {}
+    for monitor_id, item_name, display_name, facility_id in missing:
+        groups.setdefault((monitor_id, item_name, display_name), []).append(facility_id)
+    generation = resolver.generation
+
+    async def fallback(monitor_id: str, item_name: str, display_name: str, facility_ids: List[Any]) -> None:
+        async with semaphore:
+            result = await get_collect_id(monitor_id, item_name, display_name, facility_ids)
+        resolver.stats["fallbackRequests"] += 1
+        records = _records(result)
+        if records and not isinstance(records[0], dict):
+            # 収集IDだけが返る場合は、ファシリティが1つのときだけ対応付けられる
+            if len(facility_ids) == 1 and len(records) == 1:
+                records = [{"monitorId": monitor_id, "itemName": item_name, "displayName": display_name,
+                            "facilityId": facility_ids[0], "collectId": records[0]}]
+            elif len(facility_ids) > 1:
+                await asyncio.gather(*(fallback(monitor_id, item_name, display_name, [facility_id])
+                                       for facility_id in facility_ids))
+                return
+            else:
+                records = []
+        # 応答に監視設定ID・収集項目が含まれない場合は問い合わせた値で補う
+        base = {"monitorId": monitor_id, "itemName": item_name, "displayName": display_name}
+        resolver.add([{**base, **record} for record in records if isinstance(record, dict)], generation=generation)
+
+    await asyncio.gather(*(fallback(*group, facility_ids) for group, facility_ids in groups.items()))
+    resolved, unresolved = resolver.lookup(missing)
+    found.update(resolved)
+    if unresolved:
+        logger.info(f"collect id: {len(unresolved)} keys could not be resolved")
+    return found, unresolved
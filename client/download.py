@@ -0,0 +1,78 @@
+import os
+import re
+import uuid
+import hashlib
+import tempfile
+from typing import Dict, Any, Optional
+
+# ストリーミングダウンロード時の1チャンクのバイト数
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+
+def download_dir() -> str:
+    """ダウンロード・出力ファイルの保存先ディレクトリ（HINEMOS_DOWNLOAD_DIR、既定: <tmp>/hinemos-downloads）"""
+    return os.path.realpath(os.getenv("HINEMOS_DOWNLOAD_DIR") or os.path.join(tempfile.gettempdir(), "hinemos-downloads"))
+
+
+def resolve_download_path(output_path: Optional[str], default_name: str) -> str:
+    """
+    ダウンロード先パスを決定する
+    output_path は HINEMOS_DOWNLOAD_DIR からの相対パス（またはその配下の絶対パス）として解決し、
+    ディレクトリの外を指すパスは拒否する。未指定の場合は HINEMOS_DOWNLOAD_DIR 配下に default_name で保存
+    """
+    directory = download_dir()
+    if not output_path:
+        output_path = re.sub(r"[^\w.\-]", "_", default_name)
+    path = os.path.realpath(os.path.join(directory, output_path))
+    if path == directory or os.path.commonpath([directory, path]) != directory:
+        raise ValueError(f"保存先は HINEMOS_DOWNLOAD_DIR（{directory}）配下のファイルを指定してください: {output_path}")
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    return path
+
+
+def partial_path(path: str) -> str:
+    """書き込み中の一時ファイルのパス（同じ出力先への同時書き込みが衝突しないよう pid と乱数を付ける）"""
+    return f"{path}.{os.getpid()}.{uuid.uuid4().hex[:8]}.part"
+
+
+class DownloadWriter:
+    """
+    レスポンスのチャンクを一時ファイルへ逐次書き込み、サイズとSHA-256を計算する
+    正常終了時のみ出力パスへリネームし、例外時は一時ファイルを削除する
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.size = 0
+        self._partial_path = partial_path(path)
+        self._digest = hashlib.sha256()
+        self._file = open(self._partial_path, "wb")
+
+    def write(self, chunk: bytes) -> None:
+        if not chunk:
+            return
+        self._file.write(chunk)
+        self._digest.update(chunk)
+        self.size += len(chunk)
+
+    def commit(self, content_type: Optional[str] = None) -> Dict[str, Any]:
+        self._file.close()
+        os.replace(self._partial_path, self.path)
+        return {
+            "path": self.path,
+            "size": self.size,
+            "sha256": self._digest.hexdigest(),
+            "contentType": content_type,
+        }
+
+    def abort(self) -> None:
+        self._file.close()
+        if os.path.exists(self._partial_path):
+            os.remove(self._partial_path)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if exc_type is not None:
+            self.abort()
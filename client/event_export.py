@@ -0,0 +1,217 @@
+import os
+import csv
+import json
+import time
+import logging
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence
+
+from .download import partial_path
+
+logger = logging.getLogger(__name__)
+
+EXPORT_FORMATS = ("ndjson", "csv", "parquet")
+EXPORT_EXTENSIONS = {"ndjson": "ndjson", "csv": "csv", "parquet": "parquet"}
+
+# event_search の eventList の項目（CSV の列順・Parquet のスキーマ）
+EVENT_EXPORT_FIELDS = (
+    "monitorId", "monitorDetailId", "pluginId", "facilityId", "facilityName", "priority",
+    "message", "messageOrg", "generationDate", "outputDate", "confirmType", "confirmDate", "confirmUser",
+    "duplicationCount", "comment", "commentDate", "commentUser", "collectGraphFlg", "ownerRoleId",
+    "application", "scopeText",
+)
+_INTEGER_FIELDS = {"confirmType": "int32", "duplicationCount": "int64"}
+_BOOLEAN_FIELDS = {"collectGraphFlg"}
+
+# Parquet の1行グループの行数（この件数分だけメモリに保持する）
+PARQUET_ROW_GROUP_SIZE = 50000
+
+
+def export_rows(events: Iterable[Dict[str, Any]], fields: Optional[Sequence[str]] = None) -> Iterator[Dict[str, Any]]:
+    """イベントを出力用の行に変換するジェネレータ（fields 指定時はその項目だけを残す）"""
+    if not fields:
+        yield from events
+        return
+    for event in events:
+        yield {field: event.get(field) for field in fields}
+
+
+class _ExportWriter(ABC):
+    """一時ファイル(.part)へ書き込み、close() で出力パスへリネームする"""
+
+    def __init__(self, path: str, fields: Sequence[str]):
+        self.path = path
+        self.fields = list(fields)
+        self.rows = 0
+        self._partial_path = partial_path(path)
+
+    @abstractmethod
+    def write_batch(self, rows: Iterable[Dict[str, Any]]) -> None:
+        ...
+
+    @abstractmethod
+    def _finish(self) -> None:
+        ...
+
+    def close(self) -> None:
+        self._finish()
+        os.replace(self._partial_path, self.path)
+
+    def abort(self) -> None:
+        try:
+            self._finish()
+        finally:
+            if os.path.exists(self._partial_path):
+                os.remove(self._partial_path)
+
+
+class _NdjsonWriter(_ExportWriter):
+    def __init__(self, path: str, fields: Sequence[str]):
+        super().__init__(path, fields)
+        self._file = open(self._partial_path, "w", encoding="utf-8", newline="\n")
+
+    def write_batch(self, rows: Iterable[Dict[str, Any]]) -> None:
+        lines = [json.dumps(row, ensure_ascii=False, default=str) for row in rows]
+        if lines:
+            self._file.write("\n".join(lines) + "\n")
+            self.rows += len(lines)
+
+    def _finish(self) -> None:
+        self._file.close()
+
+
+class _CsvWriter(_ExportWriter):
+    def __init__(self, path: str, fields: Sequence[str]):
+        super().__init__(path, fields)
+        self._file = open(self._partial_path, "w", encoding="utf-8", newline="")
+        self._writer = csv.DictWriter(self._file, fieldnames=self.fields, extrasaction="ignore")
+        self._writer.writeheader()
+
+    def write_batch(self, rows: Iterable[Dict[str, Any]]) -> None:
+        before = self.rows
+        for row in rows:
+            self._writer.writerow(row)
+            self.rows += 1
+        if self.rows != before:
+            self._file.flush()
+
+    def _finish(self) -> None:
+        self._file.close()
+
+
+class _ParquetWriter(_ExportWriter):
+    def __init__(self, path: str, fields: Sequence[str]):
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise ValueError("parquet 形式の出力には pyarrow が必要です（pip install pyarrow）")
+        super().__init__(path, fields)
+        self._pa = pa
+        self._schema = pa.schema([
+            (field, getattr(pa, _INTEGER_FIELDS[field])() if field in _INTEGER_FIELDS
+             else pa.bool_() if field in _BOOLEAN_FIELDS else pa.string())
+            for field in self.fields
+        ])
+        self._writer = pq.ParquetWriter(self._partial_path, self._schema, compression="zstd")
+        self._buffer: List[Dict[str, Any]] = []
+
+    def _normalize(self, row: Dict[str, Any]) -> Dict[str, Any]:
+        # 想定外の型（重要度が数値の場合など）は文字列に揃える
+        normalized = {}
+        for field in self.fields:
+            value = row.get(field)
+            if value is not None and field not in _INTEGER_FIELDS and field not in _BOOLEAN_FIELDS \
+                    and not isinstance(value, str):
+                value = str(value)
+            normalized[field] = value
+        return normalized
+
+    def write_batch(self, rows: Iterable[Dict[str, Any]]) -> None:
+        for row in rows:
+            self._buffer.append(self._normalize(row))
+            self.rows += 1
+        if len(self._buffer) >= PARQUET_ROW_GROUP_SIZE:
+            self._flush()
+
+    def _flush(self) -> None:
+        if self._buffer:
+            self._writer.write_table(self._pa.Table.from_pylist(self._buffer, schema=self._schema))
+            self._buffer = []
+
+    def _finish(self) -> None:
+        if self._writer is not None:
+            try:
+                self._flush()
+            finally:
+                self._writer.close()
+                self._writer = None
+
+    def abort(self) -> None:
+        self._buffer = []
+        super().abort()
+
+
+_WRITERS = {"ndjson": _NdjsonWriter, "csv": _CsvWriter, "parquet": _ParquetWriter}
+
+
+class EventExport:
+    """
+    ページ単位で受け取ったイベントを NDJSON / CSV / Parquet へ逐次書き込む
+    メモリに保持するのは1ページ分（Parquet は1行グループ分）だけ。
+    使用例:
+        with EventExport(path, "csv") as export:
+            for page in pages:
+                export.write(page)
+        export.result()  # {"path", "rows", "bytes", "seconds", "rowsPerSecond"}
+    """
+
+    def __init__(self, path: str, format: str = "ndjson", fields: Optional[Sequence[str]] = None):
+        if format not in EXPORT_FORMATS:
+            raise ValueError(f"format は {', '.join(EXPORT_FORMATS)} のいずれかです: {format}")
+        self.format = format
+        # CSV / Parquet は列が固定のため、未指定時は既定の項目を使う（NDJSON は項目をそのまま出力）
+        self.fields = list(fields) if fields else None
+        self._writer = _WRITERS[format](path, self.fields or EVENT_EXPORT_FIELDS)
+        self._started = time.monotonic()
+        self._elapsed: Optional[float] = None
+
+    @property
+    def path(self) -> str:
+        return self._writer.path
+
+    @property
+    def rows(self) -> int:
+        return self._writer.rows
+
+    def write(self, events: Iterable[Dict[str, Any]]) -> None:
+        self._writer.write_batch(export_rows(events, self.fields))
+
+    def close(self) -> None:
+        if self._elapsed is None:
+            self._writer.close()
+            self._elapsed = time.monotonic() - self._started
+
+    def abort(self) -> None:
+        self._writer.abort()
+
+    def result(self) -> Dict[str, Any]:
+        seconds = self._elapsed if self._elapsed is not None else time.monotonic() - self._started
+        return {
+            "path": self.path,
+            "format": self.format,
+            "rows": self.rows,
+            "bytes": os.path.getsize(self.path) if os.path.exists(self.path) else None,
+            "seconds": round(seconds, 3),
+            "rowsPerSecond": round(self.rows / seconds, 1) if seconds > 0 else None,
+        }
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if exc_type is not None:
+            self.abort()
+        else:
+            self.close()
+            logger.info(f"event export: {self.result()}")
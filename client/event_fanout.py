@@ -0,0 +1,236 @@
+import os
+import time
+import heapq
+import asyncio
+import logging
+from dataclasses import dataclass
+from typing import Dict, Any, List, Optional, Callable, Awaitable, Iterable
+
+from .event_pager import _format_millis, _now_millis, _parse_millis
+
+logger = logging.getLogger(__name__)
+
+# 同一イベントの判定キー（スコープ分割で複数スコープに属するノードのイベントが重複するため）
+_EVENT_KEY_FIELDS = ("monitorId", "monitorDetailId", "pluginId", "facilityId", "outputDate")
+
+
+@dataclass
+class FanoutConfig:
+    """
+    event_search の時間分割・並列実行の設定
+    Attributes:
+        concurrency: 同時に実行するスライス検索数
+        initial_slice_minutes: 最初のスライス幅（分）
+        target_seconds: 1スライスあたりの目標応答時間。実測に応じてスライス幅を伸縮する
+        min_slice_seconds: スライス幅の下限（秒）
+        max_slice_hours: スライス幅の上限（時間）
+    """
+    concurrency: int = 4
+    initial_slice_minutes: float = 360.0
+    target_seconds: float = 3.0
+    min_slice_seconds: float = 60.0
+    max_slice_hours: float = 24.0 * 7
+
+    @classmethod
+    def from_env(cls) -> "FanoutConfig":
+        default = cls()
+        return cls(
+            concurrency=int(os.getenv("HINEMOS_FANOUT_CONCURRENCY", default.concurrency)),
+            initial_slice_minutes=float(os.getenv("HINEMOS_FANOUT_SLICE_MINUTES", default.initial_slice_minutes)),
+            target_seconds=float(os.getenv("HINEMOS_FANOUT_TARGET_SECONDS", default.target_seconds)),
+            min_slice_seconds=default.min_slice_seconds,
+            max_slice_hours=default.max_slice_hours,
+        )
+
+
+class SliceTuner:
+    """
+    スライス幅の適応制御
+    応答時間が目標より長ければ縮め、短ければ伸ばす（1回あたり 0.5〜2 倍）。
+    """
+
+    def __init__(self, config: FanoutConfig):
+        self.config = config
+        self.span_ms = int(config.initial_slice_minutes * 60000)
+        self._min_ms = int(config.min_slice_seconds * 1000)
+        self._max_ms = int(config.max_slice_hours * 3600000)
+
+    def observe(self, span_ms: int, seconds: float) -> None:
+        factor = self.config.target_seconds / seconds if seconds > 0 else 2.0
+        factor = min(2.0, max(0.5, factor))
+        # 並列実行中は古い幅での観測も届くため、観測したスライス幅を基準にする
+        self.span_ms = int(min(self._max_ms, max(self._min_ms, span_ms * factor)))
+
+
+def event_key(event: Dict[str, Any]) -> tuple:
+    return tuple(event.get(field) for field in _EVENT_KEY_FIELDS)
+
+
+def scope_children(tree: Dict[str, Any], facility_id: str) -> List[str]:
+    """
+    facility_tree の応答から facility_id 直下の子ファシリティIDを返す
+    （見つからない・子がない場合は空リスト）
+    """
+    stack = [tree]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, list):
+            stack.extend(item)
+            continue
+        if not isinstance(item, dict):
+            continue
+        data = item.get("data") or item
+        children = item.get("children") or []
+        if data.get("facilityId") == facility_id:
+            return [(child.get("data") or child).get("facilityId") for child in children
+                    if (child.get("data") or child).get("facilityId")]
+        stack.extend(children)
+    return []
+
+
+class _Lane:
+    """1スコープ分の時間カーソル（新しい側から古い側へ進む）"""
+
+    def __init__(self, facility_id: Optional[str], start: int, end: int):
+        self.facility_id = facility_id
+        self.start = start
+        self.cursor = end
+        # [covered_to, end] が取得済み（連続区間）。未完了のスライスは pending に保持
+        self.covered_to = end + 1
+        self.pending: Dict[int, int] = {}
+
+    @property
+    def exhausted(self) -> bool:
+        return self.cursor < self.start
+
+    def complete(self, upper: int, lower: int) -> None:
+        self.pending[upper] = lower
+        while self.covered_to - 1 in self.pending:
+            self.covered_to = self.pending.pop(self.covered_to - 1)
+
+
+async def fanout_event_search(search: Callable[[Dict[str, Any], Optional[int]], Awaitable[Dict[str, Any]]],
+                              filter: Dict[str, Any], size: int = 1000, field: str = "generationDate",
+                              scopes: Optional[Iterable[str]] = None,
+                              config: Optional[FanoutConfig] = None) -> Dict[str, Any]:
+    """
+    filter の日時範囲を時間スライス（とスコープ）に分割し、並列に検索して日時の新しい順にマージする
+    新しいスライスから順に取得し、全スコープで取得済みの区間に size 件以上が揃った時点で残りのスライスは打ち切る。
+    Args:
+        search: event_search 相当のコルーチン関数 (filter, size) -> {"total", "eventList"}
+        filter: 検索条件（{field}From/To で範囲を指定。省略時は 1970年〜現在）
+        size: 返す最大件数
+        field: 分割・並び順に使う日時項目（generationDate / outputDate）
+        scopes: 分割するファシリティIDの一覧（None の場合はスコープ分割しない）
+    Returns:
+        {"total", "eventList", "fanout": {実行統計}}
+    """
+    if field not in ("outputDate", "generationDate"):
+        raise ValueError(f"field は outputDate / generationDate のいずれかです: {field}")
+    config = config or FanoutConfig.from_env()
+    filter = dict(filter or {})
+    from_value = filter.get(f"{field}From")
+    to_value = filter.get(f"{field}To")
+    iso = 'T' in (from_value or to_value or 'T')
+    # スライス境界とイベントの日時は同じ基準で比べる（Hinemos形式ならマネージャのローカル時刻をUTCとみなす）
+    start = _parse_millis(from_value, iso) if from_value else 0
+    end = _parse_millis(to_value, iso) if to_value else _now_millis(iso)
+    lanes = [_Lane(scope, start, end) for scope in (scopes or [None])]
+    tuner = SliceTuner(config)
+    results: List[List[tuple]] = []
+    stats = {"slices": 0, "truncatedSlices": 0, "total": 0, "maxSliceSeconds": 0.0}
+    stop = asyncio.Event()
+    started = time.monotonic()
+
+    def event_millis(event: Dict[str, Any]) -> int:
+        value = event.get(field)
+        return _parse_millis(value, iso) if value else 0
+
+    def enough() -> bool:
+        # 全レーンで取得済みの境界より新しいイベントが size 件あれば、以降のスライスは結果に影響しない
+        boundary = max(lane.covered_to for lane in lanes)
+        fetched = 0
+        for events in results:
+            fetched += sum(1 for millis, _ in events if millis >= boundary)
+            if fetched >= size:
+                return True
+        return False
+
+    def next_slice():
+        candidates = [lane for lane in lanes if not lane.exhausted]
+        if not candidates:
+            return None
+        lane = max(candidates, key=lambda l: l.cursor)
+        span = tuner.span_ms
+        upper = lane.cursor
+        lower = max(lane.start, upper - span + 1)
+        lane.cursor = lower - 1
+        return lane, lower, upper
+
+    async def worker():
+        while not stop.is_set():
+            planned = next_slice()
+            if planned is None:
+                return
+            lane, lower, upper = planned
+            request = {**filter, f"{field}From": _format_millis(lower, iso), f"{field}To": _format_millis(upper, iso)}
+            if lane.facility_id is not None:
+                request["facilityId"] = lane.facility_id
+            began = time.monotonic()
+            result = await search(request, size)
+            elapsed = time.monotonic() - began
+            events = [(event_millis(event), event) for event in (result.get("eventList") or [])]
+            total = result.get("total") or len(events)
+            tuner.observe(upper - lower + 1, elapsed)
+            stats["slices"] += 1
+            stats["total"] += total
+            stats["maxSliceSeconds"] = max(stats["maxSliceSeconds"], elapsed)
+            events.sort(key=lambda item: item[0], reverse=True)
+            covered_lower = lower
+            if total > len(events):
+                # size 件で切られたスライスは、返った最古イベントより新しい区間だけが取得済み
+                stats["truncatedSlices"] += 1
+                covered_lower = max(lower, events[-1][0]) if events else upper + 1
+            results.append(events)
+            lane.complete(upper, covered_lower)
+            if stats["total"] >= size and enough():
+                stop.set()
+
+    workers = max(1, config.concurrency)
+    tasks = [asyncio.ensure_future(worker()) for _ in range(workers)]
+    try:
+        await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        raise
+
+    merged: List[Dict[str, Any]] = []
+    seen = set()
+    for _, event in heapq.merge(*results, key=lambda item: item[0], reverse=True):
+        key = event_key(event)
+        if key in seen:
+            continue
+        seen.add(key)
+        merged.append(event)
+        if len(merged) >= size:
+            break
+    stopped_early = any(not lane.exhausted for lane in lanes)
+    fanout = {
+        "slices": stats["slices"],
+        "scopes": [lane.facility_id for lane in lanes] if scopes else None,
+        "concurrency": workers,
+        "truncatedSlices": stats["truncatedSlices"],
+        "stoppedEarly": stopped_early,
+        "sliceMinutes": round(tuner.span_ms / 60000, 2),
+        "maxSliceSeconds": round(stats["maxSliceSeconds"], 3),
+        "elapsedSeconds": round(time.monotonic() - started, 3),
+    }
+    logger.info(f"event_search fan-out: {fanout}")
+    return {
+        # 打ち切り時・スコープ分割時（重複を含む）の total は概数
+        "total": stats["total"],
+        "totalIsExact": not stopped_early and not scopes,
+        "eventList": merged,
+        "fanout": fanout,
+    }
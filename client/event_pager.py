@@ -0,0 +1,167 @@
+import json
+import math
+import base64
+import logging
+from datetime import datetime, timezone
+from typing import Dict, Any, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+Window = Tuple[int, int]
+
+# ウィンドウ分割時、1ウィンドウあたり page_size のこの割合に収まるよう分割数を決める
+_SPLIT_FILL_RATIO = 0.8
+# 1回の分割で作るサブウィンドウ数の上限
+_MAX_SPLIT = 16
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def parse_event_date(value: str) -> datetime:
+    """ISO8601(…Z) / Hinemos形式(yyyy-MM-dd HH:mm:ss[.SSS]) をUTCのdatetimeに変換"""
+    text = value.strip()
+    if text.endswith('Z'):
+        text = text[:-1] + '+00:00'
+    dt = datetime.fromisoformat(text)
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt
+
+
+def _parse_millis(value: str, iso: bool) -> int:
+    """検索条件の日時をウィンドウ境界のミリ秒に変換する（Hinemos形式で送る場合はマネージャのローカル時刻として扱う）"""
+    if iso:
+        return _to_millis(parse_event_date(value))
+    text = value.strip()
+    dt = datetime.fromisoformat(text[:-1] + '+00:00' if text.endswith('Z') else text)
+    if dt.tzinfo is not None:
+        # オフセット付きの日時はローカル時刻に直し、壁時計の時刻をそのまま使う
+        dt = dt.astimezone().replace(tzinfo=None)
+    return _to_millis(dt.replace(tzinfo=timezone.utc))
+
+
+def _to_millis(dt: datetime) -> int:
+    return int((dt - _EPOCH).total_seconds() * 1000)
+
+
+def _now_millis(iso: bool) -> int:
+    # Hinemos形式の日時はマネージャのローカル時刻として解釈されるため、ローカルの現在時刻をそのままUTCとみなす
+    now = datetime.now(timezone.utc) if iso else datetime.now().replace(tzinfo=timezone.utc)
+    return _to_millis(now)
+
+
+def _format_millis(millis: int, iso: bool) -> str:
+    dt = datetime.fromtimestamp(millis / 1000, tz=timezone.utc)
+    text = dt.strftime('%Y-%m-%dT%H:%M:%S.%f' if iso else '%Y-%m-%d %H:%M:%S.%f')[:-3]
+    return text + 'Z' if iso else text
+
+
+class EventWindowPager:
+    """
+    event_search の size 上限を超える結果を、日時ウィンドウ単位で分割して取得するためのカーソル
+    ウィンドウの件数(total)が page_size を超えた場合は total から分割数を見積もってサブウィンドウに分け、
+    新しいウィンドウから順に処理する。状態は to_token() で継続トークンに変換できる。
+    """
+
+    # ウィンドウ分割に使える日時項目、検索結果の一覧の項目名、ウィンドウ境界の分解能（ミリ秒）
+    FIELDS = ("outputDate", "generationDate")
+    LIST_KEY = "eventList"
+    RESOLUTION_MS = 1
+
+    def __init__(self, filter: Dict[str, Any], page_size: int = 1000, field: str = "outputDate",
+                 windows: Optional[List[Window]] = None, iso: Optional[bool] = None):
+        if field not in self.FIELDS:
+            raise ValueError(f"field は {' / '.join(self.FIELDS)} のいずれかです: {field}")
+        self.filter = dict(filter or {})
+        self.page_size = page_size
+        self.field = field
+        from_key, to_key = self.filter_keys(field)
+        from_value = self.filter.get(from_key)
+        to_value = self.filter.get(to_key)
+        self.iso = iso if iso is not None else 'T' in (from_value or to_value or 'T')
+        if windows is None:
+            start = _parse_millis(from_value, self.iso) if from_value else 0
+            end = _parse_millis(to_value, self.iso) if to_value else _now_millis(self.iso)
+            windows = [(start, end)] if start <= end else []
+        # 末尾から取り出す（末尾ほど新しいウィンドウ）
+        self.windows: List[Window] = [tuple(w) for w in windows]
+        self.truncated = 0
+
+    @property
+    def has_next(self) -> bool:
+        return bool(self.windows)
+
+    def pop(self) -> Window:
+        return self.windows.pop()
+
+    @staticmethod
+    def filter_keys(field: str) -> Tuple[str, str]:
+        """field の期間指定に使う検索条件の項目名 (From, To)"""
+        return f"{field}From", f"{field}To"
+
+    def format_date(self, millis: int) -> str:
+        return _format_millis(millis, self.iso)
+
+    def request_filter(self, window: Window) -> Dict[str, Any]:
+        start, end = window
+        from_key, to_key = self.filter_keys(self.field)
+        return {**self.filter, from_key: self.format_date(start), to_key: self.format_date(end)}
+
+    def feed(self, window: Window, result: Dict[str, Any]) -> Optional[List[Dict[str, Any]]]:
+        """
+        ウィンドウの検索結果を受け取る
+        Returns:
+            そのウィンドウのイベント一覧。件数超過でサブウィンドウに分割した場合は None
+        """
+        events = result.get(self.LIST_KEY) or []
+        total = result.get("total") or len(events)
+        if total <= len(events):
+            return events
+        start, end = self._unit_range(window)
+        if start >= end:
+            # 同一ミリ秒（RESOLUTION_MS 単位）に page_size 件を超えるイベントがあり、これ以上分割できない
+            self.truncated += 1
+            logger.warning(f"event window {_format_millis(window[0], True)} has {total} events; only {len(events)} returned")
+            return events
+        self._split(window, total)
+        return None
+
+    def _unit_range(self, window: Window) -> Window:
+        """ウィンドウが丸ごと含む RESOLUTION_MS 単位の範囲 (先頭, 末尾)"""
+        unit = self.RESOLUTION_MS
+        if unit == 1:
+            return window
+        # To はその単位の先頭の時刻ちょうどまでしか含まないため、末尾の単位は To の直前の単位になる
+        return window[0] // unit, max(window[0], window[1] - 1) // unit
+
+    def _split(self, window: Window, total: int) -> None:
+        # 境界は RESOLUTION_MS 単位に揃える（検索条件の日時が秒単位の API で同じ範囲を繰り返し検索しないように）
+        unit = self.RESOLUTION_MS
+        start, end = self._unit_range(window)
+        span = end - start + 1
+        parts = min(_MAX_SPLIT, span, max(2, math.ceil(total / (self.page_size * _SPLIT_FILL_RATIO))))
+        step = span / parts
+        bounds = [start + int(round(step * i)) for i in range(parts)] + [end + 1]
+        # 古い順に積み、新しいウィンドウから取り出されるようにする
+        for lower, upper in zip(bounds, bounds[1:]):
+            if lower >= upper:
+                continue
+            if unit == 1:
+                self.windows.append((lower, upper - 1))
+            else:
+                # 秒単位などの検索条件は端数を切り捨てて送るため、To を次のウィンドウの From と重ねて
+                # 境界の単位内（x:59.000 より後）の結果が抜け落ちないようにする（重複は呼び出し側で除く）
+                self.windows.append((max(lower * unit, window[0]), min(upper * unit, window[1])))
+
+    def to_token(self) -> Optional[str]:
+        if not self.windows:
+            return None
+        state = {"f": self.filter, "s": self.page_size, "k": self.field, "i": self.iso, "w": self.windows}
+        return base64.urlsafe_b64encode(json.dumps(state, ensure_ascii=False).encode('utf-8')).decode('ascii')
+
+    @classmethod
+    def from_token(cls, token: str) -> "EventWindowPager":
+        try:
+            state = json.loads(base64.urlsafe_b64decode(token.encode('ascii')))
+            return cls(state["f"], state["s"], state["k"], windows=state["w"], iso=state["i"])
+        except (ValueError, KeyError, TypeError) as e:
+            raise ValueError(f"継続トークンが不正です: {e}")
@@ -1,5 +1,7 @@
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Iterator, List, Optional
 from .base import BaseClient
+from .download import resolve_download_path
+from .job_history_pager import JobHistoryPager
 
 class JobClient(BaseClient):
     """
@@ -118,6 +120,31 @@ class JobClient(BaseClient):
         body = {"size": size, "filter": filter}
         return self._make_request('POST', self.NAME + '/job/history_search', json=body)
 
+    def next_history_page(self, pager: JobHistoryPager) -> List[Dict[str, Any]]:
+        """
+        pager の次のウィンドウを検索し、1ページ分（最大 pager.page_size 件）のジョブ履歴を返す
+        件数超過のウィンドウは分割して再検索し、空のウィンドウは読み飛ばす
+        """
+        while pager.has_next:
+            window = pager.pop()
+            history = pager.feed(window, self.history_search(pager.page_size, pager.request_filter(window)))
+            if history:
+                return history
+        return []
+
+    def iter_job_history(self, filter: Dict[str, Any], page_size: int = 1000, field: str = "startDate") -> Iterator[Dict[str, Any]]:
+        """
+        size 上限に関係なく filter に一致する全ジョブ履歴を新しいウィンドウから順に返すジェネレータ
+        ウィンドウは境界の時刻を重ねて分割するため、境界の時刻ちょうどに開始した履歴は重複して返ることがある。
+        Args:
+            filter: history_search と同じ検索条件（startFromDate/startToDate で期間を指定）
+            page_size: 1回の history_search で取得する件数
+            field: ウィンドウ分割に使う日時項目（startDate / endDate）
+        """
+        pager = JobHistoryPager(filter, page_size, field)
+        while pager.has_next:
+            yield from self.next_history_page(pager)
+
     # --- 8. ジョブキック管理 ---
     def add_schedule(self, schedule: Dict[str, Any]) -> Dict[str, Any]:
         return self._make_request('POST', self.NAME + '/job/setting/kick/schedule', json=schedule)
@@ -227,8 +254,9 @@ class JobClient(BaseClient):
     def get_rpa_screenshot(self, sessionId: str, jobunitId: str, jobId: str, facilityId: str) -> List[Dict[str, Any]]:
         return self._make_request('GET', self.NAME + f'/job/sessionNode_operation/screenshot/{sessionId}/jobunit/{jobunitId}/job/{jobId}/facility/{facilityId}')
 
-    def get_rpa_screenshot_file(self, sessionId: str, jobunitId: str, jobId: str, facilityId: str, regDate: str) -> bytes:
-        return self._make_request('GET', self.NAME + f'/job/sessionNode_operation/screenshot_file/{sessionId}/jobunit/{jobunitId}/job/{jobId}/facility/{facilityId}/regdate/{regDate}', stream=True)
+    def get_rpa_screenshot_file(self, sessionId: str, jobunitId: str, jobId: str, facilityId: str, regDate: str, output_path: Optional[str] = None) -> Dict[str, Any]:
+        download_to = resolve_download_path(output_path, f"screenshot_{sessionId}_{jobId}_{facilityId}_{regDate}.png")
+        return self._make_request('GET', self.NAME + f'/job/sessionNode_operation/screenshot_file/{sessionId}/jobunit/{jobunitId}/job/{jobId}/facility/{facilityId}/regdate/{regDate}', download_to=download_to)
 
     # --- 15. その他 ---
     def get_jobmap_icon_image_iconId(self, ownerRoleId: Optional[str] = None) -> Dict[str, Any]:
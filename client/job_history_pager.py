@@ -0,0 +1,28 @@
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+from .event_pager import EventWindowPager, Window
+
+
+class JobHistoryPager(EventWindowPager):
+    """
+    history_search の size 上限を超える履歴を、開始（または終了）日時のウィンドウ単位で分割して取得するためのカーソル
+    分割・継続トークンの仕組みは EventWindowPager と同じ。検索条件の日時は秒単位（yyyy-MM-dd HH:mm:ss）。
+    """
+    FIELDS = ("startDate", "endDate")
+    LIST_KEY = "list"
+    RESOLUTION_MS = 1000
+
+    def __init__(self, filter: Dict[str, Any], page_size: int = 1000, field: str = "startDate",
+                 windows: Optional[List[Window]] = None, iso: Optional[bool] = None):
+        # 検索条件の日時は常にHinemos形式（マネージャのローカル時刻）で送るため、ISO8601 の入力も壁時計の時刻で扱う
+        super().__init__(filter, page_size, field, windows, iso=False)
+
+    @staticmethod
+    def filter_keys(field: str) -> Tuple[str, str]:
+        # startDate → startFromDate / startToDate
+        prefix = field[:-len("Date")]
+        return f"{prefix}FromDate", f"{prefix}ToDate"
+
+    def format_date(self, millis: int) -> str:
+        return datetime.fromtimestamp(millis / 1000, tz=timezone.utc).strftime('%Y-%m-%d %H:%M:%S')
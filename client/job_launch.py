@@ -0,0 +1,159 @@
+import os
+import time
+import asyncio
+import logging
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence
+
+from .bulk import ProgressCallback
+
+logger = logging.getLogger(__name__)
+
+LAUNCH_COLUMNS = ["index", "target", "sessionId", "error"]
+
+
+@dataclass
+class LaunchConfig:
+    """
+    ジョブの一括実行の並列・流量制限設定
+    Attributes:
+        concurrency: 同時に送信する実行要求の数
+        rate: 1秒あたりの実行要求数の上限（トークンバケットの補充速度。0 以下で無制限）
+        burst: 連続して送信できる実行要求数（トークンバケットの容量）
+    """
+    concurrency: int = 4
+    rate: float = 5.0
+    burst: int = 5
+
+    @classmethod
+    def from_env(cls) -> "LaunchConfig":
+        default = cls()
+        return cls(
+            concurrency=int(os.getenv("HINEMOS_JOB_LAUNCH_CONCURRENCY", default.concurrency)),
+            rate=float(os.getenv("HINEMOS_JOB_LAUNCH_RATE", default.rate)),
+            burst=int(os.getenv("HINEMOS_JOB_LAUNCH_BURST", default.burst)),
+        )
+
+
+class TokenBucket:
+    """rate 個/秒で補充され、最大 burst 個まで貯まるトークンバケット（rate が 0 以下なら待たない）"""
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.capacity = max(1, burst)
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        if self.rate <= 0:
+            return
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
+def expand_launches(launches: Optional[Sequence[Dict[str, Any]]] = None,
+                    jobunit_ids: Optional[Sequence[str]] = None, job_id: Optional[str] = None,
+                    job_kick_id: Optional[str] = None, request: Optional[Dict[str, Any]] = None,
+                    variants: Optional[Sequence[Dict[str, Any]]] = None) -> List[Dict[str, Any]]:
+    """
+    一括実行の指定を1件ずつの実行要求に展開する
+        launches:    [{"jobunitId", "jobId", "request"} または {"jobKickId", "request"}] をそのまま使う
+        jobunit_ids: 各ジョブユニットの job_id を実行する（同じジョブネットを複数のジョブユニットで実行する場合）
+        job_kick_id: 実行契機を実行する
+    request は共通の要求本文（RunJobRequest / RunJobKickRequest）。variants を指定すると、対象ごとに
+    request に各 variant を上書きした要求を1件ずつ作る（パラメータ値だけを変えて同じジョブを複数回実行する場合）。
+    """
+    base = dict(request or {})
+    targets: List[Dict[str, Any]] = []
+    for launch in launches or []:
+        if launch.get("jobKickId"):
+            targets.append({"jobKickId": launch["jobKickId"], "request": {**base, **(launch.get("request") or {})}})
+        elif launch.get("jobunitId") and launch.get("jobId"):
+            targets.append({"jobunitId": launch["jobunitId"], "jobId": launch["jobId"],
+                            "request": {**base, **(launch.get("request") or {})}})
+        else:
+            raise ValueError(f"launches の各要素には jobunitId と jobId、または jobKickId が必要です: {launch}")
+    if jobunit_ids:
+        if not job_id:
+            raise ValueError("jobunit_ids を指定する場合は job_id も指定してください")
+        targets += [{"jobunitId": jobunit_id, "jobId": job_id, "request": base} for jobunit_id in jobunit_ids]
+    elif job_id:
+        raise ValueError("job_id を指定する場合は jobunit_ids も指定してください")
+    if job_kick_id:
+        targets.append({"jobKickId": job_kick_id, "request": base})
+    if variants:
+        targets = [{**target, "request": {**target["request"], **variant}} for target in targets for variant in variants]
+    return targets
+
+
+def launch_label(launch: Dict[str, Any]) -> str:
+    if launch.get("jobKickId"):
+        return f"kick:{launch['jobKickId']}"
+    return f"{launch['jobunitId']}/{launch['jobId']}"
+
+
+def _session_id(result: Any) -> Optional[str]:
+    if isinstance(result, dict):
+        return result.get("sessionId")
+    return result if isinstance(result, str) and result else None
+
+
+async def launch_jobs(launches: Sequence[Dict[str, Any]],
+                      run_job: Callable[[str, str, Dict[str, Any]], Awaitable[Any]],
+                      run_job_kick: Callable[[str, Dict[str, Any]], Awaitable[Any]],
+                      config: Optional[LaunchConfig] = None,
+                      on_progress: Optional[ProgressCallback] = None) -> Dict[str, Any]:
+    """
+    実行要求を concurrency 件まで並列に、トークンバケットで流量を抑えて送信する
+    ジョブの実行は冪等でないため、失敗した要求は再送せずエラーとして返す。
+    Returns:
+        {"requested", "started", "failed", "columns": LAUNCH_COLUMNS, "rows", "elapsedSeconds"}
+    """
+    config = config or LaunchConfig.from_env()
+    semaphore = asyncio.Semaphore(max(1, config.concurrency))
+    bucket = TokenBucket(config.rate, config.burst)
+    rows: List[Optional[List[Any]]] = [None] * len(launches)
+    progress = {"done": 0, "started": 0}
+    started = time.monotonic()
+
+    async def launch(index: int, target: Dict[str, Any]) -> None:
+        async with semaphore:
+            await bucket.acquire()
+            session_id, error = None, None
+            try:
+                if target.get("jobKickId"):
+                    result = await run_job_kick(target["jobKickId"], target["request"])
+                else:
+                    result = await run_job(target["jobunitId"], target["jobId"], target["request"])
+                session_id = _session_id(result)
+                if session_id is None:
+                    error = f"sessionId が応答に含まれていません: {str(result)[:200]}"
+            except Exception as e:
+                error = str(e)
+                logger.warning(f"run_job_bulk: {launch_label(target)} failed: {e}")
+            rows[index] = [index, launch_label(target), session_id, error]
+            progress["done"] += 1
+            progress["started"] += session_id is not None
+        if on_progress is not None:
+            await on_progress(progress["done"], len(launches),
+                              f"run_job_bulk: {progress['started']}/{len(launches)} started")
+
+    await asyncio.gather(*(launch(index, target) for index, target in enumerate(launches)))
+    summary = {
+        "requested": len(launches),
+        "started": progress["started"],
+        "failed": len(launches) - progress["started"],
+        "columns": list(LAUNCH_COLUMNS),
+        "rows": rows,
+        "elapsedSeconds": round(time.monotonic() - started, 3),
+    }
+    logger.info(f"run_job_bulk: {summary['started']}/{summary['requested']} started in {summary['elapsedSeconds']}s")
+    return summary
@@ -661,4 +661,12 @@ class MonitorClient(BaseClient):
         params = {}
         if monitor_id:
             params["monitorId"] = monitor_id
-        return self._make_request('GET', 'MonitorsettingRestEndpoints/monitorsetting/httpScenario', params=params)
\ No newline at end of file
+        return self._make_request('GET', 'MonitorsettingRestEndpoints/monitorsetting/httpScenario', params=params)
+    # --- マスタ管理 ---
+    def get_jmx_master_list(self) -> List[Dict[str, Any]]:
+        """
+        JMXマスタ一覧取得API (/monitorsetting/jmxmaster_all)
+        Returns:
+            JMXマスタ一覧（配列）
+        """
+        return self._make_request('GET', 'MonitorsettingRestEndpoints/monitorsetting/jmxmaster_all')
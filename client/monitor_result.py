@@ -1,5 +1,9 @@
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Iterator, List, Optional
+from datetime import datetime
 from .base import BaseClient
+from .download import resolve_download_path
+from .event_pager import EventWindowPager
+from .event_export import EventExport, EXPORT_EXTENSIONS
 
 class MonitorResultClient(BaseClient):
     """
@@ -17,6 +21,60 @@ class MonitorResultClient(BaseClient):
             body["size"] = size
         return self._make_request('POST', 'MonitorResultRestEndpoints/monitorresult/event_search', json=body)
 
+    def next_event_page(self, pager: EventWindowPager) -> List[Dict[str, Any]]:
+        """
+        pager の次のウィンドウを検索し、1ページ分（最大 pager.page_size 件）のイベントを返す
+        件数超過のウィンドウは分割して再検索し、空のウィンドウは読み飛ばす
+        """
+        while pager.has_next:
+            window = pager.pop()
+            events = pager.feed(window, self.event_search(pager.request_filter(window), pager.page_size))
+            if events:
+                return events
+        return []
+
+    def iter_events(self, filter: Dict[str, Any], page_size: int = 1000, field: str = "outputDate") -> Iterator[Dict[str, Any]]:
+        """
+        size 上限に関係なく filter に一致する全イベントを新しいウィンドウから順に返すジェネレータ
+        Args:
+            filter: event_search と同じ検索条件
+            page_size: 1回の event_search で取得する件数
+            field: ウィンドウ分割に使う日時項目（outputDate / generationDate）
+        """
+        pager = EventWindowPager(filter, page_size, field)
+        while pager.has_next:
+            yield from self.next_event_page(pager)
+
+    def export_events(
+        self,
+        filter: Dict[str, Any],
+        format: str = "ndjson",
+        output_path: Optional[str] = None,
+        fields: Optional[List[str]] = None,
+        page_size: int = 1000,
+        field: str = "outputDate"
+    ) -> Dict[str, Any]:
+        """
+        filter に一致する全イベントを event_search でページングしながらファイルへ逐次書き出す
+        Args:
+            format: ndjson / csv / parquet（parquet は pyarrow が必要）
+            output_path: 出力先（未指定時はダウンロードディレクトリ）
+            fields: 出力する項目（未指定時は CSV/Parquet は既定の項目、NDJSON は全項目）
+        Returns:
+            {"path", "format", "rows", "bytes", "seconds", "rowsPerSecond"}
+        """
+        path = self._export_path(format, output_path)
+        pager = EventWindowPager(filter, page_size, field)
+        with EventExport(path, format, fields) as export:
+            while pager.has_next:
+                export.write(self.next_event_page(pager))
+        return export.result()
+
+    @staticmethod
+    def _export_path(format: str, output_path: Optional[str]) -> str:
+        extension = EXPORT_EXTENSIONS.get(format, format)
+        return resolve_download_path(output_path, f"events_{datetime.now().strftime('%Y%m%d%H%M%S')}.{extension}")
+
     def scope_list(
         self,
         facility_id: Optional[str] = None,
@@ -61,18 +119,24 @@ class MonitorResultClient(BaseClient):
         self,
         filter: Dict[str, Any],
         selected_events: Optional[List[Dict[str, Any]]] = None,
-        filename: Optional[str] = None
-    ) -> bytes:
+        filename: Optional[str] = None,
+        output_path: Optional[str] = None
+    ) -> Dict[str, Any]:
         """
         イベントファイルダウンロード
         POST /monitorresult/event_download
+        レスポンスはメモリに保持せず output_path（未指定時はダウンロードディレクトリ）へ逐次書き込む
+        Returns:
+            {"path", "size", "sha256", "contentType"}
         """
         body = {"filter": filter}
         if selected_events is not None:
             body["selectedEvents"] = selected_events
         if filename is not None:
             body["filename"] = filename
-        return self._make_request('POST', 'MonitorResultRestEndpoints/monitorresult/event_download', json=body, stream=True)
+        default_name = filename or f"events_{datetime.now().strftime('%Y%m%d%H%M%S')}.csv"
+        download_to = resolve_download_path(output_path, default_name)
+        return self._make_request('POST', 'MonitorResultRestEndpoints/monitorresult/event_download', json=body, download_to=download_to)
 
     def event_detail_search(
         self,
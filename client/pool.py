@@ -0,0 +1,74 @@
+import os
+from dataclasses import dataclass
+from typing import Dict, Any, Optional
+from requests.adapters import HTTPAdapter
+
+
+@dataclass
+class PoolConfig:
+    """
+    HTTPコネクションプール設定
+    Attributes:
+        pool_connections: ホスト毎のプールをいくつ保持するか (requests)
+        pool_maxsize: 1ホストあたりの最大コネクション数 (requests: pool_maxsize / aiohttp: limit_per_host)
+        pool_limit: 全体の最大コネクション数 (aiohttp: limit)
+        pool_block: プール枯渇時に空きを待つか (requests)。Falseの場合は使い捨てコネクションを張る
+        keepalive_timeout: アイドルコネクションの保持秒数 (aiohttp)。0でkeep-aliveを無効化
+    """
+    pool_connections: int = 10
+    pool_maxsize: int = 50
+    pool_limit: int = 100
+    pool_block: bool = True
+    keepalive_timeout: float = 15.0
+
+    @property
+    def keep_alive(self) -> bool:
+        return self.keepalive_timeout > 0
+
+    @classmethod
+    def from_env(cls) -> "PoolConfig":
+        """HINEMOS_POOL_* / HINEMOS_KEEPALIVE_TIMEOUT 環境変数から設定を生成"""
+        default = cls()
+        return cls(
+            pool_connections=int(os.getenv("HINEMOS_POOL_CONNECTIONS", default.pool_connections)),
+            pool_maxsize=int(os.getenv("HINEMOS_POOL_MAXSIZE", default.pool_maxsize)),
+            pool_limit=int(os.getenv("HINEMOS_POOL_LIMIT", default.pool_limit)),
+            pool_block=os.getenv("HINEMOS_POOL_BLOCK", str(default.pool_block)).lower() in ("1", "true", "yes"),
+            keepalive_timeout=float(os.getenv("HINEMOS_KEEPALIVE_TIMEOUT", default.keepalive_timeout)),
+        )
+
+    def create_http_adapter(self) -> HTTPAdapter:
+        return HTTPAdapter(
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            pool_block=self.pool_block,
+        )
+
+    def connector_kwargs(self) -> Dict[str, Any]:
+        """aiohttp.TCPConnector に渡す引数"""
+        if not self.keep_alive:
+            return {"limit": self.pool_limit, "limit_per_host": self.pool_maxsize, "force_close": True}
+        return {
+            "limit": self.pool_limit,
+            "limit_per_host": self.pool_maxsize,
+            "keepalive_timeout": self.keepalive_timeout,
+        }
+
+
+def adapter_pool_stats(adapter: HTTPAdapter) -> Dict[str, Any]:
+    """
+    HTTPAdapter配下の全ホストプールの統計
+    Returns:
+        requests: 送信リクエスト数 / connections: 新規に張ったコネクション数 / reuse_rate: コネクション再利用率
+    """
+    requests_count = 0
+    connections = 0
+    pools = adapter.poolmanager.pools
+    for key in list(pools.keys()):
+        pool: Optional[Any] = pools.get(key)
+        if pool is None:
+            continue
+        requests_count += pool.num_requests
+        connections += pool.num_connections
+    reuse_rate = 1 - connections / requests_count if requests_count else 0.0
+    return {"requests": requests_count, "connections": connections, "reuse_rate": round(reuse_rate, 4)}
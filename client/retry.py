@@ -0,0 +1,166 @@
+import os
+import re
+import time
+import random
+import logging
+import threading
+import contextvars
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Dict, Any, FrozenSet, Optional
+
+logger = logging.getLogger(__name__)
+
+# 副作用のない参照系 POST（検索・ダウンロード・計画参照）
+_READ_ONLY_POST = re.compile(r"(_search|_download|schedule_plan)$")
+
+# 更新系APIのリトライを呼び出し側が明示的に許可しているか
+_mutation_retry_allowed: contextvars.ContextVar[bool] = contextvars.ContextVar("hinemos_mutation_retry", default=False)
+
+
+@contextmanager
+def allow_mutation_retry():
+    """
+    このブロック内では更新系API(add_node, run_job等)もリトライ対象にする
+    使用例:
+        with allow_mutation_retry():
+            client.add_node(node_info)
+    """
+    token = _mutation_retry_allowed.set(True)
+    try:
+        yield
+    finally:
+        _mutation_retry_allowed.reset(token)
+
+
+def endpoint_key(endpoint: str) -> str:
+    """サーキットブレーカーの単位。パスパラメータ(ID等)を除いた先頭3階層を使う"""
+    return "/".join(endpoint.split("?")[0].split("/")[:3])
+
+
+def is_idempotent(method: str, endpoint: str) -> bool:
+    method = method.upper()
+    if method in ("GET", "HEAD", "OPTIONS"):
+        return True
+    if method == "POST":
+        return bool(_READ_ONLY_POST.search(endpoint.split("?")[0].rstrip("/")))
+    return False
+
+
+@dataclass
+class RetryPolicy:
+    """
+    指数バックオフ + フルジッターのリトライ方針
+    Attributes:
+        max_attempts: 最大試行回数（初回を含む）
+        base_delay: バックオフの基準秒数
+        max_delay: 1回あたりの最大待機秒数
+        retry_statuses: リトライ対象のHTTPステータス
+    """
+    max_attempts: int = 3
+    base_delay: float = 0.5
+    max_delay: float = 8.0
+    retry_statuses: FrozenSet[int] = frozenset({429, 502, 503, 504})
+
+    @classmethod
+    def from_env(cls) -> "RetryPolicy":
+        default = cls()
+        return cls(
+            max_attempts=int(os.getenv("HINEMOS_RETRY_MAX_ATTEMPTS", default.max_attempts)),
+            base_delay=float(os.getenv("HINEMOS_RETRY_BASE_DELAY", default.base_delay)),
+            max_delay=float(os.getenv("HINEMOS_RETRY_MAX_DELAY", default.max_delay)),
+        )
+
+    def is_retryable_request(self, method: str, endpoint: str) -> bool:
+        return is_idempotent(method, endpoint) or _mutation_retry_allowed.get()
+
+    def is_retryable_status(self, status: Optional[int]) -> bool:
+        # status が None の場合は接続エラー/タイムアウト
+        return status is None or status in self.retry_statuses
+
+    def delay(self, attempt: int) -> float:
+        """attempt回目(0始まり)の失敗後の待機秒数"""
+        return random.uniform(0, min(self.max_delay, self.base_delay * (2 ** attempt)))
+
+
+class CircuitOpenError(Exception):
+    """サーキットブレーカーが開いているため、マネージャへ送信せずに失敗させた"""
+
+
+@dataclass
+class CircuitBreaker:
+    """
+    エンドポイント単位のサーキットブレーカー
+    closed: 通常 / open: 即時失敗 / half_open: 1件だけ試行し結果で closed か open に戻る
+    """
+    name: str
+    failure_threshold: int = 5
+    reset_timeout: float = 30.0
+    state: str = "closed"
+    failures: int = 0
+    opened_at: Optional[float] = None
+    _probe_in_flight: bool = field(default=False, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def before_request(self) -> None:
+        with self._lock:
+            if self.state == "open":
+                if time.monotonic() - self.opened_at < self.reset_timeout:
+                    raise CircuitOpenError(f"Circuit open for {self.name}; Hinemos manager is unhealthy")
+                self._transition("half_open")
+            if self.state == "half_open":
+                if self._probe_in_flight:
+                    raise CircuitOpenError(f"Circuit half-open for {self.name}; waiting for probe request")
+                self._probe_in_flight = True
+
+    def release(self) -> None:
+        """結果を判定できなかった試行の後始末（half_open の試行枠だけを解放）"""
+        with self._lock:
+            self._probe_in_flight = False
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._probe_in_flight = False
+            self.failures = 0
+            if self.state != "closed":
+                self._transition("closed")
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._probe_in_flight = False
+            self.failures += 1
+            if self.state == "half_open" or self.failures >= self.failure_threshold:
+                self.opened_at = time.monotonic()
+                if self.state != "open":
+                    self._transition("open")
+
+    def _transition(self, state: str) -> None:
+        log = logger.warning if state == "open" else logger.info
+        log(f"Circuit breaker {self.name}: {self.state} -> {state} (failures={self.failures})")
+        self.state = state
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {"state": self.state, "failures": self.failures}
+
+
+class CircuitBreakerRegistry:
+    """endpoint_key() 毎の CircuitBreaker を保持"""
+
+    def __init__(self, failure_threshold: Optional[int] = None, reset_timeout: Optional[float] = None):
+        self.failure_threshold = failure_threshold or int(os.getenv("HINEMOS_CIRCUIT_FAILURE_THRESHOLD", "5"))
+        self.reset_timeout = reset_timeout or float(os.getenv("HINEMOS_CIRCUIT_RESET_TIMEOUT", "30"))
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    def get(self, endpoint: str) -> CircuitBreaker:
+        key = endpoint_key(endpoint)
+        breaker = self._breakers.get(key)
+        if breaker is None:
+            with self._lock:
+                breaker = self._breakers.setdefault(
+                    key, CircuitBreaker(key, self.failure_threshold, self.reset_timeout)
+                )
+        return breaker
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        return {key: breaker.snapshot() for key, breaker in list(self._breakers.items())}
@@ -0,0 +1,308 @@
+import os
+import time
+import asyncio
+import logging
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+# 進捗通知 (経過秒, 待機上限秒, メッセージ)
+WaitProgress = Callable[[float, float, str], Awaitable[None]]
+
+# ポーリング間隔が延びている間も進捗通知を送る間隔（秒）
+_HEARTBEAT_SECONDS = 5.0
+
+# ジョブセッションの状態（status は列挙名・コードのどちらでも、コードに直してから判定する）
+# 300 番台（終了・変更済・終了(条件未達成) など）は終了、200 番台（保留・スキップ・中断・コマンド停止など）は操作待ち
+_STATUS_CODES = {
+    "WAIT": 0, "RUNNING": 100, "STOPPING": 101, "RUNNING_QUEUE": 102,
+    "RESERVING": 200, "SKIP": 201, "SUSPEND": 202, "STOP": 203, "SUSPEND_QUEUE": 204,
+    "END": 300, "MODIFIED": 301, "END_UNMATCH": 302, "END_CALENDAR": 303, "END_SKIP": 304,
+    "END_START_DELAY": 305, "END_END_DELAY": 306, "END_EXCLUSIVE_BRANCH": 307,
+    "END_FAILED_OLD_RUNNING": 308, "END_QUEUE_LIMIT": 309,
+}
+# 一覧にない列挙名のうち、これらで始まるものは終了とみなす
+_FINISHED_PREFIXES = ("END", "MODIFIED")
+
+
+def _status_code(status: Any) -> int:
+    if isinstance(status, (int, float)) or str(status).isdigit():
+        return int(status)
+    name = str(status).upper()
+    code = _STATUS_CODES.get(name)
+    if code is None:
+        code = 300 if name.startswith(_FINISHED_PREFIXES) else 100
+    return code
+
+
+def session_state(status: Any) -> str:
+    """ジョブの状態を "finished" / "halted" / "running" / "unknown" に分類する"""
+    if status is None:
+        return "unknown"
+    code = _status_code(status)
+    return "finished" if code >= 300 else "halted" if code >= 200 else "running"
+
+
+def _session_summary(session_id: str, item: Dict[str, Any]) -> Dict[str, Any]:
+    detail = item.get("detail") if isinstance(item.get("detail"), dict) else item
+    data = item.get("data") if isinstance(item.get("data"), dict) else item
+    return {
+        "sessionId": session_id,
+        "jobunitId": data.get("jobunitId"),
+        "jobId": data.get("jobId"),
+        "jobName": data.get("jobName", data.get("name")),
+        "status": detail.get("status"),
+        "endStatus": detail.get("endStatus"),
+        "endValue": detail.get("endValue"),
+        "startDate": detail.get("startDate"),
+        "endDate": detail.get("endDate"),
+    }
+
+
+def detail_summary(session_id: str, tree: Any) -> Optional[Dict[str, Any]]:
+    """get_session_job_detail のジョブツリーから、状態を持つ最上位のジョブ（実行したジョブ）の状態を取り出す"""
+    queue = [tree] if isinstance(tree, dict) else list(tree or [])
+    while queue:
+        item = queue.pop(0)
+        if not isinstance(item, dict):
+            continue
+        detail = item.get("detail")
+        if isinstance(detail, dict) and detail.get("status") is not None:
+            return _session_summary(session_id, item)
+        queue.extend(item.get("children") or [])
+    return None
+
+
+def _history_list(result: Any) -> List[Dict[str, Any]]:
+    if isinstance(result, list):
+        return result
+    if isinstance(result, dict):
+        for key in ("list", "jobHistoryList"):
+            if isinstance(result.get(key), list):
+                return result[key]
+    return []
+
+
+@dataclass
+class WatchConfig:
+    """
+    ジョブセッション監視のポーリング設定
+    Attributes:
+        min_interval: 状態が変わった直後のポーリング間隔（秒）
+        max_interval: 状態が変わらない間に延ばす間隔の上限（秒）
+        backoff: 状態が変わらなかったときに間隔に掛ける倍率
+        concurrency: セッション詳細を個別に取得するときの同時リクエスト数
+        history_size: 一括取得（history_search）で取得する最大件数
+    """
+    min_interval: float = 1.0
+    max_interval: float = 30.0
+    backoff: float = 1.5
+    concurrency: int = 4
+    history_size: int = 500
+
+    @classmethod
+    def from_env(cls) -> "WatchConfig":
+        default = cls()
+        return cls(
+            min_interval=float(os.getenv("HINEMOS_WATCH_MIN_INTERVAL", default.min_interval)),
+            max_interval=float(os.getenv("HINEMOS_WATCH_MAX_INTERVAL", default.max_interval)),
+            backoff=float(os.getenv("HINEMOS_WATCH_BACKOFF", default.backoff)),
+            concurrency=int(os.getenv("HINEMOS_WATCH_CONCURRENCY", default.concurrency)),
+            history_size=int(os.getenv("HINEMOS_WATCH_HISTORY_SIZE", default.history_size)),
+        )
+
+
+class _Watched:
+    def __init__(self, session_id: str, interval: float):
+        self.session_id = session_id
+        self.summary: Dict[str, Any] = {"sessionId": session_id}
+        self.state = "unknown"
+        self.interval = interval
+        self.next_poll = 0.0
+        self.waiters = 0
+        self.polls = 0
+        self.error: Optional[str] = None
+
+
+class SessionWatcher:
+    """
+    複数の wait 呼び出しで共有するジョブセッションの監視ループ
+    待たれているセッションだけを1本のループでまとめてポーリングする。開始日時が分かっているセッションが複数あれば
+    history_search 1回でまとめて取得し、見つからないものだけ get_session_job_detail で個別に取得する。
+    状態が変わらない間はセッションごとに間隔を backoff 倍ずつ延ばし、終了したセッションと待つ者がいなくなった
+    セッションはポーリング対象から外す。
+    Args:
+        get_detail: get_session_job_detail 相当のコルーチン関数 (sessionId)
+        history_search: history_search 相当のコルーチン関数 (size, filter)。None なら個別取得のみ
+    """
+
+    def __init__(self, get_detail: Callable[[str], Awaitable[Any]],
+                 history_search: Optional[Callable[[int, Dict[str, Any]], Awaitable[Any]]] = None,
+                 config: Optional[WatchConfig] = None):
+        self.get_detail = get_detail
+        self.history_search = history_search
+        self.config = config or WatchConfig.from_env()
+        self._sessions: Dict[str, _Watched] = {}
+        self._changed: Optional[asyncio.Condition] = None
+        self._task: Optional[asyncio.Task] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self.stats = {"cycles": 0, "historyRequests": 0, "detailRequests": 0, "errors": 0}
+
+    def _active(self) -> List[_Watched]:
+        return [w for w in self._sessions.values() if w.waiters > 0 and w.state not in ("finished",)]
+
+    def _ensure_loop(self) -> None:
+        if self._changed is None:
+            self._changed = asyncio.Condition()
+            self._wakeup = asyncio.Event()
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+        else:
+            self._wakeup.set()
+
+    async def _run(self) -> None:
+        try:
+            while True:
+                active = self._active()
+                if not active:
+                    return
+                now = time.monotonic()
+                due = [w for w in active if w.next_poll <= now]
+                if due:
+                    await self._poll(due)
+                    self.stats["cycles"] += 1
+                    async with self._changed:
+                        self._changed.notify_all()
+                    continue
+                self._wakeup.clear()
+                wait = min(w.next_poll for w in active) - now
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=max(0.0, wait))
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            self._task = None
+
+    async def _poll(self, due: List[_Watched]) -> None:
+        results: Dict[str, Optional[Dict[str, Any]]] = {}
+        known = [w for w in due if w.summary.get("startDate")]
+        if self.history_search is not None and len(known) >= 2:
+            # 最も古い開始日時以降の履歴をまとめて取得する（フィルタの日時はセッション詳細の値をそのまま使う）
+            start = min(str(w.summary["startDate"]) for w in known)
+            try:
+                history = await self.history_search(self.config.history_size, {"startFromDate": start})
+                self.stats["historyRequests"] += 1
+                wanted = {w.session_id for w in known}
+                for item in _history_list(history):
+                    if item.get("sessionId") in wanted:
+                        results[item["sessionId"]] = _session_summary(item["sessionId"], item)
+            except Exception as e:
+                logger.debug(f"session watcher: history_search failed, falling back to detail: {e}")
+
+        semaphore = asyncio.Semaphore(max(1, self.config.concurrency))
+
+        async def fetch(watched: _Watched) -> None:
+            async with semaphore:
+                try:
+                    tree = await self.get_detail(watched.session_id)
+                    self.stats["detailRequests"] += 1
+                    results[watched.session_id] = detail_summary(watched.session_id, tree)
+                    watched.error = None
+                except Exception as e:
+                    self.stats["errors"] += 1
+                    watched.error = str(e)
+                    results[watched.session_id] = None
+
+        await asyncio.gather(*(fetch(w) for w in due if w.session_id not in results))
+        now = time.monotonic()
+        for watched in due:
+            summary = results.get(watched.session_id)
+            watched.polls += 1
+            changed = False
+            if summary is not None:
+                changed = (summary.get("status"), summary.get("endStatus")) != \
+                          (watched.summary.get("status"), watched.summary.get("endStatus"))
+                watched.summary = {**watched.summary, **{k: v for k, v in summary.items() if v is not None}}
+                watched.state = session_state(summary.get("status"))
+            if changed:
+                watched.interval = self.config.min_interval
+            else:
+                watched.interval = min(self.config.max_interval, watched.interval * self.config.backoff)
+            watched.next_poll = now + watched.interval
+
+    def _result(self, session_ids: Sequence[str]) -> List[Dict[str, Any]]:
+        sessions = []
+        for session_id in session_ids:
+            watched = self._sessions[session_id]
+            item = {**watched.summary, "state": watched.state, "polls": watched.polls}
+            if watched.error:
+                item["error"] = watched.error
+            sessions.append(item)
+        return sessions
+
+    async def wait(self, session_ids: Sequence[str], timeout: float, until: str = "all",
+                   return_on_halt: bool = True, on_progress: Optional[WaitProgress] = None) -> Dict[str, Any]:
+        """
+        セッションが終了する（until="any" ならいずれかが終了する）か、timeout 秒が経つまで待つ
+        return_on_halt が真の場合、中断・停止など操作待ちの状態も待機終了の条件とみなす
+        Returns:
+            {"sessions": [{..., "state"}], "completed", "timedOut", "elapsedSeconds"}
+        """
+        session_ids = list(dict.fromkeys(session_ids))
+        settled_states = ("finished", "halted") if return_on_halt else ("finished",)
+        started = time.monotonic()
+        deadline = started + max(0.0, timeout)
+        for session_id in session_ids:
+            watched = self._sessions.get(session_id)
+            if watched is None:
+                watched = self._sessions[session_id] = _Watched(session_id, self.config.min_interval)
+            watched.waiters += 1
+            if watched.state != "finished":
+                # 新たに待たれたセッションはすぐに状態を確認する
+                watched.next_poll = min(watched.next_poll, time.monotonic())
+        try:
+            self._ensure_loop()
+            while True:
+                settled = [s for s in session_ids if self._sessions[s].state in settled_states]
+                done = len(settled) == len(session_ids) or (until == "any" and settled)
+                remaining = deadline - time.monotonic()
+                if on_progress is not None:
+                    states = [self._sessions[s].summary.get("status") or "unknown" for s in session_ids]
+                    await on_progress(min(timeout, time.monotonic() - started), timeout,
+                                      f"{len(settled)}/{len(session_ids)} sessions settled ({', '.join(map(str, states[:5]))})")
+                if done or remaining <= 0:
+                    break
+                async with self._changed:
+                    try:
+                        await asyncio.wait_for(self._changed.wait(), timeout=min(remaining, _HEARTBEAT_SECONDS))
+                    except asyncio.TimeoutError:
+                        pass
+            if on_progress is not None:
+                await on_progress(timeout, timeout, f"{len(settled)}/{len(session_ids)} sessions settled")
+            return {
+                "sessions": self._result(session_ids),
+                "completed": bool(done),
+                "timedOut": not done,
+                "elapsedSeconds": round(time.monotonic() - started, 3),
+            }
+        finally:
+            for session_id in session_ids:
+                self._sessions[session_id].waiters -= 1
+            self._forget()
+
+    def _forget(self) -> None:
+        # 待つ者がいなくなったセッションは破棄する（終了済みのものも含め、次回の wait では取り直す）
+        for session_id in [s for s, w in self._sessions.items() if w.waiters <= 0]:
+            del self._sessions[session_id]
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    async def close(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
@@ -0,0 +1,270 @@
+import json
+import bisect
+import hashlib
+import secrets
+from collections import OrderedDict
+from operator import itemgetter
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+StatusKey = Tuple[Any, Any, Any, Any]
+
+_STATUS_KEY_FIELDS = ("facilityId", "monitorId", "monitorDetailId", "pluginId")
+_status_key_getter = itemgetter(*_STATUS_KEY_FIELDS)
+_priority_getter = itemgetter("priority")
+
+# 履歴上の「存在しない」状態
+_ABSENT = object()
+
+
+def status_key(status: Dict[str, Any]) -> StatusKey:
+    return (status.get("facilityId"), status.get("monitorId"), status.get("monitorDetailId"), status.get("pluginId"))
+
+
+def _key_hashes(status_list: List[Dict[str, Any]]) -> np.ndarray:
+    try:
+        keys = map(_status_key_getter, status_list)
+        return np.fromiter(map(hash, keys), dtype=np.int64, count=len(status_list))
+    except KeyError:
+        return np.fromiter(map(hash, map(status_key, status_list)), dtype=np.int64, count=len(status_list))
+
+
+class StatusTracker:
+    """
+    status_search の結果をバージョン付きスナップショットとして保持し、任意の過去バージョンからの差分を返す
+    スナップショットはキー (facilityId, monitorId, monitorDetailId, pluginId) のハッシュ値(int64)と重要度コードを
+    ハッシュ順に並べた配列で持ち、前回との突き合わせは searchsorted で行う（行ごとの dict 構築なし）。
+    変化したキーだけを変更ログに積み、差分はログのカーソル以降だけを見るため変化件数に比例した時間で求まる。
+    変化したキーにはバージョンごとの状態（重要度、または解消済み）の履歴を持ち、カーソル時点の有無と重要度を
+    履歴から求める（解消後に再び現れたキーも正しく判定する）。
+    キーのハッシュはプロセス内でのみ有効（状態はメモリ上だけに持つ）。
+    Args:
+        max_versions: 差分を返せる過去バージョン数。これより古いカーソルは reset 扱い
+    """
+
+    def __init__(self, max_versions: int = 1000):
+        self.max_versions = max_versions
+        self.version = 0
+        self._rows: List[Dict[str, Any]] = []
+        self._hashes = np.empty(0, dtype=np.int64)     # ハッシュ昇順
+        self._positions = np.empty(0, dtype=np.int64)  # _hashes[i] の行の _rows 上の位置
+        self._priorities = np.empty(0, dtype=np.int16)
+        self._priority_codes: Dict[Any, int] = {}
+        self._priority_names: List[Any] = []
+        # 変化したキー → [(バージョン, そのバージョン以降の重要度 または _ABSENT), ...]
+        # 最初の要素より前は存在しない。履歴のないキーは初回から重要度が変わらず存在している
+        self._history: Dict[int, List[Tuple[int, Any]]] = {}
+        # 解消済みのキー → 最後の行
+        self._removed: Dict[int, Dict[str, Any]] = {}
+        self._log_versions: List[int] = []
+        self._log_keys: List[int] = []
+
+    @property
+    def total(self) -> int:
+        return len(self._rows)
+
+    @property
+    def rows(self) -> List[Dict[str, Any]]:
+        """最新のスナップショット（status_search の結果の行）"""
+        return self._rows
+
+    @property
+    def oldest_version(self) -> int:
+        return max(1, self.version - self.max_versions)
+
+    def _codes(self, status_list: List[Dict[str, Any]]) -> np.ndarray:
+        codes = self._priority_codes
+        names = self._priority_names
+
+        def code(priority):
+            value = codes.get(priority)
+            if value is None:
+                value = codes[priority] = len(names)
+                names.append(priority)
+            return value
+
+        try:
+            priorities = map(_priority_getter, status_list)
+            return np.fromiter(map(code, priorities), dtype=np.int16, count=len(status_list))
+        except KeyError:
+            return np.fromiter((code(row.get("priority")) for row in status_list), dtype=np.int16, count=len(status_list))
+
+    @staticmethod
+    def _lookup(sorted_hashes: np.ndarray, hashes: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """hashes の各値の sorted_hashes 上の位置と、存在するかどうか"""
+        if not len(sorted_hashes):
+            return np.zeros(len(hashes), dtype=np.int64), np.zeros(len(hashes), dtype=bool)
+        index = np.searchsorted(sorted_hashes, hashes)
+        index[index >= len(sorted_hashes)] = 0
+        return index, sorted_hashes[index] == hashes
+
+    def _log(self, key: int) -> None:
+        self._log_versions.append(self.version)
+        self._log_keys.append(key)
+
+    def update(self, status_list: List[Dict[str, Any]]) -> int:
+        """最新の status_search 結果を取り込み、新しいバージョン番号を返す"""
+        self.version += 1
+        version = self.version
+        hashes = _key_hashes(status_list)
+        priorities = self._codes(status_list)
+        order = np.argsort(hashes, kind="stable")
+        hashes, priorities = hashes[order], priorities[order]
+
+        if version > 1:
+            names = self._priority_names
+            index, found = self._lookup(self._hashes, hashes)
+            for i in np.flatnonzero(~found):
+                key = int(hashes[i])
+                self._removed.pop(key, None)
+                self._history.setdefault(key, []).append((version, names[priorities[i]]))
+                self._log(key)
+            # 前回が空のスナップショットなら全キーが追加で、重要度を比べる相手はない
+            changed = np.flatnonzero(found & (self._priorities[index] != priorities)) if len(self._hashes) else []
+            for i in changed:
+                key = int(hashes[i])
+                self._track(key, names[self._priorities[index[i]]]).append((version, names[priorities[i]]))
+                self._log(key)
+            _, still = self._lookup(hashes, self._hashes)
+            for i in np.flatnonzero(~still):
+                key = int(self._hashes[i])
+                self._removed[key] = self._rows[self._positions[i]]
+                self._track(key, names[self._priorities[i]]).append((version, _ABSENT))
+                self._log(key)
+
+        self._rows = status_list
+        self._hashes, self._positions, self._priorities = hashes, order, priorities
+        self._prune()
+        return version
+
+    def _track(self, key: int, previous: Any) -> List[Tuple[int, Any]]:
+        """key の履歴（前回まで変化のなかったキーは初回から previous の重要度で存在していたものとして始める）"""
+        history = self._history.get(key)
+        if history is None:
+            history = self._history[key] = [(1, previous)]
+        return history
+
+    def _prune(self) -> None:
+        floor = self.oldest_version
+        cut = bisect.bisect_right(self._log_versions, floor)
+        if not cut:
+            return
+        keys = set(self._log_keys[:cut])
+        del self._log_versions[:cut]
+        del self._log_keys[:cut]
+        # floor より前の履歴は floor 時点の状態を表す最後の1件だけ残す
+        for key in keys:
+            history = self._history.get(key)
+            if history is None:
+                continue
+            index = bisect.bisect_right(history, floor, key=lambda item: item[0])
+            if index > 1:
+                del history[:index - 1]
+            if len(history) == 1 and history[0][0] <= floor:
+                # floor 以降に変化がない。存在していれば履歴は不要、解消済みならキーごと忘れる
+                del self._history[key]
+                if history[0][1] is _ABSENT:
+                    self._removed.pop(key, None)
+
+    def _state_at(self, key: int, version: int, current: Any) -> Any:
+        """version 時点の key の重要度（存在しなければ _ABSENT）。current は履歴のないキーの現在の重要度"""
+        history = self._history.get(key)
+        if not history:
+            return current
+        index = bisect.bisect_right(history, version, key=lambda item: item[0])
+        return history[index - 1][1] if index else _ABSENT
+
+    def changes_since(self, version: int, limit: Optional[int] = None) -> Dict[str, Any]:
+        """
+        version 時点からの差分
+        Returns:
+            {"added", "removed", "changed", "truncated"}。changed の各行には previousPriority を付ける。
+            version が保持範囲より古い場合は {"reset": True}
+        """
+        if version < self.oldest_version or version > self.version:
+            return {"reset": True}
+        start = bisect.bisect_right(self._log_versions, version)
+        keys = list(dict.fromkeys(self._log_keys[start:]))
+        added: List[Dict[str, Any]] = []
+        removed: List[Dict[str, Any]] = []
+        changed: List[Dict[str, Any]] = []
+        index, found = self._lookup(self._hashes, np.array(keys, dtype=np.int64))
+        for key, i, present in zip(keys, index, found):
+            current = self._priority_names[self._priorities[i]] if present else _ABSENT
+            previous = self._state_at(key, version, current)
+            if present:
+                row = self._rows[self._positions[i]]
+                if previous is _ABSENT:
+                    added.append(row)
+                elif previous != current:
+                    changed.append({**row, "previousPriority": previous})
+            elif previous is not _ABSENT and key in self._removed:
+                removed.append(self._removed[key])
+        total = len(added) + len(removed) + len(changed)
+        truncated = limit is not None and total > limit
+        if truncated:
+            added = added[:limit]
+            removed = removed[:max(0, limit - len(added))]
+            changed = changed[:max(0, limit - len(added) - len(removed))]
+        return {"added": added, "removed": removed, "changed": changed, "truncated": truncated}
+
+
+class StatusChangeFeed:
+    """
+    検索条件ごとの StatusTracker と、呼び出し元に返すカーソルの管理
+    カーソルは "<プロセス固有値>.<検索条件のダイジェスト>.<バージョン>"。再起動後や別条件のカーソルは reset 扱いになる。
+    Args:
+        max_filters: 保持する検索条件の数（超えた分は最も使われていないものから破棄）
+        max_versions: 検索条件ごとに差分を返せる過去バージョン数
+    """
+
+    def __init__(self, max_filters: int = 16, max_versions: int = 1000):
+        self.max_filters = max_filters
+        self.max_versions = max_versions
+        self._epoch = secrets.token_hex(4)
+        self._trackers: "OrderedDict[str, StatusTracker]" = OrderedDict()
+
+    @staticmethod
+    def _digest(filter: Optional[Dict[str, Any]]) -> str:
+        canonical = json.dumps(filter or {}, sort_keys=True, ensure_ascii=False, default=str)
+        return hashlib.sha1(canonical.encode("utf-8")).hexdigest()[:12]
+
+    def _tracker(self, digest: str) -> StatusTracker:
+        tracker = self._trackers.get(digest)
+        if tracker is None:
+            tracker = self._trackers[digest] = StatusTracker(self.max_versions)
+            while len(self._trackers) > self.max_filters:
+                self._trackers.popitem(last=False)
+        self._trackers.move_to_end(digest)
+        return tracker
+
+    def _parse_cursor(self, cursor: Optional[str], digest: str) -> Optional[int]:
+        if not cursor:
+            return None
+        try:
+            epoch, cursor_digest, version = cursor.split(".")
+            if epoch == self._epoch and cursor_digest == digest:
+                return int(version)
+        except ValueError:
+            pass
+        return None
+
+    def apply(self, filter: Optional[Dict[str, Any]], status_list: List[Dict[str, Any]],
+              cursor: Optional[str] = None, limit: Optional[int] = None) -> Dict[str, Any]:
+        """
+        最新のステータス一覧を取り込み、cursor 以降の差分と次回用のカーソルを返す
+        cursor が未指定・無効・保持範囲外の場合は差分を返さず、基準点（baseline）として新しいカーソルだけを返す
+        """
+        digest = self._digest(filter)
+        tracker = self._tracker(digest)
+        since = self._parse_cursor(cursor, digest)
+        version = tracker.update(status_list)
+        result: Dict[str, Any] = {"cursor": f"{self._epoch}.{digest}.{version}", "total": tracker.total}
+        changes = tracker.changes_since(since, limit) if since is not None else {"reset": True}
+        if changes.get("reset"):
+            result["baseline"] = True
+            if cursor:
+                result["message"] = "カーソルが無効または古いため、今回の結果を基準点にしました"
+            return result
+        return {**result, **changes}
@@ -14,7 +14,14 @@ import base64
 import json
 from typing import Any, Dict, List, Optional
 from datetime import datetime
-from client.hinemos_client import HinemosClient
+from client.async_hinemos_client import AsyncHinemosClient
+from client.event_pager import EventWindowPager
+from client.bulk import BulkConfig
+from client.status_tracker import StatusChangeFeed
+from client.collect_fetch import CollectFetchConfig
+from client.collect_resolver import collect_keys
+from client.session_watcher import SessionWatcher
+from client.job_launch import LaunchConfig, expand_launches
 
 # Fix encoding for Windows Japanese environment
 if sys.platform == "win32":
@@ -22,9 +29,19 @@ if sys.platform == "win32":
 
 from mcp.server.models import InitializationOptions
 from mcp.server import NotificationOptions, Server
-from mcp.types import TextContent, Tool, ListToolsResult
+from mcp.types import TextContent, Tool, ListToolsResult, Resource
+from pydantic import AnyUrl
 
 from mcp_tools import get_all_tools, dispatch_tool
+from mcp_tools.progress import progress_scope, report_progress
+from mcp_resources import get_resources, read_resource, SubscriptionHub, HinemosPoller
+from mcp_resources.poller import EVENTS_RECENT_URI
+from analytics import EventStore, EventSummarizer, TemplateMiner, SeriesCache, JobHistoryStore
+from analytics.series_cache import fetch_cached_series
+from analytics.downsample import DEFAULT_POINTS, downsample as downsample_series
+from analytics.metric_anomaly import DEFAULT_PERCENTILES as ANOMALY_PERCENTILES, rank_anomalies
+from analytics.forecast import forecast_series
+from analytics.event_summary import priority_name
 
 # Configure logging
 logging.basicConfig(
@@ -38,1053 +55,942 @@ logging.basicConfig(
 logger = logging.getLogger("hinemos-mcp")
 
 
-class HinemosSyncManager:
-    """同期版 Hinemos REST APIクライアントラッパー（hinemos_client.py利用）"""
+# collect_forecast が返す系列数の上限
+FORECAST_TOP_N_LIMIT = 200
+# wait_for_session の待機秒数（既定・上限）
+WAIT_SESSION_DEFAULT_SECONDS = 300
+WAIT_SESSION_MAX_SECONDS = 3600
+# run_job_bulk で一度に実行できる要求数の上限
+JOB_LAUNCH_LIMIT = 1000
+
+
+class HinemosAsyncManager:
+    """非同期版 Hinemos REST APIクライアントラッパー（client/async_hinemos_client.py利用）"""
     def __init__(self):
-        self.client = HinemosClient()
+        self.client = AsyncHinemosClient()
         self.logged_in = False
+        self._event_store: Optional[EventStore] = None
+        self._series_cache: Optional[SeriesCache] = None
+        self._job_history: Optional[JobHistoryStore] = None
+        self.status_feed = StatusChangeFeed()
+        self.session_watcher = SessionWatcher(self.client.get_session_job_detail, self.client.history_search)
+
+    @property
+    def event_store(self) -> EventStore:
+        # 分析ツールが初めて使われた時点でストアを開く
+        if self._event_store is None:
+            self._event_store = EventStore()
+        return self._event_store
+
+    @property
+    def series_cache(self) -> SeriesCache:
+        if self._series_cache is None:
+            self._series_cache = SeriesCache()
+        return self._series_cache
+
+    @property
+    def job_history(self) -> JobHistoryStore:
+        if self._job_history is None:
+            self._job_history = JobHistoryStore()
+        return self._job_history
 
     async def test_connection(self) -> Dict[str, Any]:
-        import asyncio
         try:
-            loop = asyncio.get_event_loop()
-            result = await loop.run_in_executor(None, self.client.login)
+            result = await self.client.login()
             self.logged_in = True
             return {
                 "status": "connected",
-                "manager_type": "sync",
+                "manager_type": "async",
                 "message": "Hinemos REST API接続に成功しました"
             }
         except Exception as e:
             return {
                 "status": "connection_failed",
-                "manager_type": "sync",
+                "manager_type": "async",
                 "error": str(e),
                 "message": f"Hinemos REST API接続に失敗しました: {str(e)}"
             }
         
     async def get_facility_list(self, **kwargs) -> Dict[str, Any]:
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.client.get_facility_list, **kwargs)
+        return await self.client.get_facility_list(**kwargs)
 
     async def get_facility_tree(self, **kwargs) -> Dict[str, Any]:
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.client.get_facility_tree, **kwargs)
+        return await self.client.get_facility_tree(**kwargs)
 
     async def get_node_list(self, **kwargs) -> Dict[str, Any]:
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.client.get_node_list)
+        return await self.client.get_node_list()
 
     async def add_node(self, **kwargs) -> Dict[str, Any]:
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.client.add_node, kwargs)
+        return await self.client.add_node(kwargs)
 
     async def delete_node(self, facility_ids: list) -> Dict[str, Any]:
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.client.delete_node, facility_ids)
+        return await self.client.delete_node(facility_ids)
 
     async def add_http_monitor(self, **kwargs) -> Dict[str, Any]:
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.client.add_http_monitor, **kwargs)
+        return await self.client.add_http_monitor(**kwargs)
 
     async def add_ping_monitor(self, **kwargs) -> Dict[str, Any]:
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.client.add_ping_monitor, **kwargs)
+        return await self.client.add_ping_monitor(**kwargs)
 
     async def get_monitor_list(self, **kwargs) -> Dict[str, Any]:
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.client.get_monitor_list)
+        return await self.client.get_monitor_list()
 
     async def delete_monitor(self, monitor_ids: list) -> Dict[str, Any]:
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.client.delete_monitor, monitor_ids)
+        return await self.client.delete_monitor(monitor_ids)
 
     async def get_event_list(self, **kwargs) -> Dict[str, Any]:
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.client.get_event_list)
+        return await self.client.get_event_list()
 
     async def get_scope_list(self, **kwargs) -> Dict[str, Any]:
-        import asyncio
-        loop = asyncio.get_event_loop()
         # スコープ一覧取得APIはget_facility_listで代用
-        return await loop.run_in_executor(None, self.client.get_facility_list)
+        return await self.client.get_facility_list()
 
     async def get_calendar_list(self, **kwargs) -> Dict[str, Any]:
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.client.get_calendar_list, **kwargs)
+        return await self.client.get_calendar_list(**kwargs)
 
     async def get_calendar(self, **kwargs) -> Dict[str, Any]:
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.client.get_calendar, kwargs["calendar_id"])
+        return await self.client.get_calendar(kwargs["calendar_id"])
 
     async def add_calendar(self, **kwargs) -> Dict[str, Any]:
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.client.add_calendar, kwargs['calendar_info'])
+        return await self.client.add_calendar(kwargs['calendar_info'])
 
     async def modify_calendar(self, **kwargs) -> Dict[str, Any]:
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.client.modify_calendar, kwargs["calendar_id"], kwargs["calendar_info"])
+        return await self.client.modify_calendar(kwargs["calendar_id"], kwargs["calendar_info"])
 
     async def delete_calendar(self, **kwargs) -> Dict[str, Any]:
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.client.delete_calendar, kwargs["calendar_ids"])
+        return await self.client.delete_calendar(kwargs["calendar_ids"])
 
     async def get_calendar_month(self, **kwargs) -> Dict[str, Any]:
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.client.get_calendar_month, kwargs["calendar_id"], kwargs["year"], kwargs["month"])
+        return await self.client.get_calendar_month(kwargs["calendar_id"], kwargs["year"], kwargs["month"])
 
     async def get_calendar_week(self, **kwargs) -> Dict[str, Any]:
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.client.get_calendar_week, kwargs["calendar_id"], kwargs["year"], kwargs["month"], kwargs["day"])
+        return await self.client.get_calendar_week(kwargs["calendar_id"], kwargs["year"], kwargs["month"], kwargs["day"])
 
     async def get_calendar_pattern_list(self, **kwargs) -> Dict[str, Any]:
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.client.get_calendar_pattern_list, **kwargs)
+        return await self.client.get_calendar_pattern_list(**kwargs)
 
     async def get_calendar_pattern(self, **kwargs) -> Dict[str, Any]:
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.client.get_calendar_pattern, kwargs["calendar_pattern_id"])
+        return await self.client.get_calendar_pattern(kwargs["calendar_pattern_id"])
 
     async def add_calendar_pattern(self, **kwargs) -> Dict[str, Any]:
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.client.add_calendar_pattern, kwargs['pattern_info'])
+        return await self.client.add_calendar_pattern(kwargs['pattern_info'])
 
     async def modify_calendar_pattern(self, **kwargs) -> Dict[str, Any]:
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.client.modify_calendar_pattern, kwargs["calendar_pattern_id"], kwargs["pattern_info"])
+        return await self.client.modify_calendar_pattern(kwargs["calendar_pattern_id"], kwargs["pattern_info"])
 
     async def delete_calendar_pattern(self, **kwargs) -> Dict[str, Any]:
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.client.delete_calendar_pattern, kwargs["calendar_pattern_ids"])
+        return await self.client.delete_calendar_pattern(kwargs["calendar_pattern_ids"])
 
     # --- 監視設定一覧・検索 ---
     async def get_monitor_list(self, **kwargs):
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.client.get_monitor_list)
+        return await self.client.get_monitor_list()
 
     async def get_monitor_list_by_condition(self, **kwargs):
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.client.search_monitor_list, kwargs.get("monitor_filter_info"))
+        return await self.client.search_monitor_list(kwargs.get("monitor_filter_info"))
 
     async def get_monitor(self, **kwargs):
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.client.get_monitor, kwargs.get("monitor_id"))
+        return await self.client.get_monitor(kwargs.get("monitor_id"))
 
     async def delete_monitor(self, **kwargs):
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.client.delete_monitor, kwargs.get("monitor_ids"))
+        return await self.client.delete_monitor(kwargs.get("monitor_ids"))
 
     async def set_status_monitor(self, **kwargs):
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.client.set_status_monitor, kwargs.get("monitor_ids"), kwargs.get("valid_flg"))
+        return await self.client.set_status_monitor(kwargs.get("monitor_ids"), kwargs.get("valid_flg"))
 
     async def set_status_collector(self, **kwargs):
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.client.set_status_collector, kwargs.get("monitor_ids"), kwargs.get("valid_flg"))
+        return await self.client.set_status_collector(kwargs.get("monitor_ids"), kwargs.get("valid_flg"))
 
     # --- HTTPシナリオ監視 ---
     async def add_http_scenario_monitor(self, **kwargs):
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.client.add_http_scenario_monitor, kwargs.get("monitor_info"))
+        return await self.client.add_http_scenario_monitor(kwargs.get("monitor_info"))
 
     async def modify_http_scenario_monitor(self, **kwargs):
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.client.modify_http_scenario_monitor, kwargs.get("monitor_id"), kwargs.get("monitor_info"))
+        return await self.client.modify_http_scenario_monitor(kwargs.get("monitor_id"), kwargs.get("monitor_info"))
 
     async def get_http_scenario_list(self, **kwargs):
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.client.get_http_scenario_list, kwargs.get("monitor_id"))
+        return await self.client.get_http_scenario_list(kwargs.get("monitor_id"))
 
     # --- HTTP監視（数値） ---
     async def add_http_numeric_monitor(self, **kwargs):
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.client.add_http_numeric_monitor, kwargs.get("monitor_info"))
+        return await self.client.add_http_numeric_monitor(kwargs.get("monitor_info"))
 
     async def modify_http_numeric_monitor(self, **kwargs):
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.client.modify_http_numeric_monitor, kwargs.get("monitor_id"), kwargs.get("monitor_info"))
+        return await self.client.modify_http_numeric_monitor(kwargs.get("monitor_id"), kwargs.get("monitor_info"))
 
     async def get_http_numeric_list(self, **kwargs):
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.client.get_http_numeric_list, kwargs.get("monitor_id"))
+        return await self.client.get_http_numeric_list(kwargs.get("monitor_id"))
 
     # --- HTTP監視（文字列） ---
     async def add_http_string_monitor(self, **kwargs):
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.client.add_http_string_monitor, kwargs.get("monitor_info"))
+        return await self.client.add_http_string_monitor(kwargs.get("monitor_info"))
 
     async def modify_http_string_monitor(self, **kwargs):
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.client.modify_http_string_monitor, kwargs.get("monitor_id"), kwargs.get("monitor_info"))
+        return await self.client.modify_http_string_monitor(kwargs.get("monitor_id"), kwargs.get("monitor_info"))
 
     async def get_http_string_list(self, **kwargs):
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.client.get_http_string_list, kwargs.get("monitor_id"))
+        return await self.client.get_http_string_list(kwargs.get("monitor_id"))
 
     # --- エージェント監視 ---
     async def add_agent_monitor(self, **kwargs):
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.client.add_agent_monitor, kwargs.get("monitor_info"))
+        return await self.client.add_agent_monitor(kwargs.get("monitor_info"))
 
     async def modify_agent_monitor(self, **kwargs):
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.client.modify_agent_monitor, kwargs.get("monitor_id"), kwargs.get("monitor_info"))
+        return await self.client.modify_agent_monitor(kwargs.get("monitor_id"), kwargs.get("monitor_info"))
 
     async def get_agent_list(self, **kwargs):
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.client.get_agent_list, kwargs.get("monitor_id"))
+        return await self.client.get_agent_list(kwargs.get("monitor_id"))
 
     # --- JMX監視 ---
     async def add_jmx_monitor(self, **kwargs):
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.client.add_jmx_monitor, kwargs.get("monitor_info"))
+        return await self.client.add_jmx_monitor(kwargs.get("monitor_info"))
 
     async def modify_jmx_monitor(self, **kwargs):
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.client.modify_jmx_monitor, kwargs.get("monitor_id"), kwargs.get("monitor_info"))
+        return await self.client.modify_jmx_monitor(kwargs.get("monitor_id"), kwargs.get("monitor_info"))
 
     async def get_jmx_list(self, **kwargs):
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.client.get_jmx_list, kwargs.get("monitor_id"))
+        return await self.client.get_jmx_list(kwargs.get("monitor_id"))
 
     async def get_jmx_url_format_list(self, **kwargs):
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.client.get_jmx_url_format_list)
+        return await self.client.get_jmx_url_format_list()
 
     # --- PING監視 ---
     async def add_ping_monitor(self, **kwargs):
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.client.add_ping_monitor, kwargs.get("monitor_info"))
+        return await self.client.add_ping_monitor(kwargs.get("monitor_info"))
 
     async def modify_ping_monitor(self, **kwargs):
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.client.modify_ping_monitor, kwargs.get("monitor_id"), kwargs.get("monitor_info"))
+        return await self.client.modify_ping_monitor(kwargs.get("monitor_id"), kwargs.get("monitor_info"))
 
     async def get_ping_list(self, **kwargs):
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.client.get_ping_list, kwargs.get("monitor_id"))
+        return await self.client.get_ping_list(kwargs.get("monitor_id"))
 
     # --- カスタム監視（数値） ---
     async def add_custom_numeric_monitor(self, **kwargs):
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.client.add_custom_numeric_monitor, kwargs.get("monitor_info"))
+        return await self.client.add_custom_numeric_monitor(kwargs.get("monitor_info"))
 
     async def modify_custom_numeric_monitor(self, **kwargs):
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.client.modify_custom_monitor, kwargs.get("monitor_id"), kwargs.get("monitor_info"))
+        return await self.client.modify_custom_monitor(kwargs.get("monitor_id"), kwargs.get("monitor_info"))
 
     async def get_custom_numeric_list(self, **kwargs):
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.client.get_custom_list, kwargs.get("monitor_id"))
+        return await self.client.get_custom_list(kwargs.get("monitor_id"))
 
     # --- カスタム監視（文字列） ---
     async def add_custom_string_monitor(self, **kwargs):
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.client.add_custom_string_monitor, kwargs.get("monitor_info"))
+        return await self.client.add_custom_string_monitor(kwargs.get("monitor_info"))
 
     async def modify_custom_string_monitor(self, **kwargs):
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.client.modify_custom_string_monitor, kwargs.get("monitor_id"), kwargs.get("monitor_info"))
+        return await self.client.modify_custom_string_monitor(kwargs.get("monitor_id"), kwargs.get("monitor_info"))
 
     async def get_custom_string_list(self, **kwargs):
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.client.get_custom_string_list, kwargs.get("monitor_id"))
+        return await self.client.get_custom_string_list(kwargs.get("monitor_id"))
     
     # --- リソース監視 ---
     async def add_performance_monitor(self, **kwargs):
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.client.add_performance_monitor, kwargs.get("monitor_info"))
+        return await self.client.add_performance_monitor(kwargs.get("monitor_info"))
 
     async def modify_performance_monitor(self, **kwargs):
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.client.modify_performance_monitor, kwargs.get("monitor_id"), kwargs.get("monitor_info"))
+        return await self.client.modify_performance_monitor(kwargs.get("monitor_id"), kwargs.get("monitor_info"))
 
     async def get_performance_list(self, **kwargs):
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.client.get_performance_list, kwargs.get("monitor_id"))
+        return await self.client.get_performance_list(kwargs.get("monitor_id"))
 
     # --- JMXマスタ管理 ---
     async def get_jmx_master_list(self, **kwargs):
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.client.get_jmx_master_list)
+        return await self.client.get_jmx_master_list()
 
     async def add_jmx_master_list(self, **kwargs):
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.client.add_jmx_master_list, kwargs.get("jmx_master_list"))
+        return await self.client.add_jmx_master_list(kwargs.get("jmx_master_list"))
 
     async def delete_jmx_master(self, **kwargs):
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.client.delete_jmx_master, kwargs.get("jmx_master_ids"))
+        return await self.client.delete_jmx_master(kwargs.get("jmx_master_ids"))
 
     async def delete_jmx_master_all(self, **kwargs):
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.client.delete_jmx_master_all)
+        return await self.client.delete_jmx_master_all()
 
     # --- 補助API ---
     async def get_jdbc_driver_list(self, **kwargs):
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.client.get_jdbc_driver_list)
+        return await self.client.get_jdbc_driver_list()
 
     async def get_binary_preset_list(self, **kwargs):
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.client.get_binary_preset_list)
+        return await self.client.get_binary_preset_list()
 
     async def get_monitor_string_tag_list(self, **kwargs):
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.client.get_monitor_string_tag_list, kwargs.get("monitor_id"), kwargs.get("owner_role_id"))
+        return await self.client.get_monitor_string_tag_list(kwargs.get("monitor_id"), kwargs.get("owner_role_id"))
 
     # --- SNMP監視（数値/文字列） ---
     async def add_snmp_numeric_monitor(self, **kwargs):
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.client.add_snmp_numeric_monitor, kwargs.get("monitor_info"))
+        return await self.client.add_snmp_numeric_monitor(kwargs.get("monitor_info"))
 
     async def modify_snmp_numeric_monitor(self, **kwargs):
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.client.modify_snmp_numeric_monitor, kwargs.get("monitor_id"), kwargs.get("monitor_info"))
+        return await self.client.modify_snmp_numeric_monitor(kwargs.get("monitor_id"), kwargs.get("monitor_info"))
 
     async def get_snmp_numeric_list(self, **kwargs):
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.client.get_snmp_numeric_list, kwargs.get("monitor_id"))
+        return await self.client.get_snmp_numeric_list(kwargs.get("monitor_id"))
 
     async def add_snmp_string_monitor(self, **kwargs):
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.client.add_snmp_string_monitor, kwargs.get("monitor_info"))
+        return await self.client.add_snmp_string_monitor(kwargs.get("monitor_info"))
 
     async def modify_snmp_string_monitor(self, **kwargs):
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.client.modify_snmp_string_monitor, kwargs.get("monitor_id"), kwargs.get("monitor_info"))
+        return await self.client.modify_snmp_string_monitor(kwargs.get("monitor_id"), kwargs.get("monitor_info"))
 
     async def get_snmp_string_list(self, **kwargs):
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.client.get_snmp_string_list, kwargs.get("monitor_id"))
+        return await self.client.get_snmp_string_list(kwargs.get("monitor_id"))
 
     # --- SQL監視 ---
     async def add_sql_numeric_monitor(self, **kwargs):
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.client.add_sql_numeric_monitor, kwargs.get("monitor_info"))
+        return await self.client.add_sql_numeric_monitor(kwargs.get("monitor_info"))
 
     async def modify_sql_numeric_monitor(self, **kwargs):
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.client.modify_sql_numeric_monitor, kwargs.get("monitor_id"), kwargs.get("monitor_info"))
+        return await self.client.modify_sql_numeric_monitor(kwargs.get("monitor_id"), kwargs.get("monitor_info"))
 
     async def get_sql_numeric_list(self, **kwargs):
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.client.get_sql_numeric_list, kwargs.get("monitor_id"))
+        return await self.client.get_sql_numeric_list(kwargs.get("monitor_id"))
 
     # --- ログファイル監視 ---
     async def add_logfile_monitor(self, **kwargs):
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.client.add_logfile_monitor, kwargs.get("monitor_info"))
+        return await self.client.add_logfile_monitor(kwargs.get("monitor_info"))
 
     async def modify_logfile_monitor(self, **kwargs):
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.client.modify_logfile_monitor, kwargs.get("monitor_id"), kwargs.get("monitor_info"))
+        return await self.client.modify_logfile_monitor(kwargs.get("monitor_id"), kwargs.get("monitor_info"))
 
     async def get_logfile_list(self, **kwargs):
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.client.get_logfile_list, kwargs.get("monitor_id"))
+        return await self.client.get_logfile_list(kwargs.get("monitor_id"))
 
     # --- プロセス監視 ---
     async def add_process_monitor(self, **kwargs):
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.client.add_process_monitor, kwargs.get("monitor_info"))
+        return await self.client.add_process_monitor(kwargs.get("monitor_info"))
 
     async def modify_process_monitor(self, **kwargs):
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.client.modify_process_monitor, kwargs.get("monitor_id"), kwargs.get("monitor_info"))
+        return await self.client.modify_process_monitor(kwargs.get("monitor_id"), kwargs.get("monitor_info"))
 
     async def get_process_list(self, **kwargs):
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.client.get_process_list, kwargs.get("monitor_id"))
+        return await self.client.get_process_list(kwargs.get("monitor_id"))
 
     # --- 監視結果API ---
     async def event_search(self, filter, size=None):
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(
-            None,
-            self.client.event_search,
-            filter,
-            size
-        )
+        return await self.client.event_search(filter, size)
+
+    async def event_search_paged(self, filter=None, page_size=None, field=None, continuation_token=None):
+        if continuation_token:
+            pager = EventWindowPager.from_token(continuation_token)
+        else:
+            pager = EventWindowPager(filter or {}, page_size or 1000, field or "outputDate")
+        events = await self.client.next_event_page(pager)
+        return {
+            "eventList": events,
+            "count": len(events),
+            "truncatedWindows": pager.truncated,
+            "continuation_token": pager.to_token(),
+        }
+
+    async def event_search_parallel(self, filter, size=None, field=None, split_by_scope=None, concurrency=None):
+        return await self.client.event_search_fanout(filter or {}, size or 1000, field or "generationDate",
+                                                     bool(split_by_scope), concurrency)
+
+    async def event_summary(self, filter, max_events=None, top_n=None, samples=None):
+        max_events = max_events or 100000
+        summarizer = EventSummarizer(top_n or 10, samples if samples is not None else 5)
+        truncated = False
+        async for event in self.client.iter_events(filter or {}):
+            if summarizer.count >= max_events:
+                truncated = True
+                break
+            summarizer.add(event)
+        return {**summarizer.result(), "truncated": truncated}
+
+    async def event_templates(self, filter, max_events=None, top_n=None, similarity=None, parameter_values=None):
+        max_events = max_events or 100000
+        miner = TemplateMiner(similarity if similarity is not None else 0.5)
+        truncated = False
+        async for event in self.client.iter_events(filter or {}):
+            if miner.total >= max_events:
+                truncated = True
+                break
+            miner.add(event.get("message"), {
+                "priority": priority_name(event.get("priority")),
+                "monitorId": event.get("monitorId"),
+            })
+        result = miner.result(top_n or 20, parameter_values if parameter_values is not None else 5)
+        return {**result, "truncated": truncated}
 
     async def scope_list(self, facility_id=None, status_flag=None, event_flag=None, order_flg=None):
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(
-            None,
-            self.client.scope_list,
-            facility_id,
-            status_flag,
-            event_flag,
-            order_flg
-        )
+        return await self.client.scope_list(facility_id, status_flag, event_flag, order_flg)
 
     async def status_search(self, filter, size=None):
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(
-            None,
-            self.client.status_search,
-            filter,
-            size
-        )
+        return await self.client.status_search(filter, size)
+
+    async def status_changes(self, filter=None, cursor=None, size=None, max_rows=None):
+        size = size or int(os.getenv("HINEMOS_STATUS_POLL_SIZE", "10000"))
+        result = await self.client.status_search(filter or {}, size)
+        status_list = result.get("statusList") or []
+        changes = self.status_feed.apply(filter, status_list, cursor, max_rows or 1000)
+        if (result.get("total") or 0) > len(status_list):
+            # size で切られた一覧では、取得されなかった行が解消扱いになる
+            changes["warning"] = f"ステータス {result['total']} 件中 {len(status_list)} 件のみ取得しました。size を増やしてください"
+        return changes
 
     async def status_delete(self, status_data_info_request_list):
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(
-            None,
-            self.client.status_delete,
-            status_data_info_request_list
-        )
-
-    async def event_download(self, filter, selected_events=None, filename=None):
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(
-            None,
-            self.client.event_download,
-            filter,
-            selected_events,
-            filename
-        )
+        return await self.client.status_delete(status_data_info_request_list)
+
+    async def event_download(self, filter, selected_events=None, filename=None, output_path=None):
+        return await self.client.event_download(filter, selected_events, filename, output_path)
+
+    async def event_export(self, filter, format=None, output_path=None, fields=None, page_size=None):
+        result = await self.client.export_events(filter or {}, format or "ndjson", output_path, fields,
+                                                 page_size or 1000, on_progress=report_progress)
+        logger.info(f"event_export: {result['rows']} rows in {result['seconds']}s "
+                    f"({result['rowsPerSecond']} rows/s, {result['bytes']} bytes) -> {result['path']}")
+        return {"path": result["path"], "rows": result["rows"]}
 
     async def event_detail_search(self, monitorId, monitorDetailId, pluginId, facilityId, outputDate):
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(
-            None,
-            self.client.event_detail_search,
-            monitorId,
-            monitorDetailId,
-            pluginId,
-            facilityId,
-            outputDate
-        )
+        return await self.client.event_detail_search(monitorId, monitorDetailId, pluginId, facilityId, outputDate)
 
     async def event_comment(self, monitorId, monitorDetailId, pluginId, facilityId, outputDate, comment, commentDate, commentUser):
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(
-            None,
-            self.client.event_comment,
-            monitorId,
-            monitorDetailId,
-            pluginId,
-            facilityId,
-            outputDate,
-            comment,
-            commentDate,
-            commentUser
-        )
+        return await self.client.event_comment(monitorId, monitorDetailId, pluginId, facilityId, outputDate, comment, commentDate, commentUser)
 
     async def event_confirm(self, list, confirmType):
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(
-            None,
-            self.client.event_confirm,
-            list,
-            confirmType
-        )
+        return await self.client.event_confirm(list, confirmType)
+
+    async def _bulk_targets(self, events, filter, max_events):
+        if events:
+            return list(events)
+        if not filter:
+            raise ValueError("events または filter を指定してください")
+        max_events = max_events or 100000
+        targets = []
+        async for event in self.client.iter_events(filter):
+            if len(targets) >= max_events:
+                break
+            targets.append(event)
+        return targets
+
+    @staticmethod
+    def _bulk_config(chunk_size, concurrency):
+        config = BulkConfig.from_env()
+        return BulkConfig(chunk_size or config.chunk_size, concurrency or config.concurrency, config.max_attempts)
+
+    async def event_bulk_confirm(self, confirmType, events=None, filter=None, max_events=None,
+                                 chunk_size=None, concurrency=None):
+        targets = await self._bulk_targets(events, filter, max_events)
+        return await self.client.event_confirm_bulk(targets, confirmType, self._bulk_config(chunk_size, concurrency),
+                                                    on_progress=report_progress)
+
+    async def event_bulk_comment(self, comment, commentUser, events=None, filter=None, max_events=None,
+                                 commentDate=None, chunk_size=None, concurrency=None):
+        targets = await self._bulk_targets(events, filter, max_events)
+        return await self.client.event_comment_bulk(targets, comment, commentUser, commentDate,
+                                                    self._bulk_config(chunk_size, concurrency),
+                                                    on_progress=report_progress)
 
     async def event_multiConfirm(self, confirmType, filter):
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(
-            None,
-            self.client.event_multiConfirm,
-            confirmType,
-            filter
-        )
+        return await self.client.event_multiConfirm(confirmType, filter)
 
     async def event_collectGraphFlg(self, list, collectGraphFlg):
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(
-            None,
-            self.client.event_collectGraphFlg,
-            list,
-            collectGraphFlg
-        )
+        return await self.client.event_collectGraphFlg(list, collectGraphFlg)
 
     async def event_update(self, info):
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(
-            None,
-            self.client.event_update,
-            info
-        )
+        return await self.client.event_update(info)
 
     async def eventCustomCommand_exec(self, commandNo, eventList):
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(
-            None,
-            self.client.eventCustomCommand_exec,
-            commandNo,
-            eventList
-        )
+        return await self.client.eventCustomCommand_exec(commandNo, eventList)
 
     async def eventCustomCommand_result(self, uuid):
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(
-            None,
-            self.client.eventCustomCommand_result,
-            uuid
-        )
+        return await self.client.eventCustomCommand_result(uuid)
 
     async def event_collectValid_mapKeyFacility(self, facilityIdList=None):
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(
-            None,
-            self.client.event_collectValid_mapKeyFacility,
-            facilityIdList
-        )
+        return await self.client.event_collectValid_mapKeyFacility(facilityIdList)
+
+    # --- ローカルイベントストア ---
+    async def ingest_polled_events(self, uri, payload):
+        """ポーラの新着イベントをストアへ取り込むリスナー"""
+        if uri == EVENTS_RECENT_URI:
+            await asyncio.to_thread(self.event_store.ingest, payload)
+
+    async def event_store_sync(self, filter, page_size=None):
+        batch, fetched, added = [], 0, 0
+        async for event in self.client.iter_events(filter or {}, page_size or 1000):
+            batch.append(event)
+            if len(batch) >= 5000:
+                added += await asyncio.to_thread(self.event_store.ingest, batch)
+                fetched += len(batch)
+                batch = []
+        if batch:
+            added += await asyncio.to_thread(self.event_store.ingest, batch)
+            fetched += len(batch)
+        return {"fetched": fetched, "added": added, "store": await asyncio.to_thread(self.event_store.stats)}
+
+    async def event_count_by(self, group_by=None, filter=None, limit=None):
+        return await asyncio.to_thread(self.event_store.count_by, group_by, filter, limit)
+
+    async def event_top_n(self, field, n=None, filter=None):
+        return await asyncio.to_thread(self.event_store.top_n, field, n or 10, filter)
+
+    async def event_histogram(self, interval=None, filter=None, group_by=None, utc_offset_hours=None):
+        return await asyncio.to_thread(self.event_store.histogram, interval or "hour", filter, group_by, utc_offset_hours or 0)
+
+    async def event_store_stats(self):
+        return await asyncio.to_thread(self.event_store.stats)
+
+    # --- 収集データ ---
+    async def _resolve_targets(self, targets):
+        """{"monitorId", "itemName", "displayName", "facilityIds"} の一覧を収集IDに解決し、収集ID → 対象の対応と未解決の対象を返す"""
+        found, unresolved = await self.client.resolve_collect_ids(collect_keys(targets))
+        labels = {collect_id: dict(zip(("monitorId", "itemName", "displayName", "facilityId"), key))
+                  for key, collect_id in found.items()}
+        return labels, [dict(zip(("monitorId", "itemName", "displayName", "facilityId"), key)) for key in unresolved]
+
+    async def _collect_series(self, id_list, summary_type, from_time, to_time, size=None,
+                              ids_per_request=None, window_hours=None, concurrency=None, use_cache=None, targets=None):
+        """
+        収集データを取得する（targets 指定時は収集IDに解決してから取得する）
+        Returns:
+            (CollectFetchResult, 収集ID → 対象, 未解決の対象)
+        """
+        labels, unresolved = await self._resolve_targets(targets) if targets else ({}, [])
+        id_list = list(dict.fromkeys(list(id_list or []) + list(labels)))
+        if not id_list and not unresolved:
+            raise ValueError("id_list または targets を指定してください")
+        config = CollectFetchConfig.from_env()
+        config = CollectFetchConfig(ids_per_request or config.ids_per_request, config.max_id_chars,
+                                    window_hours or config.window_hours, concurrency or config.concurrency)
+        if use_cache is False:
+            result = await self.client.fetch_collect_series(id_list, summary_type, from_time, to_time, size, config)
+        else:
+            result = await fetch_cached_series(self.series_cache, self.client.fetch_collect_series,
+                                               id_list, summary_type, from_time, to_time, size, config)
+        return result, labels, unresolved
+
+    async def collect_data_fetch(self, id_list=None, summary_type=None, from_time=None, to_time=None, size=None,
+                                 ids_per_request=None, window_hours=None, concurrency=None, use_cache=None,
+                                 downsample=None, points=None, percentiles=None, targets=None):
+        result, labels, unresolved = await self._collect_series(id_list, summary_type, from_time, to_time, size,
+                                                                ids_per_request, window_hours, concurrency,
+                                                                use_cache, targets)
+        summary = result.summary()
+        if downsample:
+            points = points or int(os.getenv("HINEMOS_DOWNSAMPLE_POINTS", DEFAULT_POINTS))
+            for item, series in zip(summary["series"], result.series.values()):
+                item["data"] = await asyncio.to_thread(downsample_series, series.times, series.values,
+                                                       downsample, points, percentiles)
+        for item in summary["series"]:
+            item.update(labels.get(item["collectId"], {}))
+        if unresolved:
+            summary["unresolved"] = unresolved
+        return summary
+
+    async def collect_anomalies(self, id_list=None, summary_type=None, from_time=None, to_time=None, window=None,
+                                z_threshold=None, threshold=None, direction=None, rank_by=None, top_n=None,
+                                percentiles=None, use_cache=None, targets=None):
+        result, labels, unresolved = await self._collect_series(id_list, summary_type, from_time, to_time,
+                                                                use_cache=use_cache, targets=targets)
+        ranking = await asyncio.to_thread(
+            rank_anomalies, list(result.series.values()), rank_by or "zscore", top_n or 20,
+            z_threshold=5.0 if z_threshold is None else z_threshold, threshold=threshold,
+            window=window or 60, direction=direction or "above",
+            percentiles=percentiles or ANOMALY_PERCENTILES)
+        for item in ranking["series"]:
+            item.update(labels.get(item["collectId"], {}))
+        if unresolved:
+            ranking["unresolved"] = unresolved
+        return {**ranking, "fetch": result.stats}
+
+    async def collect_forecast(self, id_list=None, summary_type=None, from_time=None, to_time=None, threshold=None,
+                               direction=None, horizon_days=None, model=None, bucket_minutes=None, top_n=None,
+                               use_cache=None, targets=None):
+        if threshold is None:
+            raise ValueError("threshold を指定してください")
+        result, labels, unresolved = await self._collect_series(id_list, summary_type, from_time, to_time,
+                                                                use_cache=use_cache, targets=targets)
+        # 応答の大きさを一定に保つため、返す系列数には上限を設ける
+        top_n = min(top_n or 20, FORECAST_TOP_N_LIMIT)
+        forecast = await asyncio.to_thread(
+            forecast_series, list(result.series.values()), threshold, direction or "above",
+            horizon_days or 30.0, model or "auto", bucket_minutes or 60.0, top_n)
+        for item in forecast["series"]:
+            item.update(labels.get(item["collectId"], {}))
+        if unresolved:
+            forecast["unresolved"] = unresolved
+        return {**forecast, "fetch": result.stats}
+
+    async def collect_id_resolve(self, targets):
+        labels, unresolved = await self._resolve_targets(targets)
+        return {
+            "mappings": [{**label, "collectId": collect_id} for collect_id, label in labels.items()],
+            "unresolved": unresolved,
+            "resolver": self.client.collect_ids.snapshot(),
+        }
+
+    async def collect_cache_stats(self):
+        return await asyncio.to_thread(self.series_cache.stats)
 
     async def close(self):
-        self.client.logout()
+        logger.info(f"Login stats: {self.client.get_login_stats()}")
+        logger.info(f"Connection pool stats: {self.client.get_pool_stats()}")
+        logger.info(f"Retry/circuit breaker stats: {self.client.get_resilience_stats()}")
+        logger.info(f"Response cache stats: {self.client.get_cache_stats()}")
+        if self._event_store is not None:
+            self._event_store.close()
+        if self._series_cache is not None:
+            self._series_cache.flush()
+        if self._job_history is not None:
+            self._job_history.close()
+        await self.session_watcher.close()
+        await self.client.close()
 
     # --- ジョブ管理API ---
     async def get_job_tree_simple(self, ownerRoleId=None):
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.client.get_job_tree_simple, ownerRoleId)
+        return await self.client.get_job_tree_simple(ownerRoleId)
 
     async def get_job_tree_full(self, ownerRoleId=None):
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.client.get_job_tree_full, ownerRoleId)
+        return await self.client.get_job_tree_full(ownerRoleId)
 
     async def get_job_info(self, jobunitId, jobId):
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.client.get_job_info, jobunitId, jobId)
+        return await self.client.get_job_info(jobunitId, jobId)
 
     async def get_job_info_bulk(self, jobList):
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.client.get_job_info_bulk, jobList)
+        return await self.client.get_job_info_bulk(jobList)
 
     async def add_jobunit(self, jobunit, isClient=False):
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.client.add_jobunit, jobunit, isClient)
+        return await self.client.add_jobunit(jobunit, isClient)
 
     async def modify_jobunit(self, jobunitId, jobunit, isClient=False):
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.client.modify_jobunit, jobunitId, jobunit, isClient)
+        return await self.client.modify_jobunit(jobunitId, jobunit, isClient)
 
     async def delete_jobunit(self, jobunitId):
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.client.delete_jobunit, jobunitId)
+        return await self.client.delete_jobunit(jobunitId)
 
     async def get_edit_lock(self, jobunitId, updateTime, forceFlag):
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.client.get_edit_lock, jobunitId, updateTime, forceFlag)
+        return await self.client.get_edit_lock(jobunitId, updateTime, forceFlag)
 
     async def check_edit_lock(self, jobunitId, editSession):
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.client.check_edit_lock, jobunitId, editSession)
+        return await self.client.check_edit_lock(jobunitId, editSession)
 
     async def release_edit_lock(self, jobunitId, editSession):
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.client.release_edit_lock, jobunitId, editSession)
+        return await self.client.release_edit_lock(jobunitId, editSession)
 
     async def add_jobnet(self, jobunitId, jobnet):
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.client.add_jobnet, jobunitId, jobnet)
+        return await self.client.add_jobnet(jobunitId, jobnet)
 
     async def add_command_job(self, jobunitId, job):
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.client.add_command_job, jobunitId, job)
+        return await self.client.add_command_job(jobunitId, job)
 
     async def add_file_job(self, jobunitId, job):
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.client.add_file_job, jobunitId, job)
+        return await self.client.add_file_job(jobunitId, job)
 
     async def add_refer_job(self, jobunitId, job):
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.client.add_refer_job, jobunitId, job)
+        return await self.client.add_refer_job(jobunitId, job)
 
     async def add_monitor_job(self, jobunitId, job):
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.client.add_monitor_job, jobunitId, job)
+        return await self.client.add_monitor_job(jobunitId, job)
 
     async def add_approval_job(self, jobunitId, job):
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.client.add_approval_job, jobunitId, job)
+        return await self.client.add_approval_job(jobunitId, job)
 
     async def add_joblinksend_job(self, jobunitId, job):
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.client.add_joblinksend_job, jobunitId, job)
+        return await self.client.add_joblinksend_job(jobunitId, job)
 
     async def add_joblinkrcv_job(self, jobunitId, job):
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.client.add_joblinkrcv_job, jobunitId, job)
+        return await self.client.add_joblinkrcv_job(jobunitId, job)
 
     async def add_filecheck_job(self, jobunitId, job):
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.client.add_filecheck_job, jobunitId, job)
+        return await self.client.add_filecheck_job(jobunitId, job)
 
     async def add_rpa_job(self, jobunitId, job):
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.client.add_rpa_job, jobunitId, job)
+        return await self.client.add_rpa_job(jobunitId, job)
 
     async def delete_job(self, jobunitId, jobId):
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.client.delete_job, jobunitId, jobId)
+        return await self.client.delete_job(jobunitId, jobId)
 
     async def run_job(self, jobunitId, jobId, runJobRequest):
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.client.run_job, jobunitId, jobId, runJobRequest)
+        return await self.client.run_job(jobunitId, jobId, runJobRequest)
 
     async def run_job_kick(self, jobKickId, runJobKickRequest):
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.client.run_job_kick, jobKickId, runJobKickRequest)
+        return await self.client.run_job_kick(jobKickId, runJobKickRequest)
 
     async def session_job_operation(self, sessionId, jobunitId, jobId, operation):
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.client.session_job_operation, sessionId, jobunitId, jobId, operation)
+        return await self.client.session_job_operation(sessionId, jobunitId, jobId, operation)
 
     async def session_node_operation(self, sessionId, jobunitId, jobId, facilityId, operation):
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.client.session_node_operation, sessionId, jobunitId, jobId, facilityId, operation)
+        return await self.client.session_node_operation(sessionId, jobunitId, jobId, facilityId, operation)
 
     async def get_session_job_detail(self, sessionId):
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.client.get_session_job_detail, sessionId)
+        return await self.client.get_session_job_detail(sessionId)
+
+    async def run_job_bulk(self, launches=None, jobunit_ids=None, job_id=None, job_kick_id=None, request=None,
+                           variants=None, concurrency=None, rate=None, wait=None, timeout_seconds=None):
+        targets = expand_launches(launches, jobunit_ids, job_id, job_kick_id, request, variants)
+        if not targets:
+            raise ValueError("launches、jobunit_ids と job_id、job_kick_id のいずれかを指定してください")
+        if len(targets) > JOB_LAUNCH_LIMIT:
+            raise ValueError(f"一度に実行できるのは {JOB_LAUNCH_LIMIT} 件までです: {len(targets)} 件")
+        config = LaunchConfig.from_env()
+        if concurrency:
+            config.concurrency = int(concurrency)
+        if rate is not None:
+            config.rate = float(rate)
+        result = await self.client.run_job_bulk(targets, config, on_progress=report_progress)
+        session_ids = [row[2] for row in result["rows"] if row[2]]
+        if not wait or not session_ids:
+            return result
+
+        # 完了待ちの進捗は実行要求の件数の後ろに続けて通知する（進捗値を減らさないため）
+        async def waiting_progress(elapsed, timeout, message):
+            await report_progress(len(targets) + elapsed, len(targets) + timeout, message)
+
+        waited = await self.session_watcher.wait(session_ids, self._wait_timeout(timeout_seconds),
+                                                 on_progress=waiting_progress)
+        states = {session["sessionId"]: session for session in waited["sessions"]}
+        result["columns"] += ["state", "status", "endStatus", "endValue"]
+        for row in result["rows"]:
+            session = states.get(row[2], {})
+            row += [session.get("state"), session.get("status"), session.get("endStatus"), session.get("endValue")]
+        result.update({key: waited[key] for key in ("completed", "timedOut")})
+        result["waitSeconds"] = waited["elapsedSeconds"]
+        return result
+
+    @staticmethod
+    def _wait_timeout(timeout_seconds):
+        timeout = WAIT_SESSION_DEFAULT_SECONDS if timeout_seconds is None else float(timeout_seconds)
+        return min(max(0.0, timeout), WAIT_SESSION_MAX_SECONDS)
+
+    async def wait_for_session(self, session_ids, timeout_seconds=None, mode=None, return_on_halt=None):
+        if isinstance(session_ids, str):
+            session_ids = [session_ids]
+        if not session_ids:
+            raise ValueError("session_ids を指定してください")
+        mode = mode or "all"
+        if mode not in ("all", "any"):
+            raise ValueError(f"mode は all / any のいずれかです: {mode}")
+        return await self.session_watcher.wait(session_ids, self._wait_timeout(timeout_seconds), until=mode,
+                                               return_on_halt=True if return_on_halt is None else bool(return_on_halt),
+                                               on_progress=report_progress)
 
     async def get_session_node_detail(self, sessionId, jobunitId, jobId):
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.client.get_session_node_detail, sessionId, jobunitId, jobId)
+        return await self.client.get_session_node_detail(sessionId, jobunitId, jobId)
 
     async def get_session_file_detail(self, sessionId, jobunitId, jobId):
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.client.get_session_file_detail, sessionId, jobunitId, jobId)
+        return await self.client.get_session_file_detail(sessionId, jobunitId, jobId)
 
     async def get_session_job_jobInfo(self, sessionId, jobunitId, jobId):
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.client.get_session_job_jobInfo, sessionId, jobunitId, jobId)
+        return await self.client.get_session_job_jobInfo(sessionId, jobunitId, jobId)
 
     async def get_session_job_allDetail(self, sessionId):
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.client.get_session_job_allDetail, sessionId)
+        return await self.client.get_session_job_allDetail(sessionId)
 
     async def history_search(self, size, filter):
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.client.history_search, size, filter)
+        return await self.client.history_search(size, filter)
+
+    # --- ローカルジョブ履歴ストア ---
+    async def job_history_sync(self, filter, page_size=None):
+        batch, fetched, added, updated = [], 0, 0, 0
+        async for run in self.client.iter_job_history(filter or {}, page_size or 1000):
+            batch.append(run)
+            if len(batch) >= 5000:
+                counts = await asyncio.to_thread(self.job_history.ingest, batch)
+                fetched, added, updated = fetched + len(batch), added + counts["added"], updated + counts["updated"]
+                batch = []
+                await report_progress(fetched, None, f"job_history_sync: {fetched} runs")
+        if batch:
+            counts = await asyncio.to_thread(self.job_history.ingest, batch)
+            fetched, added, updated = fetched + len(batch), added + counts["added"], updated + counts["updated"]
+        return {"fetched": fetched, "added": added, "updated": updated,
+                "store": await asyncio.to_thread(self.job_history.stats)}
+
+    async def job_duration_stats(self, filter=None, percentiles=None, sort_by=None, limit=None, interval=None,
+                                 utc_offset_hours=None):
+        return await asyncio.to_thread(self.job_history.duration_stats, filter, percentiles, sort_by or "p95",
+                                       limit, interval, utc_offset_hours or 0)
+
+    async def job_slowest_runs(self, filter=None, n=None, per_job=None):
+        return await asyncio.to_thread(self.job_history.slowest_runs, filter, n or 10, bool(per_job))
+
+    async def job_history_stats(self):
+        return await asyncio.to_thread(self.job_history.stats)
 
     async def add_schedule(self, schedule):
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.client.add_schedule, schedule)
+        return await self.client.add_schedule(schedule)
 
     async def add_filecheck(self, filecheck):
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.client.add_filecheck, filecheck)
+        return await self.client.add_filecheck(filecheck)
 
     async def add_manual(self, manual):
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.client.add_manual, manual)
+        return await self.client.add_manual(manual)
 
     async def add_joblinkrcv(self, joblinkrcv):
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.client.add_joblinkrcv, joblinkrcv)
+        return await self.client.add_joblinkrcv(joblinkrcv)
 
     async def get_kick_list(self):
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.client.get_kick_list)
+        return await self.client.get_kick_list()
 
     async def kick_search(self, condition):
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.client.kick_search, condition)
+        return await self.client.kick_search(condition)
 
     async def set_kick_valid(self, setStatus):
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.client.set_kick_valid, setStatus)
+        return await self.client.set_kick_valid(setStatus)
 
     async def delete_kick(self, jobkickIds):
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.client.delete_kick, jobkickIds)
+        return await self.client.delete_kick(jobkickIds)
 
     async def session_approval_search(self, request):
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.client.session_approval_search, request)
+        return await self.client.session_approval_search(request)
 
     async def modify_approval_info(self, sessionId, jobunitId, jobId, info):
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.client.modify_approval_info, sessionId, jobunitId, jobId, info)
+        return await self.client.modify_approval_info(sessionId, jobunitId, jobId, info)
 
     async def get_queue_list(self, roleId=None):
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.client.get_queue_list, roleId)
+        return await self.client.get_queue_list(roleId)
 
     async def get_queue_detail(self, queueId):
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.client.get_queue_detail, queueId)
+        return await self.client.get_queue_detail(queueId)
 
     async def add_queue(self, queue):
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.client.add_queue, queue)
+        return await self.client.add_queue(queue)
 
     async def modify_queue(self, queueId, queue):
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.client.modify_queue, queueId, queue)
+        return await self.client.modify_queue(queueId, queue)
 
     async def delete_queue(self, queueIds):
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.client.delete_queue, queueIds)
+        return await self.client.delete_queue(queueIds)
 
     async def queue_activity_search(self, request):
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.client.queue_activity_search, request)
+        return await self.client.queue_activity_search(request)
 
     async def queue_activity_detail(self, queueId):
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.client.queue_activity_detail, queueId)
+        return await self.client.queue_activity_detail(queueId)
 
     async def get_joblinksend_setting_list(self, ownerRoleId=None):
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.client.get_joblinksend_setting_list, ownerRoleId)
+        return await self.client.get_joblinksend_setting_list(ownerRoleId)
 
     async def get_joblinksend_setting_detail(self, joblinkSendSettingId):
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.client.get_joblinksend_setting_detail, joblinkSendSettingId)
+        return await self.client.get_joblinksend_setting_detail(joblinkSendSettingId)
 
     async def add_joblinksend_setting(self, setting):
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.client.add_joblinksend_setting, setting)
+        return await self.client.add_joblinksend_setting(setting)
 
     async def modify_joblinksend_setting(self, joblinkSendSettingId, setting):
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.client.modify_joblinksend_setting, joblinkSendSettingId, setting)
+        return await self.client.modify_joblinksend_setting(joblinkSendSettingId, setting)
 
     async def delete_joblinksend_setting(self, joblinkSendSettingIds):
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.client.delete_joblinksend_setting, joblinkSendSettingIds)
+        return await self.client.delete_joblinksend_setting(joblinkSendSettingIds)
 
     async def regist_joblink_message(self, message):
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.client.regist_joblink_message, message)
+        return await self.client.regist_joblink_message(message)
 
     async def send_joblink_message_manual(self, message):
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.client.send_joblink_message_manual, message)
+        return await self.client.send_joblink_message_manual(message)
 
     async def joblink_message_search(self, request):
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.client.joblink_message_search, request)
+        return await self.client.joblink_message_search(request)
 
     async def available_start_operation(self, sessionId, jobunitId, jobId):
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.client.available_start_operation, sessionId, jobunitId, jobId)
+        return await self.client.available_start_operation(sessionId, jobunitId, jobId)
 
     async def available_start_operation_node(self, sessionId, jobunitId, jobId, facilityId):
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.client.available_start_operation_node, sessionId, jobunitId, jobId, facilityId)
+        return await self.client.available_start_operation_node(sessionId, jobunitId, jobId, facilityId)
 
     async def available_stop_operation(self, sessionId, jobunitId, jobId):
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.client.available_stop_operation, sessionId, jobunitId, jobId)
+        return await self.client.available_stop_operation(sessionId, jobunitId, jobId)
 
     async def available_stop_operation_node(self, sessionId, jobunitId, jobId, facilityId):
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.client.available_stop_operation_node, sessionId, jobunitId, jobId, facilityId)
+        return await self.client.available_stop_operation_node(sessionId, jobunitId, jobId, facilityId)
 
     async def get_rpa_login_resolution(self):
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.client.get_rpa_login_resolution)
+        return await self.client.get_rpa_login_resolution()
 
     async def get_rpa_screenshot(self, sessionId, jobunitId, jobId, facilityId):
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.client.get_rpa_screenshot, sessionId, jobunitId, jobId, facilityId)
+        return await self.client.get_rpa_screenshot(sessionId, jobunitId, jobId, facilityId)
 
-    async def get_rpa_screenshot_file(self, sessionId, jobunitId, jobId, facilityId, regDate):
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.client.get_rpa_screenshot_file, sessionId, jobunitId, jobId, facilityId, regDate)
+    async def get_rpa_screenshot_file(self, sessionId, jobunitId, jobId, facilityId, regDate, output_path=None):
+        return await self.client.get_rpa_screenshot_file(sessionId, jobunitId, jobId, facilityId, regDate, output_path)
 
     async def get_jobmap_icon_image_iconId(self, ownerRoleId=None):
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.client.get_jobmap_icon_image_iconId, ownerRoleId)
+        return await self.client.get_jobmap_icon_image_iconId(ownerRoleId)
 
     async def delete_premakejobsession(self, jobkickId):
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.client.delete_premakejobsession, jobkickId)
+        return await self.client.delete_premakejobsession(jobkickId)
 
     async def get_schedule_plan(self, plan):
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.client.get_schedule_plan, plan)
+        return await self.client.get_schedule_plan(plan)
 
     async def get_job_referrer_queue(self, queueId):
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.client.get_job_referrer_queue, queueId)
+        return await self.client.get_job_referrer_queue(queueId)
 
     async def queue_search(self, search):
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.client.queue_search, search)
+        return await self.client.queue_search(search)
 
     async def modify_jobnet(self, jobunitId, jobId, jobnet):
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.client.modify_jobnet, jobunitId, jobId, jobnet)
+        return await self.client.modify_jobnet(jobunitId, jobId, jobnet)
 
     async def modify_command_job(self, jobunitId, jobId, job):
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.client.modify_command_job, jobunitId, jobId, job)
+        return await self.client.modify_command_job(jobunitId, jobId, job)
 
     async def modify_file_job(self, jobunitId, jobId, job):
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.client.modify_file_job, jobunitId, jobId, job)
+        return await self.client.modify_file_job(jobunitId, jobId, job)
 
     async def modify_refer_job(self, jobunitId, jobId, job):
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.client.modify_refer_job, jobunitId, jobId, job)
+        return await self.client.modify_refer_job(jobunitId, jobId, job)
 
     async def modify_monitor_job(self, jobunitId, jobId, job):
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.client.modify_monitor_job, jobunitId, jobId, job)
+        return await self.client.modify_monitor_job(jobunitId, jobId, job)
 
     async def modify_approval_job(self, jobunitId, jobId, job):
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.client.modify_approval_job, jobunitId, jobId, job)
+        return await self.client.modify_approval_job(jobunitId, jobId, job)
 
     async def modify_joblinksend_job(self, jobunitId, jobId, job):
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.client.modify_joblinksend_job, jobunitId, jobId, job)
+        return await self.client.modify_joblinksend_job(jobunitId, jobId, job)
 
     async def modify_joblinkrcv_job(self, jobunitId, jobId, job):
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.client.modify_joblinkrcv_job, jobunitId, jobId, job)
+        return await self.client.modify_joblinkrcv_job(jobunitId, jobId, job)
 
     async def modify_filecheck_job(self, jobunitId, jobId, job):
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.client.modify_filecheck_job, jobunitId, jobId, job)
+        return await self.client.modify_filecheck_job(jobunitId, jobId, job)
 
     async def modify_rpa_job(self, jobunitId, jobId, job):
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.client.modify_rpa_job, jobunitId, jobId, job)
+        return await self.client.modify_rpa_job(jobunitId, jobId, job)
 
     async def get_schedule_detail(self, jobKickId):
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.client.get_schedule_detail, jobKickId)
+        return await self.client.get_schedule_detail(jobKickId)
 
     async def get_filecheck_detail(self, jobKickId):
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.client.get_filecheck_detail, jobKickId)
+        return await self.client.get_filecheck_detail(jobKickId)
 
     async def get_manual_detail(self, jobKickId):
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.client.get_manual_detail, jobKickId)
+        return await self.client.get_manual_detail(jobKickId)
 
     async def get_joblinkrcv_detail(self, jobKickId):
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.client.get_joblinkrcv_detail, jobKickId)
+        return await self.client.get_joblinkrcv_detail(jobKickId)
 
     async def get_kick_detail(self, jobKickId):
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.client.get_kick_detail, jobKickId)
+        return await self.client.get_kick_detail(jobKickId)
 
     async def modify_schedule(self, jobKickId, schedule):
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.client.modify_schedule, jobKickId, schedule)
+        return await self.client.modify_schedule(jobKickId, schedule)
 
     async def modify_filecheck(self, jobKickId, filecheck):
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.client.modify_filecheck, jobKickId, filecheck)
+        return await self.client.modify_filecheck(jobKickId, filecheck)
 
     async def modify_manual(self, jobKickId, manual):
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.client.modify_manual, jobKickId, manual)
+        return await self.client.modify_manual(jobKickId, manual)
 
     async def modify_joblinkrcv(self, jobKickId, joblinkrcv):
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.client.modify_joblinkrcv, jobKickId, joblinkrcv)
+        return await self.client.modify_joblinkrcv(jobKickId, joblinkrcv)
 
     async def delete_schedule(self, jobkickIds):
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.client.delete_schedule, jobkickIds)
+        return await self.client.delete_schedule(jobkickIds)
 
     async def delete_filecheck(self, jobkickIds):
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.client.delete_filecheck, jobkickIds)
+        return await self.client.delete_filecheck(jobkickIds)
 
     async def delete_manual(self, jobkickIds):
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.client.delete_manual, jobkickIds)
+        return await self.client.delete_manual(jobkickIds)
 
     async def delete_joblinkrcv(self, jobkickIds):
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.client.delete_joblinkrcv, jobkickIds)
+        return await self.client.delete_joblinkrcv(jobkickIds)
 
 # Global manager instance
 hinemos_manager = None
+# イベント/ステータスのポーラ（全セッションで1本を共有）
+hinemos_poller = None
+subscriptions = SubscriptionHub()
 
 # Create the MCP server
 server = Server("hinemos-mcp")
@@ -1104,6 +1010,39 @@ async def handle_list_tools() -> ListToolsResult:
     tools.extend(extention_tools)
     return tools
 
+@server.list_resources()
+async def handle_list_resources() -> List[Resource]:
+    return get_resources()
+
+@server.read_resource()
+async def handle_read_resource(uri: AnyUrl) -> str:
+    if hinemos_poller is None:
+        raise ValueError("Hinemos poller is not initialized")
+    return await read_resource(hinemos_poller, str(uri))
+
+@server.subscribe_resource()
+async def handle_subscribe_resource(uri: AnyUrl) -> None:
+    subscriptions.subscribe(str(uri), server.request_context.session)
+    # ポーリングは最初の購読で開始する（購読者がいなくなると止まる）
+    if hinemos_poller is not None:
+        hinemos_poller.start()
+
+@server.unsubscribe_resource()
+async def handle_unsubscribe_resource(uri: AnyUrl) -> None:
+    subscriptions.unsubscribe(str(uri), server.request_context.session)
+
+
+# これより大きい結果はインデントせずに返す（時系列の行配列などで1要素1行になり、サイズも整形時間も膨らむため）
+COMPACT_RESULT_CHARS = 20000
+
+
+def format_result(result: Any) -> str:
+    compact = json.dumps(result, ensure_ascii=False, separators=(",", ":"))
+    if len(compact) > COMPACT_RESULT_CHARS:
+        return compact
+    return json.dumps(result, indent=2, ensure_ascii=False)
+
+
 @server.call_tool()
 async def handle_call_tool(name: str, arguments: dict) -> List[TextContent]:
     global hinemos_manager
@@ -1111,15 +1050,28 @@ async def handle_call_tool(name: str, arguments: dict) -> List[TextContent]:
         # ...モックやエラー処理...
         pass
     try:
-        result = await dispatch_tool(name, hinemos_manager, arguments)
+        context = server.request_context
+        token = context.meta.progressToken if context.meta else None
+        with progress_scope(context.session, token, context.request_id):
+            result = await dispatch_tool(name, hinemos_manager, arguments)
         if result is None:
             return [TextContent(type="text", text=f"未知のツール: {name}")]
-        import json
-        return [TextContent(type="text", text=f"**{name}**:\n```json\n{json.dumps(result, indent=2, ensure_ascii=False)}\n```")]
+        return [TextContent(type="text", text=f"**{name}**:\n```json\n{format_result(result)}\n```")]
     except Exception as e:
         return [TextContent(type="text", text=f"**{name}** でエラー: {str(e)}")]
 
 
+def get_server_capabilities():
+    capabilities = server.get_capabilities(
+        notification_options=NotificationOptions(),
+        experimental_capabilities={},
+    )
+    # mcp の lowlevel Server は subscribe を常に False で広告するため、購読対応を明示する
+    if capabilities.resources is not None:
+        capabilities.resources.subscribe = True
+    return capabilities
+
+
 async def main():
     """Main entry point"""
     logger.info("Starting Hinemos MCP Server (REST API Version for Hinemos 7.1)")
@@ -1157,7 +1109,7 @@ async def main():
     logger.info(f"   HINEMOS_USERNAME: {username or 'not set'}")
     logger.info(f"   HINEMOS_PASSWORD: {'set' if password else 'not set'}")
     
-    global hinemos_manager
+    global hinemos_manager, hinemos_poller
     
     if not all([endpoint, username, password]):
         logger.warning("Hinemos credentials not fully configured, using mock manager")
@@ -1165,7 +1117,15 @@ async def main():
     else:
         logger.info("Hinemos credentials configured, initializing REST client")
         try:
-            hinemos_manager = HinemosSyncManager()
+            hinemos_manager = HinemosAsyncManager()
+            # トークン失効前にバックグラウンドで再ログインし、ツール呼び出しがログイン待ちにならないようにする
+            hinemos_manager.client.start_token_refresher()
+            hinemos_poller = HinemosPoller(hinemos_manager.client)
+            hinemos_poller.add_listener(subscriptions.notify, active=subscriptions.has_subscribers)
+            if os.getenv("HINEMOS_EVENT_STORE"):
+                # ストアを明示的に指定した場合だけ、ポーラの新着イベントを取り込む（常時ポーリングする）
+                hinemos_poller.add_listener(hinemos_manager.ingest_polled_events)
+            hinemos_poller.start()
             logger.info("REST client initialized successfully")
         except Exception as e:
             logger.error(f"Failed to initialize REST client: {e}")
@@ -1183,10 +1143,7 @@ async def main():
                 InitializationOptions(
                     server_name="hinemos-mcp",
                     server_version="1.0.0",
-                    capabilities=server.get_capabilities(
-                        notification_options=NotificationOptions(),
-                        experimental_capabilities={},
-                    ),
+                    capabilities=get_server_capabilities(),
                 ),
             )
     except Exception as e:
@@ -1194,6 +1151,8 @@ async def main():
         raise
     finally:
         # Cleanup
+        if hinemos_poller:
+            await hinemos_poller.stop()
         if hinemos_manager and hasattr(hinemos_manager, 'close'):
             await hinemos_manager.close()
 
@@ -0,0 +1,71 @@
+"""
+MCPリソース（hinemos://events/recent, hinemos://monitor/status）
+HinemosPoller の結果を公開し、購読中のセッションへ更新通知を送る。
+"""
+import json
+import logging
+from typing import Any, Dict, List, Set
+
+from mcp.types import Resource
+from pydantic import AnyUrl
+
+from .poller import HinemosPoller, EVENTS_RECENT_URI, MONITOR_STATUS_URI
+
+logger = logging.getLogger(__name__)
+
+
+def get_resources() -> List[Resource]:
+    return [
+        Resource(
+            uri=EVENTS_RECENT_URI,
+            name="最新のイベント情報",
+            description="バックグラウンドポーラが取得した新着イベント（新しい順）。購読すると新着時に更新通知を送る",
+            mimeType="application/json",
+        ),
+        Resource(
+            uri=MONITOR_STATUS_URI,
+            name="現在の監視ステータス",
+            description="ステータス一覧と直近の変化（追加・解消・重要度変化）。購読すると変化時に更新通知を送る",
+            mimeType="application/json",
+        ),
+    ]
+
+
+async def read_resource(poller: HinemosPoller, uri: str) -> str:
+    readers = {
+        EVENTS_RECENT_URI: poller.recent_events,
+        MONITOR_STATUS_URI: poller.monitor_status,
+    }
+    reader = readers.get(uri)
+    if reader is None:
+        raise ValueError(f"未知のリソース: {uri}")
+    await poller.ensure_polled()
+    return json.dumps(reader(), indent=2, ensure_ascii=False)
+
+
+class SubscriptionHub:
+    """リソースURI → 購読中セッション。ポーラの更新を各セッションへ resources/updated で通知する"""
+
+    def __init__(self):
+        self._subscribers: Dict[str, Set[Any]] = {}
+
+    def subscribe(self, uri: str, session: Any) -> None:
+        self._subscribers.setdefault(uri, set()).add(session)
+
+    def unsubscribe(self, uri: str, session: Any) -> None:
+        self._subscribers.get(uri, set()).discard(session)
+
+    def subscriber_count(self, uri: str) -> int:
+        return len(self._subscribers.get(uri, ()))
+
+    def has_subscribers(self) -> bool:
+        return any(self._subscribers.values())
+
+    async def notify(self, uri: str, payload: Any = None) -> None:
+        for session in list(self._subscribers.get(uri, ())):
+            try:
+                await session.send_resource_updated(AnyUrl(uri))
+            except Exception as e:
+                # 切断済みのセッションは購読を外す
+                logger.info(f"Dropping subscriber of {uri}: {e}")
+                self.unsubscribe(uri, session)
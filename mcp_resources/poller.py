@@ -0,0 +1,205 @@
+"""
+イベント/ステータスのバックグラウンドポーラ
+マネージャへのポーリングを1本にまとめ、接続中の全MCPクライアントで結果を共有する。
+"""
+import os
+import time
+import asyncio
+import logging
+from collections import deque
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple
+
+from client.event_pager import parse_event_date
+from client.status_tracker import StatusTracker
+
+logger = logging.getLogger(__name__)
+
+EVENTS_RECENT_URI = "hinemos://events/recent"
+MONITOR_STATUS_URI = "hinemos://monitor/status"
+
+# listener(uri, payload): 新着イベント一覧 / ステータス差分を受け取る
+Listener = Callable[[str, Any], Awaitable[None]]
+# リスナーが更新を必要としているか（購読者がいるかなど）
+ActiveCheck = Callable[[], bool]
+
+
+def event_key(event: Dict[str, Any]) -> Tuple:
+    """イベントを一意に識別するキー（event_detail_search の引数と同じ組）"""
+    return (event.get("monitorId"), event.get("monitorDetailId"), event.get("pluginId"),
+            event.get("facilityId"), event.get("outputDate"))
+
+
+class HinemosPoller:
+    """
+    outputDate のハイウォーターマーク以降のイベントと、ステータス一覧の変化だけを定期取得する
+    バックグラウンドのポーリングは有効なリスナー（購読者がいる購読通知、常時有効なリスナー）がある間だけ動き、
+    なくなると止まる。止まっている間のリソース読み出しは、その場で最新の状態を取り直す。
+    ステータスの差分は StatusTracker で求める。
+    Attributes:
+        interval: ポーリング間隔秒数（HINEMOS_POLL_INTERVAL）
+        recent_limit: hinemos://events/recent に保持するイベント数（HINEMOS_RECENT_EVENTS）
+    """
+
+    def __init__(self, client, interval: Optional[float] = None, recent_limit: Optional[int] = None,
+                 event_filter: Optional[Dict[str, Any]] = None, status_filter: Optional[Dict[str, Any]] = None):
+        self.client = client
+        self.interval = interval if interval is not None else float(os.getenv("HINEMOS_POLL_INTERVAL", "30"))
+        self.recent_limit = recent_limit or int(os.getenv("HINEMOS_RECENT_EVENTS", "200"))
+        self.event_filter = event_filter or {}
+        self.status_filter = status_filter or {}
+        self.status_size = int(os.getenv("HINEMOS_STATUS_POLL_SIZE", "10000"))
+        self.recent: deque = deque(maxlen=self.recent_limit)
+        self.high_water_mark: Optional[str] = None
+        self._seen_at_mark: Set[Tuple] = set()
+        self.status_tracker = StatusTracker(max_versions=1)
+        self.last_status_changes: Optional[Dict[str, Any]] = None
+        self.last_poll: Optional[str] = None
+        self._last_poll_at: Optional[float] = None
+        self.stats = {"polls": 0, "events_fetched": 0, "status_changes": 0, "errors": 0}
+        self._listeners: List[Tuple[Listener, Optional[ActiveCheck]]] = []
+        self._poll_lock = asyncio.Lock()
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def enabled(self) -> bool:
+        return self.interval > 0
+
+    def add_listener(self, listener: Listener, active: Optional[ActiveCheck] = None) -> None:
+        """
+        更新を受け取るリスナーを登録する
+        active を指定した場合、それが真を返す間だけポーリングを続ける（未指定なら常に有効）
+        """
+        self._listeners.append((listener, active))
+
+    @property
+    def wanted(self) -> bool:
+        return any(active is None or active() for _, active in self._listeners)
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    async def _publish(self, uri: str, payload: Any) -> None:
+        for listener, _ in list(self._listeners):
+            try:
+                await listener(uri, payload)
+            except Exception as e:
+                logger.warning(f"Poller listener failed for {uri}: {e}")
+
+    async def poll_once(self, rebaseline: bool = False) -> None:
+        """
+        イベントとステータスを1回ずつ取得する（同時呼び出しは1本にまとめる）
+        rebaseline が真の場合、ハイウォーターマーク以降を追わずに最新 recent_limit 件から取り直す
+        """
+        async with self._poll_lock:
+            self.stats["polls"] += 1
+            new_events = await self._poll_events(rebaseline)
+            changes = await self._poll_status()
+            self.last_poll = datetime.now().isoformat(timespec="seconds")
+            self._last_poll_at = time.monotonic()
+        if new_events:
+            await self._publish(EVENTS_RECENT_URI, new_events)
+        if changes:
+            await self._publish(MONITOR_STATUS_URI, changes)
+
+    async def _poll_events(self, rebaseline: bool = False) -> List[Dict[str, Any]]:
+        if self.high_water_mark is None or rebaseline:
+            # 初回（とポーリングを止めていた後）は最新 recent_limit 件だけ取得して基準点にする
+            result = await self.client.event_search(self.event_filter, self.recent_limit)
+            fetched = result.get("eventList") or []
+            self.high_water_mark = None
+            self._seen_at_mark = set()
+            self.recent.clear()
+        else:
+            fetched = []
+            async for event in self.client.iter_events({**self.event_filter, "outputDateFrom": self.high_water_mark}):
+                fetched.append(event)
+        new_events = [e for e in fetched if e.get("outputDate") and event_key(e) not in self._seen_at_mark]
+        if not new_events:
+            return []
+        new_events.sort(key=lambda e: parse_event_date(e["outputDate"]))
+        newest = new_events[-1]["outputDate"]
+        if self.high_water_mark is None or parse_event_date(newest) > parse_event_date(self.high_water_mark):
+            self.high_water_mark = newest
+            self._seen_at_mark = set()
+        # outputDateFrom は境界を含むため、ハイウォーターマークと同時刻のイベントは次回読み飛ばす
+        mark = parse_event_date(self.high_water_mark)
+        self._seen_at_mark.update(event_key(e) for e in new_events if parse_event_date(e["outputDate"]) == mark)
+        self.recent.extendleft(new_events)
+        self.stats["events_fetched"] += len(new_events)
+        return list(reversed(new_events))
+
+    async def _poll_status(self) -> Optional[Dict[str, Any]]:
+        result = await self.client.status_search(self.status_filter, self.status_size)
+        version = self.status_tracker.update(result.get("statusList") or [])
+        if version == 1:
+            self.last_status_changes = {"added": [], "removed": [], "changed": []}
+            return None
+        changes = self.status_tracker.changes_since(version - 1)
+        changes.pop("truncated", None)
+        if not any(changes.values()):
+            return None
+        self.last_status_changes = {**changes, "detectedAt": datetime.now().isoformat(timespec="seconds")}
+        self.stats["status_changes"] += sum(len(v) for v in changes.values())
+        return self.last_status_changes
+
+    async def _run(self) -> None:
+        # 開始直後は止まっていた間の差分を追わず、最新の状態を基準点にする
+        rebaseline = True
+        try:
+            while self.wanted:
+                try:
+                    await self.poll_once(rebaseline)
+                    rebaseline = False
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    self.stats["errors"] += 1
+                    logger.warning(f"Hinemos poll failed: {e}")
+                await asyncio.sleep(self.interval)
+            logger.info("Hinemos poller idle: no active listeners")
+        finally:
+            self._task = None
+
+    def start(self) -> None:
+        """有効なリスナーがあればポーリングを開始する（購読時などに何度呼んでもよい）"""
+        if self.enabled and not self.running and self.wanted:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def ensure_polled(self) -> None:
+        """
+        まだ一度もポーリングしていなければその場で取得する
+        ポーリングが止まっている場合は、前回の取得から interval 秒以上経っていれば最新の状態を取り直す
+        """
+        if self.running:
+            if self.last_poll is None:
+                await self.poll_once()
+            return
+        if self._last_poll_at is None or time.monotonic() - self._last_poll_at >= self.interval:
+            await self.poll_once(rebaseline=True)
+
+    def recent_events(self) -> Dict[str, Any]:
+        return {
+            "highWaterMark": self.high_water_mark,
+            "lastPoll": self.last_poll,
+            "count": len(self.recent),
+            "eventList": list(self.recent),
+        }
+
+    def monitor_status(self) -> Dict[str, Any]:
+        return {
+            "lastPoll": self.last_poll,
+            "total": self.status_tracker.total,
+            "statusList": list(self.status_tracker.rows),
+            "lastChanges": self.last_status_changes,
+        }
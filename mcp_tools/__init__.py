@@ -1,26 +1,31 @@
-from .repository import get_tools as repo_tools, dispatch as repo_dispatch
-from .calendar import get_tools as calendar_tools, dispatch as calendar_dispatch
-from .monitor import get_tools as monitor_tools, dispatch as monitor_dispatch
-from .monitor_result import get_tools as monitor_result_tools, dispatch as monitor_result_dispatch
-from .job import get_tools as job_tools, dispatch as job_dispatch
+from .registry import ToolRegistry
+from .repository import get_tools as repo_tools, dispatch as repo_dispatch, HANDLERS as repo_handlers
+from .calendar import get_tools as calendar_tools, dispatch as calendar_dispatch, HANDLERS as calendar_handlers
+from .monitor import get_tools as monitor_tools, dispatch as monitor_dispatch, HANDLERS as monitor_handlers
+from .monitor_result import get_tools as monitor_result_tools, dispatch as monitor_result_dispatch, HANDLERS as monitor_result_handlers
+from .job import get_tools as job_tools, dispatch as job_dispatch, HANDLERS as job_handlers
+from .event_analytics import get_tools as event_analytics_tools, dispatch as event_analytics_dispatch, HANDLERS as event_analytics_handlers
+from .job_analytics import get_tools as job_analytics_tools, dispatch as job_analytics_dispatch, HANDLERS as job_analytics_handlers
+from .collect import get_tools as collect_tools, dispatch as collect_dispatch, HANDLERS as collect_handlers
 
 ALL_TOOL_MODULES = [
-    (repo_tools, repo_dispatch),
-    (calendar_tools, calendar_dispatch),
-    (monitor_tools, monitor_dispatch),
-    (monitor_result_tools, monitor_result_dispatch),
-    (job_tools, job_dispatch),
+    (repo_tools, repo_dispatch, repo_handlers),
+    (calendar_tools, calendar_dispatch, calendar_handlers),
+    (monitor_tools, monitor_dispatch, monitor_handlers),
+    (monitor_result_tools, monitor_result_dispatch, monitor_result_handlers),
+    (job_tools, job_dispatch, job_handlers),
+    (event_analytics_tools, event_analytics_dispatch, event_analytics_handlers),
+    (job_analytics_tools, job_analytics_dispatch, job_analytics_handlers),
+    (collect_tools, collect_dispatch, collect_handlers),
 ]
 
+# インポート時に一度だけ Tool 定義とハンドラ表を構築する
+TOOL_REGISTRY = ToolRegistry()
+for _get_tools, _, _handlers in ALL_TOOL_MODULES:
+    TOOL_REGISTRY.register_module(_get_tools, _handlers)
+
 def get_all_tools():
-    tools = []
-    for get_tools, _ in ALL_TOOL_MODULES:
-        tools.extend(get_tools())
-    return tools
+    return TOOL_REGISTRY.tools
 
 async def dispatch_tool(name, manager, arguments):
-    for get_tools, dispatch in ALL_TOOL_MODULES:
-        tool_names = [tool.name for tool in get_tools()]
-        if name in tool_names:
-            return await dispatch(name, manager, arguments)
-    return None
\ No newline at end of file
+    return await TOOL_REGISTRY.dispatch(name, manager, arguments)
@@ -1,4 +1,5 @@
 from mcp.types import Tool
+from .registry import passthrough, make_dispatch
 from typing import List
 
 def get_tools():
@@ -272,29 +273,19 @@ def get_tools():
         ),
     ]
 
-async def dispatch(name, manager, arguments):
-    if name == "get_calendar_list":
-        return await manager.get_calendar_list(**arguments)
-    elif name == "get_calendar":
-        return await manager.get_calendar(**arguments)
-    elif name == "add_calendar":
-        return await manager.add_calendar(**arguments)
-    elif name == "modify_calendar":
-        return await manager.modify_calendar(**arguments)
-    elif name == "delete_calendar":
-        return await manager.delete_calendar(**arguments)
-    elif name == "get_calendar_month":
-        return await manager.get_calendar_month(**arguments)
-    elif name == "get_calendar_week":
-        return await manager.get_calendar_week(**arguments)
-    elif name == "get_calendar_pattern_list":
-        return await manager.get_calendar_pattern_list(**arguments)
-    elif name == "get_calendar_pattern":
-        return await manager.get_calendar_pattern(**arguments)
-    elif name == "add_calendar_pattern":
-        return await manager.add_calendar_pattern(**arguments)
-    elif name == "modify_calendar_pattern":
-        return await manager.modify_calendar_pattern(**arguments)
-    elif name == "delete_calendar_pattern":
-        return await manager.delete_calendar_pattern(**arguments)
-    return None
\ No newline at end of file
+HANDLERS = {
+    "get_calendar_list": passthrough("get_calendar_list"),
+    "get_calendar": passthrough("get_calendar"),
+    "add_calendar": passthrough("add_calendar"),
+    "modify_calendar": passthrough("modify_calendar"),
+    "delete_calendar": passthrough("delete_calendar"),
+    "get_calendar_month": passthrough("get_calendar_month"),
+    "get_calendar_week": passthrough("get_calendar_week"),
+    "get_calendar_pattern_list": passthrough("get_calendar_pattern_list"),
+    "get_calendar_pattern": passthrough("get_calendar_pattern"),
+    "add_calendar_pattern": passthrough("add_calendar_pattern"),
+    "modify_calendar_pattern": passthrough("modify_calendar_pattern"),
+    "delete_calendar_pattern": passthrough("delete_calendar_pattern"),
+}
+
+dispatch = make_dispatch(HANDLERS)
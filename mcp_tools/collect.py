@@ -0,0 +1,168 @@
+from mcp.types import Tool
+from .registry import bind, make_dispatch
+
+_TARGETS_SCHEMA = {
+    "type": "array",
+    "items": {
+        "type": "object",
+        "properties": {
+            "monitorId": {"type": "string", "description": "監視設定ID"},
+            "itemName": {"type": "string", "description": "収集項目コード"},
+            "displayName": {"type": "string", "description": "表示名（デバイス名など。省略時は空文字）"},
+            "facilityIds": {"type": "array", "items": {"type": "string"}, "description": "ファシリティIDリスト"}
+        },
+        "required": ["monitorId", "itemName", "facilityIds"]
+    },
+    "description": "収集IDの代わりに監視設定ID・収集項目・ファシリティで指定する。収集IDはキャッシュした対応表から解決し、結果の各系列に monitorId/itemName/displayName/facilityId を付ける"
+}
+
+
+def get_tools():
+    return [
+        Tool(
+            name="collect_data_fetch",
+            description="Hinemos 7.1 収集データ（性能値）を取得して収集IDごとに要約（REST API）。収集IDのバッチと期間ウィンドウに分割して並列に get_collect_data を実行するため、多数のノード・数週間分でもURL長超過やタイムアウトを避けられる。取得済みの期間はローカルの時系列キャッシュから読み、未取得の期間だけをマネージャに問い合わせる。各収集IDの件数・期間・最小/最大/平均・最新値と取得統計を返し、downsample 指定時は間引いた時系列も返す",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "id_list": {
+                        "type": "array",
+                        "items": {"type": ["integer", "string"]},
+                        "description": "収集IDリスト（targets と併用可）"
+                    },
+                    "targets": _TARGETS_SCHEMA,
+                    "summary_type": {"type": "string", "description": "サマリタイプ（get_collect_data と同じ）"},
+                    "from_time": {"type": "string", "description": "取得開始日時 (yyyy-MM-dd HH:mm:ss)"},
+                    "to_time": {"type": "string", "description": "取得終了日時 (yyyy-MM-dd HH:mm:ss)"},
+                    "size": {
+                        "type": "integer",
+                        "description": "1リクエストあたりの取得件数上限。上限に達したチャンクは期間を分けて取り直す"
+                    },
+                    "ids_per_request": {"type": "integer", "description": "1リクエストの収集ID数（既定: HINEMOS_COLLECT_IDS_PER_REQUEST または 20）"},
+                    "window_hours": {"type": "number", "description": "1リクエストの期間（時間。既定: HINEMOS_COLLECT_WINDOW_HOURS または 24）"},
+                    "concurrency": {"type": "integer", "description": "同時リクエスト数（既定: HINEMOS_COLLECT_CONCURRENCY または 4）"},
+                    "use_cache": {
+                        "type": "boolean",
+                        "description": "ローカルの時系列キャッシュを使う（既定: true）。false の場合は全期間をマネージャから取得し、キャッシュも更新しない"
+                    },
+                    "downsample": {
+                        "type": "string",
+                        "enum": ["lttb", "minmax", "percentile"],
+                        "description": "指定すると各収集IDの時系列を間引いて data（columns と rows）に含める。lttb: 形状・スパイクを保つ実在点の抽出, minmax: 等間隔バケットごとの min/max/avg/件数, percentile: 等間隔バケットごとのパーセンタイル。未指定時は要約のみ"
+                    },
+                    "points": {
+                        "type": "integer",
+                        "description": "間引き後の点数（minmax/percentile はバケット数。既定: HINEMOS_DOWNSAMPLE_POINTS または 500）"
+                    },
+                    "percentiles": {
+                        "type": "array",
+                        "items": {"type": "number"},
+                        "description": "percentile で求めるパーセンタイル（既定: [50, 95, 99]）"
+                    }
+                },
+                "required": ["summary_type", "from_time", "to_time"]
+            }
+        ),
+        Tool(
+            name="collect_anomalies",
+            description="収集データ（性能値）の異常検知（ローカル分析）。collect_data_fetch と同じ経路（キャッシュ・分割並列取得）で取得した各収集IDの時系列について、移動平均・移動標準偏差による z スコア、パーセンタイル、閾値超過時間を NumPy で計算し、異常と判定した系列を順位付けして返す。生データは返さない",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "id_list": {
+                        "type": "array",
+                        "items": {"type": ["integer", "string"]},
+                        "description": "収集IDリスト（targets と併用可）"
+                    },
+                    "targets": _TARGETS_SCHEMA,
+                    "summary_type": {"type": "string", "description": "サマリタイプ（get_collect_data と同じ）"},
+                    "from_time": {"type": "string", "description": "分析開始日時 (yyyy-MM-dd HH:mm:ss)"},
+                    "to_time": {"type": "string", "description": "分析終了日時 (yyyy-MM-dd HH:mm:ss)"},
+                    "window": {"type": "integer", "description": "移動平均・移動標準偏差に使う直前の点数（既定: 60）"},
+                    "z_threshold": {"type": "number", "description": "|z| がこの値以上の点を異常点とみなす（既定: 5）"},
+                    "threshold": {"type": "number", "description": "指定すると値がこの閾値を超えた時間（合計・最長連続）を集計する"},
+                    "direction": {
+                        "type": "string",
+                        "enum": ["above", "below"],
+                        "description": "閾値超過の向き（既定: above。below は閾値を下回った時間を集計）"
+                    },
+                    "rank_by": {
+                        "type": "string",
+                        "enum": ["zscore", "anomalies", "breach"],
+                        "description": "順位付けの基準（zscore: 最大 |z|, anomalies: 異常点数, breach: 閾値超過時間。既定: zscore）"
+                    },
+                    "top_n": {"type": "integer", "description": "返す系列数（既定: 20）"},
+                    "percentiles": {
+                        "type": "array",
+                        "items": {"type": "number"},
+                        "description": "系列ごとに求めるパーセンタイル（既定: [50, 95, 99]）"
+                    },
+                    "use_cache": {"type": "boolean", "description": "ローカルの時系列キャッシュを使う（既定: true）"}
+                },
+                "required": ["summary_type", "from_time", "to_time"]
+            }
+        ),
+        Tool(
+            name="collect_forecast",
+            description="収集データ（性能値）の容量予測（ローカル分析）。collect_data_fetch と同じ経路で取得した全系列を等間隔バケットに揃え、線形トレンドと日・週周期の季節項を NumPy の一括最小二乗で当てはめ、閾値に達するまでの日数が短い順に返す（例: 30日以内に使用率90%を超えるファイルシステム）。返す系列数は上限付き",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "id_list": {
+                        "type": "array",
+                        "items": {"type": ["integer", "string"]},
+                        "description": "収集IDリスト（targets と併用可）"
+                    },
+                    "targets": _TARGETS_SCHEMA,
+                    "summary_type": {"type": "string", "description": "サマリタイプ（get_collect_data と同じ。長期間は時間平均などを推奨）"},
+                    "from_time": {"type": "string", "description": "学習期間の開始日時 (yyyy-MM-dd HH:mm:ss)"},
+                    "to_time": {"type": "string", "description": "学習期間の終了日時 (yyyy-MM-dd HH:mm:ss)"},
+                    "threshold": {"type": "number", "description": "容量の閾値（使用率 90 など）"},
+                    "direction": {
+                        "type": "string",
+                        "enum": ["above", "below"],
+                        "description": "above: 増加して閾値を超えるまで（既定）, below: 減少して閾値を下回るまで（空き容量など）"
+                    },
+                    "horizon_days": {"type": "number", "description": "この日数以内に閾値に達する系列を返す（既定: 30）"},
+                    "model": {
+                        "type": "string",
+                        "enum": ["linear", "seasonal", "auto"],
+                        "description": "linear: 線形トレンド, seasonal: 線形 + 日周期（2週間以上なら週周期も）, auto: 系列ごとに BIC で選択（既定）"
+                    },
+                    "bucket_minutes": {"type": "number", "description": "当てはめに使うバケット幅（分。既定: 60）"},
+                    "top_n": {"type": "integer", "description": "返す系列数（既定: 20、最大 200）"},
+                    "use_cache": {"type": "boolean", "description": "ローカルの時系列キャッシュを使う（既定: true）"}
+                },
+                "required": ["summary_type", "from_time", "to_time", "threshold"]
+            }
+        ),
+        Tool(
+            name="collect_id_resolve",
+            description="監視設定ID・収集項目コード・表示名・ファシリティIDの組を収集IDに一括で解決する。ファシリティ単位に収集キー一覧をまとめて取得してキャッシュし、見つからない組だけを個別に問い合わせる（収集設定の追加・変更・削除でキャッシュを破棄）",
+            inputSchema={
+                "type": "object",
+                "properties": {"targets": _TARGETS_SCHEMA},
+                "required": ["targets"]
+            }
+        ),
+        Tool(
+            name="collect_cache_stats",
+            description="collect_data_fetch が使うローカル時系列キャッシュの状態（保存先・系列数・点数・サイズ）",
+            inputSchema={"type": "object", "properties": {}}
+        ),
+    ]
+
+HANDLERS = {
+    "collect_data_fetch": bind("collect_data_fetch", "id_list", "summary_type", "from_time", "to_time", "size",
+                               "ids_per_request", "window_hours", "concurrency", "use_cache", "downsample", "points",
+                               "percentiles", "targets"),
+    "collect_anomalies": bind("collect_anomalies", "id_list", "summary_type", "from_time", "to_time", "window",
+                              "z_threshold", "threshold", "direction", "rank_by", "top_n", "percentiles", "use_cache",
+                              "targets"),
+    "collect_forecast": bind("collect_forecast", "id_list", "summary_type", "from_time", "to_time", "threshold",
+                             "direction", "horizon_days", "model", "bucket_minutes", "top_n", "use_cache", "targets"),
+    "collect_id_resolve": bind("collect_id_resolve", "targets"),
+    "collect_cache_stats": bind("collect_cache_stats"),
+}
+
+dispatch = make_dispatch(HANDLERS)
@@ -0,0 +1,91 @@
+from mcp.types import Tool
+from .registry import bind, make_dispatch
+
+_FILTER_SCHEMA = {
+    "type": "object",
+    "description": (
+        "絞り込み条件。priority, facilityId, monitorId, monitorDetailId, pluginId, application, confirmType, ownerRoleId "
+        "は値またはリストで指定（\"WEB*\" のように * を含む文字列は部分一致）。"
+        "from / to は発生日時（ISO8601、toは含まない）"
+    ),
+}
+
+
+def get_tools():
+    return [
+        Tool(
+            name="event_store_sync",
+            description="Hinemosのイベントをローカルイベントストアへ取り込む（size上限を超える範囲もページングで全件取得）。HINEMOS_EVENT_STORE を指定した場合はバックグラウンドポーラの新着イベントも自動で取り込まれる",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "filter": {
+                        "type": "object",
+                        "description": "event_search と同じ検索条件（outputDateFrom/To で取り込む期間を指定）"
+                    },
+                    "page_size": {"type": "integer", "description": "1回の event_search の取得件数（既定: 1000）"}
+                },
+                "required": ["filter"]
+            }
+        ),
+        Tool(
+            name="event_count_by",
+            description="ローカルイベントストアから項目の組み合わせ毎のイベント件数を集計（例: 今週のWebサーバのCRITICAL件数）",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "group_by": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                        "description": "集計項目（priority, facilityId, monitorId, pluginId, application, confirmType 等）。省略時は総件数"
+                    },
+                    "filter": _FILTER_SCHEMA,
+                    "limit": {"type": "integer", "description": "返す行数の上限"}
+                }
+            }
+        ),
+        Tool(
+            name="event_top_n",
+            description="ローカルイベントストアから件数の多い値の上位N件を取得（例: イベントの多いファシリティ上位10件）",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "field": {"type": "string", "description": "集計項目（facilityId, monitorId, pluginId, priority 等）"},
+                    "n": {"type": "integer", "description": "件数（既定: 10）"},
+                    "filter": _FILTER_SCHEMA
+                },
+                "required": ["field"]
+            }
+        ),
+        Tool(
+            name="event_histogram",
+            description="ローカルイベントストアから発生日時の時系列ヒストグラムを取得",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "interval": {
+                        "type": "string",
+                        "description": "バケット幅（minute, 5m, 15m, hour, 6h, day, week または秒数。既定: hour）"
+                    },
+                    "filter": _FILTER_SCHEMA,
+                    "group_by": {"type": "string", "description": "系列を分ける項目（例: priority）"},
+                    "utc_offset_hours": {"type": "number", "description": "バケット境界のタイムゾーン（例: JSTは9）"}
+                }
+            }
+        ),
+        Tool(
+            name="event_store_stats",
+            description="ローカルイベントストアの件数・期間・保持設定",
+            inputSchema={"type": "object", "properties": {}}
+        ),
+    ]
+
+HANDLERS = {
+    "event_store_sync": bind("event_store_sync", "filter", "page_size"),
+    "event_count_by": bind("event_count_by", "group_by", "filter", "limit"),
+    "event_top_n": bind("event_top_n", "field", "n", "filter"),
+    "event_histogram": bind("event_histogram", "interval", "filter", "group_by", "utc_offset_hours"),
+    "event_store_stats": bind("event_store_stats"),
+}
+
+dispatch = make_dispatch(HANDLERS)
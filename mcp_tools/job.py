@@ -1,4 +1,5 @@
 from mcp.types import Tool
+from .registry import bind, make_dispatch
 
 def get_tools():
     return [
@@ -78,14 +79,14 @@ def get_tools():
                                             "type": {"type": "string", "description": "ジョブタイプ（JOBUNIT固定）", "default": "JOBUNIT"},
                                             "description": {"type": "string", "description": "説明", "default": ""},
                                             "ownerRoleId": {"type": "string", "description": "オーナーロールID"},
-                                            "registered": {"type": "boolean", "description": "登録フラグ", "default": false},
-                                            "isUseApprovalReqSentence": {"type": "boolean", "description": "承認要求文使用フラグ", "default": false},
-                                            "expNodeRuntimeFlg": {"type": "boolean", "description": "ノード実行時展開フラグ", "default": false},
+                                            "registered": {"type": "boolean", "description": "登録フラグ", "default": False},
+                                            "isUseApprovalReqSentence": {"type": "boolean", "description": "承認要求文使用フラグ", "default": False},
+                                            "expNodeRuntimeFlg": {"type": "boolean", "description": "ノード実行時展開フラグ", "default": False},
                                             "beginPriority": {"type": "string", "description": "開始優先度", "default": "INFO"},
                                             "normalPriority": {"type": "string", "description": "正常優先度", "default": "INFO"},
                                             "warnPriority": {"type": "string", "description": "警告優先度", "default": "WARNING"},
                                             "abnormalPriority": {"type": "string", "description": "異常優先度", "default": "CRITICAL"},
-                                            "updateTaget": {"type": "boolean", "description": "更新対象フラグ", "default": true},
+                                            "updateTaget": {"type": "boolean", "description": "更新対象フラグ", "default": True},
                                             "endStatus": {
                                                 "type": "array",
                                                 "description": "終了ステータス定義",
@@ -116,7 +117,7 @@ def get_tools():
                         },
                         "required": ["jobTreeItem"]
                     },
-                    "isClient": {"type": "boolean", "description": "クライアント用モード", "default": true}
+                    "isClient": {"type": "boolean", "description": "クライアント用モード", "default": True}
                 },
                 "required": ["jobunit"]
             }
@@ -654,6 +655,43 @@ def get_tools():
                 "required": ["jobKickId", "runJobKickRequest"]
             }
         ),
+        Tool(
+            name="run_job_bulk",
+            description="ジョブの一括実行。同じジョブネットを複数ジョブユニットで実行する、パラメータ値だけを変えて同じジョブを複数回実行する、"
+                        "といった run_job / run_job_kick をまとめて並列に送信する（並列数とトークンバケットで流量を制限、失敗は再送しない）。"
+                        "columns/rows 形式で各要求の sessionId とエラーを返す。wait=true の場合は続けて全セッションの終了を待つ",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "launches": {
+                        "type": "array",
+                        "description": "個別の実行要求。{jobunitId, jobId, request} または {jobKickId, request}（request は共通の request に上書き）",
+                        "items": {
+                            "type": "object",
+                            "properties": {
+                                "jobunitId": {"type": "string"},
+                                "jobId": {"type": "string"},
+                                "jobKickId": {"type": "string"},
+                                "request": {"type": "object"}
+                            }
+                        }
+                    },
+                    "jobunit_ids": {"type": "array", "items": {"type": "string"}, "description": "job_id を実行するジョブユニットID"},
+                    "job_id": {"type": "string", "description": "jobunit_ids の各ジョブユニットで実行するジョブID"},
+                    "job_kick_id": {"type": "string", "description": "実行するジョブキックID"},
+                    "request": {"type": "object", "description": "共通の要求本文（run_job の runJobRequest / run_job_kick の runJobKickRequest）"},
+                    "variants": {
+                        "type": "array",
+                        "items": {"type": "object"},
+                        "description": "対象ごとに request に上書きする内容の一覧（例: [{\"jobRuntimeParamList\": [...]}, ...]）。要素ごとに1回ずつ実行する"
+                    },
+                    "concurrency": {"type": "integer", "description": "同時に送信する実行要求の数（既定: HINEMOS_JOB_LAUNCH_CONCURRENCY または 4）"},
+                    "rate": {"type": "number", "description": "1秒あたりの実行要求数の上限（既定: HINEMOS_JOB_LAUNCH_RATE または 5、0 で無制限）"},
+                    "wait": {"type": "boolean", "description": "実行後に全セッションの終了を待ち、状態・終了状態・終了値を列に加える（既定: false）"},
+                    "timeout_seconds": {"type": "number", "description": "wait 時の待機の上限秒数（既定: 300、最大: 3600）"}
+                }
+            }
+        ),
         Tool(
             name="session_job_operation",
             description="セッションジョブ操作",
@@ -709,6 +747,24 @@ def get_tools():
                 "required": ["sessionId"]
             }
         ),
+        Tool(
+            name="wait_for_session",
+            description="ジョブセッションの終了待ち（run_job / run_job_kick の後に使用）。複数セッションをまとめてポーリングし、"
+                        "状態が変わらない間は間隔を延ばす。終了（または中断・停止）するか timeout_seconds が経つと、"
+                        "各セッションの状態・終了状態・終了値を返す。待機中は進捗通知を送る",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "session_ids": {"type": "array", "items": {"type": "string"}, "description": "待機するセッションID"},
+                    "timeout_seconds": {"type": "number", "description": "待機の上限秒数（既定: 300、最大: 3600）"},
+                    "mode": {"type": "string", "enum": ["all", "any"],
+                             "description": "all: 全セッションの終了を待つ（既定）、any: いずれかが終了したら返す"},
+                    "return_on_halt": {"type": "boolean",
+                                       "description": "中断・停止など操作待ちの状態でも待機を終える（既定: true）"}
+                },
+                "required": ["session_ids"]
+            }
+        ),
         Tool(
             name="get_session_node_detail",
             description="ノード詳細一覧取得",
@@ -876,7 +932,7 @@ def get_tools():
             }
         ),
         Tool(
-            name="add_joblinkrcv_job",
+            name="add_joblinkrcv",
             description="ジョブ連携受信ジョブキック追加",
             inputSchema={
                 "type": "object",
@@ -1222,7 +1278,7 @@ def get_tools():
         ),
         Tool(
             name="get_rpa_screenshot_file",
-            description="RPAスクリーンショットファイルダウンロード",
+            description="RPAスクリーンショットファイルダウンロード（サーバ側に保存し、保存先パス・サイズ・SHA-256を返す）",
             inputSchema={
                 "type": "object",
                 "properties": {
@@ -1230,7 +1286,8 @@ def get_tools():
                     "jobunitId": {"type": "string"},
                     "jobId": {"type": "string"},
                     "facilityId": {"type": "string"},
-                    "regDate": {"type": "string"}
+                    "regDate": {"type": "string"},
+                    "output_path": {"type": "string", "description": "保存先パス（HINEMOS_DOWNLOAD_DIR からの相対パス、またはその配下の絶対パス。省略時はHINEMOS_DOWNLOAD_DIR配下）"}
                 },
                 "required": ["sessionId", "jobunitId", "jobId", "facilityId", "regDate"]
             }
@@ -1571,188 +1628,100 @@ def get_tools():
         ),
     ]
 
-async def dispatch(name, manager, arguments):
-    # 省略: 既存のAPI名に合わせて manager.XXX(**arguments) を呼び出す分岐を追加してください
-    # 例:
-    if name == "get_job_tree_simple":
-        return await manager.get_job_tree_simple(ownerRoleId=arguments.get("ownerRoleId"))
-    elif name == "get_job_tree_full":
-        return await manager.get_job_tree_full(ownerRoleId=arguments.get("ownerRoleId"))
-    elif name == "get_job_info":
-        return await manager.get_job_info(jobunitId=arguments.get("jobunitId"), jobId=arguments.get("jobId"))
-    elif name == "get_job_info_bulk":
-        return await manager.get_job_info_bulk(jobList=arguments.get("jobList"))
-    elif name == "add_jobunit":
-        return await manager.add_jobunit(jobunit=arguments.get("jobunit"), isClient=arguments.get("isClient"))
-    elif name == "modify_jobunit":
-        return await manager.modify_jobunit(jobunitId=arguments.get("jobunitId"), jobunit=arguments.get("jobunit"), isClient=arguments.get("isClient"))
-    elif name == "delete_jobunit":
-        return await manager.delete_jobunit(jobunitId=arguments.get("jobunitId"))
-    elif name == "get_edit_lock":
-        return await manager.get_edit_lock(jobunitId=arguments.get("jobunitId"), updateTime=arguments.get("updateTime"), forceFlag=arguments.get("forceFlag"))
-    elif name == "check_edit_lock":
-        return await manager.check_edit_lock(jobunitId=arguments.get("jobunitId"), editSession=arguments.get("editSession"))
-    elif name == "release_edit_lock":
-        return await manager.release_edit_lock(jobunitId=arguments.get("jobunitId"), editSession=arguments.get("editSession"))
-    elif name == "add_jobnet":
-        return await manager.add_jobnet(jobunitId=arguments.get("jobunitId"), jobnet=arguments.get("jobnet"))
-    elif name == "add_command_job":
-        return await manager.add_command_job(jobunitId=arguments.get("jobunitId"), job=arguments.get("job"))
-    elif name == "add_file_job":
-        return await manager.add_file_job(jobunitId=arguments.get("jobunitId"), job=arguments.get("job"))
-    elif name == "add_refer_job":
-        return await manager.add_refer_job(jobunitId=arguments.get("jobunitId"), job=arguments.get("job"))
-    elif name == "add_monitor_job":
-        return await manager.add_monitor_job(jobunitId=arguments.get("jobunitId"), job=arguments.get("job"))
-    elif name == "add_approval_job":
-        return await manager.add_approval_job(jobunitId=arguments.get("jobunitId"), job=arguments.get("job"))
-    elif name == "add_joblinksend_job":
-        return await manager.add_joblinksend_job(jobunitId=arguments.get("jobunitId"), job=arguments.get("job"))
-    elif name == "add_joblinkrcv_job":
-        return await manager.add_joblinkrcv_job(jobunitId=arguments.get("jobunitId"), job=arguments.get("job"))
-    elif name == "add_filecheck_job":
-        return await manager.add_filecheck_job(jobunitId=arguments.get("jobunitId"), job=arguments.get("job"))
-    elif name == "add_rpa_job":
-        return await manager.add_rpa_job(jobunitId=arguments.get("jobunitId"), job=arguments.get("job"))
-    elif name == "delete_job":
-        return await manager.delete_job(jobunitId=arguments.get("jobunitId"), jobId=arguments.get("jobId"))
-    elif name == "run_job":
-        return await manager.run_job(jobunitId=arguments.get("jobunitId"), jobId=arguments.get("jobId"), runJobRequest=arguments.get("runJobRequest"))
-    elif name == "run_job_kick":
-        return await manager.run_job_kick(jobKickId=arguments.get("jobKickId"), runJobKickRequest=arguments.get("runJobKickRequest"))
-    elif name == "session_job_operation":
-        return await manager.session_job_operation(sessionId=arguments.get("sessionId"), jobunitId=arguments.get("jobunitId"), jobId=arguments.get("jobId"), operation=arguments.get("operation"))
-    elif name == "session_node_operation":
-        return await manager.session_node_operation(sessionId=arguments.get("sessionId"), jobunitId=arguments.get("jobunitId"), jobId=arguments.get("jobId"), facilityId=arguments.get("facilityId"), operation=arguments.get("operation"))
-    elif name == "get_session_job_detail":
-        return await manager.get_session_job_detail(sessionId=arguments.get("sessionId"))
-    elif name == "get_session_node_detail":
-        return await manager.get_session_node_detail(sessionId=arguments.get("sessionId"), jobunitId=arguments.get("jobunitId"), jobId=arguments.get("jobId"))
-    elif name == "get_session_file_detail":
-        return await manager.get_session_file_detail(sessionId=arguments.get("sessionId"), jobunitId=arguments.get("jobunitId"), jobId=arguments.get("jobId"))
-    elif name == "get_session_job_jobInfo":
-        return await manager.get_session_job_jobInfo(sessionId=arguments.get("sessionId"), jobunitId=arguments.get("jobunitId"), jobId=arguments.get("jobId"))
-    elif name == "get_session_job_allDetail":
-        return await manager.get_session_job_allDetail(sessionId=arguments.get("sessionId"))
-    elif name == "history_search":
-        return await manager.history_search(size=arguments.get("size"), filter=arguments.get("filter"))
-    elif name == "add_schedule":
-        return await manager.add_schedule(schedule=arguments.get("schedule"))
-    elif name == "add_filecheck":
-        return await manager.add_filecheck(filecheck=arguments.get("filecheck"))
-    elif name == "add_manual":
-        return await manager.add_manual(manual=arguments.get("manual"))
-    elif name == "add_joblinkrcv":
-        return await manager.add_joblinkrcv(joblinkrcv=arguments.get("joblinkrcv"))
-    elif name == "get_kick_list":
-        return await manager.get_kick_list()
-    elif name == "kick_search":
-        return await manager.kick_search(condition=arguments.get("condition"))
-    elif name == "set_kick_valid":
-        return await manager.set_kick_valid(setStatus=arguments.get("setStatus"))
-    elif name == "delete_kick":
-        return await manager.delete_kick(jobkickIds=arguments.get("jobkickIds"))
-    elif name == "session_approval_search":
-        return await manager.session_approval_search(request=arguments.get("request"))
-    elif name == "modify_approval_info":
-        return await manager.modify_approval_info(sessionId=arguments.get("sessionId"), jobunitId=arguments.get("jobunitId"), jobId=arguments.get("jobId"), info=arguments.get("info"))
-    elif name == "get_queue_list":
-        return await manager.get_queue_list(roleId=arguments.get("roleId"))
-    elif name == "get_queue_detail":
-        return await manager.get_queue_detail(queueId=arguments.get("queueId"))
-    elif name == "add_queue":
-        return await manager.add_queue(queue=arguments.get("queue"))
-    elif name == "modify_queue":
-        return await manager.modify_queue(queueId=arguments.get("queueId"), queue=arguments.get("queue"))
-    elif name == "delete_queue":
-        return await manager.delete_queue(queueIds=arguments.get("queueIds"))
-    elif name == "queue_activity_search":
-        return await manager.queue_activity_search(request=arguments.get("request"))
-    elif name == "queue_activity_detail":
-        return await manager.queue_activity_detail(queueId=arguments.get("queueId"))
-    elif name == "get_joblinksend_setting_list":
-        return await manager.get_joblinksend_setting_list(ownerRoleId=arguments.get("ownerRoleId"))
-    elif name == "get_joblinksend_setting_detail":
-        return await manager.get_joblinksend_setting_detail(joblinkSendSettingId=arguments.get("joblinkSendSettingId"))
-    elif name == "add_joblinksend_setting":
-        return await manager.add_joblinksend_setting(setting=arguments.get("setting"))
-    elif name == "modify_joblinksend_setting":
-        return await manager.modify_joblinksend_setting(joblinkSendSettingId=arguments.get("joblinkSendSettingId"), setting=arguments.get("setting"))
-    elif name == "delete_joblinksend_setting":
-        return await manager.delete_joblinksend_setting(joblinkSendSettingIds=arguments.get("joblinkSendSettingIds"))
-    elif name == "regist_joblink_message":
-        return await manager.regist_joblink_message(message=arguments.get("message"))
-    elif name == "send_joblink_message_manual":
-        return await manager.send_joblink_message_manual(message=arguments.get("message"))
-    elif name == "joblink_message_search":
-        return await manager.joblink_message_search(request=arguments.get("request"))
-    elif name == "available_start_operation":
-        return await manager.available_start_operation(sessionId=arguments.get("sessionId"), jobunitId=arguments.get("jobunitId"), jobId=arguments.get("jobId"))
-    elif name == "available_start_operation_node":
-        return await manager.available_start_operation_node(sessionId=arguments.get("sessionId"), jobunitId=arguments.get("jobunitId"), jobId=arguments.get("jobId"), facilityId=arguments.get("facilityId"))
-    elif name == "available_stop_operation":
-        return await manager.available_stop_operation(sessionId=arguments.get("sessionId"), jobunitId=arguments.get("jobunitId"), jobId=arguments.get("jobId"))
-    elif name == "available_stop_operation_node":
-        return await manager.available_stop_operation_node(sessionId=arguments.get("sessionId"), jobunitId=arguments.get("jobunitId"), jobId=arguments.get("jobId"), facilityId=arguments.get("facilityId"))
-    elif name == "get_rpa_login_resolution":
-        return await manager.get_rpa_login_resolution()
-    elif name == "get_rpa_screenshot":
-        return await manager.get_rpa_screenshot(sessionId=arguments.get("sessionId"), jobunitId=arguments.get("jobunitId"), jobId=arguments.get("jobId"), facilityId=arguments.get("facilityId"))
-    elif name == "get_rpa_screenshot_file":
-        return await manager.get_rpa_screenshot_file(sessionId=arguments.get("sessionId"), jobunitId=arguments.get("jobunitId"), jobId=arguments.get("jobId"), facilityId=arguments.get("facilityId"), regDate=arguments.get("regDate"))
-    elif name == "get_jobmap_icon_image_iconId":
-        return await manager.get_jobmap_icon_image_iconId(ownerRoleId=arguments.get("ownerRoleId"))
-    elif name == "delete_premakejobsession":
-        return await manager.delete_premakejobsession(jobkickId=arguments.get("jobkickId"))
-    elif name == "get_schedule_plan":
-        return await manager.get_schedule_plan(plan=arguments.get("plan"))
-    elif name == "get_job_referrer_queue":
-        return await manager.get_job_referrer_queue(queueId=arguments.get("queueId"))
-    elif name == "queue_search":
-        return await manager.queue_search(search=arguments.get("search"))
-    elif name == "modify_jobnet":
-        return await manager.modify_jobnet(jobunitId=arguments.get("jobunitId"), jobId=arguments.get("jobId"), jobnet=arguments.get("jobnet"))
-    elif name == "modify_command_job":
-        return await manager.modify_command_job(jobunitId=arguments.get("jobunitId"), jobId=arguments.get("jobId"), job=arguments.get("job"))
-    elif name == "modify_file_job":
-        return await manager.modify_file_job(jobunitId=arguments.get("jobunitId"), jobId=arguments.get("jobId"), job=arguments.get("job"))
-    elif name == "modify_refer_job":
-        return await manager.modify_refer_job(jobunitId=arguments.get("jobunitId"), jobId=arguments.get("jobId"), job=arguments.get("job"))
-    elif name == "modify_monitor_job":
-        return await manager.modify_monitor_job(jobunitId=arguments.get("jobunitId"), jobId=arguments.get("jobId"), job=arguments.get("job"))
-    elif name == "modify_approval_job":
-        return await manager.modify_approval_job(jobunitId=arguments.get("jobunitId"), jobId=arguments.get("jobId"), job=arguments.get("job"))
-    elif name == "modify_joblinksend_job":
-        return await manager.modify_joblinksend_job(jobunitId=arguments.get("jobunitId"), jobId=arguments.get("jobId"), job=arguments.get("job"))
-    elif name == "modify_joblinkrcv_job":
-        return await manager.modify_joblinkrcv_job(jobunitId=arguments.get("jobunitId"), jobId=arguments.get("jobId"), job=arguments.get("job"))
-    elif name == "modify_filecheck_job":
-        return await manager.modify_filecheck_job(jobunitId=arguments.get("jobunitId"), jobId=arguments.get("jobId"), job=arguments.get("job"))
-    elif name == "modify_rpa_job":
-        return await manager.modify_rpa_job(jobunitId=arguments.get("jobunitId"), jobId=arguments.get("jobId"), job=arguments.get("job"))
-    elif name == "get_schedule_detail":
-        return await manager.get_schedule_detail(jobKickId=arguments.get("jobKickId"))
-    elif name == "get_filecheck_detail":
-        return await manager.get_filecheck_detail(jobKickId=arguments.get("jobKickId"))
-    elif name == "get_manual_detail":
-        return await manager.get_manual_detail(jobKickId=arguments.get("jobKickId"))
-    elif name == "get_joblinkrcv_detail":
-        return await manager.get_joblinkrcv_detail(jobKickId=arguments.get("jobKickId"))
-    elif name == "get_kick_detail":
-        return await manager.get_kick_detail(jobKickId=arguments.get("jobKickId"))
-    elif name == "modify_schedule":
-        return await manager.modify_schedule(jobKickId=arguments.get("jobKickId"), schedule=arguments.get("schedule"))
-    elif name == "modify_filecheck":
-        return await manager.modify_filecheck(jobKickId=arguments.get("jobKickId"), filecheck=arguments.get("filecheck"))
-    elif name == "modify_manual":
-        return await manager.modify_manual(jobKickId=arguments.get("jobKickId"), manual=arguments.get("manual"))
-    elif name == "modify_joblinkrcv":
-        return await manager.modify_joblinkrcv(jobKickId=arguments.get("jobKickId"), joblinkrcv=arguments.get("joblinkrcv"))
-    elif name == "delete_schedule":
-        return await manager.delete_schedule(jobkickIds=arguments.get("jobkickIds"))
-    elif name == "delete_filecheck":
-        return await manager.delete_filecheck(jobkickIds=arguments.get("jobkickIds"))
-    elif name == "delete_manual":
-        return await manager.delete_manual(jobkickIds=arguments.get("jobkickIds"))
-    elif name == "delete_joblinkrcv":
-        return await manager.delete_joblinkrcv(jobkickIds=arguments.get("jobkickIds"))
\ No newline at end of file
+HANDLERS = {
+    "get_job_tree_simple": bind("get_job_tree_simple", "ownerRoleId"),
+    "get_job_tree_full": bind("get_job_tree_full", "ownerRoleId"),
+    "get_job_info": bind("get_job_info", "jobunitId", "jobId"),
+    "get_job_info_bulk": bind("get_job_info_bulk", "jobList"),
+    "add_jobunit": bind("add_jobunit", "jobunit", "isClient"),
+    "modify_jobunit": bind("modify_jobunit", "jobunitId", "jobunit", "isClient"),
+    "delete_jobunit": bind("delete_jobunit", "jobunitId"),
+    "get_edit_lock": bind("get_edit_lock", "jobunitId", "updateTime", "forceFlag"),
+    "check_edit_lock": bind("check_edit_lock", "jobunitId", "editSession"),
+    "release_edit_lock": bind("release_edit_lock", "jobunitId", "editSession"),
+    "add_jobnet": bind("add_jobnet", "jobunitId", "jobnet"),
+    "add_command_job": bind("add_command_job", "jobunitId", "job"),
+    "add_file_job": bind("add_file_job", "jobunitId", "job"),
+    "add_refer_job": bind("add_refer_job", "jobunitId", "job"),
+    "add_monitor_job": bind("add_monitor_job", "jobunitId", "job"),
+    "add_approval_job": bind("add_approval_job", "jobunitId", "job"),
+    "add_joblinksend_job": bind("add_joblinksend_job", "jobunitId", "job"),
+    "add_joblinkrcv_job": bind("add_joblinkrcv_job", "jobunitId", "job"),
+    "add_filecheck_job": bind("add_filecheck_job", "jobunitId", "job"),
+    "add_rpa_job": bind("add_rpa_job", "jobunitId", "job"),
+    "delete_job": bind("delete_job", "jobunitId", "jobId"),
+    "run_job": bind("run_job", "jobunitId", "jobId", "runJobRequest"),
+    "run_job_kick": bind("run_job_kick", "jobKickId", "runJobKickRequest"),
+    "run_job_bulk": bind("run_job_bulk", "launches", "jobunit_ids", "job_id", "job_kick_id", "request", "variants", "concurrency", "rate", "wait", "timeout_seconds"),
+    "session_job_operation": bind("session_job_operation", "sessionId", "jobunitId", "jobId", "operation"),
+    "session_node_operation": bind("session_node_operation", "sessionId", "jobunitId", "jobId", "facilityId", "operation"),
+    "get_session_job_detail": bind("get_session_job_detail", "sessionId"),
+    "wait_for_session": bind("wait_for_session", "session_ids", "timeout_seconds", "mode", "return_on_halt"),
+    "get_session_node_detail": bind("get_session_node_detail", "sessionId", "jobunitId", "jobId"),
+    "get_session_file_detail": bind("get_session_file_detail", "sessionId", "jobunitId", "jobId"),
+    "get_session_job_jobInfo": bind("get_session_job_jobInfo", "sessionId", "jobunitId", "jobId"),
+    "get_session_job_allDetail": bind("get_session_job_allDetail", "sessionId"),
+    "history_search": bind("history_search", "size", "filter"),
+    "add_schedule": bind("add_schedule", "schedule"),
+    "add_filecheck": bind("add_filecheck", "filecheck"),
+    "add_manual": bind("add_manual", "manual"),
+    "add_joblinkrcv": bind("add_joblinkrcv", "joblinkrcv"),
+    "get_kick_list": bind("get_kick_list"),
+    "kick_search": bind("kick_search", "condition"),
+    "set_kick_valid": bind("set_kick_valid", "setStatus"),
+    "delete_kick": bind("delete_kick", "jobkickIds"),
+    "session_approval_search": bind("session_approval_search", "request"),
+    "modify_approval_info": bind("modify_approval_info", "sessionId", "jobunitId", "jobId", "info"),
+    "get_queue_list": bind("get_queue_list", "roleId"),
+    "get_queue_detail": bind("get_queue_detail", "queueId"),
+    "add_queue": bind("add_queue", "queue"),
+    "modify_queue": bind("modify_queue", "queueId", "queue"),
+    "delete_queue": bind("delete_queue", "queueIds"),
+    "queue_activity_search": bind("queue_activity_search", "request"),
+    "queue_activity_detail": bind("queue_activity_detail", "queueId"),
+    "get_joblinksend_setting_list": bind("get_joblinksend_setting_list", "ownerRoleId"),
+    "get_joblinksend_setting_detail": bind("get_joblinksend_setting_detail", "joblinkSendSettingId"),
+    "add_joblinksend_setting": bind("add_joblinksend_setting", "setting"),
+    "modify_joblinksend_setting": bind("modify_joblinksend_setting", "joblinkSendSettingId", "setting"),
+    "delete_joblinksend_setting": bind("delete_joblinksend_setting", "joblinkSendSettingIds"),
+    "regist_joblink_message": bind("regist_joblink_message", "message"),
+    "send_joblink_message_manual": bind("send_joblink_message_manual", "message"),
+    "joblink_message_search": bind("joblink_message_search", "request"),
+    "available_start_operation": bind("available_start_operation", "sessionId", "jobunitId", "jobId"),
+    "available_start_operation_node": bind("available_start_operation_node", "sessionId", "jobunitId", "jobId", "facilityId"),
+    "available_stop_operation": bind("available_stop_operation", "sessionId", "jobunitId", "jobId"),
+    "available_stop_operation_node": bind("available_stop_operation_node", "sessionId", "jobunitId", "jobId", "facilityId"),
+    "get_rpa_login_resolution": bind("get_rpa_login_resolution"),
+    "get_rpa_screenshot": bind("get_rpa_screenshot", "sessionId", "jobunitId", "jobId", "facilityId"),
+    "get_rpa_screenshot_file": bind("get_rpa_screenshot_file", "sessionId", "jobunitId", "jobId", "facilityId", "regDate", "output_path"),
+    "get_jobmap_icon_image_iconId": bind("get_jobmap_icon_image_iconId", "ownerRoleId"),
+    "delete_premakejobsession": bind("delete_premakejobsession", "jobkickId"),
+    "get_schedule_plan": bind("get_schedule_plan", "plan"),
+    "get_job_referrer_queue": bind("get_job_referrer_queue", "queueId"),
+    "queue_search": bind("queue_search", "search"),
+    "modify_jobnet": bind("modify_jobnet", "jobunitId", "jobId", "jobnet"),
+    "modify_command_job": bind("modify_command_job", "jobunitId", "jobId", "job"),
+    "modify_file_job": bind("modify_file_job", "jobunitId", "jobId", "job"),
+    "modify_refer_job": bind("modify_refer_job", "jobunitId", "jobId", "job"),
+    "modify_monitor_job": bind("modify_monitor_job", "jobunitId", "jobId", "job"),
+    "modify_approval_job": bind("modify_approval_job", "jobunitId", "jobId", "job"),
+    "modify_joblinksend_job": bind("modify_joblinksend_job", "jobunitId", "jobId", "job"),
+    "modify_joblinkrcv_job": bind("modify_joblinkrcv_job", "jobunitId", "jobId", "job"),
+    "modify_filecheck_job": bind("modify_filecheck_job", "jobunitId", "jobId", "job"),
+    "modify_rpa_job": bind("modify_rpa_job", "jobunitId", "jobId", "job"),
+    "get_schedule_detail": bind("get_schedule_detail", "jobKickId"),
+    "get_filecheck_detail": bind("get_filecheck_detail", "jobKickId"),
+    "get_manual_detail": bind("get_manual_detail", "jobKickId"),
+    "get_joblinkrcv_detail": bind("get_joblinkrcv_detail", "jobKickId"),
+    "get_kick_detail": bind("get_kick_detail", "jobKickId"),
+    "modify_schedule": bind("modify_schedule", "jobKickId", "schedule"),
+    "modify_filecheck": bind("modify_filecheck", "jobKickId", "filecheck"),
+    "modify_manual": bind("modify_manual", "jobKickId", "manual"),
+    "modify_joblinkrcv": bind("modify_joblinkrcv", "jobKickId", "joblinkrcv"),
+    "delete_schedule": bind("delete_schedule", "jobkickIds"),
+    "delete_filecheck": bind("delete_filecheck", "jobkickIds"),
+    "delete_manual": bind("delete_manual", "jobkickIds"),
+    "delete_joblinkrcv": bind("delete_joblinkrcv", "jobkickIds"),
+}
+
+dispatch = make_dispatch(HANDLERS)
@@ -0,0 +1,74 @@
+from mcp.types import Tool
+from .registry import bind, make_dispatch
+
+_FILTER_SCHEMA = {
+    "type": "object",
+    "description": (
+        "絞り込み条件。jobunitId, jobId, sessionId, facilityId, ownerRoleId, triggerType, status, endStatus "
+        "は値またはリストで指定（\"JOB_*\" のように * を含む文字列は部分一致）。"
+        "from / to は開始日時（yyyy-MM-dd HH:mm:ss または ISO8601、toは含まない）"
+    ),
+}
+
+
+def get_tools():
+    return [
+        Tool(
+            name="job_history_sync",
+            description="Hinemosのジョブ履歴をローカルジョブ履歴ストアへ取り込む（size上限を超える範囲も開始日時のウィンドウ分割で全件取得）。"
+                        "取り込み済みの実行は状態・終了日時を更新する",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "filter": {
+                        "type": "object",
+                        "description": "history_search と同じ検索条件（startFromDate/startToDate で取り込む期間を指定）"
+                    },
+                    "page_size": {"type": "integer", "description": "1回の history_search の取得件数（既定: 1000）"}
+                },
+                "required": ["filter"]
+            }
+        ),
+        Tool(
+            name="job_duration_stats",
+            description="ローカルジョブ履歴ストアからジョブごとの実行回数・所要時間（p50/p95/最大/平均、秒）・失敗率を集計"
+                        "（interval 指定時は期間ごとの推移）",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "filter": _FILTER_SCHEMA,
+                    "percentiles": {"type": "array", "items": {"type": "number"}, "description": "求めるパーセンタイル（既定: [50, 95]）"},
+                    "sort_by": {"type": "string", "description": "並び順（p50, p95, max, avg, runs, failureRate。降順。既定: p95）"},
+                    "limit": {"type": "integer", "description": "返す行数の上限"},
+                    "interval": {"type": "string", "description": "期間ごとの推移を出す場合の単位（day, week など、または秒数）"},
+                    "utc_offset_hours": {"type": "number", "description": "interval の境界のタイムゾーン（例: JSTは9）"}
+                }
+            }
+        ),
+        Tool(
+            name="job_slowest_runs",
+            description="ローカルジョブ履歴ストアから所要時間の長い実行の上位N件を取得（per_job の場合はジョブごとに上位N件）",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "filter": _FILTER_SCHEMA,
+                    "n": {"type": "integer", "description": "件数（既定: 10）"},
+                    "per_job": {"type": "boolean", "description": "ジョブごとに上位N件を返す（既定: false）"}
+                }
+            }
+        ),
+        Tool(
+            name="job_history_stats",
+            description="ローカルジョブ履歴ストアの実行数・ジョブ数・期間",
+            inputSchema={"type": "object", "properties": {}}
+        ),
+    ]
+
+HANDLERS = {
+    "job_history_sync": bind("job_history_sync", "filter", "page_size"),
+    "job_duration_stats": bind("job_duration_stats", "filter", "percentiles", "sort_by", "limit", "interval", "utc_offset_hours"),
+    "job_slowest_runs": bind("job_slowest_runs", "filter", "n", "per_job"),
+    "job_history_stats": bind("job_history_stats"),
+}
+
+dispatch = make_dispatch(HANDLERS)
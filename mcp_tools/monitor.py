@@ -1,4 +1,5 @@
 from mcp.types import Tool
+from .registry import passthrough, make_dispatch
 from typing import List
 
 def get_tools():
@@ -1452,149 +1453,94 @@ def get_tools():
         )
     ]
 
-async def dispatch(name, manager, arguments):
+HANDLERS = {
     # 監視設定一覧・検索
-    if name == "get_monitor_list":
-        return await manager.get_monitor_list(**arguments)
-    elif name == "get_monitor_list_by_condition":
-        return await manager.get_monitor_list_by_condition(**arguments)
-    elif name == "get_monitor":
-        return await manager.get_monitor(**arguments)
-    elif name == "delete_monitor":
-        return await manager.delete_monitor(**arguments)
-    elif name == "set_status_monitor":
-        return await manager.set_status_monitor(**arguments)
-    elif name == "set_status_collector":
-        return await manager.set_status_collector(**arguments)
+    "get_monitor_list": passthrough("get_monitor_list"),
+    "get_monitor_list_by_condition": passthrough("get_monitor_list_by_condition"),
+    "get_monitor": passthrough("get_monitor"),
+    "delete_monitor": passthrough("delete_monitor"),
+    "set_status_monitor": passthrough("set_status_monitor"),
+    "set_status_collector": passthrough("set_status_collector"),
 
     # HTTPシナリオ監視
-    elif name == "add_http_scenario_monitor":
-        return await manager.add_http_scenario_monitor(**arguments)
-    elif name == "modify_http_scenario_monitor":
-        return await manager.modify_http_scenario_monitor(**arguments)
-    elif name == "get_http_scenario_list":
-        return await manager.get_http_scenario_list(**arguments)
+    "add_http_scenario_monitor": passthrough("add_http_scenario_monitor"),
+    "modify_http_scenario_monitor": passthrough("modify_http_scenario_monitor"),
+    "get_http_scenario_list": passthrough("get_http_scenario_list"),
 
     # HTTP監視（数値）
-    elif name == "add_http_numeric_monitor":
-        return await manager.add_http_numeric_monitor(**arguments)
-    elif name == "modify_http_numeric_monitor":
-        return await manager.modify_http_numeric_monitor(**arguments)
-    elif name == "get_http_numeric_list":
-        return await manager.get_http_numeric_list(**arguments)
+    "add_http_numeric_monitor": passthrough("add_http_numeric_monitor"),
+    "modify_http_numeric_monitor": passthrough("modify_http_numeric_monitor"),
+    "get_http_numeric_list": passthrough("get_http_numeric_list"),
 
     # HTTP監視（文字列）
-    elif name == "add_http_string_monitor":
-        return await manager.add_http_string_monitor(**arguments)
-    elif name == "modify_http_string_monitor":
-        return await manager.modify_http_string_monitor(**arguments)
-    elif name == "get_http_string_list":
-        return await manager.get_http_string_list(**arguments)
+    "add_http_string_monitor": passthrough("add_http_string_monitor"),
+    "modify_http_string_monitor": passthrough("modify_http_string_monitor"),
+    "get_http_string_list": passthrough("get_http_string_list"),
 
     # エージェント監視
-    elif name == "add_agent_monitor":
-        return await manager.add_agent_monitor(**arguments)
-    elif name == "modify_agent_monitor":
-        return await manager.modify_agent_monitor(**arguments)
-    elif name == "get_agent_list":
-        return await manager.get_agent_list(**arguments)
+    "add_agent_monitor": passthrough("add_agent_monitor"),
+    "modify_agent_monitor": passthrough("modify_agent_monitor"),
+    "get_agent_list": passthrough("get_agent_list"),
 
     # JMX監視
-    elif name == "add_jmx_monitor":
-        return await manager.add_jmx_monitor(**arguments)
-    elif name == "modify_jmx_monitor":
-        return await manager.modify_jmx_monitor(**arguments)
-    elif name == "get_jmx_list":
-        return await manager.get_jmx_list(**arguments)
-    elif name == "get_jmx_url_format_list":
-        return await manager.get_jmx_url_format_list(**arguments)
+    "add_jmx_monitor": passthrough("add_jmx_monitor"),
+    "modify_jmx_monitor": passthrough("modify_jmx_monitor"),
+    "get_jmx_list": passthrough("get_jmx_list"),
+    "get_jmx_url_format_list": passthrough("get_jmx_url_format_list"),
 
     # PING監視
-    elif name == "add_ping_monitor":
-        return await manager.add_ping_monitor(**arguments)
-    elif name == "modify_ping_monitor":
-        return await manager.modify_ping_monitor(**arguments)
-    elif name == "get_ping_list":
-        return await manager.get_ping_list(**arguments)
+    "add_ping_monitor": passthrough("add_ping_monitor"),
+    "modify_ping_monitor": passthrough("modify_ping_monitor"),
+    "get_ping_list": passthrough("get_ping_list"),
 
     # カスタム監視（数値）
-    elif name == "add_custom_numeric_monitor":
-        return await manager.add_custom_numeric_monitor(**arguments)
-    elif name == "modify_custom_numeric_monitor":
-        return await manager.modify_custom_numeric_monitor(**arguments)
-    elif name == "get_custom_numeric_list":
-        return await manager.get_custom_numeric_list(**arguments)
+    "add_custom_numeric_monitor": passthrough("add_custom_numeric_monitor"),
+    "modify_custom_numeric_monitor": passthrough("modify_custom_numeric_monitor"),
+    "get_custom_numeric_list": passthrough("get_custom_numeric_list"),
 
     # カスタム監視（文字列）
-    elif name == "add_custom_string_monitor":
-        return await manager.add_custom_string_monitor(**arguments)
-    elif name == "modify_custom_string_monitor":
-        return await manager.modify_custom_string_monitor(**arguments)
-    elif name == "get_custom_string_list":
-        return await manager.get_custom_string_list(**arguments)
-    
+    "add_custom_string_monitor": passthrough("add_custom_string_monitor"),
+    "modify_custom_string_monitor": passthrough("modify_custom_string_monitor"),
+    "get_custom_string_list": passthrough("get_custom_string_list"),
+
     # リソース監視
-    elif name == "add_performance_monitor":
-        return await manager.add_performance_monitor(**arguments)
-    elif name == "modify_performance_monitor":
-        return await manager.modify_performance_monitor(**arguments)
-    elif name == "get_performance_list":
-        return await manager.get_performance_list(**arguments)
+    "add_performance_monitor": passthrough("add_performance_monitor"),
+    "modify_performance_monitor": passthrough("modify_performance_monitor"),
+    "get_performance_list": passthrough("get_performance_list"),
 
     # SNMP監視
-    elif name == "add_snmp_numeric_monitor":
-        return await manager.add_snmp_numeric_monitor(**arguments)
-    elif name == "modify_snmp_numeric_monitor":
-        return await manager.modify_snmp_numeric_monitor(**arguments)
-    elif name == "get_snmp_numeric_list":
-        return await manager.get_snmp_numeric_list(**arguments)
-    elif name == "add_snmp_string_monitor":
-        return await manager.add_snmp_string_monitor(**arguments)
-    elif name == "modify_snmp_string_monitor":
-        return await manager.modify_snmp_string_monitor(**arguments)
-    elif name == "get_snmp_string_list":
-        return await manager.get_snmp_string_list(**arguments)
+    "add_snmp_numeric_monitor": passthrough("add_snmp_numeric_monitor"),
+    "modify_snmp_numeric_monitor": passthrough("modify_snmp_numeric_monitor"),
+    "get_snmp_numeric_list": passthrough("get_snmp_numeric_list"),
+    "add_snmp_string_monitor": passthrough("add_snmp_string_monitor"),
+    "modify_snmp_string_monitor": passthrough("modify_snmp_string_monitor"),
+    "get_snmp_string_list": passthrough("get_snmp_string_list"),
 
     # SQL監視
-    elif name == "add_sql_numeric_monitor":
-        return await manager.add_sql_numeric_monitor(**arguments)
-    elif name == "modify_sql_numeric_monitor":
-        return await manager.modify_sql_numeric_monitor(**arguments)
-    elif name == "get_sql_numeric_list":
-        return await manager.get_sql_numeric_list(**arguments)
+    "add_sql_numeric_monitor": passthrough("add_sql_numeric_monitor"),
+    "modify_sql_numeric_monitor": passthrough("modify_sql_numeric_monitor"),
+    "get_sql_numeric_list": passthrough("get_sql_numeric_list"),
 
     # ログファイル監視
-    elif name == "add_logfile_monitor":
-        return await manager.add_logfile_monitor(**arguments)
-    elif name == "modify_logfile_monitor":
-        return await manager.modify_logfile_monitor(**arguments)
-    elif name == "get_logfile_list":
-        return await manager.get_logfile_list(**arguments)
+    "add_logfile_monitor": passthrough("add_logfile_monitor"),
+    "modify_logfile_monitor": passthrough("modify_logfile_monitor"),
+    "get_logfile_list": passthrough("get_logfile_list"),
 
     # プロセス監視
-    elif name == "add_process_monitor":
-        return await manager.add_process_monitor(**arguments)
-    elif name == "modify_process_monitor":
-        return await manager.modify_process_monitor(**arguments)
-    elif name == "get_process_list":
-        return await manager.get_process_list(**arguments)
+    "add_process_monitor": passthrough("add_process_monitor"),
+    "modify_process_monitor": passthrough("modify_process_monitor"),
+    "get_process_list": passthrough("get_process_list"),
 
     # JMXマスタ管理
-    elif name == "get_jmx_master_list":
-        return await manager.get_jmx_master_list(**arguments)
-    elif name == "add_jmx_master_list":
-        return await manager.add_jmx_master_list(**arguments)
-    elif name == "delete_jmx_master":
-        return await manager.delete_jmx_master(**arguments)
-    elif name == "delete_jmx_master_all":
-        return await manager.delete_jmx_master_all(**arguments)
+    "get_jmx_master_list": passthrough("get_jmx_master_list"),
+    "add_jmx_master_list": passthrough("add_jmx_master_list"),
+    "delete_jmx_master": passthrough("delete_jmx_master"),
+    "delete_jmx_master_all": passthrough("delete_jmx_master_all"),
 
     # 補助API
-    elif name == "get_jdbc_driver_list":
-        return await manager.get_jdbc_driver_list(**arguments)
-    elif name == "get_binary_preset_list":
-        return await manager.get_binary_preset_list(**arguments)
-    elif name == "get_monitor_string_tag_list":
-        return await manager.get_monitor_string_tag_list(**arguments)
+    "get_jdbc_driver_list": passthrough("get_jdbc_driver_list"),
+    "get_binary_preset_list": passthrough("get_binary_preset_list"),
+    "get_monitor_string_tag_list": passthrough("get_monitor_string_tag_list"),
+}
 
-    return None
\ No newline at end of file
+dispatch = make_dispatch(HANDLERS)
@@ -1,4 +1,5 @@
 from mcp.types import Tool
+from .registry import bind, make_dispatch
 
 def get_tools():
     return [
@@ -20,6 +21,101 @@ def get_tools():
                 "required": ["filter"]
             }
         ),
+        Tool(
+            name="event_search_parallel",
+            description="Hinemos 7.1イベント一覧検索（REST API）を日時スライスに分割して並列実行し、日時の新しい順にマージして返す。ROOT配下・数週間分など1回の event_search ではタイムアウトする広い検索向け。スライス幅は応答時間に応じて自動調整され、新しい側から size 件が揃った時点で打ち切る",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "filter": {
+                        "type": "object",
+                        "description": "検索条件（event_searchと同じ。generationDateFrom/To（field=outputDate の場合は outputDateFrom/To）で範囲を指定）"
+                    },
+                    "size": {"type": "integer", "description": "取得件数上限（既定: 1000）"},
+                    "field": {
+                        "type": "string",
+                        "enum": ["generationDate", "outputDate"],
+                        "description": "分割・並び順に使う日時項目（既定: generationDate）"
+                    },
+                    "split_by_scope": {
+                        "type": "boolean",
+                        "description": "filter.facilityId（既定: ROOT）直下の子スコープ単位にも分割する（既定: false）。親スコープ直属のイベントは対象外になる"
+                    },
+                    "concurrency": {"type": "integer", "description": "同時実行数（既定: HINEMOS_FANOUT_CONCURRENCY または 4）"}
+                },
+                "required": ["filter"]
+            }
+        ),
+        Tool(
+            name="event_summary",
+            description="Hinemos 7.1イベントを検索してサーバ側で要約（重要度・ファシリティ・監視別の件数、ノイズの多い監視、最初/最後の発生日時、代表イベント）。件数が多くても応答サイズは一定。個々のイベントが必要な場合のみ event_search / event_search_paged を使う",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "filter": {
+                        "type": "object",
+                        "description": "検索条件（event_searchと同じ）"
+                    },
+                    "max_events": {
+                        "type": "integer",
+                        "description": "要約対象とする最大イベント数（既定: 100000）。size上限を超える分はページングして取得"
+                    },
+                    "top_n": {"type": "integer", "description": "内訳・ノイズの多い監視の上位件数（既定: 10）"},
+                    "samples": {"type": "integer", "description": "代表イベント数（既定: 5）"}
+                },
+                "required": ["filter"]
+            }
+        ),
+        Tool(
+            name="event_templates",
+            description="Hinemos 7.1イベントを検索し、メッセージをテンプレート（ID・IPアドレス・数値等を<*>に置換した形）にまとめて件数順に返す。イベントストーム時に「何種類のメッセージが何件ずつ出ているか」を把握する用途。各テンプレートには可変部分の値の分布・重要度別件数・監視ID別件数・サンプルが付く",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "filter": {
+                        "type": "object",
+                        "description": "検索条件（event_searchと同じ）"
+                    },
+                    "max_events": {
+                        "type": "integer",
+                        "description": "対象とする最大イベント数（既定: 100000）。size上限を超える分はページングして取得"
+                    },
+                    "top_n": {"type": "integer", "description": "返すテンプレート数（既定: 20）"},
+                    "similarity": {
+                        "type": "number",
+                        "description": "同じテンプレートとみなすトークン一致率 0〜1（既定: 0.5）。大きいほど細かく分かれる"
+                    },
+                    "parameter_values": {"type": "integer", "description": "可変部分ごとに返す値の上位件数（既定: 5）"}
+                },
+                "required": ["filter"]
+            }
+        ),
+        Tool(
+            name="event_search_paged",
+            description="Hinemos 7.1イベント一覧をページ単位で全件取得（REST API）。size上限を超える場合は日時ウィンドウを自動分割する。continuation_token が返る間は同じツールにトークンを渡して続きを取得する",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "filter": {
+                        "type": "object",
+                        "description": "検索条件（event_searchと同じ。outputDateFrom/To または generationDateFrom/To で範囲を指定）"
+                    },
+                    "page_size": {
+                        "type": "integer",
+                        "description": "1ページの最大件数（既定: 1000）"
+                    },
+                    "field": {
+                        "type": "string",
+                        "enum": ["outputDate", "generationDate"],
+                        "description": "ウィンドウ分割に使う日時項目（既定: outputDate）"
+                    },
+                    "continuation_token": {
+                        "type": "string",
+                        "description": "前回の応答の continuation_token（指定時は filter 等は無視）"
+                    }
+                }
+            }
+        ),
         Tool(
             name="scope_list",
             description="Hinemos 7.1スコープ一覧取得（REST API）",
@@ -51,6 +147,19 @@ def get_tools():
                 "required": ["filter"]
             }
         ),
+        Tool(
+            name="status_changes",
+            description="Hinemos 7.1ステータス一覧の差分取得（REST API）。前回の応答の cursor を渡すと、それ以降に追加・解消・重要度が変化したステータスだけを返す。cursor なしの初回呼び出しは基準点となり、cursor と件数のみを返す",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "filter": {"type": "object", "description": "検索条件（status_searchと同じ。同じ条件で呼び出すこと）"},
+                    "cursor": {"type": "string", "description": "前回の応答の cursor"},
+                    "size": {"type": "integer", "description": "status_search の取得件数上限（既定: HINEMOS_STATUS_POLL_SIZE または 10000）"},
+                    "max_rows": {"type": "integer", "description": "返す差分の最大行数（既定: 1000）"}
+                }
+            }
+        ),
         Tool(
             name="status_delete",
             description="Hinemos 7.1ステータス削除（REST API）",
@@ -78,7 +187,7 @@ def get_tools():
         ),
         Tool(
             name="event_download",
-            description="Hinemos 7.1イベントファイルダウンロード（REST API）",
+            description="Hinemos 7.1イベントファイルダウンロード（REST API）。ファイルはサーバ側に保存し、保存先パス・サイズ・SHA-256を返す",
             inputSchema={
                 "type": "object",
                 "properties": {
@@ -100,11 +209,35 @@ def get_tools():
                         },
                         "description": "ダウンロード対象イベントリスト"
                     },
-                    "filename": {"type": "string", "description": "出力ファイル名"}
+                    "filename": {"type": "string", "description": "出力ファイル名"},
+                    "output_path": {"type": "string", "description": "保存先パス（HINEMOS_DOWNLOAD_DIR からの相対パス、またはその配下の絶対パス。省略時はHINEMOS_DOWNLOAD_DIR配下にfilenameで保存）"}
                 },
                 "required": ["filter", "filename"]
             }
         ),
+        Tool(
+            name="event_export",
+            description="Hinemos 7.1イベントを検索条件で全件エクスポート（REST API）。event_search をページングしながら NDJSON / CSV / Parquet ファイルへ逐次書き込み、出力パスと件数のみを返す",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "filter": {"type": "object", "description": "検索条件（event_searchと同じ。outputDateFrom/To で期間を指定）"},
+                    "format": {
+                        "type": "string",
+                        "enum": ["ndjson", "csv", "parquet"],
+                        "description": "出力形式（既定: ndjson。parquet は pyarrow が必要）"
+                    },
+                    "output_path": {"type": "string", "description": "出力先ファイルパス（HINEMOS_DOWNLOAD_DIR からの相対パス、またはその配下の絶対パス。未指定時は HINEMOS_DOWNLOAD_DIR 配下）"},
+                    "fields": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                        "description": "出力する項目（未指定時: CSV/Parquet は既定の全項目、NDJSON はイベントの全項目）"
+                    },
+                    "page_size": {"type": "integer", "description": "1回の event_search の取得件数（既定: 1000）"}
+                },
+                "required": ["filter"]
+            }
+        ),
         Tool(
             name="event_detail_search",
             description="Hinemos 7.1イベント詳細検索（REST API）",
@@ -178,6 +311,72 @@ def get_tools():
                 "required": ["confirmType", "filter"]
             }
         ),
+        Tool(
+            name="event_bulk_confirm",
+            description="大量イベントの確認状態を一括更新（REST API）。対象をチャンクに分割して並列に event_confirm し、失敗したチャンクは再送する。進捗は progress 通知で送り、チャンクごとの結果の要約を返す",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "confirmType": {"type": "integer", "description": "確認タイプ（0:未確認, 1:確認中, 2:確認済）"},
+                    "events": {
+                        "type": "array",
+                        "description": "対象イベント（event_search の eventList をそのまま渡せる）",
+                        "items": {
+                            "type": "object",
+                            "properties": {
+                                "monitorId": {"type": "string"},
+                                "monitorDetailId": {"type": "string"},
+                                "pluginId": {"type": "string"},
+                                "facilityId": {"type": "string"},
+                                "outputDate": {"type": "string"}
+                            }
+                        }
+                    },
+                    "filter": {
+                        "type": "object",
+                        "description": "events 未指定時、この検索条件（event_searchと同じ）に一致するイベントを対象にする"
+                    },
+                    "max_events": {"type": "integer", "description": "filter 指定時の最大対象件数（既定: 100000）"},
+                    "chunk_size": {"type": "integer", "description": "1リクエストあたりの件数（既定: HINEMOS_BULK_CHUNK_SIZE または 500）"},
+                    "concurrency": {"type": "integer", "description": "同時送信チャンク数（既定: HINEMOS_BULK_CONCURRENCY または 4）"}
+                },
+                "required": ["confirmType"]
+            }
+        ),
+        Tool(
+            name="event_bulk_comment",
+            description="大量イベントに同じコメントを一括設定（REST API）。チャンク単位で並列に event_comment し、失敗したチャンクは再送する。進捗は progress 通知で送り、チャンクごとの結果の要約を返す",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "comment": {"type": "string", "description": "コメント"},
+                    "commentUser": {"type": "string", "description": "コメントユーザー"},
+                    "commentDate": {"type": "string", "description": "コメント日時（既定: 現在時刻）"},
+                    "events": {
+                        "type": "array",
+                        "description": "対象イベント（event_search の eventList をそのまま渡せる）",
+                        "items": {
+                            "type": "object",
+                            "properties": {
+                                "monitorId": {"type": "string"},
+                                "monitorDetailId": {"type": "string"},
+                                "pluginId": {"type": "string"},
+                                "facilityId": {"type": "string"},
+                                "outputDate": {"type": "string"}
+                            }
+                        }
+                    },
+                    "filter": {
+                        "type": "object",
+                        "description": "events 未指定時、この検索条件（event_searchと同じ）に一致するイベントを対象にする"
+                    },
+                    "max_events": {"type": "integer", "description": "filter 指定時の最大対象件数（既定: 100000）"},
+                    "chunk_size": {"type": "integer", "description": "1リクエストあたりの件数（既定: HINEMOS_BULK_CHUNK_SIZE または 500）"},
+                    "concurrency": {"type": "integer", "description": "同時送信チャンク数（既定: HINEMOS_BULK_CONCURRENCY または 4）"}
+                },
+                "required": ["comment", "commentUser"]
+            }
+        ),
         Tool(
             name="event_collectGraphFlg",
             description="Hinemos 7.1性能グラフフラグ更新（REST API）",
@@ -265,83 +464,29 @@ def get_tools():
         ),
     ]
 
-async def dispatch(name, manager, arguments):
-    if name == "event_search":
-        return await manager.event_search(
-            filter=arguments.get("filter"),
-            size=arguments.get("size"),
-        )
-    elif name == "scope_list":
-        return await manager.scope_list(
-            facility_id=arguments.get("facility_id"),
-            status_flag=arguments.get("status_flag"),
-            event_flag=arguments.get("event_flag"),
-            order_flg=arguments.get("order_flg"),
-        )
-    elif name == "status_search":
-        return await manager.status_search(
-            filter=arguments.get("filter"),
-            size=arguments.get("size"),
-        )
-    elif name == "status_delete":
-        return await manager.status_delete(
-            status_data_info_request_list=arguments.get("status_data_info_request_list"),
-        )
-    elif name == "event_download":
-        return await manager.event_download(
-            filter=arguments.get("filter"),
-            selected_events=arguments.get("selected_events"),
-            filename=arguments.get("filename"),
-        )
-    elif name == "event_detail_search":
-        return await manager.event_detail_search(
-            monitorId=arguments.get("monitorId"),
-            monitorDetailId=arguments.get("monitorDetailId"),
-            pluginId=arguments.get("pluginId"),
-            facilityId=arguments.get("facilityId"),
-            outputDate=arguments.get("outputDate"),
-        )
-    elif name == "event_comment":
-        return await manager.event_comment(
-            monitorId=arguments.get("monitorId"),
-            monitorDetailId=arguments.get("monitorDetailId"),
-            pluginId=arguments.get("pluginId"),
-            facilityId=arguments.get("facilityId"),
-            outputDate=arguments.get("outputDate"),
-            comment=arguments.get("comment"),
-            commentDate=arguments.get("commentDate"),
-            commentUser=arguments.get("commentUser"),
-        )
-    elif name == "event_confirm":
-        return await manager.event_confirm(
-            list=arguments.get("list"),
-            confirmType=arguments.get("confirmType"),
-        )
-    elif name == "event_multiConfirm":
-        return await manager.event_multiConfirm(
-            confirmType=arguments.get("confirmType"),
-            filter=arguments.get("filter"),
-        )
-    elif name == "event_collectGraphFlg":
-        return await manager.event_collectGraphFlg(
-            list=arguments.get("list"),
-            collectGraphFlg=arguments.get("collectGraphFlg"),
-        )
-    elif name == "event_update":
-        return await manager.event_update(
-            info=arguments.get("info"),
-        )
-    elif name == "eventCustomCommand_exec":
-        return await manager.eventCustomCommand_exec(
-            commandNo=arguments.get("commandNo"),
-            eventList=arguments.get("eventList"),
-        )
-    elif name == "eventCustomCommand_result":
-        return await manager.eventCustomCommand_result(
-            uuid=arguments.get("uuid"),
-        )
-    elif name == "event_collectValid_mapKeyFacility":
-        return await manager.event_collectValid_mapKeyFacility(
-            facilityIdList=arguments.get("facilityIdList"),
-        )
-    return None
\ No newline at end of file
+HANDLERS = {
+    "event_search": bind("event_search", "filter", "size"),
+    "event_search_parallel": bind("event_search_parallel", "filter", "size", "field", "split_by_scope", "concurrency"),
+    "event_summary": bind("event_summary", "filter", "max_events", "top_n", "samples"),
+    "event_templates": bind("event_templates", "filter", "max_events", "top_n", "similarity", "parameter_values"),
+    "event_search_paged": bind("event_search_paged", "filter", "page_size", "field", "continuation_token"),
+    "scope_list": bind("scope_list", "facility_id", "status_flag", "event_flag", "order_flg"),
+    "status_search": bind("status_search", "filter", "size"),
+    "status_changes": bind("status_changes", "filter", "cursor", "size", "max_rows"),
+    "status_delete": bind("status_delete", "status_data_info_request_list"),
+    "event_download": bind("event_download", "filter", "selected_events", "filename", "output_path"),
+    "event_export": bind("event_export", "filter", "format", "output_path", "fields", "page_size"),
+    "event_detail_search": bind("event_detail_search", "monitorId", "monitorDetailId", "pluginId", "facilityId", "outputDate"),
+    "event_comment": bind("event_comment", "monitorId", "monitorDetailId", "pluginId", "facilityId", "outputDate", "comment", "commentDate", "commentUser"),
+    "event_confirm": bind("event_confirm", "list", "confirmType"),
+    "event_multiConfirm": bind("event_multiConfirm", "confirmType", "filter"),
+    "event_bulk_confirm": bind("event_bulk_confirm", "confirmType", "events", "filter", "max_events", "chunk_size", "concurrency"),
+    "event_bulk_comment": bind("event_bulk_comment", "comment", "commentUser", "events", "filter", "max_events", "commentDate", "chunk_size", "concurrency"),
+    "event_collectGraphFlg": bind("event_collectGraphFlg", "list", "collectGraphFlg"),
+    "event_update": bind("event_update", "info"),
+    "eventCustomCommand_exec": bind("eventCustomCommand_exec", "commandNo", "eventList"),
+    "eventCustomCommand_result": bind("eventCustomCommand_result", "uuid"),
+    "event_collectValid_mapKeyFacility": bind("event_collectValid_mapKeyFacility", "facilityIdList"),
+}
+
+dispatch = make_dispatch(HANDLERS)
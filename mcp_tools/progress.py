@@ -0,0 +1,63 @@
+"""
+ツール実行中の進捗通知（notifications/progress）
+handle_call_tool で要求の progressToken とセッションを束縛しておき、マネージャ側は report_progress() を呼ぶだけで通知できる。
+progressToken を付けずに呼ばれた場合は何もしない。
+"""
+import time
+import logging
+import contextvars
+from contextlib import contextmanager
+from typing import Any, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+# 通知の最小間隔（秒）。完了時の通知は間隔に関係なく送る
+PROGRESS_MIN_INTERVAL = 0.5
+
+
+class ProgressReporter:
+    """1回のツール呼び出しに対応する進捗通知の送信先"""
+
+    def __init__(self, session: Any, token: Union[str, int], request_id: Optional[str] = None,
+                 min_interval: float = PROGRESS_MIN_INTERVAL):
+        self.session = session
+        self.token = token
+        self.request_id = request_id
+        self.min_interval = min_interval
+        self._last_sent = 0.0
+        self.sent = 0
+
+    async def report(self, progress: float, total: Optional[float] = None, message: Optional[str] = None) -> None:
+        now = time.monotonic()
+        finished = total is not None and progress >= total
+        if not finished and now - self._last_sent < self.min_interval:
+            return
+        self._last_sent = now
+        try:
+            await self.session.send_progress_notification(self.token, progress, total, message,
+                                                          related_request_id=self.request_id)
+            self.sent += 1
+        except Exception as e:
+            # 通知の失敗でツール本体を失敗させない
+            logger.debug(f"progress notification failed: {e}")
+
+
+_current_reporter: contextvars.ContextVar[Optional[ProgressReporter]] = contextvars.ContextVar(
+    "hinemos_progress_reporter", default=None)
+
+
+@contextmanager
+def progress_scope(session: Any, token: Optional[Union[str, int]], request_id: Optional[str] = None):
+    """このブロック内の report_progress() を token 宛ての進捗通知にする（token が None なら無効）"""
+    reporter = ProgressReporter(session, token, request_id) if token is not None else None
+    context_token = _current_reporter.set(reporter)
+    try:
+        yield reporter
+    finally:
+        _current_reporter.reset(context_token)
+
+
+async def report_progress(progress: float, total: Optional[float] = None, message: Optional[str] = None) -> None:
+    reporter = _current_reporter.get()
+    if reporter is not None:
+        await reporter.report(progress, total, message)
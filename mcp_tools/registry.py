@@ -0,0 +1,75 @@
+"""
+MCPツールのディスパッチレジストリ
+ツール定義(Tool)とハンドラをインポート時に一度だけ構築し、ツール名から O(1) でハンドラを引く。
+"""
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+from mcp.types import Tool
+
+Handler = Callable[[Any, Dict[str, Any]], Awaitable[Any]]
+
+
+def passthrough(method: str) -> Handler:
+    """arguments をそのままキーワード引数として manager.<method> に渡すハンドラを生成"""
+    async def handler(manager, arguments):
+        return await getattr(manager, method)(**arguments)
+    return handler
+
+
+def bind(method: str, *params: str) -> Handler:
+    """arguments から params のみを取り出して manager.<method> に渡すハンドラを生成（未指定はNone）"""
+    async def handler(manager, arguments):
+        return await getattr(manager, method)(**{param: arguments.get(param) for param in params})
+    return handler
+
+
+def make_dispatch(handlers: Dict[str, Handler]):
+    """モジュール単位の dispatch(name, manager, arguments) をハンドラ表から生成"""
+    async def dispatch(name, manager, arguments):
+        handler = handlers.get(name)
+        if handler is None:
+            return None
+        return await handler(manager, arguments)
+    return dispatch
+
+
+class ToolRegistry:
+    """ツール名 → (ハンドラ, 必須パラメータ) の対応表"""
+
+    def __init__(self):
+        self._tools: List[Tool] = []
+        self._entries: Dict[str, Tuple[Handler, Tuple[str, ...]]] = {}
+
+    def register(self, tool: Tool, handler: Handler) -> None:
+        if tool.name in self._entries:
+            raise ValueError(f"ツール名が重複しています: {tool.name}")
+        required = tuple(tool.inputSchema.get("required", ()))
+        self._tools.append(tool)
+        self._entries[tool.name] = (handler, required)
+
+    def register_module(self, get_tools: Callable[[], List[Tool]], handlers: Dict[str, Handler]) -> None:
+        for tool in get_tools():
+            handler = handlers.get(tool.name)
+            if handler is None:
+                raise ValueError(f"ツールのハンドラが未定義です: {tool.name}")
+            self.register(tool, handler)
+
+    @property
+    def tools(self) -> List[Tool]:
+        return list(self._tools)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def dispatch(self, name: str, manager: Any, arguments: Optional[Dict[str, Any]]) -> Any:
+        entry = self._entries.get(name)
+        if entry is None:
+            return None
+        handler, required = entry
+        arguments = arguments or {}
+        missing = [param for param in required if param not in arguments]
+        if missing:
+            raise ValueError(f"必須パラメータが不足しています: {', '.join(missing)}")
+        return await handler(manager, arguments)
@@ -1,4 +1,5 @@
 from mcp.types import Tool, TextContent
+from .registry import passthrough, make_dispatch
 from typing import List
 
 def get_tools():
@@ -389,41 +390,25 @@ def get_tools():
         ),
     ]
 
-async def dispatch(name, manager, arguments):
-    if name == "get_facility_tree":
-        return await manager.get_facility_tree(**arguments)
-    elif name == "get_exec_target_facility_tree":
-        return await manager.get_exec_target_facility_tree(**arguments)
-    elif name == "get_node_facility_tree":
-        return await manager.get_node_facility_tree(**arguments)
-    elif name == "get_node_list":
-        return await manager.get_node_list(**arguments)
-    elif name == "get_node":
-        return await manager.get_node(**arguments)
-    elif name == "get_node_full":
-        return await manager.get_node_full(**arguments)
-    elif name == "add_node":
-        return await manager.add_node(**arguments)
-    elif name == "modify_node":
-        return await manager.modify_node(**arguments)
-    elif name == "delete_node":
-        return await manager.delete_node(**arguments)
-    elif name == "search_node":
-        return await manager.search_node(**arguments)
-    elif name == "get_facility_list":
-        return await manager.get_facility_list(**arguments)
-    elif name == "get_scope":
-        return await manager.get_scope(**arguments)
-    elif name == "get_scope_default":
-        return await manager.get_scope_default(**arguments)
-    elif name == "add_scope":
-        return await manager.add_scope(**arguments)
-    elif name == "modify_scope":
-        return await manager.modify_scope(**arguments)
-    elif name == "delete_scope":
-        return await manager.delete_scope(**arguments)
-    elif name == "get_platform_list":
-        return await manager.get_platform_list(**arguments)
-    elif name == "get_subplatform_list":
-        return await manager.get_subplatform_list(**arguments)
-    return None
\ No newline at end of file
+HANDLERS = {
+    "get_facility_tree": passthrough("get_facility_tree"),
+    "get_exec_target_facility_tree": passthrough("get_exec_target_facility_tree"),
+    "get_node_facility_tree": passthrough("get_node_facility_tree"),
+    "get_node_list": passthrough("get_node_list"),
+    "get_node": passthrough("get_node"),
+    "get_node_full": passthrough("get_node_full"),
+    "add_node": passthrough("add_node"),
+    "modify_node": passthrough("modify_node"),
+    "delete_node": passthrough("delete_node"),
+    "search_node": passthrough("search_node"),
+    "get_facility_list": passthrough("get_facility_list"),
+    "get_scope": passthrough("get_scope"),
+    "get_scope_default": passthrough("get_scope_default"),
+    "add_scope": passthrough("add_scope"),
+    "modify_scope": passthrough("modify_scope"),
+    "delete_scope": passthrough("delete_scope"),
+    "get_platform_list": passthrough("get_platform_list"),
+    "get_subplatform_list": passthrough("get_subplatform_list"),
+}
+
+dispatch = make_dispatch(HANDLERS)
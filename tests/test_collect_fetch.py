@@ -0,0 +1,24 @@
+import asyncio
+import random
+
+from client.collect_fetch import CollectFetchConfig, fetch_collect_series, parse_collect_time
+
+
+def test_boundary_seconds_are_not_lost_between_windows():
+    rng = random.Random(3)
+    start = parse_collect_time("2025-01-01 00:00:00")
+    # 1時間分、秒の中の端数（.000 / .500 / .999 を含む）を持つ収集値
+    stamps = sorted({start + second * 1000 + rng.choice([0, 500, 999, rng.randrange(1000)])
+                     for second in rng.sample(range(3600), 1500)})
+    records = [{"collectId": 1, "time": stamp, "value": float(index)} for index, stamp in enumerate(stamps)]
+
+    async def fetch(ids, summary_type, from_time, to_time, size):
+        lower, upper = parse_collect_time(from_time), parse_collect_time(to_time)
+        matched = [record for record in records if lower <= record["time"] <= upper]
+        return {"collectDataList": matched[:size] if size else matched}
+
+    config = CollectFetchConfig(window_hours=0.1)
+    result = asyncio.run(fetch_collect_series(fetch, [1], "RAW", "2025-01-01 00:00:00", "2025-01-01 01:00:00",
+                                              size=50, config=config))
+    assert result.series[1].times.tolist() == stamps
+    assert result.stats["splits"] > 0
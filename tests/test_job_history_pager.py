@@ -0,0 +1,38 @@
+from datetime import datetime, timedelta
+
+from client.job_history_pager import JobHistoryPager
+
+
+def _collect(pager, runs):
+    def parse(text):
+        return datetime.strptime(text, "%Y-%m-%d %H:%M:%S")
+
+    seen = []
+    while pager.has_next:
+        window = pager.pop()
+        request = pager.request_filter(window)
+        lower, upper = parse(request["startFromDate"]), parse(request["startToDate"])
+        matched = [{"sessionId": s} for s, start in runs if lower <= start <= upper]
+        history = pager.feed(window, {"list": matched[:pager.page_size], "total": len(matched)})
+        seen += [run["sessionId"] for run in history or []]
+    return seen
+
+
+def test_split_windows_keep_runs_inside_boundary_seconds():
+    base = datetime(2026, 10, 1)
+    # 1秒ごとに .000 / .500 / .999 に開始した履歴（分割境界の秒内の端数を含む）
+    runs = [(f"s{second}-{ms}", base + timedelta(seconds=second, milliseconds=ms))
+            for second in range(600) for ms in (0, 500, 999)]
+    pager = JobHistoryPager({"startFromDate": "2026-10-01 00:00:00", "startToDate": "2026-10-01 00:10:00"},
+                            page_size=50, field="startDate")
+    seen = _collect(pager, runs)
+    assert set(seen) == {s for s, _ in runs}
+    assert pager.truncated == 0
+
+
+def test_iso_offset_keeps_wall_clock():
+    pager = JobHistoryPager({"startFromDate": "2026-10-01T00:00:00+09:00",
+                             "startToDate": "2026-10-02T00:00:00+09:00"}, field="startDate")
+    request = pager.request_filter(pager.windows[-1])
+    local = datetime.fromisoformat("2026-10-01T00:00:00+09:00").astimezone().strftime("%Y-%m-%d %H:%M:%S")
+    assert request["startFromDate"] == local
@@ -0,0 +1,72 @@
+import random
+
+from client.status_tracker import StatusTracker, status_key
+
+
+def _row(facility, priority):
+    return {"facilityId": facility, "monitorId": "M", "monitorDetailId": "", "pluginId": "P", "priority": priority}
+
+
+def _naive_diff(previous, current):
+    before = {status_key(row): row for row in previous}
+    after = {status_key(row): row for row in current}
+    added = {key for key in after.keys() - before.keys()}
+    removed = {key for key in before.keys() - after.keys()}
+    changed = {(key, before[key]["priority"], after[key]["priority"])
+               for key in after.keys() & before.keys() if before[key]["priority"] != after[key]["priority"]}
+    return added, removed, changed
+
+
+def _tracker_diff(changes):
+    return ({status_key(row) for row in changes["added"]},
+            {status_key(row) for row in changes["removed"]},
+            {(status_key(row), row["previousPriority"], row["priority"]) for row in changes["changed"]})
+
+
+def test_empty_and_non_empty_snapshots_alternate():
+    tracker = StatusTracker()
+    snapshots = [[], [_row("F1", "INFO")], [], [_row("F1", "CRITICAL"), _row("F2", "INFO")]]
+    for previous, current in zip([None] + snapshots, snapshots):
+        version = tracker.update(current)
+        assert tracker.total == len(current)
+        if previous is not None:
+            assert _tracker_diff(tracker.changes_since(version - 1)) == _naive_diff(previous, current)
+
+
+def test_changes_match_naive_diff():
+    rng = random.Random(7)
+    facilities = [f"F{i}" for i in range(30)]
+    tracker = StatusTracker()
+    previous = None
+    for _ in range(200):
+        current = [_row(facility, rng.choice(["INFO", "WARNING", "CRITICAL"]))
+                   for facility in facilities if rng.random() < 0.6]
+        version = tracker.update(current)
+        if previous is not None:
+            assert _tracker_diff(tracker.changes_since(version - 1)) == _naive_diff(previous, current)
+        previous = current
+
+
+def test_changes_since_any_cursor_with_readded_keys():
+    rng = random.Random(11)
+    facilities = [f"F{i}" for i in range(12)]
+    tracker = StatusTracker(max_versions=20)
+    snapshots = {}
+    for _ in range(120):
+        # 解消と再出現を繰り返すよう、各キーを高い確率で出し入れする
+        current = [_row(facility, rng.choice(["INFO", "CRITICAL"])) for facility in facilities if rng.random() < 0.5]
+        version = tracker.update(current)
+        snapshots[version] = current
+        for cursor in range(tracker.oldest_version, version + 1):
+            assert _tracker_diff(tracker.changes_since(cursor)) == _naive_diff(snapshots[cursor], current)
+    assert tracker.changes_since(tracker.oldest_version - 1) == {"reset": True}
+
+
+def test_key_removed_and_readded_after_cursor_is_unchanged():
+    tracker = StatusTracker()
+    cursor = tracker.update([_row("F1", "INFO")])
+    tracker.update([])
+    tracker.update([_row("F1", "INFO")])
+    assert _tracker_diff(tracker.changes_since(cursor)) == (set(), set(), set())
+    tracker.update([_row("F1", "CRITICAL")])
+    assert _tracker_diff(tracker.changes_since(cursor)) == (set(), set(), {(status_key(_row("F1", "")), "INFO", "CRITICAL")})
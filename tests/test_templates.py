@@ -0,0 +1,26 @@
+from analytics.templates import TemplateMiner
+
+
+def test_timestamped_message_keeps_parameter_positions():
+    miner = TemplateMiner()
+    for index in range(3):
+        miner.add(f"backup started 2025-06-0{index + 1} 10:00:0{index} on host{index} size {index}")
+    result = miner.result()
+    assert result["templateCount"] == 1
+    template = result["templates"][0]
+    assert template["template"] == "backup started <*> <*> on host<*> size <*>"
+    values = {p["position"]: {v["value"] for v in p["top"]} for p in template["parameters"]}
+    assert values == {
+        2: {"2025-06-01", "2025-06-02", "2025-06-03"},
+        3: {"10:00:00", "10:00:01", "10:00:02"},
+        5: {"host0", "host1", "host2"},
+        7: {"0", "1", "2"},
+    }
+
+
+def test_iso_timestamp_is_a_single_parameter():
+    miner = TemplateMiner()
+    miner.add("job finished at 2025-06-01T10:00:00.123 rc 0")
+    miner.add("job finished at 2025-06-02T11:30:00.456 rc 0")
+    template = miner.result()["templates"][0]
+    assert template["template"] == "job finished at <*> rc <*>"